@@ -7,6 +7,7 @@ from pathlib import Path
 from textwrap import dedent
 from datetime import datetime
 from collections import defaultdict, deque
+from functools import partial
 from typing import (
     Any,
     AsyncIterator,
@@ -36,13 +37,16 @@ from phi.model.base import Model
 from phi.model.message import Message, MessageReferences
 from phi.model.response import ModelResponse, ModelResponseEvent
 from phi.memory.agent import AgentMemory, MemoryRetrieval, Memory, AgentRun, SessionSummary  # noqa: F401
+from phi.memory.background import flush_memory_updates, submit_memory_update
 from phi.prompt.template import PromptTemplate
 from phi.storage.agent.base import AgentStorage
 from phi.tools import Tool, Toolkit, Function
 from phi.utils.log import logger, set_log_level_to_debug, set_log_level_to_info
 from phi.utils.message import get_text_from_message
 from phi.utils.merge_dict import merge_dictionaries
+from phi.utils.threads import run_in_thread
 from phi.utils.timer import Timer
+from phi.utils.tokens import Tokenizer, get_tokenizer, TRUNCATED_TOOL_RESULT_TOKENS
 
 
 class Agent(BaseModel):
@@ -91,6 +95,10 @@ class Agent(BaseModel):
     add_history_to_messages: bool = Field(False, alias="add_chat_history_to_messages")
     # Number of historical responses to add to the messages.
     num_history_responses: int = 3
+    # Maximum number of tokens in the messages sent to the Model, including the tool definitions.
+    # If set, references and history are trimmed to fit: references are kept before history,
+    # long tool results in the history are truncated and then the oldest runs are dropped.
+    max_context_tokens: Optional[int] = None
 
     # -*- Agent Knowledge
     knowledge: Optional[AgentKnowledge] = Field(None, alias="knowledge_base")
@@ -108,6 +116,8 @@ class Agent(BaseModel):
     storage: Optional[AgentStorage] = None
     # AgentSession from the database: DO NOT SET MANUALLY
     _agent_session: Optional[AgentSession] = None
+    # Token count of the model's tool definitions, cached with the tokenizer and tools it was counted for
+    _tools_token_count: Optional[Tuple[str, Any, int, int]] = None
 
     # -*- Agent Tools
     # A list of tools provided to the Model.
@@ -118,6 +128,8 @@ class Agent(BaseModel):
     show_tool_calls: bool = False
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # If True, runs independent tool calls from a single model response concurrently.
+    run_tools_in_parallel: Optional[bool] = None
     # Controls which (if any) tool is called by the model.
     # "none" means the model will not call a tool and instead generates a message.
     # "auto" means the model can pick between generating a message or calling a tool.
@@ -311,6 +323,45 @@ class Agent(BaseModel):
         logger.debug(f"Created new Agent: agent_id: {new_agent.agent_id} | session_id: {new_agent.session_id}")
         return new_agent
 
+    def copy_for_run(self, *, update: Optional[Dict[str, Any]] = None) -> "Agent":
+        """Create and return a lightweight copy of this Agent for a single run, optionally updating fields.
+
+        Unlike deep_copy, configuration that a run does not change (tools, knowledge, storage, clients, prompts)
+        is shared with this Agent. Only the state a run mutates is copied: the model's tools, functions and metrics,
+        the memory's runs and messages, the session state and other list or dict fields.
+        This makes it cheap to serve concurrent requests from one Agent.
+
+        Args:
+            update (Optional[Dict[str, Any]]): Optional dictionary of fields for the new Agent.
+
+        Returns:
+            Agent: A new Agent instance.
+        """
+        from copy import copy, deepcopy
+
+        fields_for_new_agent: Dict[str, Any] = {}
+        for field_name in self.model_fields_set:
+            field_value = getattr(self, field_name)
+            if field_value is None:
+                continue
+            if field_name in ("model", "memory"):
+                field_value = field_value.copy_for_run()
+            elif field_name == "team":
+                field_value = [member.copy_for_run() for member in field_value]
+            elif field_name == "session_state":
+                field_value = deepcopy(field_value)
+            elif isinstance(field_value, (list, dict)):
+                field_value = copy(field_value)
+            fields_for_new_agent[field_name] = field_value
+
+        # Update fields if provided
+        if update:
+            fields_for_new_agent.update(update)
+
+        new_agent = self.__class__(**fields_for_new_agent)
+        logger.debug(f"Created Agent for run: agent_id: {new_agent.agent_id} | session_id: {new_agent.session_id}")
+        return new_agent
+
     def _deep_copy_field(self, field_name: str, field_value: Any) -> Any:
         """Helper method to deep copy a field based on its type."""
         from copy import copy, deepcopy
@@ -532,6 +583,10 @@ class Agent(BaseModel):
         if self.tool_call_limit is not None:
             self.model.tool_call_limit = self.tool_call_limit
 
+        # Set run_tools_in_parallel if set on the agent
+        if self.run_tools_in_parallel is not None:
+            self.model.run_tools_in_parallel = self.run_tools_in_parallel
+
         # Add session_id to the Model
         if self.session_id is not None:
             self.model.session_id = self.session_id
@@ -557,12 +612,23 @@ class Agent(BaseModel):
                 else:
                     self.context[ctx_key] = ctx_value
 
-    def load_user_memories(self) -> None:
+    def load_user_memories(self, query: Optional[str] = None) -> None:
+        if self.memory.create_user_memories:
+            if self.user_id is not None:
+                self.memory.user_id = self.user_id
+
+            self.memory.load_user_memories(query=query)
+            if self.user_id is not None:
+                logger.debug(f"Memories loaded for user: {self.user_id}")
+            else:
+                logger.debug("Memories loaded")
+
+    async def aload_user_memories(self, query: Optional[str] = None) -> None:
         if self.memory.create_user_memories:
             if self.user_id is not None:
                 self.memory.user_id = self.user_id
 
-            self.memory.load_user_memories()
+            await self.memory.aload_user_memories(query=query)
             if self.user_id is not None:
                 logger.debug(f"Memories loaded for user: {self.user_id}")
             else:
@@ -725,9 +791,12 @@ class Agent(BaseModel):
                 logger.warning(f"Failed to load AgentMemory: {e}")
         logger.debug(f"-*- AgentSession loaded: {session.session_id}")
 
-    def read_from_storage(self) -> Optional[AgentSession]:
+    def read_from_storage(self, memory_query: Optional[str] = None) -> Optional[AgentSession]:
         """Load the AgentSession from storage
 
+        Args:
+            memory_query (Optional[str]): The message to load relevant user memories for, with semantic retrieval.
+
         Returns:
             Optional[AgentSession]: The loaded AgentSession or None if not found.
         """
@@ -735,7 +804,7 @@ class Agent(BaseModel):
             self._agent_session = self.storage.read(session_id=self.session_id)
             if self._agent_session is not None:
                 self.from_agent_session(session=self._agent_session)
-        self.load_user_memories()
+        self.load_user_memories(query=memory_query)
         return self._agent_session
 
     def write_to_storage(self) -> Optional[AgentSession]:
@@ -748,6 +817,101 @@ class Agent(BaseModel):
             self._agent_session = self.storage.upsert(session=self.get_agent_session())
         return self._agent_session
 
+    async def aread_from_storage(self, memory_query: Optional[str] = None) -> Optional[AgentSession]:
+        """Load the AgentSession from storage without blocking the event loop
+
+        Args:
+            memory_query (Optional[str]): The message to load relevant user memories for, with semantic retrieval.
+
+        Returns:
+            Optional[AgentSession]: The loaded AgentSession or None if not found.
+        """
+        if self.storage is not None and self.session_id is not None:
+            self._agent_session = await self.storage.aread(session_id=self.session_id)
+            if self._agent_session is not None:
+                self.from_agent_session(session=self._agent_session)
+        await self.aload_user_memories(query=memory_query)
+        return self._agent_session
+
+    async def awrite_to_storage(self) -> Optional[AgentSession]:
+        """Save the AgentSession to storage without blocking the event loop
+
+        Returns:
+            Optional[AgentSession]: The saved AgentSession or None if not saved.
+        """
+        if self.storage is not None:
+            self._agent_session = await self.storage.aupsert(session=self.get_agent_session())
+        return self._agent_session
+
+    def defer_memory_update(self, inputs: List[str]) -> None:
+        """Queue the user memory and session summary updates for a run, to run in a background thread.
+
+        Updates for a session run in order. Updates queued while one is running are coalesced into one update.
+        The update runs on a copy of the memory taken now, with its own classifier, manager and summarizer,
+        so later runs and sessions of this Agent do not change it.
+
+        Args:
+            inputs (List[str]): The user messages to create memories from.
+        """
+        if self.session_id is None:
+            return
+        submit_memory_update(
+            session_id=self.session_id,
+            inputs=inputs,
+            update=partial(
+                self.run_deferred_memory_update, session_id=self.session_id, memory=self.memory.copy_for_run()
+            ),
+        )
+
+    def run_deferred_memory_update(self, inputs: List[str], session_id: str, memory: AgentMemory) -> None:
+        """Update the user memories and the session summary, then save them to the session in storage.
+
+        Only the summary and memories keys of the stored session memory are updated,
+        so runs and session data saved in the meantime are kept.
+
+        Args:
+            inputs (List[str]): The user messages to create memories from.
+            session_id (str): The session the update was queued for.
+            memory (AgentMemory): The copy of the memory taken when the update was queued.
+        """
+        if len(inputs) > 0 and memory.create_user_memories and memory.update_user_memories_after_run:
+            memory.update_memory(input="\n".join(inputs))
+        if memory.create_session_summary and memory.update_session_summary_after_run:
+            memory.update_summary()
+
+        session_memory: Dict[str, Any] = {}
+        if memory.summary is not None:
+            session_memory["summary"] = memory.summary.to_dict()
+        if memory.memories:
+            session_memory["memories"] = [user_memory.to_dict() for user_memory in memory.memories]
+
+        # Show the update in this Agent if it is still on the same session
+        if self.session_id == session_id:
+            if memory.summary is not None:
+                self.memory.summary = memory.summary
+            if memory.memories:
+                self.memory.memories = memory.memories
+
+        if self.storage is None or len(session_memory) == 0:
+            return
+        if not self.storage.update_session_memory(session_id=session_id, memory=session_memory):
+            logger.debug(f"Session not found, skipping memory update for session: {session_id}")
+
+    def flush_memory_updates(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the memory updates deferred by the runs of this session to finish.
+
+        Args:
+            timeout (Optional[float]): Maximum number of seconds to wait.
+
+        Returns:
+            bool: True if all updates finished, False on timeout.
+        """
+        return flush_memory_updates(session_id=self.session_id, timeout=timeout)
+
+    async def aflush_memory_updates(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the memory updates deferred by the runs of this session to finish, without blocking the event loop."""
+        return await run_in_thread(flush_memory_updates, session_id=self.session_id, timeout=timeout)
+
     def add_introduction(self, introduction: str) -> None:
         """Add an introduction to the chat history"""
 
@@ -809,6 +973,12 @@ class Agent(BaseModel):
         - Create a new session_id
         - Load the new session
         """
+        # Finish the memory updates of the current session before clearing its memory
+        if not self.flush_memory_updates(timeout=self.memory.flush_timeout):
+            logger.warning(
+                f"Memory updates for session {self.session_id} did not finish within {self.memory.flush_timeout}s, "
+                "they will continue in the background"
+            )
         self._agent_session = None
         if self.model is not None:
             self.model.clear()
@@ -1140,6 +1310,7 @@ class Agent(BaseModel):
         audio: Optional[Any] = None,
         images: Optional[Sequence[Any]] = None,
         videos: Optional[Sequence[Any]] = None,
+        references_token_budget: Optional[int] = None,
         **kwargs: Any,
     ) -> Optional[Message]:
         """Return the user message for the Agent.
@@ -1157,6 +1328,13 @@ class Agent(BaseModel):
             retrieval_timer = Timer()
             retrieval_timer.start()
             docs_from_knowledge = self.get_relevant_docs_from_knowledge(query=message, **kwargs)
+            # Keep the references that fit the context, if max_context_tokens is set
+            if docs_from_knowledge is not None and references_token_budget is not None:
+                docs_from_knowledge = self.fit_references_to_context(
+                    references=docs_from_knowledge,
+                    max_tokens=references_token_budget,
+                    tokenizer=get_tokenizer(self.model),
+                )
             if docs_from_knowledge is not None:
                 references = MessageReferences(
                     query=message, references=docs_from_knowledge, time=round(retrieval_timer.elapsed, 4)
@@ -1300,23 +1478,23 @@ class Agent(BaseModel):
                     else:
                         self.run_response.extra_data.add_messages.extend(_add_messages)
 
-        # 3.3 Add history to the messages list
+        # Count the tokens used so far if the messages must fit max_context_tokens
+        tokenizer: Optional[Tokenizer] = None
+        context_tokens: int = 0
+        if self.max_context_tokens is not None:
+            tokenizer = get_tokenizer(self.model)
+            context_tokens = self.get_tools_token_count(tokenizer) + sum(
+                m.get_token_count(tokenizer) for m in messages_for_model
+            )
+
+        # 3.3 Get the history
+        history: List[Message] = []
         if self.add_history_to_messages:
-            history: List[Message] = self.memory.get_messages_from_last_n_runs(
+            history = self.memory.get_messages_from_last_n_runs(
                 last_n=self.num_history_responses, skip_role=self.system_message_role
             )
-            if len(history) > 0:
-                logger.debug(f"Adding {len(history)} messages from history")
-                if self.run_response.extra_data is None:
-                    self.run_response.extra_data = RunResponseExtraData(history=history)
-                else:
-                    if self.run_response.extra_data.history is None:
-                        self.run_response.extra_data.history = history
-                    else:
-                        self.run_response.extra_data.history.extend(history)
-                messages_for_model += history
 
-        # 3.4. Add the User Messages to the messages list
+        # 3.4. Get the User Messages
         user_messages: List[Message] = []
         # 3.4.1 Build user message from message if provided
         if message is not None:
@@ -1325,9 +1503,18 @@ class Agent(BaseModel):
                 user_messages.append(message)
             # If message is provided as a str or list, build the Message object
             elif isinstance(message, str) or isinstance(message, list):
+                # References are added before the history, so they may use the tokens left after the message
+                references_token_budget: Optional[int] = None
+                if tokenizer is not None and self.max_context_tokens is not None and isinstance(message, str):
+                    references_token_budget = self.max_context_tokens - context_tokens - tokenizer.count(message)
                 # Get the user message
                 user_message: Optional[Message] = self.get_user_message(
-                    message=message, audio=audio, images=images, videos=videos, **kwargs
+                    message=message,
+                    audio=audio,
+                    images=images,
+                    videos=videos,
+                    references_token_budget=references_token_budget,
+                    **kwargs,
                 )
                 # Add user message to the messages list
                 if user_message is not None:
@@ -1350,13 +1537,100 @@ class Agent(BaseModel):
                         user_messages.append(Message.model_validate(_m))
                     except Exception as e:
                         logger.warning(f"Failed to validate message: {e}")
-        # Add the User Messages to the messages list
+
+        # 3.5 Add history to the messages list
+        if tokenizer is not None and self.max_context_tokens is not None:
+            context_tokens += sum(m.get_token_count(tokenizer) for m in user_messages)
+            history = self.fit_history_to_context(
+                history=history, max_tokens=self.max_context_tokens - context_tokens, tokenizer=tokenizer
+            )
+            context_tokens += sum(m.get_token_count(tokenizer) for m in history)
+            logger.debug(f"Estimated context tokens: {context_tokens} of {self.max_context_tokens}")
+            if self.run_response.metrics is None:
+                self.run_response.metrics = {}
+            self.run_response.metrics["context_tokens"] = context_tokens
+        if len(history) > 0:
+            logger.debug(f"Adding {len(history)} messages from history")
+            if self.run_response.extra_data is None:
+                self.run_response.extra_data = RunResponseExtraData(history=history)
+            else:
+                if self.run_response.extra_data.history is None:
+                    self.run_response.extra_data.history = history
+                else:
+                    self.run_response.extra_data.history.extend(history)
+            messages_for_model += history
+
+        # 3.6 Add the User Messages to the messages list
         messages_for_model.extend(user_messages)
         # Update the run_response messages with the messages list
         self.run_response.messages = messages_for_model
 
         return system_message, user_messages, messages_for_model
 
+    def get_tools_token_count(self, tokenizer: Tokenizer) -> int:
+        """Returns the number of tokens in the tool definitions sent to the Model."""
+        if self.model is None or not self.model.tools:
+            return 0
+        tools = self.model.tools
+        cached = self._tools_token_count
+        if cached is not None and cached[0] == tokenizer.name and cached[1] is tools and cached[2] == len(tools):
+            return cached[3]
+        num_tokens = tokenizer.count_json(self.model.get_tools_for_api())
+        self._tools_token_count = (tokenizer.name, tools, len(tools), num_tokens)
+        return num_tokens
+
+    def fit_references_to_context(
+        self, references: List[Dict[str, Any]], max_tokens: int, tokenizer: Tokenizer
+    ) -> List[Dict[str, Any]]:
+        """Returns the leading references that fit in max_tokens. References are kept in the order retrieved."""
+        fitted: List[Dict[str, Any]] = []
+        num_tokens = 0
+        for reference in references:
+            num_tokens += tokenizer.count(self.convert_documents_to_string([reference]))
+            if num_tokens > max_tokens:
+                break
+            fitted.append(reference)
+        if len(fitted) < len(references):
+            logger.debug(f"Dropped {len(references) - len(fitted)} references to fit the context")
+        return fitted
+
+    def fit_history_to_context(self, history: List[Message], max_tokens: int, tokenizer: Tokenizer) -> List[Message]:
+        """Returns the history trimmed to fit in max_tokens.
+
+        Long tool results are truncated first, oldest first. If the history still does not fit, the oldest runs
+        are dropped. A run starts with a user message, so tool calls are never separated from their results.
+        The messages in memory are not modified.
+        """
+        num_tokens = sum(m.get_token_count(tokenizer) for m in history)
+        if num_tokens <= max_tokens:
+            return history
+
+        # 1. Truncate long tool results
+        fitted: List[Message] = []
+        for m in history:
+            if num_tokens > max_tokens and m.role == "tool" and isinstance(m.content, str):
+                m_tokens = m.get_token_count(tokenizer)
+                if m_tokens > TRUNCATED_TOOL_RESULT_TOKENS:
+                    truncated_content = tokenizer.truncate(m.content, TRUNCATED_TOOL_RESULT_TOKENS)
+                    m = m.model_copy(update={"content": f"{truncated_content}\n[truncated]"})
+                    num_tokens -= m_tokens - m.get_token_count(tokenizer)
+            fitted.append(m)
+
+        # 2. Drop the oldest runs
+        runs: List[List[Message]] = []
+        for m in fitted:
+            if m.role == self.user_message_role or len(runs) == 0:
+                runs.append([])
+            runs[-1].append(m)
+        num_dropped = 0
+        while len(runs) > 0 and num_tokens > max_tokens:
+            dropped_run = runs.pop(0)
+            num_tokens -= sum(m.get_token_count(tokenizer) for m in dropped_run)
+            num_dropped += len(dropped_run)
+        if num_dropped > 0:
+            logger.debug(f"Dropped {num_dropped} messages from history to fit the context")
+        return [m for run in runs for m in run]
+
     def save_run_response_to_file(self, message: Optional[Union[str, List, Dict, Message]] = None) -> None:
         if self.save_response_to_file is not None and self.run_response is not None:
             message_str = None
@@ -1766,8 +2040,8 @@ class Agent(BaseModel):
         if self.context is not None and self.resolve_context:
             self._resolve_context()
 
-        # 2. Read existing session from storage
-        self.read_from_storage()
+        # 2. Read existing session from storage, with the user memories relevant to this message
+        self.read_from_storage(memory_query=get_text_from_message(message) if message else None)
 
         # 3. Prepare messages for this run
         system_message, user_messages, messages_for_model = self.get_messages_for_run(
@@ -1856,7 +2130,10 @@ class Agent(BaseModel):
             run_messages.insert(0, system_message)
         # Update the run_response
         self.run_response.messages = run_messages
-        self.run_response.metrics = self._aggregate_metrics_from_run_messages(run_messages)
+        self.run_response.metrics = {
+            **(self.run_response.metrics or {}),
+            **self._aggregate_metrics_from_run_messages(run_messages),
+        }
         # Update the run_response content if streaming as run_response will only contain the last chunk
         if self.stream:
             self.run_response.content = model_response.content
@@ -1878,6 +2155,8 @@ class Agent(BaseModel):
 
         # Create an AgentRun object to add to memory
         agent_run = AgentRun(response=self.run_response)
+        # User messages to create memories from
+        memory_inputs: List[str] = []
         if message is not None:
             user_message_for_memory: Optional[Message] = None
             if isinstance(message, str):
@@ -1888,7 +2167,7 @@ class Agent(BaseModel):
                 agent_run.message = user_message_for_memory
                 # Update the memories with the user message if needed
                 if self.memory.create_user_memories and self.memory.update_user_memories_after_run:
-                    self.memory.update_memory(input=user_message_for_memory.get_content_string())
+                    memory_inputs.append(user_message_for_memory.get_content_string())
         elif messages is not None and len(messages) > 0:
             for _m in messages:
                 _um = None
@@ -1907,18 +2186,27 @@ class Agent(BaseModel):
                         agent_run.messages = []
                     agent_run.messages.append(_um)
                     if self.memory.create_user_memories and self.memory.update_user_memories_after_run:
-                        self.memory.update_memory(input=_um.get_content_string())
+                        memory_inputs.append(_um.get_content_string())
                 else:
                     logger.warning("Unable to add message to memory")
         # Add AgentRun to memory
         self.memory.add_run(agent_run)
 
-        # Update the session summary if needed
-        if self.memory.create_session_summary and self.memory.update_session_summary_after_run:
-            self.memory.update_summary()
+        update_summary = self.memory.create_session_summary and self.memory.update_session_summary_after_run
+        update_in_background = self.memory.update_in_background and (len(memory_inputs) > 0 or update_summary)
+        if not update_in_background:
+            # Update the memories with the user messages if needed
+            for memory_input in memory_inputs:
+                self.memory.update_memory(input=memory_input)
+            # Update the session summary if needed
+            if update_summary:
+                self.memory.update_summary()
 
         # 7. Save session to storage
         self.write_to_storage()
+        # Update the memories and session summary in the background, after the response is returned
+        if update_in_background:
+            self.defer_memory_update(memory_inputs)
 
         # 8. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=message)
@@ -2111,8 +2399,8 @@ class Agent(BaseModel):
         self.update_model()
         self.run_response.model = self.model.id if self.model is not None else None
 
-        # 2. Read existing session from storage
-        self.read_from_storage()
+        # 2. Read existing session from storage, with the user memories relevant to this message
+        await self.aread_from_storage(memory_query=get_text_from_message(message) if message else None)
 
         # 3. Prepare messages for this run
         system_message, user_messages, messages_for_model = self.get_messages_for_run(
@@ -2204,7 +2492,10 @@ class Agent(BaseModel):
             run_messages.insert(0, system_message)
         # Update the run_response
         self.run_response.messages = run_messages
-        self.run_response.metrics = self._aggregate_metrics_from_run_messages(run_messages)
+        self.run_response.metrics = {
+            **(self.run_response.metrics or {}),
+            **self._aggregate_metrics_from_run_messages(run_messages),
+        }
         # Update the run_response content if streaming as run_response will only contain the last chunk
         if self.stream:
             self.run_response.content = model_response.content
@@ -2226,6 +2517,8 @@ class Agent(BaseModel):
 
         # Create an AgentRun object to add to memory
         agent_run = AgentRun(response=self.run_response)
+        # User messages to create memories from
+        memory_inputs: List[str] = []
         if message is not None:
             user_message_for_memory: Optional[Message] = None
             if isinstance(message, str):
@@ -2236,7 +2529,7 @@ class Agent(BaseModel):
                 agent_run.message = user_message_for_memory
                 # Update the memories with the user message if needed
                 if self.memory.create_user_memories and self.memory.update_user_memories_after_run:
-                    await self.memory.aupdate_memory(input=user_message_for_memory.get_content_string())
+                    memory_inputs.append(user_message_for_memory.get_content_string())
         elif messages is not None and len(messages) > 0:
             for _m in messages:
                 _um = None
@@ -2255,18 +2548,27 @@ class Agent(BaseModel):
                         agent_run.messages = []
                     agent_run.messages.append(_um)
                     if self.memory.create_user_memories and self.memory.update_user_memories_after_run:
-                        await self.memory.aupdate_memory(input=_um.get_content_string())
+                        memory_inputs.append(_um.get_content_string())
                 else:
                     logger.warning("Unable to add message to memory")
         # Add AgentRun to memory
         self.memory.add_run(agent_run)
 
-        # Update the session summary if needed
-        if self.memory.create_session_summary and self.memory.update_session_summary_after_run:
-            await self.memory.aupdate_summary()
+        update_summary = self.memory.create_session_summary and self.memory.update_session_summary_after_run
+        update_in_background = self.memory.update_in_background and (len(memory_inputs) > 0 or update_summary)
+        if not update_in_background:
+            # Update the memories with the user messages if needed
+            for memory_input in memory_inputs:
+                await self.memory.aupdate_memory(input=memory_input)
+            # Update the session summary if needed
+            if update_summary:
+                await self.memory.aupdate_summary()
 
         # 7. Save session to storage
-        self.write_to_storage()
+        await self.awrite_to_storage()
+        # Update the memories and session summary in the background, after the response is returned
+        if update_in_background:
+            self.defer_memory_update(memory_inputs)
 
         # 8. Save output to file if save_response_to_file is set
         self.save_run_response_to_file(message=message)
@@ -2415,6 +2717,18 @@ class Agent(BaseModel):
         # -*- Log Agent session
         self.log_agent_session()
 
+    async def arename_session(self, session_name: str) -> None:
+        """Rename the current session and save to storage without blocking the event loop"""
+
+        # -*- Read from storage
+        await self.aread_from_storage()
+        # -*- Rename session
+        self.session_name = session_name
+        # -*- Save to storage
+        await self.awrite_to_storage()
+        # -*- Log Agent session
+        await self.alog_agent_session()
+
     def generate_session_name(self) -> str:
         """Generate a name for the session using the first 6 messages from the memory"""
 
@@ -2477,6 +2791,15 @@ class Agent(BaseModel):
         # -*- Save to storage
         self.write_to_storage()
 
+    async def adelete_session(self, session_id: str):
+        """Delete the current session and save to storage without blocking the event loop"""
+        if self.storage is None:
+            return
+        # -*- Delete session
+        await self.storage.adelete_session(session_id=session_id)
+        # -*- Save to storage
+        await self.awrite_to_storage()
+
     ###########################################################################
     # Handle images and videos
     ###########################################################################
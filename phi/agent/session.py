@@ -1,4 +1,5 @@
-from typing import Optional, Any, Dict
+import json
+from typing import Optional, Any, Dict, List
 from pydantic import BaseModel, ConfigDict
 
 
@@ -50,3 +51,82 @@ class AgentSession(BaseModel):
 
     def telemetry_data(self) -> Dict[str, Any]:
         return self.model_dump(include={"model", "created_at", "updated_at"})
+
+
+# Number of runs searched for the first user message by backends that cannot search all runs in the database
+NUM_RUNS_FOR_TITLE = 3
+
+
+class AgentSessionSummary(BaseModel):
+    """Lightweight view of an AgentSession, used to list sessions without loading their memory"""
+
+    # Session UUID
+    session_id: str
+    # ID of the agent that this session is associated with
+    agent_id: Optional[str] = None
+    # ID of the user interacting with this agent
+    user_id: Optional[str] = None
+    # Name of the session, from the session data
+    session_name: Optional[str] = None
+    # The session name, or the first user message of the session
+    title: Optional[str] = None
+    # The Unix timestamp when this session was created
+    created_at: Optional[int] = None
+    # The Unix timestamp when this session was last updated
+    updated_at: Optional[int] = None
+
+    @staticmethod
+    def get_title(session_name: Optional[str], first_message: Optional[Dict[str, Any]]) -> str:
+        """Get the title from the session name or the first user message of the session."""
+        if session_name is not None:
+            return session_name
+        if first_message is None or first_message.get("role") != "user":
+            return "Unnamed session"
+        content = first_message.get("content")
+        if isinstance(content, list):
+            content = json.dumps(content)
+        return content if content else "No title"
+
+    @classmethod
+    def from_first_message(cls, first_message: Optional[Dict[str, Any]] = None, **kwargs: Any) -> "AgentSessionSummary":
+        summary = cls(**kwargs)
+        summary.title = cls.get_title(summary.session_name, first_message)
+        return summary
+
+    @staticmethod
+    def get_first_user_message(messages: List[Any]) -> Optional[Dict[str, Any]]:
+        """Get the first message with the user role, skipping runs without a message."""
+        for message in messages:
+            if isinstance(message, dict) and message.get("role") == "user":
+                return message
+        return None
+
+    @classmethod
+    def get_memory_title(cls, memory: Optional[Dict[str, Any]]) -> str:
+        """Get the title from the first user message in the memory, stored with the session on upsert."""
+        first_message: Optional[Dict[str, Any]] = None
+        if memory is not None:
+            runs = memory.get("runs") or memory.get("chats")
+            if isinstance(runs, list):
+                first_message = cls.get_first_user_message(
+                    [run.get("message") for run in runs if isinstance(run, dict)]
+                )
+        return cls.get_title(None, first_message)
+
+    @classmethod
+    def from_memory_title(cls, memory_title: str, **kwargs: Any) -> "AgentSessionSummary":
+        summary = cls(**kwargs)
+        summary.title = summary.session_name if summary.session_name is not None else memory_title
+        return summary
+
+    @classmethod
+    def from_session(cls, session: AgentSession) -> "AgentSessionSummary":
+        return cls.from_memory_title(
+            memory_title=cls.get_memory_title(session.memory),
+            session_id=session.session_id,
+            agent_id=session.agent_id,
+            user_id=session.user_id,
+            session_name=session.session_data.get("session_name") if session.session_data else None,
+            created_at=session.created_at,
+            updated_at=session.updated_at,
+        )
@@ -0,0 +1,261 @@
+import atexit
+import json
+import sys
+import time
+from pathlib import Path
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
+from pydantic import BaseModel
+
+from phi.utils.log import logger
+
+DropPolicy = Literal["drop_newest", "drop_oldest", "block"]
+
+
+class ExportEvent(BaseModel):
+    """An API call queued for export, e.g. an agent run or session to log"""
+
+    route: str
+    payload: Dict[str, Any]
+    created_at: float = 0.0
+
+
+class EventSink:
+    """Destination for exported events. Sinks are only used from the exporter thread."""
+
+    def export(self, events: List[ExportEvent]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class ApiSink(EventSink):
+    """Posts events to the phidata api, reusing one authenticated client for all events"""
+
+    def __init__(self):
+        self._client: Optional[Any] = None
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            from phi.api.api import api
+
+            self._client = api.AuthenticatedClient()
+        return self._client
+
+    def export(self, events: List[ExportEvent]) -> None:
+        # The api takes one event per request, the batch shares the client's connection
+        for event in events:
+            try:
+                self.client.post(event.route, json=event.payload)
+            except Exception as e:
+                logger.debug(f"Could not export event to {event.route}: {e}")
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+
+class StreamSink(EventSink):
+    """Writes events as JSON lines to a file, or to stdout if no path is given"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        self._file: Optional[Any] = None
+
+    def export(self, events: List[ExportEvent]) -> None:
+        if self._file is None:
+            if self.path is not None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            else:
+                self._file = sys.stdout
+        for event in events:
+            self._file.write(event.model_dump_json() + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None and self._file is not sys.stdout:
+            self._file.close()
+        self._file = None
+
+
+def get_sink(sink: str) -> EventSink:
+    """Create a sink from its name: "api", "stdout" or "file:<path>"."""
+    if sink == "api":
+        return ApiSink()
+    if sink == "stdout":
+        return StreamSink()
+    if sink.startswith("file:"):
+        return StreamSink(path=sink[len("file:") :])
+    raise ValueError(f"Unsupported sink: {sink}")
+
+
+class EventExporter:
+    """Exports events from a background thread so that logging runs and sessions does not delay responses.
+
+    Events are added to a bounded queue and exported in batches of up to `batch_size`, at least every
+    `flush_interval` seconds. When the queue is full, new events are dropped ("drop_newest"), the oldest queued
+    event is dropped ("drop_oldest", pending flushes are never dropped), or the caller waits for space ("block").
+    """
+
+    def __init__(
+        self,
+        sink: Optional[EventSink] = None,
+        max_queue_size: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+        drop_policy: DropPolicy = "drop_newest",
+    ):
+        self.sink: EventSink = sink or ApiSink()
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.drop_policy: DropPolicy = drop_policy
+        # Number of events dropped because the queue was full
+        self.dropped: int = 0
+
+        self._queue: "Queue[Tuple[Optional[ExportEvent], Optional[Event]]]" = Queue(maxsize=max_queue_size)
+        self._thread: Optional[Thread] = None
+        self._lock = Lock()
+        self._stopped: bool = False
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._worker, name="phi-exporter", daemon=True)
+                self._thread.start()
+
+    def submit(self, route: str, payload: Dict[str, Any]) -> bool:
+        """Queue an event for export. Returns False if the event was dropped."""
+        if self._stopped:
+            return False
+        self._ensure_thread()
+        item = (ExportEvent(route=route, payload=payload, created_at=time.time()), None)
+        if self.drop_policy == "block":
+            self._queue.put(item)
+            return True
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except Full:
+            pass
+        if self.drop_policy == "drop_oldest" and self._drop_oldest_event():
+            try:
+                self._queue.put_nowait(item)
+                return True
+            except Full:
+                pass
+        self.dropped += 1
+        logger.debug("Export queue is full, dropping event")
+        return False
+
+    def _drop_oldest_event(self) -> bool:
+        """Remove the oldest queued event, keeping flush requests so that their callers are still notified."""
+        with self._queue.mutex:
+            for i, (event, _) in enumerate(self._queue.queue):
+                if event is not None:
+                    del self._queue.queue[i]
+                    self._queue.not_full.notify()
+                    self.dropped += 1
+                    return True
+        return False
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until the events queued so far have been exported. Returns False on timeout."""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = Event()
+        try:
+            self._queue.put((None, done), timeout=timeout)
+        except Full:
+            return False
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: Optional[float] = 5.0) -> None:
+        """Export the queued events and stop the exporter thread."""
+        if self._stopped:
+            return
+        self.flush(timeout=timeout)
+        self._stopped = True
+        self.sink.close()
+
+    def _export(self, batch: List[ExportEvent]) -> None:
+        if len(batch) == 0:
+            return
+        try:
+            self.sink.export(batch)
+        except Exception as e:
+            logger.debug(f"Could not export {len(batch)} events: {e}")
+
+    def _worker(self) -> None:
+        batch: List[ExportEvent] = []
+        deadline = time.monotonic() + self.flush_interval
+        while not self._stopped:
+            try:
+                event, done = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except Empty:
+                event, done = None, None
+
+            if event is not None:
+                batch.append(event)
+            # Export when the batch is full, the flush interval passed or a flush was requested
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline or done is not None:
+                self._export(batch)
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+            if done is not None:
+                done.set()
+
+
+_exporter: Optional[EventExporter] = None
+_exporter_lock = Lock()
+
+
+def configure_exporter(
+    sink: Optional[str] = None,
+    max_queue_size: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    flush_interval: Optional[float] = None,
+    drop_policy: DropPolicy = "drop_newest",
+) -> EventExporter:
+    """Replace the process-wide exporter. Defaults are read from the phi cli settings (PHI_API_EXPORT_* env vars)."""
+    from phi.cli.settings import phi_cli_settings
+
+    global _exporter
+    with _exporter_lock:
+        if _exporter is not None:
+            _exporter.shutdown()
+        _exporter = EventExporter(
+            sink=get_sink(sink or phi_cli_settings.api_export_sink),
+            max_queue_size=max_queue_size or phi_cli_settings.api_export_queue_size,
+            batch_size=batch_size or phi_cli_settings.api_export_batch_size,
+            flush_interval=flush_interval or phi_cli_settings.api_export_flush_interval,
+            drop_policy=drop_policy,
+        )
+        return _exporter
+
+
+def get_exporter() -> EventExporter:
+    """Return the process-wide exporter, creating it on first use."""
+    if _exporter is None:
+        return configure_exporter()
+    return _exporter
+
+
+def export_event(route: str, payload: Dict[str, Any]) -> bool:
+    """Queue an api call to be made from the background exporter."""
+    return get_exporter().submit(route, json.loads(json.dumps(payload, default=str)))
+
+
+def _shutdown_exporter() -> None:
+    if _exporter is not None:
+        _exporter.shutdown()
+
+
+atexit.register(_shutdown_exporter)
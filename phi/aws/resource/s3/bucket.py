@@ -195,6 +195,8 @@ class S3Bucket(AwsResource):
                 S3Object(
                     bucket_name=bucket.name,
                     name=object_summary.key,
+                    e_tag=object_summary.e_tag,
+                    size=object_summary.size,
                 )
             )
         return all_objects
@@ -21,6 +21,9 @@ class S3Object(AwsResource):
     bucket_name: str
     # The Object’s key identifier. This must be set.
     name: str = Field(..., alias="key")
+    # The Object's ETag and size in bytes, set when the object is listed from a bucket
+    e_tag: Optional[str] = None
+    size: Optional[int] = None
 
     @property
     def uri(self) -> str:
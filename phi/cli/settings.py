@@ -26,6 +26,11 @@ class PhiCliSettings(BaseSettings):
     api_runtime: str = "prd"
     api_enabled: bool = True
     alpha_features: bool = False
+    # Sink for the background exporter that logs agent runs and sessions: "api", "stdout" or "file:<path>"
+    api_export_sink: str = "api"
+    api_export_queue_size: int = 1000
+    api_export_batch_size: int = 50
+    api_export_flush_interval: float = 1.0
     api_url: str = Field("https://api.phidata.com", validate_default=True)
     signin_url: str = Field("https://phidata.app/login", validate_default=True)
     playground_url: str = Field("https://phidata.app/playground", validate_default=True)
@@ -3,6 +3,7 @@ from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, ConfigDict
 
 from phi.embedder import Embedder
+from phi.utils.log import logger
 
 
 class Document(BaseModel):
@@ -28,6 +29,64 @@ class Document(BaseModel):
 
         self.embedding, self.usage = _embedder.get_embedding_and_usage(self.content)
 
+    @classmethod
+    def embed_documents(
+        cls,
+        documents: List["Document"],
+        embedder: Optional[Embedder] = None,
+        batch_size: int = 100,
+        raise_errors: bool = False,
+    ) -> List["Document"]:
+        """Embed documents in batches, making one call to the embedder per batch.
+
+        The usage returned by the embedder covers the whole batch, so it is recorded once, on the first document.
+        If a batch fails, its documents are embedded one at a time, so one bad document does not fail the others.
+        Documents already embedded by the same embedder, e.g. by the IngestionPipeline, are not embedded again.
+
+        Args:
+            documents (List[Document]): The documents to embed.
+            embedder (Optional[Embedder]): The embedder to use, defaults to the embedder of the first document.
+            batch_size (int): The number of documents embedded with one call to the embedder.
+            raise_errors (bool): Raise the error of a failed batch instead of embedding its documents one at a time.
+
+        Returns:
+            List[Document]: The documents with an embedding. Documents that could not be embedded are logged and left out.
+        """
+        if not documents:
+            return []
+
+        _embedder = embedder or documents[0].embedder
+        if _embedder is None:
+            raise ValueError("No embedder provided")
+
+        documents_to_embed = [
+            document for document in documents if document.embedding is None or document.embedder is not _embedder
+        ]
+        for i in range(0, len(documents_to_embed), batch_size):
+            batch = documents_to_embed[i : i + batch_size]
+            try:
+                embeddings, usage = _embedder.get_embeddings_and_usage([document.content for document in batch])
+                if len(embeddings) != len(batch):
+                    raise ValueError(f"Expected {len(batch)} embeddings, got {len(embeddings)}")
+            except Exception as e:
+                if raise_errors:
+                    raise
+                logger.warning(f"Error embedding a batch of {len(batch)} documents, embedding them one at a time: {e}")
+                for document in batch:
+                    try:
+                        document.embed(embedder=_embedder)
+                        document.embedder = _embedder
+                    except Exception as e:
+                        logger.error(f"Error embedding document: {document.name or document.id}: {e}")
+                        document.embedding = None
+                continue
+
+            for j, (document, embedding) in enumerate(zip(batch, embeddings)):
+                document.embedder = _embedder
+                document.embedding = embedding
+                document.usage = usage if j == 0 else None
+        return [document for document in documents if document.embedding is not None]
+
     def to_dict(self) -> Dict[str, Any]:
         """Returns a dictionary representation of the document"""
 
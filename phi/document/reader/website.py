@@ -1,11 +1,16 @@
+import asyncio
 import time
 import random
-from typing import Set, Dict, List, Tuple
+from collections import deque
+from typing import AsyncIterator, Deque, Set, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
+from urllib.robotparser import RobotFileParser
+from xml.etree import ElementTree
 
 from phi.document.base import Document
 from phi.document.reader.base import Reader
 from phi.utils.log import logger
+from phi.utils.threads import run_in_thread
 
 import httpx
 
@@ -21,8 +26,30 @@ class WebsiteReader(Reader):
     max_depth: int = 3
     max_links: int = 10
 
+    # Crawl pages concurrently with an async client, chunking each page as it arrives
+    use_async: bool = False
+    # Maximum number of pages fetched at the same time when use_async is True
+    max_concurrency: int = 10
+    # Minimum number of seconds between two requests to the same host when use_async is True.
+    # A larger Crawl-delay in the site's robots.txt takes precedence.
+    host_delay: float = 0.5
+    # Skip urls disallowed by the site's robots.txt when use_async is True
+    respect_robots_txt: bool = True
+    # Add the urls in the site's sitemap to the crawl when use_async is True
+    use_sitemap: bool = True
+    # Maximum number of crawled pages waiting to be consumed when use_async is True.
+    # The crawl keeps fetching while the pages are consumed, and pauses when this many are waiting.
+    max_queued_pages: int = 10
+    # Seconds to wait for a page
+    timeout: float = 10
+    user_agent: str = "phidata-website-reader"
+
     _visited: Set[str] = set()
-    _urls_to_crawl: List[Tuple[str, int]] = []
+    _urls_to_crawl: Deque[Tuple[str, int]] = deque()
+    _queued_urls: Set[str] = set()
+    # Validators and results of pages crawled by the async crawler: url -> (etag, last_modified, content, links).
+    # Pages that did not change are not downloaded and parsed again when the site is crawled again.
+    _page_cache: Dict[str, Tuple[Optional[str], Optional[str], str, List[str]]] = {}
 
     def delay(self, min_seconds=1, max_seconds=3):
         """
@@ -65,6 +92,25 @@ class WebsiteReader(Reader):
 
         return ""
 
+    def _get_links(self, soup: BeautifulSoup, current_url: str, primary_domain: str) -> List[str]:
+        """
+        Returns the urls linked from a page that belong to the primary domain and are not files.
+
+        :param soup: The BeautifulSoup object of the page.
+        :param current_url: The URL of the page.
+        :param primary_domain: The primary domain of the crawl.
+        :return: The linked urls.
+        """
+        links: List[str] = []
+        for link in soup.find_all("a", href=True):
+            full_url = urljoin(current_url, link["href"])
+            parsed_url = urlparse(full_url)
+            if parsed_url.netloc.endswith(primary_domain) and not any(
+                parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
+            ):
+                links.append(full_url)
+        return links
+
     def crawl(self, url: str, starting_depth: int = 1) -> Dict[str, str]:
         """
         Crawls a website and returns a dictionary of URLs and their corresponding content.
@@ -88,9 +134,11 @@ class WebsiteReader(Reader):
         primary_domain = self._get_primary_domain(url)
         # Add starting URL with its depth to the global list
         self._urls_to_crawl.append((url, starting_depth))
+        self._queued_urls.add(url)
         while self._urls_to_crawl:
             # Unpack URL and depth from the global list
-            current_url, current_depth = self._urls_to_crawl.pop(0)
+            current_url, current_depth = self._urls_to_crawl.popleft()
+            self._queued_urls.discard(current_url)
 
             # Skip if
             # - URL is already visited
@@ -120,14 +168,10 @@ class WebsiteReader(Reader):
                     num_links += 1
 
                 # Add found URLs to the global list, with incremented depth
-                for link in soup.find_all("a", href=True):
-                    full_url = urljoin(current_url, link["href"])
-                    parsed_url = urlparse(full_url)
-                    if parsed_url.netloc.endswith(primary_domain) and not any(
-                        parsed_url.path.endswith(ext) for ext in [".pdf", ".jpg", ".png"]
-                    ):
-                        if full_url not in self._visited and (full_url, current_depth + 1) not in self._urls_to_crawl:
-                            self._urls_to_crawl.append((full_url, current_depth + 1))
+                for full_url in self._get_links(soup, current_url, primary_domain):
+                    if full_url not in self._visited and full_url not in self._queued_urls:
+                        self._urls_to_crawl.append((full_url, current_depth + 1))
+                        self._queued_urls.add(full_url)
 
             except Exception as e:
                 logger.debug(f"Failed to crawl: {current_url}: {e}")
@@ -135,36 +179,277 @@ class WebsiteReader(Reader):
 
         return crawler_result
 
+    async def _await_host_delay(self, host: str, next_request_times: Dict[str, float], delay: float) -> None:
+        """
+        Waits until the next request to the host is allowed.
+
+        :param host: The host to request.
+        :param next_request_times: The time at which the next request to each host is allowed.
+        :param delay: The minimum number of seconds between two requests to the host.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        request_time = max(now, next_request_times.get(host, now))
+        next_request_times[host] = request_time + delay
+        if request_time > now:
+            await asyncio.sleep(request_time - now)
+
+    async def _aget_robots(self, client: httpx.AsyncClient, url: str) -> Optional[RobotFileParser]:
+        """
+        Fetches and parses the robots.txt of the site.
+
+        :param client: The client to fetch robots.txt with.
+        :param url: A URL of the site.
+        :return: The parsed robots.txt, or None if the site does not have one.
+        """
+        parsed_url = urlparse(url)
+        robots_url = f"{parsed_url.scheme}://{parsed_url.netloc}/robots.txt"
+        try:
+            response = await client.get(robots_url)
+        except Exception as e:
+            logger.debug(f"Failed to fetch {robots_url}: {e}")
+            return None
+        if response.status_code != 200:
+            return None
+        robots = RobotFileParser(robots_url)
+        robots.parse(response.text.splitlines())
+        return robots
+
+    async def _aget_sitemap_urls(
+        self, client: httpx.AsyncClient, url: str, robots: Optional[RobotFileParser], primary_domain: str
+    ) -> List[str]:
+        """
+        Returns the page urls listed in the site's sitemaps, following one level of sitemap indexes.
+
+        :param client: The client to fetch the sitemaps with.
+        :param url: A URL of the site.
+        :param robots: The site's robots.txt, which may list its sitemaps.
+        :param primary_domain: The primary domain of the crawl.
+        :return: The page urls.
+        """
+        parsed_url = urlparse(url)
+        sitemaps: List[str] = list((robots.site_maps() if robots is not None else None) or [])
+        if len(sitemaps) == 0:
+            sitemaps = [f"{parsed_url.scheme}://{parsed_url.netloc}/sitemap.xml"]
+
+        page_urls: List[str] = []
+        checked_sitemaps: Set[str] = set()
+        while sitemaps and len(page_urls) < self.max_links:
+            sitemap_url = sitemaps.pop(0)
+            if sitemap_url in checked_sitemaps:
+                continue
+            checked_sitemaps.add(sitemap_url)
+            try:
+                response = await client.get(sitemap_url)
+                if response.status_code != 200:
+                    continue
+                root = ElementTree.fromstring(response.content)
+            except Exception as e:
+                logger.debug(f"Failed to read sitemap {sitemap_url}: {e}")
+                continue
+            for element in root.iter():
+                if not element.tag.endswith("loc") or not element.text:
+                    continue
+                loc = element.text.strip()
+                if root.tag.endswith("sitemapindex"):
+                    sitemaps.append(loc)
+                elif urlparse(loc).netloc.endswith(primary_domain):
+                    page_urls.append(loc)
+        return page_urls[: self.max_links]
+
+    def _parse_page(self, url: str, content: bytes, primary_domain: str) -> Tuple[str, List[str]]:
+        soup = BeautifulSoup(content, "html.parser")
+        return self._extract_main_content(soup), self._get_links(soup, url, primary_domain)
+
+    async def _afetch_page(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        primary_domain: str,
+        next_request_times: Dict[str, float],
+        delay: float,
+    ) -> Tuple[str, List[str]]:
+        """
+        Fetches a page and returns its main content and links.
+
+        Pages crawled before are requested with their ETag and Last-Modified validators,
+        and are not downloaded and parsed again if they did not change.
+        """
+        await self._await_host_delay(urlparse(url).netloc, next_request_times, delay)
+
+        headers: Dict[str, str] = {}
+        cached = self._page_cache.get(url)
+        if cached is not None:
+            etag, last_modified, _, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        logger.debug(f"Crawling: {url}")
+        response = await client.get(url, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            logger.debug(f"Not modified: {url}")
+            return cached[2], cached[3]
+        response.raise_for_status()
+        if "html" not in response.headers.get("content-type", "text/html"):
+            return "", []
+
+        # Parse in a thread so pages are fetched while others are parsed
+        main_content, links = await run_in_thread(self._parse_page, url, response.content, primary_domain)
+        etag, last_modified = response.headers.get("etag"), response.headers.get("last-modified")
+        if etag or last_modified:
+            self._page_cache[url] = (etag, last_modified, main_content, links)
+        return main_content, links
+
+    async def acrawl(self, url: str, starting_depth: int = 1) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Crawls a website concurrently and yields each URL with its main content as soon as it is fetched.
+
+        Up to `max_concurrency` pages are fetched at the same time with a shared client, and requests to
+        the same host are spaced by `host_delay`. The crawl respects robots.txt and is seeded with the urls
+        in the site's sitemap, if enabled. Like `crawl`, it stops after `max_links` pages with content
+        and does not go deeper than `max_depth`.
+
+        The crawl runs in its own task and queues up to `max_queued_pages` pages,
+        so pages are fetched while the caller processes the pages yielded before.
+
+        Parameters:
+        - url (str): The starting URL to begin the crawl.
+        - starting_depth (int, optional): The starting depth level for the crawl. Defaults to 1.
+        """
+        pages: "asyncio.Queue[Tuple[str, str]]" = asyncio.Queue(maxsize=max(self.max_queued_pages, 1))
+
+        async def crawl_to_queue() -> None:
+            async for page in self._acrawl_pages(url, starting_depth):
+                await pages.put(page)
+
+        crawler = asyncio.ensure_future(crawl_to_queue())
+        next_page: Optional["asyncio.Future[Tuple[str, str]]"] = None
+        try:
+            while True:
+                next_page = asyncio.ensure_future(pages.get())
+                await asyncio.wait({next_page, crawler}, return_when=asyncio.FIRST_COMPLETED)
+                if next_page.done():
+                    yield next_page.result()
+                    continue
+                next_page.cancel()
+                # The crawl finished, yield the pages still in the queue and raise its errors
+                while not pages.empty():
+                    yield pages.get_nowait()
+                crawler.result()
+                return
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+            crawler.cancel()
+
+    async def _acrawl_pages(self, url: str, starting_depth: int) -> AsyncIterator[Tuple[str, str]]:
+        """Crawls a website and yields each URL with its main content, see `acrawl`"""
+        primary_domain = self._get_primary_domain(url)
+        frontier: Deque[Tuple[str, int]] = deque([(url, starting_depth)])
+        seen: Set[str] = {url}
+        next_request_times: Dict[str, float] = {}
+        num_links = 0
+
+        async with httpx.AsyncClient(
+            timeout=self.timeout, follow_redirects=True, headers={"User-Agent": self.user_agent}
+        ) as client:
+            robots = await self._aget_robots(client, url) if self.respect_robots_txt else None
+            delay = self.host_delay
+            if robots is not None:
+                delay = max(delay, float(robots.crawl_delay(self.user_agent) or 0))
+            if self.use_sitemap:
+                for sitemap_url in await self._aget_sitemap_urls(client, url, robots, primary_domain):
+                    if sitemap_url not in seen:
+                        seen.add(sitemap_url)
+                        frontier.append((sitemap_url, starting_depth + 1))
+
+            in_flight: Dict["asyncio.Task[Tuple[str, List[str]]]", Tuple[str, int]] = {}
+            try:
+                while (frontier or in_flight) and num_links < self.max_links:
+                    while frontier and len(in_flight) < self.max_concurrency:
+                        current_url, current_depth = frontier.popleft()
+                        if current_depth > self.max_depth:
+                            continue
+                        if robots is not None and not robots.can_fetch(self.user_agent, current_url):
+                            logger.debug(f"Disallowed by robots.txt: {current_url}")
+                            continue
+                        task = asyncio.ensure_future(
+                            self._afetch_page(client, current_url, primary_domain, next_request_times, delay)
+                        )
+                        in_flight[task] = (current_url, current_depth)
+                    if not in_flight:
+                        break
+
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        current_url, current_depth = in_flight.pop(task)
+                        try:
+                            main_content, links = task.result()
+                        except Exception as e:
+                            logger.debug(f"Failed to crawl: {current_url}: {e}")
+                            continue
+                        for link in links:
+                            if link not in seen:
+                                seen.add(link)
+                                frontier.append((link, current_depth + 1))
+                        if main_content and num_links < self.max_links:
+                            num_links += 1
+                            yield current_url, main_content
+            finally:
+                for task in in_flight:
+                    task.cancel()
+
+    def _get_documents(self, url: str, crawled_url: str, crawled_content: str) -> List[Document]:
+        document = Document(name=url, id=str(crawled_url), meta_data={"url": str(crawled_url)}, content=crawled_content)
+        if self.chunk:
+            return self.chunk_document(document)
+        return [document]
+
+    async def astream(self, url: str) -> AsyncIterator[List[Document]]:
+        """
+        Crawls a website concurrently and yields the documents of each page as soon as the page is fetched.
+
+        :param url: The URL of the website to read.
+        :return: An async iterator of the documents of each page.
+        """
+        logger.debug(f"Reading: {url}")
+        async for crawled_url, crawled_content in self.acrawl(url):
+            yield self._get_documents(url, crawled_url, crawled_content)
+
+    async def aread(self, url: str) -> List[Document]:
+        """
+        Reads a website with the concurrent crawler and returns a list of documents.
+
+        :param url: The URL of the website to read.
+        :return: A list of documents.
+        """
+        documents: List[Document] = []
+        async for page_documents in self.astream(url):
+            documents.extend(page_documents)
+        return documents
+
     def read(self, url: str) -> List[Document]:
         """
         Reads a website and returns a list of documents.
 
         This function first converts the website into a dictionary of URLs and their corresponding content.
         Then iterates through the dictionary and returns chunks of content.
+        If use_async is True, the website is crawled concurrently with `aread`.
 
         :param url: The URL of the website to read.
         :return: A list of documents.
         """
 
+        if self.use_async:
+            from phi.utils.threads import run_coroutine_sync
+
+            return run_coroutine_sync(self.aread(url))
+
         logger.debug(f"Reading: {url}")
         crawler_result = self.crawl(url)
         documents = []
         for crawled_url, crawled_content in crawler_result.items():
-            if self.chunk:
-                documents.extend(
-                    self.chunk_document(
-                        Document(
-                            name=url, id=str(crawled_url), meta_data={"url": str(crawled_url)}, content=crawled_content
-                        )
-                    )
-                )
-            else:
-                documents.append(
-                    Document(
-                        name=url,
-                        id=str(crawled_url),
-                        meta_data={"url": str(crawled_url)},
-                        content=crawled_content,
-                    )
-                )
+            documents.extend(self._get_documents(url, crawled_url, crawled_content))
         return documents
@@ -1,9 +1,10 @@
 from os import getenv
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any, Union
 from typing_extensions import Literal
 
 from phi.embedder.base import Embedder
 from phi.utils.log import logger
+from phi.utils.client_pool import get_shared_client
 
 try:
     from openai import AzureOpenAI as AzureOpenAIClient
@@ -52,9 +53,9 @@ class AzureOpenAIEmbedder(Embedder):
             _client_params["azure_ad_token"] = self.azure_ad_token
         if self.azure_ad_token_provider:
             _client_params["azure_ad_token_provider"] = self.azure_ad_token_provider
-        return AzureOpenAIClient(**_client_params)
+        return get_shared_client(AzureOpenAIClient, _client_params, http_client=True)
 
-    def _response(self, text: str) -> CreateEmbeddingResponse:
+    def _response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.model,
@@ -83,3 +84,14 @@ class AzureOpenAIEmbedder(Embedder):
         embedding = response.data[0].embedding
         usage = response.usage
         return embedding, usage.model_dump()
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        if not texts:
+            return [], None
+        response: CreateEmbeddingResponse = self._response(text=texts)
+
+        embeddings = [data.embedding for data in sorted(response.data, key=lambda d: d.index)]
+        usage = response.usage
+        if usage:
+            return embeddings, usage.model_dump()
+        return embeddings, None
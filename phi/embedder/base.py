@@ -15,3 +15,25 @@ class Embedder(BaseModel):
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         raise NotImplementedError
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self.get_embeddings_and_usage(texts)[0]
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        """Embed a batch of texts, returning one embedding per text and the usage for the whole batch.
+
+        Embedders that support batched requests should override this method.
+        The default implementation embeds each text individually and sums the numeric usage values.
+        """
+        embeddings: List[List[float]] = []
+        usage: Optional[Dict] = None
+        for text in texts:
+            embedding, text_usage = self.get_embedding_and_usage(text)
+            embeddings.append(embedding)
+            if text_usage:
+                if usage is None:
+                    usage = {}
+                for key, value in text_usage.items():
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        usage[key] = usage.get(key, 0) + value
+        return embeddings, usage
@@ -2,6 +2,7 @@ from typing import Optional, Dict, List, Tuple, Any, Union
 
 from phi.embedder.base import Embedder
 from phi.utils.log import logger
+from phi.utils.client_pool import get_shared_client
 
 try:
     from cohere import Client as CohereClient
@@ -26,9 +27,12 @@ class CohereEmbedder(Embedder):
         client_params: Dict[str, Any] = {}
         if self.api_key:
             client_params["api_key"] = self.api_key
-        return CohereClient(**client_params)
+        return get_shared_client(CohereClient, client_params)
 
     def response(self, text: str) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
+        return self._embed(texts=[text])
+
+    def _embed(self, texts: List[str]) -> Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse]:
         request_params: Dict[str, Any] = {}
 
         if self.model:
@@ -39,7 +43,7 @@ class CohereEmbedder(Embedder):
             request_params["embedding_types"] = self.embedding_types
         if self.request_params:
             request_params.update(self.request_params)
-        return self.client.embed(texts=[text], **request_params)
+        return self.client.embed(texts=texts, **request_params)
 
     def get_embedding(self, text: str) -> List[float]:
         response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self.response(text=text)
@@ -68,3 +72,19 @@ class CohereEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict[str, Any]]]:
+        if not texts:
+            return [], None
+        response: Union[EmbeddingsFloatsEmbedResponse, EmbeddingsByTypeEmbedResponse] = self._embed(texts=texts)
+
+        embeddings: List[List[float]] = []
+        if isinstance(response, EmbeddingsFloatsEmbedResponse):
+            embeddings = list(response.embeddings)
+        elif isinstance(response, EmbeddingsByTypeEmbedResponse):
+            embeddings = list(response.embeddings.float_) if response.embeddings.float_ else [[] for _ in texts]
+
+        usage = response.meta.billed_units if response.meta else None
+        if usage:
+            return embeddings, usage.model_dump()
+        return embeddings, None
@@ -14,14 +14,20 @@ class FastEmbedEmbedder(Embedder):
 
     model: str = "BAAI/bge-small-en-v1.5"
     dimensions: int = 384
+    batch_size: int = 256
+    fastembed_client: Optional[TextEmbedding] = None
 
-    def get_embedding(self, text: str) -> List[float]:
-        model = TextEmbedding(model_name=self.model)
-        embeddings = model.embed(text)
-        embedding_list = list(embeddings)
+    @property
+    def client(self) -> TextEmbedding:
+        # Loading the model is expensive, so it is done once and reused for every call
+        if self.fastembed_client is None:
+            self.fastembed_client = TextEmbedding(model_name=self.model)
+        return self.fastembed_client
 
+    def get_embedding(self, text: str) -> List[float]:
         try:
-            return embedding_list
+            embeddings = list(self.client.embed([text]))
+            return embeddings[0].tolist()
         except Exception as e:
             logger.warning(e)
             return []
@@ -32,3 +38,14 @@ class FastEmbedEmbedder(Embedder):
         usage = None
 
         return embedding, usage
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        if not texts:
+            return [], None
+        try:
+            embeddings = [embedding.tolist() for embedding in self.client.embed(texts, batch_size=self.batch_size)]
+        except Exception as e:
+            logger.warning(e)
+            embeddings = [[] for _ in texts]
+        # Currently, FastEmbed does not provide usage information
+        return embeddings, None
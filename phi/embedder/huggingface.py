@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from phi.embedder.base import Embedder
 from phi.utils.log import logger
+from phi.utils.client_pool import get_shared_client
 
 try:
     from huggingface_hub import InferenceClient, SentenceSimilarityInput
@@ -29,7 +30,7 @@ class HuggingfaceCustomEmbedder(Embedder):
             _client_params["api_key"] = self.api_key
         if self.client_params:
             _client_params.update(self.client_params)
-        return InferenceClient(**_client_params)
+        return get_shared_client(InferenceClient, _client_params)
 
     def _response(self, text: str):
         _request_params: SentenceSimilarityInput = {
@@ -1,8 +1,9 @@
 from os import getenv
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any, Union
 
 from phi.embedder.base import Embedder
 from phi.utils.log import logger
+from phi.utils.client_pool import get_shared_client
 
 try:
     from mistralai import Mistral
@@ -41,9 +42,9 @@ class MistralEmbedder(Embedder):
             _client_params["timeout"] = self.timeout
         if self.client_params:
             _client_params.update(self.client_params)
-        return Mistral(**_client_params)
+        return get_shared_client(Mistral, _client_params)
 
-    def _response(self, text: str) -> EmbeddingResponse:
+    def _response(self, text: Union[str, List[str]]) -> EmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "inputs": text,
             "model": self.model,
@@ -66,3 +67,12 @@ class MistralEmbedder(Embedder):
         embedding = response.data[0].embedding
         usage = response.usage
         return embedding, usage.model_dump()
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        if not texts:
+            return [], None
+        response: EmbeddingResponse = self._response(text=texts)
+
+        embeddings = [data.embedding or [] for data in response.data]
+        usage = response.usage
+        return embeddings, usage.model_dump() if usage else None
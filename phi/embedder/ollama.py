@@ -2,6 +2,7 @@ from typing import Optional, Dict, List, Tuple, Any
 
 from phi.embedder.base import Embedder
 from phi.utils.log import logger
+from phi.utils.client_pool import get_shared_client
 
 try:
     from ollama import Client as OllamaClient
@@ -30,7 +31,7 @@ class OllamaEmbedder(Embedder):
             _ollama_params["timeout"] = self.timeout
         if self.client_kwargs:
             _ollama_params.update(self.client_kwargs)
-        return OllamaClient(**_ollama_params)
+        return get_shared_client(OllamaClient, _ollama_params)
 
     def _response(self, text: str) -> Dict[str, Any]:
         kwargs: Dict[str, Any] = {}
@@ -54,3 +55,24 @@ class OllamaEmbedder(Embedder):
         usage = None
 
         return embedding, usage
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        if not texts:
+            return [], None
+        # The batch `embed` endpoint is only available in newer versions of the ollama client
+        if not hasattr(self.client, "embed"):
+            return super().get_embeddings_and_usage(texts)
+
+        kwargs: Dict[str, Any] = {}
+        if self.options is not None:
+            kwargs["options"] = self.options
+        try:
+            response = self.client.embed(input=texts, model=self.model, **kwargs)  # type: ignore
+            embeddings = response.get("embeddings", []) if response is not None else []
+            if len(embeddings) != len(texts):
+                logger.warning(f"Expected {len(texts)} embeddings, got {len(embeddings)}")
+                return [[] for _ in texts], None
+            return [list(embedding) for embedding in embeddings], None
+        except Exception as e:
+            logger.warning(e)
+            return [[] for _ in texts], None
@@ -1,8 +1,9 @@
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, Dict, List, Tuple, Any, Union
 from typing_extensions import Literal
 
 from phi.embedder.base import Embedder
 from phi.utils.log import logger
+from phi.utils.client_pool import get_shared_client
 
 try:
     from openai import OpenAI as OpenAIClient
@@ -37,9 +38,9 @@ class OpenAIEmbedder(Embedder):
             _client_params["base_url"] = self.base_url
         if self.client_params:
             _client_params.update(self.client_params)
-        return OpenAIClient(**_client_params)
+        return get_shared_client(OpenAIClient, _client_params, http_client=True)
 
-    def response(self, text: str) -> CreateEmbeddingResponse:
+    def response(self, text: Union[str, List[str]]) -> CreateEmbeddingResponse:
         _request_params: Dict[str, Any] = {
             "input": text,
             "model": self.model,
@@ -69,3 +70,14 @@ class OpenAIEmbedder(Embedder):
         if usage:
             return embedding, usage.model_dump()
         return embedding, None
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        if not texts:
+            return [], None
+        response: CreateEmbeddingResponse = self.response(text=texts)
+
+        embeddings = [data.embedding for data in sorted(response.data, key=lambda d: d.index)]
+        usage = response.usage
+        if usage:
+            return embeddings, usage.model_dump()
+        return embeddings, None
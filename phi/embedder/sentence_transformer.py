@@ -21,16 +21,33 @@ except ImportError:
 
 class SentenceTransformerEmbedder(Embedder):
     model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    batch_size: int = 32
     sentence_transformer_client: Optional[SentenceTransformer] = None
 
+    @property
+    def client(self) -> SentenceTransformer:
+        # Loading the model is expensive, so it is done once and reused for every call
+        if self.sentence_transformer_client is None:
+            self.sentence_transformer_client = SentenceTransformer(model_name_or_path=self.model)
+        return self.sentence_transformer_client
+
     def get_embedding(self, text: Union[str, List[str]]) -> List[float]:
-        model = SentenceTransformer(model_name_or_path=self.model)
-        embedding = model.encode(text)
+        embedding = self.client.encode(text)
         try:
-            return embedding  # type: ignore
+            return embedding.tolist()  # type: ignore
         except Exception as e:
             logger.warning(e)
             return []
 
     def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
         return self.get_embedding(text=text), None
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        if not texts:
+            return [], None
+        try:
+            embeddings = self.client.encode(texts, batch_size=self.batch_size)
+            return [embedding.tolist() for embedding in embeddings], None
+        except Exception as e:
+            logger.warning(e)
+            return [[] for _ in texts], None
@@ -2,6 +2,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from phi.embedder.base import Embedder
 from phi.utils.log import logger
+from phi.utils.client_pool import get_shared_client
 
 try:
     from voyageai import Client
@@ -35,11 +36,14 @@ class VoyageAIEmbedder(Embedder):
             _client_params["timeout"] = self.timeout
         if self.client_params:
             _client_params.update(self.client_params)
-        return Client(**_client_params)
+        return get_shared_client(Client, _client_params)
 
     def _response(self, text: str) -> EmbeddingsObject:
+        return self._embed(texts=[text])
+
+    def _embed(self, texts: List[str]) -> EmbeddingsObject:
         _request_params: Dict[str, Any] = {
-            "texts": [text],
+            "texts": texts,
             "model": self.model,
         }
         if self.request_params:
@@ -60,3 +64,12 @@ class VoyageAIEmbedder(Embedder):
         embedding = response.embeddings[0]
         usage = {"total_tokens": response.total_tokens}
         return embedding, usage
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        if not texts:
+            return [], None
+        response: EmbeddingsObject = self._embed(texts=texts)
+
+        embeddings = list(response.embeddings)
+        usage = {"total_tokens": response.total_tokens}
+        return embeddings, usage
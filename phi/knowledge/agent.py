@@ -1,4 +1,4 @@
-from typing import List, Optional, Iterator, Dict, Any
+from typing import List, Optional, Iterator, Dict, Any, Set, Union
 
 from pydantic import ConfigDict, Field, model_validator
 
@@ -7,6 +7,8 @@ from phi.document.reader.base import Reader
 from phi.document.chunking.strategy import ChunkingStrategy
 from phi.document.chunking.fixed import FixedSizeChunking
 from phi.knowledge.base import AssistantKnowledge
+from phi.knowledge.manifest import DocumentSource, KnowledgeManifest
+from phi.knowledge.pipeline import DocumentReader, IngestionPipeline
 from phi.vectordb import VectorDb
 from phi.utils.log import logger
 
@@ -26,6 +28,11 @@ class AgentKnowledge(AssistantKnowledge):
     num_documents: int = 5
     # Number of documents to optimize the vector db on
     optimize_on: Optional[int] = 1000
+    # Load documents with a pipeline that reads, embeds and writes documents concurrently
+    pipeline: Optional[IngestionPipeline] = None
+    # Manifest of the loaded sources. If provided, load() only reads new and changed sources
+    # and deletes the documents of changed and removed sources.
+    manifest: Optional[KnowledgeManifest] = None
 
     chunking_strategy: ChunkingStrategy = Field(default_factory=FixedSizeChunking)
 
@@ -44,8 +51,28 @@ class AgentKnowledge(AssistantKnowledge):
         """
         raise NotImplementedError
 
+    @property
+    def document_readers(self) -> Iterator[Union[List[Document], DocumentReader]]:
+        """Iterator that yields a function per source (e.g. a file or url) that reads the source into a list of documents.
+        The IngestionPipeline runs these functions in parallel.
+
+        Knowledge bases that do not read their sources separately yield the lists of documents from document_lists.
+        """
+        yield from self.document_lists
+
+    @property
+    def document_sources(self) -> Optional[Iterator[DocumentSource]]:
+        """Iterator that yields a DocumentSource per source, with the metadata used to detect changed sources.
+        Returns None for knowledge bases whose sources cannot be checked for changes.
+        """
+        return None
+
     def search(
-        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        num_documents: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = False,
     ) -> List[Document]:
         """Returns relevant documents matching a query"""
         try:
@@ -55,7 +82,9 @@ class AgentKnowledge(AssistantKnowledge):
 
             _num_documents = num_documents or self.num_documents
             logger.debug(f"Getting {_num_documents} relevant documents for query: {query}")
-            return self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            return self.vector_db.search(
+                query=query, limit=_num_documents, filters=filters, return_embeddings=return_embeddings
+            )
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
             return []
@@ -80,6 +109,10 @@ class AgentKnowledge(AssistantKnowledge):
             logger.warning("No vector db provided")
             return
 
+        # Sources in the manifest must be read again if the collection is recreated or was dropped
+        if self.manifest is not None and (recreate or not self.vector_db.exists()):
+            self.manifest.clear()
+
         if recreate:
             logger.info("Dropping collection")
             self.vector_db.drop()
@@ -88,22 +121,111 @@ class AgentKnowledge(AssistantKnowledge):
         self.vector_db.create()
 
         logger.info("Loading knowledge base")
-        num_documents = 0
+        if self.manifest is not None:
+            document_sources = self.document_sources
+            if document_sources is not None:
+                self.sync(
+                    document_sources=document_sources, upsert=upsert, skip_existing=skip_existing, filters=filters
+                )
+                return
+            logger.warning(f"{self.__class__.__name__} does not support a manifest, reading all sources")
+
+        if self.pipeline is not None:
+            self.pipeline.run(
+                vector_db=self.vector_db,
+                sources=self.document_readers,
+                upsert=upsert,
+                skip_existing=skip_existing,
+                filters=filters,
+            )
+            return
+
         for document_list in self.document_lists:
-            documents_to_load = document_list
-            # Upsert documents if upsert is True and vector db supports upsert
-            if upsert and self.vector_db.upsert_available():
-                self.vector_db.upsert(documents=documents_to_load, filters=filters)
-            # Insert documents
-            else:
-                # Filter out documents which already exist in the vector db
-                if skip_existing:
-                    documents_to_load = [
-                        document for document in document_list if not self.vector_db.doc_exists(document)
-                    ]
-                self.vector_db.insert(documents=documents_to_load, filters=filters)
-            num_documents += len(documents_to_load)
-            logger.info(f"Added {len(documents_to_load)} documents to knowledge base")
+            self._load_document_list(document_list, upsert=upsert, skip_existing=skip_existing, filters=filters)
+
+    def _load_document_list(
+        self, document_list: List[Document], upsert: bool, skip_existing: bool, filters: Optional[Dict[str, Any]]
+    ) -> None:
+        if self.vector_db is None:
+            return
+        documents_to_load = document_list
+        # Upsert documents if upsert is True and vector db supports upsert
+        if upsert and self.vector_db.upsert_available():
+            self.vector_db.upsert(documents=documents_to_load, filters=filters)
+        # Insert documents
+        else:
+            # Filter out documents which already exist in the vector db
+            if skip_existing:
+                documents_to_load = [
+                    document
+                    for document, exists in zip(document_list, self.vector_db.docs_exist(document_list))
+                    if not exists
+                ]
+            self.vector_db.insert(documents=documents_to_load, filters=filters)
+        logger.info(f"Added {len(documents_to_load)} documents to knowledge base")
+
+    def sync(
+        self,
+        document_sources: Iterator[DocumentSource],
+        upsert: bool = False,
+        skip_existing: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Load the new and changed sources to the vector db and delete the documents of changed and removed sources.
+
+        Sources that did not change since they were recorded in the manifest are not read.
+
+        Args:
+            document_sources (Iterator[DocumentSource]): All sources of the knowledge base.
+            upsert (bool): If True, upserts documents to the vector db. Defaults to False.
+            skip_existing (bool): If True, skips documents which already exist in the vector db when inserting. Defaults to True.
+            filters (Optional[Dict[str, Any]]): Filters to add to each row that can be used to limit results during querying. Defaults to None.
+        """
+        if self.vector_db is None or self.manifest is None:
+            return
+
+        manifest = self.manifest
+        keys: Set[str] = set()
+        # Changed sources, keyed by the id of their reader
+        changed_sources: Dict[int, DocumentSource] = {}
+        for source in document_sources:
+            keys.add(source.key)
+            if not manifest.is_unchanged(source):
+                changed_sources[id(source.read)] = source
+        # Content hashes of documents that may no longer be in any source
+        stale_hashes: List[str] = manifest.remove_missing(keys)
+        logger.info(f"{len(changed_sources)} of {len(keys)} sources are new or changed")
+
+        def on_read(reader: Union[List[Document], DocumentReader], documents: List[Document]) -> None:
+            stale_hashes.extend(manifest.update(changed_sources[id(reader)], documents))
+
+        if self.pipeline is not None:
+            self.pipeline.run(
+                vector_db=self.vector_db,
+                sources=[source.read for source in changed_sources.values()],
+                upsert=upsert,
+                skip_existing=skip_existing,
+                filters=filters,
+                on_read=on_read,
+            )
+        else:
+            for source in changed_sources.values():
+                documents = source.read()
+                self._load_document_list(documents, upsert=upsert, skip_existing=skip_existing, filters=filters)
+                on_read(source.read, documents)
+
+        # Delete the documents of changed and removed sources that no source contains anymore
+        hashes_to_delete = manifest.get_unreferenced(stale_hashes)
+        if len(hashes_to_delete) > 0:
+            try:
+                self.vector_db.delete_by_content_hash(hashes_to_delete)
+                logger.info(f"Deleted {len(hashes_to_delete)} documents from knowledge base")
+            except NotImplementedError:
+                logger.warning(
+                    f"{self.vector_db.__class__.__name__} does not support deleting documents, "
+                    f"{len(hashes_to_delete)} documents of changed or removed sources are kept"
+                )
+        manifest.write()
 
     def load_documents(
         self,
@@ -129,6 +251,17 @@ class AgentKnowledge(AssistantKnowledge):
         logger.debug("Creating collection")
         self.vector_db.create()
 
+        if self.pipeline is not None:
+            batch_size = self.pipeline.batch_size
+            self.pipeline.run(
+                vector_db=self.vector_db,
+                sources=[documents[i : i + batch_size] for i in range(0, len(documents), batch_size)],
+                upsert=upsert,
+                skip_existing=skip_existing,
+                filters=filters,
+            )
+            return
+
         # Upsert documents if upsert is True
         if upsert and self.vector_db.upsert_available():
             self.vector_db.upsert(documents=documents, filters=filters)
@@ -137,7 +270,7 @@ class AgentKnowledge(AssistantKnowledge):
 
         # Filter out documents which already exist in the vector db
         documents_to_load = (
-            [document for document in documents if not self.vector_db.doc_exists(document)]
+            [document for document, exists in zip(documents, self.vector_db.docs_exist(documents)) if not exists]
             if skip_existing
             else documents
         )
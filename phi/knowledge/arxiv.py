@@ -1,14 +1,26 @@
+from functools import partial
 from typing import Iterator, List
 
 from phi.document import Document
 from phi.document.reader.arxiv import ArxivReader
 from phi.knowledge.agent import AgentKnowledge
+from phi.knowledge.pipeline import DocumentReader
 
 
 class ArxivKnowledgeBase(AgentKnowledge):
     queries: List[str] = []
     reader: ArxivReader = ArxivReader()
 
+    @property
+    def document_readers(self) -> Iterator[DocumentReader]:
+        """Iterate over urls and yield a function that reads each one into a list of documents.
+
+        Returns:
+            Iterator[DocumentReader]: Iterator yielding a reader function per source
+        """
+        for _query in self.queries:
+            yield partial(self.reader.read, query=_query)
+
     @property
     def document_lists(self) -> Iterator[List[Document]]:
         """Iterate over urls and yield lists of documents.
@@ -17,6 +29,5 @@ class ArxivKnowledgeBase(AgentKnowledge):
         Returns:
             Iterator[List[Document]]: Iterator yielding list of documents
         """
-
-        for _query in self.queries:
-            yield self.reader.read(query=_query)
+        for read_documents in self.document_readers:
+            yield read_documents()
@@ -31,7 +31,11 @@ class AssistantKnowledge(BaseModel):
         raise NotImplementedError
 
     def search(
-        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        num_documents: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = False,
     ) -> List[Document]:
         """Returns relevant documents matching a query"""
         try:
@@ -41,7 +45,9 @@ class AssistantKnowledge(BaseModel):
 
             _num_documents = num_documents or self.num_documents
             logger.debug(f"Getting {_num_documents} relevant documents for query: {query}")
-            return self.vector_db.search(query=query, limit=_num_documents, filters=filters)
+            return self.vector_db.search(
+                query=query, limit=_num_documents, filters=filters, return_embeddings=return_embeddings
+            )
         except Exception as e:
             logger.error(f"Error searching for documents: {e}")
             return []
@@ -85,7 +91,9 @@ class AssistantKnowledge(BaseModel):
                 # Filter out documents which already exist in the vector db
                 if skip_existing:
                     documents_to_load = [
-                        document for document in document_list if not self.vector_db.doc_exists(document)
+                        document
+                        for document, exists in zip(document_list, self.vector_db.docs_exist(document_list))
+                        if not exists
                     ]
                 self.vector_db.insert(documents=documents_to_load, filters=filters)
             num_documents += len(documents_to_load)
@@ -123,7 +131,7 @@ class AssistantKnowledge(BaseModel):
 
         # Filter out documents which already exist in the vector db
         documents_to_load = (
-            [document for document in documents if not self.vector_db.doc_exists(document)]
+            [document for document, exists in zip(documents, self.vector_db.docs_exist(documents)) if not exists]
             if skip_existing
             else documents
         )
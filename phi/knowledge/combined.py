@@ -1,7 +1,9 @@
-from typing import List, Iterator
+from typing import List, Iterator, Optional, Union
 
 from phi.document import Document
 from phi.knowledge.agent import AgentKnowledge
+from phi.knowledge.manifest import DocumentSource
+from phi.knowledge.pipeline import DocumentReader
 from phi.utils.log import logger
 
 
@@ -20,3 +22,30 @@ class CombinedKnowledgeBase(AgentKnowledge):
         for kb in self.sources:
             logger.debug(f"Loading documents from {kb.__class__.__name__}")
             yield from kb.document_lists
+
+    @property
+    def document_readers(self) -> Iterator[Union[List[Document], DocumentReader]]:
+        """Iterate over knowledge bases and yield their reader functions, so the sources of all
+        knowledge bases are read in parallel by the IngestionPipeline.
+
+        Returns:
+            Iterator[Union[List[Document], DocumentReader]]: Iterator yielding reader functions or lists of documents
+        """
+
+        for kb in self.sources:
+            logger.debug(f"Reading documents from {kb.__class__.__name__}")
+            yield from kb.document_readers
+
+    @property
+    def document_sources(self) -> Optional[Iterator[DocumentSource]]:
+        """Iterate over knowledge bases and yield their sources.
+        Returns None if any knowledge base does not support checking its sources for changes.
+
+        Returns:
+            Optional[Iterator[DocumentSource]]: Iterator yielding a DocumentSource per source
+        """
+
+        kb_sources = [kb.document_sources for kb in self.sources]
+        if any(sources is None for sources in kb_sources):
+            return None
+        return (source for sources in kb_sources if sources is not None for source in sources)
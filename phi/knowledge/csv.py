@@ -1,9 +1,12 @@
+from functools import partial
 from pathlib import Path
 from typing import Union, List, Iterator
 
 from phi.document import Document
 from phi.document.reader.csv_reader import CSVReader, CSVUrlReader
 from phi.knowledge.agent import AgentKnowledge
+from phi.knowledge.manifest import DocumentSource
+from phi.knowledge.pipeline import DocumentReader
 from phi.utils.log import logger
 
 
@@ -12,21 +15,40 @@ class CSVKnowledgeBase(AgentKnowledge):
     reader: CSVReader = CSVReader()
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over CSVs and yield lists of documents.
-        Each object yielded by the iterator is a list of documents.
+    def document_sources(self) -> Iterator[DocumentSource]:
+        """Iterate over CSVs and yield each one as a DocumentSource, used to skip unchanged sources.
 
         Returns:
-            Iterator[List[Document]]: Iterator yielding list of documents
+            Iterator[DocumentSource]: Iterator yielding a DocumentSource per source
         """
-
         _csv_path: Path = Path(self.path) if isinstance(self.path, str) else self.path
 
         if _csv_path.exists() and _csv_path.is_dir():
             for _csv in _csv_path.glob("**/*.csv"):
-                yield self.reader.read(file=_csv)
+                yield DocumentSource.from_file(_csv, partial(self.reader.read, file=_csv))
         elif _csv_path.exists() and _csv_path.is_file() and _csv_path.suffix == ".csv":
-            yield self.reader.read(file=_csv_path)
+            yield DocumentSource.from_file(_csv_path, partial(self.reader.read, file=_csv_path))
+
+    @property
+    def document_readers(self) -> Iterator[DocumentReader]:
+        """Iterate over CSVs and yield a function that reads each one into a list of documents.
+
+        Returns:
+            Iterator[DocumentReader]: Iterator yielding a reader function per source
+        """
+        for source in self.document_sources:
+            yield source.read
+
+    @property
+    def document_lists(self) -> Iterator[List[Document]]:
+        """Iterate over CSVs and yield lists of documents.
+        Each object yielded by the iterator is a list of documents.
+
+        Returns:
+            Iterator[List[Document]]: Iterator yielding list of documents
+        """
+        for read_documents in self.document_readers:
+            yield read_documents()
 
 
 class CSVUrlKnowledgeBase(AgentKnowledge):
@@ -34,9 +56,19 @@ class CSVUrlKnowledgeBase(AgentKnowledge):
     reader: CSVUrlReader = CSVUrlReader()
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
+    def document_readers(self) -> Iterator[DocumentReader]:
+        """Iterate over CSV urls and yield a function that reads each one into a list of documents.
+
+        Returns:
+            Iterator[DocumentReader]: Iterator yielding a reader function per source
+        """
         for url in self.urls:
             if url.endswith(".csv"):
-                yield self.reader.read(url=url)
+                yield partial(self.reader.read, url=url)
             else:
                 logger.error(f"Unsupported URL: {url}")
+
+    @property
+    def document_lists(self) -> Iterator[List[Document]]:
+        for read_documents in self.document_readers:
+            yield read_documents()
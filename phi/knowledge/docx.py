@@ -1,9 +1,12 @@
+from functools import partial
 from pathlib import Path
 from typing import Union, List, Iterator
 
 from phi.document import Document
 from phi.document.reader.docx import DocxReader
 from phi.knowledge.agent import AgentKnowledge
+from phi.knowledge.manifest import DocumentSource
+from phi.knowledge.pipeline import DocumentReader
 
 
 class DocxKnowledgeBase(AgentKnowledge):
@@ -12,19 +15,38 @@ class DocxKnowledgeBase(AgentKnowledge):
     reader: DocxReader = DocxReader()
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over doc/docx files and yield lists of documents.
-        Each object yielded by the iterator is a list of documents.
+    def document_sources(self) -> Iterator[DocumentSource]:
+        """Iterate over doc/docx files and yield each one as a DocumentSource, used to skip unchanged sources.
 
         Returns:
-            Iterator[List[Document]]: Iterator yielding list of documents
+            Iterator[DocumentSource]: Iterator yielding a DocumentSource per source
         """
-
         _file_path: Path = Path(self.path) if isinstance(self.path, str) else self.path
 
         if _file_path.exists() and _file_path.is_dir():
             for _file in _file_path.glob("**/*"):
                 if _file.suffix in self.formats:
-                    yield self.reader.read(file=_file)
+                    yield DocumentSource.from_file(_file, partial(self.reader.read, file=_file))
         elif _file_path.exists() and _file_path.is_file() and _file_path.suffix in self.formats:
-            yield self.reader.read(file=_file_path)
+            yield DocumentSource.from_file(_file_path, partial(self.reader.read, file=_file_path))
+
+    @property
+    def document_readers(self) -> Iterator[DocumentReader]:
+        """Iterate over doc/docx files and yield a function that reads each one into a list of documents.
+
+        Returns:
+            Iterator[DocumentReader]: Iterator yielding a reader function per source
+        """
+        for source in self.document_sources:
+            yield source.read
+
+    @property
+    def document_lists(self) -> Iterator[List[Document]]:
+        """Iterate over doc/docx files and yield lists of documents.
+        Each object yielded by the iterator is a list of documents.
+
+        Returns:
+            Iterator[List[Document]]: Iterator yielding list of documents
+        """
+        for read_documents in self.document_readers:
+            yield read_documents()
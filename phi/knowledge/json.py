@@ -1,9 +1,12 @@
+from functools import partial
 from pathlib import Path
 from typing import Union, List, Iterator
 
 from phi.document import Document
 from phi.document.reader.json import JSONReader
 from phi.knowledge.agent import AgentKnowledge
+from phi.knowledge.manifest import DocumentSource
+from phi.knowledge.pipeline import DocumentReader
 
 
 class JSONKnowledgeBase(AgentKnowledge):
@@ -11,18 +14,37 @@ class JSONKnowledgeBase(AgentKnowledge):
     reader: JSONReader = JSONReader()
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over Json files and yield lists of documents.
-        Each object yielded by the iterator is a list of documents.
+    def document_sources(self) -> Iterator[DocumentSource]:
+        """Iterate over Json files and yield each one as a DocumentSource, used to skip unchanged sources.
 
         Returns:
-            Iterator[List[Document]]: Iterator yielding list of documents
+            Iterator[DocumentSource]: Iterator yielding a DocumentSource per source
         """
-
         _json_path: Path = Path(self.path) if isinstance(self.path, str) else self.path
 
         if _json_path.exists() and _json_path.is_dir():
             for _pdf in _json_path.glob("*.json"):
-                yield self.reader.read(path=_pdf)
+                yield DocumentSource.from_file(_pdf, partial(self.reader.read, path=_pdf))
         elif _json_path.exists() and _json_path.is_file() and _json_path.suffix == ".json":
-            yield self.reader.read(path=_json_path)
+            yield DocumentSource.from_file(_json_path, partial(self.reader.read, path=_json_path))
+
+    @property
+    def document_readers(self) -> Iterator[DocumentReader]:
+        """Iterate over Json files and yield a function that reads each one into a list of documents.
+
+        Returns:
+            Iterator[DocumentReader]: Iterator yielding a reader function per source
+        """
+        for source in self.document_sources:
+            yield source.read
+
+    @property
+    def document_lists(self) -> Iterator[List[Document]]:
+        """Iterate over Json files and yield lists of documents.
+        Each object yielded by the iterator is a list of documents.
+
+        Returns:
+            Iterator[List[Document]]: Iterator yielding list of documents
+        """
+        for read_documents in self.document_readers:
+            yield read_documents()
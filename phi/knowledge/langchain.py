@@ -14,7 +14,11 @@ class LangChainKnowledgeBase(AgentKnowledge):
     retriever: Optional[Any] = None
 
     def search(
-        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        num_documents: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = False,
     ) -> List[Document]:
         """Returns relevant documents matching the query"""
 
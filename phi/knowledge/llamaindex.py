@@ -18,7 +18,11 @@ class LlamaIndexKnowledgeBase(AgentKnowledge):
     loader: Optional[Callable] = None
 
     def search(
-        self, query: str, num_documents: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+        self,
+        query: str,
+        num_documents: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = False,
     ) -> List[Document]:
         """
         Returns relevant documents matching the query.
@@ -27,6 +31,7 @@ class LlamaIndexKnowledgeBase(AgentKnowledge):
             query (str): The query string to search for.
             num_documents (Optional[int]): The maximum number of documents to return. Defaults to None.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search. Defaults to None.
+            return_embeddings (bool): Not used, the retriever decides what is returned.
 
         Returns:
             List[Document]: A list of relevant documents matching the query.
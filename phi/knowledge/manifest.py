@@ -0,0 +1,161 @@
+import json
+from hashlib import md5
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Union
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from phi.document import Document
+from phi.knowledge.pipeline import DocumentReader
+from phi.utils.log import logger
+
+
+def get_content_hash(document: Document) -> str:
+    """Returns the hash of a document's content, which vector dbs use to identify the document."""
+    return md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest()
+
+
+def get_file_hash(path: Path) -> str:
+    file_hash = md5()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+class DocumentSource(BaseModel):
+    """A source of documents, e.g. a file or S3 object, with the metadata used to detect changes."""
+
+    # Identifies the source in the manifest, e.g. the file path or S3 uri
+    key: str
+    # Reads the source into a list of documents
+    read: DocumentReader
+    size: Optional[int] = None
+    mtime: Optional[float] = None
+    etag: Optional[str] = None
+    # Path of a local file, hashed when the size or mtime changed to detect files that were only touched
+    path: Optional[Path] = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @classmethod
+    def from_file(cls, path: Path, read: DocumentReader) -> "DocumentSource":
+        stat = path.stat()
+        return cls(key=str(path.resolve()), read=read, size=stat.st_size, mtime=stat.st_mtime, path=path)
+
+    @classmethod
+    def from_s3_object(cls, s3_object: Any, read: DocumentReader) -> "DocumentSource":
+        etag = getattr(s3_object, "e_tag", None)
+        size = getattr(s3_object, "size", None)
+        return cls(key=s3_object.uri, read=read, size=size, etag=etag.strip('"') if etag else None)
+
+
+class SourceEntry(BaseModel):
+    """The state of a source when it was last loaded to the vector db"""
+
+    size: Optional[int] = None
+    mtime: Optional[float] = None
+    etag: Optional[str] = None
+    content_hash: Optional[str] = None
+    # Content hashes of the documents read from the source
+    chunk_hashes: List[str] = []
+
+
+class KnowledgeManifest(BaseModel):
+    """Records the sources loaded to a vector db, so unchanged sources are not read again.
+
+    The manifest is saved as a JSON file. Use one manifest per knowledge base and vector db.
+    """
+
+    # Path of the JSON file
+    path: Union[str, Path]
+    sources: Dict[str, SourceEntry] = Field(default_factory=dict)
+
+    _loaded: bool = False
+
+    def read(self) -> None:
+        """Reads the manifest from its file, if it exists."""
+        manifest_path = Path(self.path)
+        self.sources = {}
+        if manifest_path.exists():
+            try:
+                manifest = json.loads(manifest_path.read_text())
+                self.sources = {key: SourceEntry(**entry) for key, entry in manifest.get("sources", {}).items()}
+            except Exception as e:
+                logger.warning(f"Could not read knowledge manifest {manifest_path}, all sources will be read: {e}")
+        self._loaded = True
+
+    def write(self) -> None:
+        """Writes the manifest to its file. The file is replaced atomically."""
+        manifest_path = Path(self.path)
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        manifest = {"sources": {key: entry.model_dump(exclude_none=True) for key, entry in self.sources.items()}}
+        tmp_path.write_text(json.dumps(manifest))
+        tmp_path.replace(manifest_path)
+
+    def clear(self) -> None:
+        self.sources = {}
+        self._loaded = True
+
+    def is_unchanged(self, source: DocumentSource) -> bool:
+        """Returns True if the source has not changed since it was loaded.
+
+        Files whose size and mtime changed are hashed, so files that were only touched are not read again.
+        """
+        if not self._loaded:
+            self.read()
+        entry = self.sources.get(source.key)
+        if entry is None:
+            return False
+        if source.etag is not None:
+            return source.etag == entry.etag
+        if source.size is None or source.size != entry.size:
+            return False
+        if source.mtime is not None and source.mtime == entry.mtime:
+            return True
+        if source.path is not None and entry.content_hash is not None:
+            if get_file_hash(source.path) == entry.content_hash:
+                entry.mtime = source.mtime
+                return True
+        return False
+
+    def update(self, source: DocumentSource, documents: List[Document]) -> List[str]:
+        """Records the documents read from a source.
+
+        Returns:
+            List[str]: Content hashes of the documents previously read from the source that it no longer contains.
+        """
+        previous = self.sources.get(source.key)
+        chunk_hashes = list(dict.fromkeys(get_content_hash(document) for document in documents))
+        self.sources[source.key] = SourceEntry(
+            size=source.size,
+            mtime=source.mtime,
+            etag=source.etag,
+            content_hash=get_file_hash(source.path) if source.path is not None and source.etag is None else None,
+            chunk_hashes=chunk_hashes,
+        )
+        if previous is None:
+            return []
+        return list(set(previous.chunk_hashes) - set(chunk_hashes))
+
+    def remove_missing(self, keys: Set[str]) -> List[str]:
+        """Removes the sources that are not in keys.
+
+        Returns:
+            List[str]: Content hashes of the documents read from the removed sources.
+        """
+        removed = [key for key in self.sources if key not in keys]
+        chunk_hashes: List[str] = []
+        for key in removed:
+            chunk_hashes.extend(self.sources.pop(key).chunk_hashes)
+        if len(removed) > 0:
+            logger.info(f"{len(removed)} sources were removed")
+        return chunk_hashes
+
+    def get_unreferenced(self, chunk_hashes: List[str]) -> List[str]:
+        """Returns the content hashes that no source in the manifest contains."""
+        referenced: Set[str] = set()
+        for entry in self.sources.values():
+            referenced.update(entry.chunk_hashes)
+        return [chunk_hash for chunk_hash in dict.fromkeys(chunk_hashes) if chunk_hash not in referenced]
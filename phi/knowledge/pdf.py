@@ -1,9 +1,12 @@
+from functools import partial
 from pathlib import Path
 from typing import Union, List, Iterator
 
 from phi.document import Document
 from phi.document.reader.pdf import PDFReader, PDFUrlReader, PDFImageReader, PDFUrlImageReader
 from phi.knowledge.agent import AgentKnowledge
+from phi.knowledge.manifest import DocumentSource
+from phi.knowledge.pipeline import DocumentReader
 from phi.utils.log import logger
 
 
@@ -12,38 +15,66 @@ class PDFKnowledgeBase(AgentKnowledge):
     reader: Union[PDFReader, PDFImageReader] = PDFReader()
 
     @property
-    def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over PDFs and yield lists of documents.
-        Each object yielded by the iterator is a list of documents.
+    def document_sources(self) -> Iterator[DocumentSource]:
+        """Iterate over PDFs and yield each one as a DocumentSource, used to skip unchanged sources.
 
         Returns:
-            Iterator[List[Document]]: Iterator yielding list of documents
+            Iterator[DocumentSource]: Iterator yielding a DocumentSource per source
         """
-
         _pdf_path: Path = Path(self.path) if isinstance(self.path, str) else self.path
 
         if _pdf_path.exists() and _pdf_path.is_dir():
             for _pdf in _pdf_path.glob("**/*.pdf"):
-                yield self.reader.read(pdf=_pdf)
+                yield DocumentSource.from_file(_pdf, partial(self.reader.read, pdf=_pdf))
         elif _pdf_path.exists() and _pdf_path.is_file() and _pdf_path.suffix == ".pdf":
-            yield self.reader.read(pdf=_pdf_path)
+            yield DocumentSource.from_file(_pdf_path, partial(self.reader.read, pdf=_pdf_path))
 
+    @property
+    def document_readers(self) -> Iterator[DocumentReader]:
+        """Iterate over PDFs and yield a function that reads each one into a list of documents.
 
-class PDFUrlKnowledgeBase(AgentKnowledge):
-    urls: List[str] = []
-    reader: Union[PDFUrlReader, PDFUrlImageReader] = PDFUrlReader()
+        Returns:
+            Iterator[DocumentReader]: Iterator yielding a reader function per source
+        """
+        for source in self.document_sources:
+            yield source.read
 
     @property
     def document_lists(self) -> Iterator[List[Document]]:
-        """Iterate over PDF urls and yield lists of documents.
+        """Iterate over PDFs and yield lists of documents.
         Each object yielded by the iterator is a list of documents.
 
         Returns:
             Iterator[List[Document]]: Iterator yielding list of documents
         """
+        for read_documents in self.document_readers:
+            yield read_documents()
+
 
+class PDFUrlKnowledgeBase(AgentKnowledge):
+    urls: List[str] = []
+    reader: Union[PDFUrlReader, PDFUrlImageReader] = PDFUrlReader()
+
+    @property
+    def document_readers(self) -> Iterator[DocumentReader]:
+        """Iterate over PDF urls and yield a function that reads each one into a list of documents.
+
+        Returns:
+            Iterator[DocumentReader]: Iterator yielding a reader function per source
+        """
         for url in self.urls:
             if url.endswith(".pdf"):
-                yield self.reader.read(url=url)
+                yield partial(self.reader.read, url=url)
             else:
                 logger.error(f"Unsupported URL: {url}")
+
+    @property
+    def document_lists(self) -> Iterator[List[Document]]:
+        """Iterate over PDF urls and yield lists of documents.
+        Each object yielded by the iterator is a list of documents.
+
+        Returns:
+            Iterator[List[Document]]: Iterator yielding list of documents
+        """
+        for read_documents in self.document_readers:
+            yield read_documents()
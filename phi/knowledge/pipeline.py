@@ -0,0 +1,388 @@
+import pickle
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Set, Union
+
+from pydantic import BaseModel, ConfigDict
+
+from phi.document import Document
+from phi.embedder import Embedder
+from phi.vectordb import VectorDb
+from phi.utils.log import logger
+from phi.utils.tokens import get_tokenizer
+
+# A function that reads one source (e.g. a file or url) into a list of documents
+DocumentReader = Callable[[], List[Document]]
+
+
+class IngestionMetrics(BaseModel):
+    """Progress and throughput of an IngestionPipeline run"""
+
+    sources_read: int = 0
+    documents_read: int = 0
+    documents_skipped: int = 0
+    documents_embedded: int = 0
+    documents_written: int = 0
+    # Estimated from the number of characters in the documents read
+    tokens_read: int = 0
+    embedding_requests: int = 0
+    embedding_retries: int = 0
+    start_time: float = 0.0
+    end_time: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        return (self.end_time or monotonic()) - self.start_time
+
+    @property
+    def documents_per_second(self) -> float:
+        return self.documents_written / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        return self.tokens_read / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        _dict = self.model_dump(exclude={"start_time", "end_time"})
+        _dict["elapsed"] = round(self.elapsed, 3)
+        _dict["documents_per_second"] = round(self.documents_per_second, 2)
+        _dict["tokens_per_second"] = round(self.tokens_per_second, 2)
+        return _dict
+
+    def summary(self) -> str:
+        return (
+            f"{self.documents_written} documents written, {self.documents_skipped} skipped "
+            f"from {self.sources_read} sources in {self.elapsed:.2f}s "
+            f"({self.documents_per_second:.1f} docs/s, {self.tokens_per_second:.0f} tokens/s)"
+        )
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Returns True if the error is a rate limit error from an embedding provider."""
+    if getattr(error, "status_code", None) == 429 or getattr(error, "status", None) == 429:
+        return True
+    name = error.__class__.__name__.lower()
+    message = str(error).lower()
+    return "ratelimit" in name or "rate limit" in message or "too many requests" in message
+
+
+class IngestionPipeline(BaseModel):
+    """Loads documents to a vector db in stages that run concurrently.
+
+    Sources are read (and chunked) by a pool of readers, the documents are embedded in batches by concurrent
+    embedding workers and written in batches by the writers. The stages are connected by bounded queues,
+    so parsing, embedding requests and db writes overlap while memory use stays bounded.
+    """
+
+    # Number of sources read in parallel
+    read_workers: int = 4
+    # Read sources in threads, or in processes for CPU-bound readers like PDFReader.
+    # Processes require the readers to be picklable and the main module to be guarded by `if __name__ == "__main__"`.
+    read_executor: Literal["thread", "process"] = "thread"
+    # Number of concurrent embedding requests
+    embed_workers: int = 4
+    # Number of concurrent writers. Keep at 1 for vector dbs that do not support concurrent writes.
+    write_workers: int = 1
+    # Number of documents per embedding request and per write
+    batch_size: int = 100
+    # Maximum number of batches waiting between stages
+    queue_size: int = 8
+    # Maximum number of embedding requests per minute, across all embedding workers
+    requests_per_minute: Optional[int] = None
+    # Number of times an embedding request is retried after a rate limit error
+    max_retries: int = 5
+    # Seconds to wait after the first rate limit error, doubled on each retry
+    retry_delay: float = 1.0
+    # Log progress every progress_interval seconds
+    progress_interval: float = 5.0
+    # Called with the metrics after each batch is written
+    on_progress: Optional[Callable[[IngestionMetrics], None]] = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    def run(
+        self,
+        vector_db: VectorDb,
+        sources: Iterable[Union[List[Document], DocumentReader]],
+        upsert: bool = False,
+        skip_existing: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+        on_read: Optional[Callable[[Union[List[Document], DocumentReader], List[Document]], None]] = None,
+    ) -> IngestionMetrics:
+        """Load the documents from the sources to the vector db.
+
+        Args:
+            vector_db (VectorDb): Vector db to load the documents to. The collection must exist.
+            sources (Iterable[Union[List[Document], DocumentReader]]): Lists of documents, or functions that read
+                a source into a list of documents. Functions are run by the read workers.
+            upsert (bool): If True, upserts documents to the vector db. Defaults to False.
+            skip_existing (bool): If True, skips documents which already exist in the vector db when inserting.
+            filters (Optional[Dict[str, Any]]): Filters to add to each row.
+            on_read (Optional[Callable]): Called with each source and the documents read from it.
+
+        Returns:
+            IngestionMetrics: The metrics for this run.
+        """
+        return _PipelineRun(
+            pipeline=self,
+            vector_db=vector_db,
+            upsert=upsert and vector_db.upsert_available(),
+            skip_existing=skip_existing,
+            filters=filters,
+            on_read=on_read,
+        ).run(sources)
+
+
+class _PipelineRun:
+    """State of one IngestionPipeline run"""
+
+    def __init__(
+        self,
+        pipeline: IngestionPipeline,
+        vector_db: VectorDb,
+        upsert: bool,
+        skip_existing: bool,
+        filters: Optional[Dict[str, Any]],
+        on_read: Optional[Callable[[Union[List[Document], DocumentReader], List[Document]], None]] = None,
+    ):
+        self.pipeline = pipeline
+        self.vector_db = vector_db
+        self.embedder: Optional[Embedder] = getattr(vector_db, "embedder", None)
+        self.upsert = upsert
+        self.skip_existing = skip_existing and not upsert
+        self.filters = filters
+        self.on_read = on_read
+        self.tokenizer = get_tokenizer()
+
+        self.metrics = IngestionMetrics(start_time=monotonic())
+        self.metrics_lock = Lock()
+        self.last_progress: float = self.metrics.start_time
+
+        self.embed_queue: "Queue[Optional[List[Document]]]" = Queue(maxsize=pipeline.queue_size)
+        self.write_queue: "Queue[Optional[List[Document]]]" = Queue(maxsize=pipeline.queue_size)
+        self.embed_workers_left: int = pipeline.embed_workers
+        self.stop = Event()
+        self.error: Optional[BaseException] = None
+
+        # Embedding requests are paused until this time after a rate limit error
+        self.rate_limit_lock = Lock()
+        self.paused_until: float = 0.0
+        self.next_request_time: float = 0.0
+
+    def run(self, sources: Iterable[Union[List[Document], DocumentReader]]) -> IngestionMetrics:
+        threads = [Thread(target=self._embed_worker, name=f"phi-embed-{i}") for i in range(self.pipeline.embed_workers)]
+        threads += [
+            Thread(target=self._write_worker, name=f"phi-write-{i}") for i in range(self.pipeline.write_workers)
+        ]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        try:
+            self._read(sources)
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            for _ in range(self.pipeline.embed_workers):
+                self._put(self.embed_queue, None)
+            for thread in threads:
+                thread.join()
+
+        self.metrics.end_time = monotonic()
+        if self.error is not None:
+            raise self.error
+        logger.info(f"Loaded knowledge base: {self.metrics.summary()}")
+        return self.metrics
+
+    def _fail(self, error: BaseException) -> None:
+        with self.metrics_lock:
+            if self.error is None:
+                self.error = error
+        self.stop.set()
+
+    def _put(self, queue: "Queue[Optional[List[Document]]]", item: Optional[List[Document]]) -> None:
+        """Puts an item on a queue, waiting for space unless the pipeline has stopped."""
+        while not self.stop.is_set():
+            try:
+                queue.put(item, timeout=0.1)
+                return
+            except Full:
+                continue
+
+    def _get(self, queue: "Queue[Optional[List[Document]]]") -> Optional[List[Document]]:
+        """Gets an item from a queue. Returns None at the end of the input, or once the pipeline has stopped."""
+        while True:
+            try:
+                return queue.get(timeout=0.1)
+            except Empty:
+                if self.stop.is_set():
+                    return None
+
+    # -*- Read stage
+    def _read(self, sources: Iterable[Union[List[Document], DocumentReader]]) -> None:
+        """Reads the sources and puts batches of documents on the embed queue.
+
+        Reader functions run on the read pool. Lists of documents are batched as they are iterated.
+        """
+        executor: Executor
+        if self.pipeline.read_executor == "process":
+            executor = ProcessPoolExecutor(max_workers=self.pipeline.read_workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.pipeline.read_workers, thread_name_prefix="phi-read")
+
+        buffer: List[Document] = []
+        in_flight: Dict[Future, DocumentReader] = {}
+        max_in_flight = self.pipeline.read_workers * 2
+
+        def add_documents(source: Union[List[Document], DocumentReader], documents: List[Document]) -> None:
+            if self.on_read is not None:
+                self.on_read(source, documents)
+            num_tokens = sum(self.tokenizer.count(document.content) for document in documents)
+            with self.metrics_lock:
+                self.metrics.sources_read += 1
+                self.metrics.documents_read += len(documents)
+                self.metrics.tokens_read += num_tokens
+            buffer.extend(documents)
+            while len(buffer) >= self.pipeline.batch_size:
+                self._put(self.embed_queue, buffer[: self.pipeline.batch_size])
+                del buffer[: self.pipeline.batch_size]
+
+        def collect(futures: Set[Future]) -> None:
+            for future in futures:
+                add_documents(in_flight.pop(future), future.result())
+
+        try:
+            for source in sources:
+                if self.stop.is_set():
+                    return
+                if not callable(source):
+                    add_documents(source, source)
+                    continue
+                if self.pipeline.read_executor == "process" and not _is_picklable(source):
+                    logger.debug("Reader cannot be sent to a process, reading in this process")
+                    add_documents(source, source())
+                    continue
+                in_flight[executor.submit(source)] = source
+                if len(in_flight) >= max_in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+            while in_flight and not self.stop.is_set():
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+            if len(buffer) > 0:
+                self._put(self.embed_queue, list(buffer))
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    # -*- Embed stage
+    def _embed_worker(self) -> None:
+        try:
+            while True:
+                documents = self._get(self.embed_queue)
+                if documents is None:
+                    break
+                if self.stop.is_set():
+                    continue
+                if self.skip_existing:
+                    num_documents = len(documents)
+                    documents = [
+                        document
+                        for document, exists in zip(documents, self.vector_db.docs_exist(documents))
+                        if not exists
+                    ]
+                    with self.metrics_lock:
+                        self.metrics.documents_skipped += num_documents - len(documents)
+                if len(documents) == 0:
+                    continue
+                if self.embedder is not None:
+                    documents = self._embed(documents, self.embedder)
+                if len(documents) > 0:
+                    self._put(self.write_queue, documents)
+        except BaseException as e:
+            self._fail(e)
+        finally:
+            with self.metrics_lock:
+                self.embed_workers_left -= 1
+                last_worker = self.embed_workers_left == 0
+            if last_worker:
+                for _ in range(self.pipeline.write_workers):
+                    self._put(self.write_queue, None)
+
+    def _wait_for_rate_limit(self) -> None:
+        with self.rate_limit_lock:
+            now = monotonic()
+            start = max(now, self.paused_until, self.next_request_time)
+            if self.pipeline.requests_per_minute:
+                self.next_request_time = start + 60.0 / self.pipeline.requests_per_minute
+        if start > now:
+            sleep(start - now)
+
+    def _embed(self, documents: List[Document], embedder: Embedder) -> List[Document]:
+        attempt = 0
+        while True:
+            self._wait_for_rate_limit()
+            try:
+                Document.embed_documents(documents, embedder=embedder, batch_size=len(documents), raise_errors=True)
+                break
+            except Exception as e:
+                if not is_rate_limit_error(e):
+                    # Embed the documents one at a time, leaving out the documents that fail
+                    logger.warning(f"Error embedding a batch of {len(documents)} documents: {e}")
+                    documents = Document.embed_documents(documents, embedder=embedder, batch_size=1)
+                    break
+                if attempt >= self.pipeline.max_retries:
+                    raise
+                delay = self.pipeline.retry_delay * (2**attempt)
+                attempt += 1
+                logger.warning(f"Embedding rate limited, retrying in {delay:.1f}s: {e}")
+                # Pause all embedding workers, not just this one
+                with self.rate_limit_lock:
+                    self.paused_until = max(self.paused_until, monotonic() + delay)
+                with self.metrics_lock:
+                    self.metrics.embedding_retries += 1
+        with self.metrics_lock:
+            self.metrics.embedding_requests += 1
+            self.metrics.documents_embedded += len(documents)
+        return documents
+
+    # -*- Write stage
+    def _write_worker(self) -> None:
+        try:
+            while True:
+                documents = self._get(self.write_queue)
+                if documents is None:
+                    break
+                if self.stop.is_set():
+                    continue
+                if self.upsert:
+                    self.vector_db.upsert(documents=documents, filters=self.filters)
+                else:
+                    self.vector_db.insert(documents=documents, filters=self.filters)
+                self._report_progress(len(documents))
+        except BaseException as e:
+            self._fail(e)
+
+    def _report_progress(self, num_written: int) -> None:
+        with self.metrics_lock:
+            self.metrics.documents_written += num_written
+            metrics = self.metrics.model_copy()
+            now = monotonic()
+            log_progress = now - self.last_progress >= self.pipeline.progress_interval
+            if log_progress:
+                self.last_progress = now
+        if log_progress:
+            logger.info(f"Loading knowledge base: {metrics.summary()}")
+        if self.pipeline.on_progress is not None:
+            self.pipeline.on_progress(metrics)
+
+
+def _is_picklable(value: Any) -> bool:
+    try:
+        pickle.dumps(value)
+        return True
+    except Exception:
+        return False
@@ -1,13 +1,37 @@
+from functools import partial
 from typing import List, Iterator
 
 from phi.document import Document
 from phi.document.reader.s3.pdf import S3PDFReader
 from phi.knowledge.s3.base import S3KnowledgeBase
+from phi.knowledge.manifest import DocumentSource
+from phi.knowledge.pipeline import DocumentReader
 
 
 class S3PDFKnowledgeBase(S3KnowledgeBase):
     reader: S3PDFReader = S3PDFReader()
 
+    @property
+    def document_sources(self) -> Iterator[DocumentSource]:
+        """Iterate over PDFs in a s3 bucket and yield each one as a DocumentSource, used to skip unchanged sources.
+
+        Returns:
+            Iterator[DocumentSource]: Iterator yielding a DocumentSource per source
+        """
+        for s3_object in self.s3_objects:
+            if s3_object.name.endswith(".pdf"):
+                yield DocumentSource.from_s3_object(s3_object, partial(self.reader.read, s3_object=s3_object))
+
+    @property
+    def document_readers(self) -> Iterator[DocumentReader]:
+        """Iterate over PDFs in a s3 bucket and yield a function that reads each one into a list of documents.
+
+        Returns:
+            Iterator[DocumentReader]: Iterator yielding a reader function per source
+        """
+        for source in self.document_sources:
+            yield source.read
+
     @property
     def document_lists(self) -> Iterator[List[Document]]:
         """Iterate over PDFs in a s3 bucket and yield lists of documents.
@@ -16,6 +40,5 @@ class S3PDFKnowledgeBase(S3KnowledgeBase):
         Returns:
             Iterator[List[Document]]: Iterator yielding list of documents
         """
-        for s3_object in self.s3_objects:
-            if s3_object.name.endswith(".pdf"):
-                yield self.reader.read(s3_object=s3_object)
+        for read_documents in self.document_readers:
+            yield read_documents()
@@ -6,6 +6,7 @@ from phi.document import Document
 from phi.document.reader.website import WebsiteReader
 from phi.knowledge.agent import AgentKnowledge
 from phi.utils.log import logger
+from phi.utils.threads import run_coroutine_sync, run_in_thread
 
 
 class WebsiteKnowledgeBase(AgentKnowledge):
@@ -15,11 +16,21 @@ class WebsiteKnowledgeBase(AgentKnowledge):
     # WebsiteReader parameters
     max_depth: int = 3
     max_links: int = 10
+    # Crawl concurrently and load each page as soon as it is fetched
+    use_async: bool = False
+    max_concurrency: int = 10
+    host_delay: float = 0.5
 
     @model_validator(mode="after")
     def set_reader(self) -> "WebsiteKnowledgeBase":
         if self.reader is None:
-            self.reader = WebsiteReader(max_depth=self.max_depth, max_links=self.max_links)
+            self.reader = WebsiteReader(
+                max_depth=self.max_depth,
+                max_links=self.max_links,
+                use_async=self.use_async,
+                max_concurrency=self.max_concurrency,
+                host_delay=self.host_delay,
+            )
         return self
 
     @property
@@ -72,17 +83,43 @@ class WebsiteKnowledgeBase(AgentKnowledge):
                     urls_to_read.remove(url)
 
         for url in urls_to_read:
-            document_list = self.reader.read(url=url)
-            # Filter out documents which already exist in the vector db
-            if not recreate:
-                document_list = [document for document in document_list if not self.vector_db.doc_exists(document)]
-            if upsert and self.vector_db.upsert_available():
-                self.vector_db.upsert(documents=document_list, filters=filters)
+            if self.reader.use_async:
+                num_documents += run_coroutine_sync(
+                    self._aload_url(url=url, recreate=recreate, upsert=upsert, filters=filters)
+                )
             else:
-                self.vector_db.insert(documents=document_list, filters=filters)
-            num_documents += len(document_list)
+                num_documents += self._load_page_documents(
+                    self.reader.read(url=url), recreate=recreate, upsert=upsert, filters=filters
+                )
             logger.info(f"Loaded {num_documents} documents to knowledge base")
 
         if self.optimize_on is not None and num_documents > self.optimize_on:
             logger.debug("Optimizing Vector DB")
             self.vector_db.optimize()
+
+    def _load_page_documents(
+        self, document_list: List[Document], recreate: bool, upsert: bool, filters: Optional[Dict[str, Any]]
+    ) -> int:
+        assert self.vector_db is not None
+        # Filter out documents which already exist in the vector db
+        if not recreate:
+            document_list = [
+                document
+                for document, exists in zip(document_list, self.vector_db.docs_exist(document_list))
+                if not exists
+            ]
+        if upsert and self.vector_db.upsert_available():
+            self.vector_db.upsert(documents=document_list, filters=filters)
+        else:
+            self.vector_db.insert(documents=document_list, filters=filters)
+        return len(document_list)
+
+    async def _aload_url(self, url: str, recreate: bool, upsert: bool, filters: Optional[Dict[str, Any]]) -> int:
+        """Crawls a website and loads each page to the vector db while the next pages are fetched"""
+        assert self.reader is not None
+        num_documents = 0
+        async for document_list in self.reader.astream(url=url):
+            num_documents += await run_in_thread(
+                self._load_page_documents, document_list, recreate=recreate, upsert=upsert, filters=filters
+            )
+        return num_documents
@@ -1,14 +1,26 @@
+from functools import partial
 from typing import List, Iterator
 
 from phi.document import Document
 from phi.document.reader.youtube_reader import YouTubeReader
 from phi.knowledge.agent import AgentKnowledge
+from phi.knowledge.pipeline import DocumentReader
 
 
 class YouTubeKnowledgeBase(AgentKnowledge):
     urls: List[str] = []
     reader: YouTubeReader = YouTubeReader()
 
+    @property
+    def document_readers(self) -> Iterator[DocumentReader]:
+        """Iterate over YouTube URLs and yield a function that reads each one into a list of documents.
+
+        Returns:
+            Iterator[DocumentReader]: Iterator yielding a reader function per source
+        """
+        for url in self.urls:
+            yield partial(self.reader.read, video_url=url)
+
     @property
     def document_lists(self) -> Iterator[List[Document]]:
         """Iterate over YouTube URLs and yield lists of documents.
@@ -17,6 +29,5 @@ class YouTubeKnowledgeBase(AgentKnowledge):
         Returns:
                 Iterator[List[Document]]: Iterator yielding list of documents
         """
-
-        for url in self.urls:
-            yield self.reader.read(video_url=url)
+        for read_documents in self.document_readers:
+            yield read_documents()
@@ -4,15 +4,22 @@ from copy import deepcopy
 
 from pydantic import BaseModel, ConfigDict
 
+from phi.embedder.base import Embedder
 from phi.memory.classifier import MemoryClassifier
 from phi.memory.db import MemoryDb
 from phi.memory.manager import MemoryManager
 from phi.memory.memory import Memory
+from phi.memory.row import MemoryRow
 from phi.memory.summary import SessionSummary
 from phi.memory.summarizer import MemorySummarizer
 from phi.model.message import Message
 from phi.run.response import RunResponse
 from phi.utils.log import logger
+from phi.utils.threads import run_in_thread
+
+
+# Number of memories loaded with semantic retrieval when num_memories is not set
+DEFAULT_NUM_SEMANTIC_MEMORIES = 5
 
 
 class AgentRun(BaseModel):
@@ -49,6 +56,11 @@ class AgentMemory(BaseModel):
     create_user_memories: bool = False
     # Update memories for the user after each run
     update_user_memories_after_run: bool = True
+    # Update the memories and session summary after each run in a background thread, so the response is
+    # returned without waiting for them. Use Agent.flush_memory_updates() to wait for the updates to finish.
+    update_in_background: bool = False
+    # Maximum number of seconds Agent.new_session() waits for the background updates of the current session
+    flush_timeout: Optional[float] = 30.0
 
     # MemoryDb to store personalized memories
     db: Optional[MemoryDb] = None
@@ -56,7 +68,10 @@ class AgentMemory(BaseModel):
     user_id: Optional[str] = None
     retrieval: MemoryRetrieval = MemoryRetrieval.last_n
     memories: Optional[List[Memory]] = None
+    # Number of memories to load. Semantic retrieval loads the 5 most relevant memories by default.
     num_memories: Optional[int] = None
+    # Embedder for semantic retrieval. Memories are embedded when written. Defaults to OpenAIEmbedder.
+    embedder: Optional[Embedder] = None
     classifier: Optional[MemoryClassifier] = None
     manager: Optional[MemoryManager] = None
 
@@ -77,6 +92,7 @@ class AgentMemory(BaseModel):
                 "classifier",
                 "manager",
                 "retrieval",
+                "embedder",
             },
         )
         if self.summary:
@@ -206,24 +222,80 @@ class AgentMemory(BaseModel):
                         return tool_calls
         return tool_calls
 
-    def load_user_memories(self) -> None:
-        """Load memories from memory db for this user."""
+    def get_embedder(self) -> Embedder:
+        if self.embedder is None:
+            from phi.embedder.openai import OpenAIEmbedder
+
+            self.embedder = OpenAIEmbedder()
+        return self.embedder
+
+    def get_relevant_memory_rows(self, query: str) -> List[MemoryRow]:
+        """Returns the memories most relevant to the query, using semantic retrieval."""
+        from phi.memory.semantic import search_memories
+
+        if self.db is None:
+            return []
+        return search_memories(
+            db=self.db,
+            embedder=self.get_embedder(),
+            query=query,
+            user_id=self.user_id,
+            limit=self.get_num_memories_to_load(),
+        )
+
+    def get_num_memories_to_load(self) -> Optional[int]:
+        """Returns the maximum number of memories to load. Semantic retrieval always loads a bounded number."""
+        if self.retrieval == MemoryRetrieval.semantic:
+            return self.num_memories or DEFAULT_NUM_SEMANTIC_MEMORIES
+        return self.num_memories
+
+    def load_user_memories(self, query: Optional[str] = None) -> None:
+        """Load memories from memory db for this user.
+
+        Args:
+            query: The message to load relevant memories for, when using semantic retrieval.
+                Without a query, the most recent `num_memories` memories are loaded, 5 by default.
+        """
         if self.db is None:
             return
 
         try:
-            if self.retrieval in (MemoryRetrieval.last_n, MemoryRetrieval.first_n):
+            if self.retrieval == MemoryRetrieval.semantic and query:
+                memory_rows = self.get_relevant_memory_rows(query)
+            else:
                 memory_rows = self.db.read_memories(
                     user_id=self.user_id,
-                    limit=self.num_memories,
+                    limit=self.get_num_memories_to_load(),
                     sort="asc" if self.retrieval == MemoryRetrieval.first_n else "desc",
                 )
+        except Exception as e:
+            logger.debug(f"Error reading memory: {e}")
+            return
+
+        self.set_memories_from_rows(memory_rows)
+
+    async def aload_user_memories(self, query: Optional[str] = None) -> None:
+        """Load memories from memory db for this user without blocking the event loop."""
+        if self.db is None:
+            return
+
+        try:
+            if self.retrieval == MemoryRetrieval.semantic and query:
+                memory_rows = await run_in_thread(self.get_relevant_memory_rows, query)
             else:
-                raise NotImplementedError("Semantic retrieval not yet supported.")
+                memory_rows = await self.db.aread_memories(
+                    user_id=self.user_id,
+                    limit=self.get_num_memories_to_load(),
+                    sort="asc" if self.retrieval == MemoryRetrieval.first_n else "desc",
+                )
         except Exception as e:
             logger.debug(f"Error reading memory: {e}")
             return
 
+        self.set_memories_from_rows(memory_rows)
+
+    def set_memories_from_rows(self, memory_rows: Optional[List[MemoryRow]]) -> None:
+        """Replace the loaded memories with the memories in the rows read from the memory db."""
         # Clear the existing memories
         self.memories = []
 
@@ -288,6 +360,9 @@ class AgentMemory(BaseModel):
         else:
             self.manager.db = self.db
             self.manager.user_id = self.user_id
+        # Embed memories when they are written, so they are not embedded when retrieved
+        if self.retrieval == MemoryRetrieval.semantic:
+            self.manager.embedder = self.get_embedder()
 
         response = self.manager.run(input)
         self.load_user_memories()
@@ -320,9 +395,12 @@ class AgentMemory(BaseModel):
         else:
             self.manager.db = self.db
             self.manager.user_id = self.user_id
+        # Embed memories when they are written, so they are not embedded when retrieved
+        if self.retrieval == MemoryRetrieval.semantic:
+            self.manager.embedder = self.get_embedder()
 
         response = await self.manager.arun(input)
-        self.load_user_memories()
+        await self.aload_user_memories()
         self.updating_memory = False
         return response
 
@@ -358,13 +436,35 @@ class AgentMemory(BaseModel):
         self.summary = None
         self.memories = None
 
+    def copy_for_run(self) -> "AgentMemory":
+        """Create a lightweight copy of this AgentMemory for a single run.
+
+        The db and embedder are shared with this AgentMemory, while the runs, messages, memories and summary
+        are copied. The classifier, manager and summarizer are copied with their own copy of the model,
+        so concurrent runs do not share their state, e.g. the user_id of the manager.
+        """
+        copied_obj = self.model_copy()
+        copied_obj.runs = list(self.runs)
+        copied_obj.messages = list(self.messages)
+        copied_obj.memories = list(self.memories) if self.memories is not None else None
+        copied_obj.summary = self.summary.model_copy() if self.summary is not None else None
+        copied_obj.updating_memory = False
+        for field_name in ("classifier", "manager", "summarizer"):
+            field_value = getattr(self, field_name)
+            if field_value is not None:
+                field_copy = field_value.model_copy()
+                if field_value.model is not None:
+                    field_copy.model = field_value.model.copy_for_run()
+                setattr(copied_obj, field_name, field_copy)
+        return copied_obj
+
     def deep_copy(self):
         # Create a shallow copy of the object
         copied_obj = self.__class__(**self.model_dump())
 
         # Manually deepcopy fields that are known to be safe
         for field_name, field_value in self.__dict__.items():
-            if field_name not in ["db", "classifier", "manager", "summarizer"]:
+            if field_name not in ["db", "classifier", "manager", "summarizer", "embedder"]:
                 try:
                     setattr(copied_obj, field_name, deepcopy(field_value))
                 except Exception as e:
@@ -375,5 +475,6 @@ class AgentMemory(BaseModel):
         copied_obj.classifier = self.classifier
         copied_obj.manager = self.manager
         copied_obj.summarizer = self.summarizer
+        copied_obj.embedder = self.embedder
 
         return copied_obj
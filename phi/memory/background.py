@@ -0,0 +1,124 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+from time import monotonic
+from typing import Callable, Dict, List, Optional
+
+from phi.utils.log import logger
+
+# Executor running the memory updates deferred from agent runs
+_update_executor: Optional[ThreadPoolExecutor] = None
+_update_executor_max_workers: int = 4
+_update_executor_lock = Lock()
+
+
+def get_update_executor() -> ThreadPoolExecutor:
+    global _update_executor
+    if _update_executor is None:
+        with _update_executor_lock:
+            if _update_executor is None:
+                _update_executor = ThreadPoolExecutor(
+                    max_workers=_update_executor_max_workers, thread_name_prefix="phi-memory"
+                )
+    return _update_executor
+
+
+class SessionUpdateQueue:
+    """Runs the deferred memory updates of one session, one at a time and in order.
+
+    Updates submitted while an update is running are coalesced: their inputs are processed together
+    by the last submitted update function, so a burst of runs creates one session summary.
+    """
+
+    def __init__(self, session_id: str):
+        self.session_id: str = session_id
+        self._lock = Lock()
+        self._idle = Event()
+        self._idle.set()
+        self._running: bool = False
+        self._pending_inputs: List[str] = []
+        self._pending_update: Optional[Callable[[List[str]], None]] = None
+
+    def submit(self, inputs: List[str], update: Callable[[List[str]], None]) -> None:
+        with self._lock:
+            self._pending_inputs.extend(inputs)
+            self._pending_update = update
+            self._idle.clear()
+            if self._running:
+                return
+            self._running = True
+        get_update_executor().submit(self._drain)
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                if self._pending_update is None:
+                    self._running = False
+                    self._idle.set()
+                    break
+                inputs, self._pending_inputs = self._pending_inputs, []
+                update, self._pending_update = self._pending_update, None
+            try:
+                update(inputs)
+            except Exception as e:
+                logger.warning(f"Failed to update memory for session {self.session_id}: {e}")
+        _remove_if_idle(self)
+
+    def is_idle(self) -> bool:
+        with self._lock:
+            return not self._running
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits until all updates submitted for the session have finished. Returns False on timeout."""
+        return self._idle.wait(timeout)
+
+
+_session_queues: Dict[str, SessionUpdateQueue] = {}
+_session_queues_lock = Lock()
+
+
+def submit_memory_update(session_id: str, inputs: List[str], update: Callable[[List[str]], None]) -> None:
+    """Queues a memory update for the session.
+
+    Args:
+        session_id (str): The session the update belongs to. Updates for a session run in order.
+        inputs (List[str]): The user messages to create memories from.
+        update (Callable[[List[str]], None]): Function that updates the memory with the inputs.
+            If updates are coalesced, only the last submitted function is called, with all pending inputs.
+    """
+    with _session_queues_lock:
+        queue = _session_queues.get(session_id)
+        if queue is None:
+            queue = SessionUpdateQueue(session_id=session_id)
+            _session_queues[session_id] = queue
+        queue.submit(inputs, update)
+
+
+def _remove_if_idle(queue: SessionUpdateQueue) -> None:
+    # Queues are removed once idle, so finished sessions do not accumulate
+    with _session_queues_lock:
+        if _session_queues.get(queue.session_id) is queue and queue.is_idle():
+            del _session_queues[queue.session_id]
+
+
+def flush_memory_updates(session_id: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+    """Waits for the deferred memory updates of a session, or of all sessions, to finish.
+
+    Args:
+        session_id (Optional[str]): The session to wait for. Waits for all sessions if not provided.
+        timeout (Optional[float]): Maximum number of seconds to wait.
+
+    Returns:
+        bool: True if all updates finished, False on timeout.
+    """
+    with _session_queues_lock:
+        if session_id is not None:
+            queues = [_session_queues[session_id]] if session_id in _session_queues else []
+        else:
+            queues = list(_session_queues.values())
+
+    deadline = monotonic() + timeout if timeout is not None else None
+    for queue in queues:
+        remaining = max(0.0, deadline - monotonic()) if deadline is not None else None
+        if not queue.wait(remaining):
+            return False
+    return True
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from phi.memory.row import MemoryRow
+from phi.utils.threads import run_in_thread
 
 
 class MemoryDb(ABC):
@@ -40,3 +41,35 @@ class MemoryDb(ABC):
     @abstractmethod
     def clear(self) -> bool:
         raise NotImplementedError
+
+    def read_memory_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Returns the stored embeddings for the memories with these ids.
+        Databases that do not store embeddings return an empty dict."""
+        return {}
+
+    def search_memories(
+        self, query_embedding: List[float], user_id: Optional[str] = None, limit: Optional[int] = None
+    ) -> Optional[List[MemoryRow]]:
+        """Returns the memories most similar to the query embedding, most similar first.
+        Databases without vector search return None and the memories are ranked in process."""
+        return None
+
+    # Async variants. Backends without a native async driver run the sync method in a thread
+    # so that memory reads and writes do not block the event loop.
+
+    async def amemory_exists(self, memory: MemoryRow) -> bool:
+        return await run_in_thread(self.memory_exists, memory)
+
+    async def aread_memories(
+        self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
+    ) -> List[MemoryRow]:
+        return await run_in_thread(self.read_memories, user_id=user_id, limit=limit, sort=sort)
+
+    async def aupsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
+        return await run_in_thread(self.upsert_memory, memory)
+
+    async def adelete_memory(self, id: str) -> None:
+        return await run_in_thread(self.delete_memory, id=id)
+
+    async def aclear(self) -> bool:
+        return await run_in_thread(self.clear)
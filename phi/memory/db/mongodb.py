@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime, timezone
 
 try:
@@ -88,7 +88,8 @@ class MongoMemoryDb(MemoryDb):
 
             # Build sort order
             sort_order = -1 if sort != "asc" else 1
-            cursor = self.collection.find(query).sort("created_at", sort_order)
+            # Embeddings are only read for semantic retrieval
+            cursor = self.collection.find(query, {"embedding": 0}).sort("created_at", sort_order)
 
             if limit is not None:
                 cursor = cursor.limit(limit)
@@ -125,6 +126,8 @@ class MongoMemoryDb(MemoryDb):
                 "memory": memory.memory,
                 "updated_at": timestamp,
                 "_version": memory_dict["_version"],
+                # An updated memory without an embedding clears the embedding of the previous memory
+                "embedding": memory.embedding,
             }
 
             # For new documents, set created_at
@@ -142,6 +145,22 @@ class MongoMemoryDb(MemoryDb):
             logger.error(f"Error upserting memory: {e}")
             raise
 
+    def read_memory_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        """Read the stored embeddings of memories
+        Args:
+            ids: IDs of the memories
+        Returns:
+            Dict[str, List[float]]: Embeddings by memory id
+        """
+        if len(ids) == 0:
+            return {}
+        try:
+            cursor = self.collection.find({"id": {"$in": ids}, "embedding": {"$ne": None}}, {"id": 1, "embedding": 1})
+            return {doc["id"]: doc["embedding"] for doc in cursor}
+        except PyMongoError as e:
+            logger.error(f"Error reading memory embeddings: {e}")
+            return {}
+
     def delete_memory(self, id: str) -> None:
         """Delete a memory from the collection
         Args:
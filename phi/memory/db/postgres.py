@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
 try:
     from sqlalchemy.dialects import postgresql
@@ -6,14 +6,29 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import sessionmaker, scoped_session
     from sqlalchemy.schema import MetaData, Table, Column
-    from sqlalchemy.sql.expression import text, select, delete
+    from sqlalchemy.sql.expression import text, select, delete, null
     from sqlalchemy.types import DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed")
 
+try:
+    from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+except ImportError:
+    # The asyncio extension requires `greenlet`. Without it, async methods run the sync methods in a thread.
+    AsyncEngine = async_sessionmaker = create_async_engine = None  # type: ignore
+
+try:
+    from pgvector.sqlalchemy import Vector
+
+    PGVECTOR_INSTALLED = True
+except ImportError:
+    # Without pgvector, memory embeddings are not stored and semantic retrieval ranks the memories in process
+    PGVECTOR_INSTALLED = False
+
 from phi.memory.db import MemoryDb
 from phi.memory.row import MemoryRow
 from phi.utils.log import logger
+from phi.utils.threads import run_in_thread
 
 
 class PgMemoryDb(MemoryDb):
@@ -23,6 +38,9 @@ class PgMemoryDb(MemoryDb):
         schema: Optional[str] = "ai",
         db_url: Optional[str] = None,
         db_engine: Optional[Engine] = None,
+        async_db_url: Optional[str] = None,
+        async_db_engine: Optional[AsyncEngine] = None,
+        dimensions: Optional[int] = None,
     ):
         """
         This class provides a memory store backed by a postgres table.
@@ -31,11 +49,19 @@ class PgMemoryDb(MemoryDb):
             1. Use the db_engine if provided
             2. Use the db_url to create the engine
 
+        Async methods use the async_db_engine if provided, otherwise an engine created from the async_db_url,
+        otherwise an engine created from the db_url if it uses the async capable psycopg driver.
+        Without an async engine, async methods run the sync methods in a thread.
+
         Args:
             table_name (str): The name of the table to store memory rows.
             schema (Optional[str]): The schema to store the table in. Defaults to "ai".
             db_url (Optional[str]): The database URL to connect to. Defaults to None.
             db_engine (Optional[Engine]): The database engine to use. Defaults to None.
+            async_db_url (Optional[str]): The database URL for async access. Defaults to None.
+            async_db_engine (Optional[AsyncEngine]): The async database engine to use. Defaults to None.
+            dimensions (Optional[int]): The dimensions of the memory embeddings.
+                Defaults to the dimensions of the first embedding written.
         """
         _engine: Optional[Engine] = db_engine
         if _engine is None and db_url is not None:
@@ -44,6 +70,19 @@ class PgMemoryDb(MemoryDb):
         if _engine is None:
             raise ValueError("Must provide either db_url or db_engine")
 
+        _async_engine: Optional[AsyncEngine] = async_db_engine
+        if _async_engine is None and async_db_url is not None:
+            if create_async_engine is None:
+                raise ImportError("`greenlet` not installed. Please install it using `pip install greenlet`")
+            _async_engine = create_async_engine(async_db_url)
+        elif (
+            _async_engine is None
+            and create_async_engine is not None
+            and db_url is not None
+            and db_url.startswith("postgresql+psycopg://")
+        ):
+            _async_engine = create_async_engine(db_url)
+
         self.table_name: str = table_name
         self.schema: Optional[str] = schema
         self.db_url: Optional[str] = db_url
@@ -51,19 +90,75 @@ class PgMemoryDb(MemoryDb):
         self.inspector = inspect(self.db_engine)
         self.metadata: MetaData = MetaData(schema=self.schema)
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        self.async_db_engine: Optional[AsyncEngine] = _async_engine
+        self.AsyncSession: Optional[async_sessionmaker] = (
+            async_sessionmaker(bind=self.async_db_engine) if self.async_db_engine is not None else None
+        )
+        # The embedding column is added by upgrade_schema() when memories are first embedded
+        self.dimensions: Optional[int] = dimensions
+        self.has_embedding_column: bool = False
+        # True once the table was checked for an embedding column added by another instance
+        self.checked_embedding_column: bool = False
         self.table: Table = self.get_table()
 
     def get_table(self) -> Table:
-        return Table(
-            self.table_name,
-            self.metadata,
+        columns = [
             Column("id", String, primary_key=True),
             Column("user_id", String),
             Column("memory", postgresql.JSONB, server_default=text("'{}'::jsonb")),
             Column("created_at", DateTime(timezone=True), server_default=text("now()")),
             Column("updated_at", DateTime(timezone=True), onupdate=text("now()")),
-            extend_existing=True,
-        )
+        ]
+        if self.has_embedding_column:
+            columns.append(Column("embedding", Vector(self.dimensions)))
+        return Table(self.table_name, self.metadata, *columns, extend_existing=True)
+
+    @property
+    def embedding_index_name(self) -> str:
+        return f"{self.table_name}_embedding_hnsw_index"
+
+    def upgrade_schema(self, dimensions: Optional[int] = None) -> bool:
+        """
+        Adds the embedding column used for semantic retrieval, with an HNSW index for cosine distance searches.
+
+        The column is created with the dimensions of the first embedding written. Without dimensions, only an
+        existing embedding column is used. Returns False if there is no embedding column or pgvector is not available.
+        """
+        if self.has_embedding_column:
+            return True
+        if not PGVECTOR_INSTALLED:
+            return False
+        dimensions = dimensions or self.dimensions
+        try:
+            if dimensions is None:
+                if self.checked_embedding_column or not self.table_exists():
+                    return False
+                self.checked_embedding_column = True
+                columns = inspect(self.db_engine).get_columns(self.table_name, schema=self.schema)
+                if not any(column["name"] == "embedding" for column in columns):
+                    return False
+            else:
+                self.create()
+                with self.Session() as sess, sess.begin():
+                    sess.execute(text("CREATE EXTENSION IF NOT EXISTS vector;"))
+                    sess.execute(
+                        text(
+                            f"ALTER TABLE {self.table.fullname} ADD COLUMN IF NOT EXISTS embedding vector({dimensions});"
+                        )
+                    )
+                    sess.execute(
+                        text(
+                            f'CREATE INDEX IF NOT EXISTS "{self.embedding_index_name}" ON {self.table.fullname} '
+                            "USING hnsw (embedding vector_cosine_ops);"
+                        )
+                    )
+        except Exception as e:
+            logger.warning(f"Could not add the embedding column to '{self.table.fullname}': {e}")
+            return False
+        self.dimensions = dimensions
+        self.has_embedding_column = True
+        self.table = self.get_table()
+        return True
 
     def create(self) -> None:
         if not self.table_exists():
@@ -85,23 +180,32 @@ class PgMemoryDb(MemoryDb):
             result = sess.execute(stmt).first()
             return result is not None
 
+    def get_memory_columns(self) -> List[Column]:
+        # Embeddings are only read for semantic retrieval
+        return [column for column in self.table.columns if column.name != "embedding"]
+
+    def get_read_memories_statement(
+        self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
+    ):
+        stmt = select(*self.get_memory_columns())
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        if sort == "asc":
+            stmt = stmt.order_by(self.table.c.created_at.asc())
+        else:
+            stmt = stmt.order_by(self.table.c.created_at.desc())
+        return stmt
+
     def read_memories(
         self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
     ) -> List[MemoryRow]:
         memories: List[MemoryRow] = []
         try:
             with self.Session() as sess, sess.begin():
-                stmt = select(self.table)
-                if user_id is not None:
-                    stmt = stmt.where(self.table.c.user_id == user_id)
-                if limit is not None:
-                    stmt = stmt.limit(limit)
-
-                if sort == "asc":
-                    stmt = stmt.order_by(self.table.c.created_at.asc())
-                else:
-                    stmt = stmt.order_by(self.table.c.created_at.desc())
-
+                stmt = self.get_read_memories_statement(user_id=user_id, limit=limit, sort=sort)
                 rows = sess.execute(stmt).fetchall()
                 for row in rows:
                     if row is not None:
@@ -113,29 +217,29 @@ class PgMemoryDb(MemoryDb):
             self.create()
         return memories
 
+    def get_upsert_statement(self, memory: MemoryRow):
+        values: Dict[str, Any] = dict(id=memory.id, user_id=memory.user_id, memory=memory.memory)
+        if self.has_embedding_column:
+            # An updated memory without an embedding clears the embedding of the previous memory
+            values["embedding"] = memory.embedding if memory.embedding is not None else null()
+        # Create an insert statement
+        stmt = postgresql.insert(self.table).values(**values)
+
+        # Define the upsert if the memory already exists
+        # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+        return stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={key: stmt.excluded[key] for key in values if key != "id"},
+        )
+
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
         """Create a new memory if it does not exist, otherwise update the existing memory"""
+        # Check for an embedding column even without an embedding, to clear the embedding of an updated memory
+        self.upgrade_schema(dimensions=len(memory.embedding) if memory.embedding is not None else None)
 
         try:
             with self.Session() as sess, sess.begin():
-                # Create an insert statement
-                stmt = postgresql.insert(self.table).values(
-                    id=memory.id,
-                    user_id=memory.user_id,
-                    memory=memory.memory,
-                )
-
-                # Define the upsert if the memory already exists
-                # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["id"],
-                    set_=dict(
-                        user_id=stmt.excluded.user_id,
-                        memory=stmt.excluded.memory,
-                    ),
-                )
-
-                sess.execute(stmt)
+                sess.execute(self.get_upsert_statement(memory))
         except Exception as e:
             logger.debug(f"Exception upserting into table: {e}")
             logger.debug(f"Table does not exist: {self.table.name}")
@@ -150,6 +254,98 @@ class PgMemoryDb(MemoryDb):
             stmt = delete(self.table).where(self.table.c.id == id)
             sess.execute(stmt)
 
+    def read_memory_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        if len(ids) == 0 or not self.upgrade_schema():
+            return {}
+
+        with self.Session() as sess, sess.begin():
+            stmt = select(self.table.c.id, self.table.c.embedding).where(
+                self.table.c.id.in_(ids), self.table.c.embedding.isnot(None)
+            )
+            return {row.id: [float(x) for x in row.embedding] for row in sess.execute(stmt)}
+
+    def search_memories(
+        self, query_embedding: List[float], user_id: Optional[str] = None, limit: Optional[int] = None
+    ) -> Optional[List[MemoryRow]]:
+        if not self.upgrade_schema():
+            return None
+
+        stmt = select(*self.get_memory_columns()).where(self.table.c.embedding.isnot(None))
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        stmt = stmt.order_by(self.table.c.embedding.cosine_distance(query_embedding))
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        with self.Session() as sess, sess.begin():
+            return [MemoryRow.model_validate(row) for row in sess.execute(stmt).fetchall()]
+
+    async def amemory_exists(self, memory: MemoryRow) -> bool:
+        if self.AsyncSession is None:
+            return await super().amemory_exists(memory)
+
+        async with self.AsyncSession() as sess, sess.begin():
+            stmt = select(self.table.c.id).where(self.table.c.id == memory.id)
+            result = (await sess.execute(stmt)).first()
+            return result is not None
+
+    async def aread_memories(
+        self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
+    ) -> List[MemoryRow]:
+        if self.AsyncSession is None:
+            return await super().aread_memories(user_id=user_id, limit=limit, sort=sort)
+
+        memories: List[MemoryRow] = []
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                stmt = self.get_read_memories_statement(user_id=user_id, limit=limit, sort=sort)
+                rows = (await sess.execute(stmt)).fetchall()
+                for row in rows:
+                    if row is not None:
+                        memories.append(MemoryRow.model_validate(row))
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await run_in_thread(self.create)
+        return memories
+
+    async def aupsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> Optional[MemoryRow]:
+        """Create a new memory if it does not exist, otherwise update the existing memory"""
+        if self.AsyncSession is None:
+            return await super().aupsert_memory(memory)
+        if not self.has_embedding_column:
+            await run_in_thread(self.upgrade_schema, len(memory.embedding) if memory.embedding is not None else None)
+
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                await sess.execute(self.get_upsert_statement(memory))
+        except Exception as e:
+            logger.debug(f"Exception upserting into table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await run_in_thread(self.create)
+            if create_and_retry:
+                return await self.aupsert_memory(memory, create_and_retry=False)
+            return None
+        return None
+
+    async def adelete_memory(self, id: str) -> None:
+        if self.AsyncSession is None:
+            return await super().adelete_memory(id=id)
+
+        async with self.AsyncSession() as sess, sess.begin():
+            stmt = delete(self.table).where(self.table.c.id == id)
+            await sess.execute(stmt)
+
+    async def aclear(self) -> bool:
+        if self.AsyncSession is None:
+            return await super().aclear()
+
+        async with self.AsyncSession() as sess, sess.begin():
+            stmt = delete(self.table)
+            await sess.execute(stmt)
+            return True
+
     def drop_table(self) -> None:
         if self.table_exists():
             logger.debug(f"Deleting table: {self.table_name}")
@@ -191,7 +387,7 @@ class PgMemoryDb(MemoryDb):
             if k in {"metadata", "table"}:
                 continue
             # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "Session"}:
+            elif k in {"db_engine", "Session", "async_db_engine", "AsyncSession"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
@@ -1,5 +1,6 @@
+import json
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 try:
     from sqlalchemy import (
@@ -72,13 +73,13 @@ class SqliteMemoryDb(MemoryDb):
 
         # Database session
         self.Session = scoped_session(sessionmaker(bind=self.db_engine))
+        # The embedding column is added by upgrade_schema() when memories are first embedded
+        self.has_embedding_column: bool = False
         # Database table for memories
         self.table: Table = self.get_table()
 
     def get_table(self) -> Table:
-        return Table(
-            self.table_name,
-            self.metadata,
+        columns: List[Column] = [
             Column("id", String, primary_key=True),
             Column("user_id", String),
             Column("memory", String),
@@ -86,8 +87,24 @@ class SqliteMemoryDb(MemoryDb):
             Column(
                 "updated_at", DateTime, server_default=text("CURRENT_TIMESTAMP"), onupdate=text("CURRENT_TIMESTAMP")
             ),
-            extend_existing=True,
-        )
+        ]
+        if self.has_embedding_column:
+            # Embeddings are stored as JSON and ranked in process
+            columns.append(Column("embedding", String))
+        return Table(self.table_name, self.metadata, *columns, extend_existing=True)
+
+    def upgrade_schema(self) -> None:
+        """Adds the embedding column used for semantic retrieval to a table created without it."""
+        if self.has_embedding_column:
+            return
+        self.create()
+        existing_columns = {column["name"] for column in inspect(self.db_engine).get_columns(self.table_name)}
+        if "embedding" not in existing_columns:
+            with self.Session() as session:
+                session.execute(text(f"ALTER TABLE {self.table_name} ADD COLUMN embedding TEXT"))
+                session.commit()
+        self.has_embedding_column = True
+        self.table = self.get_table()
 
     def create(self) -> None:
         if not self.table_exists():
@@ -110,7 +127,7 @@ class SqliteMemoryDb(MemoryDb):
         memories: List[MemoryRow] = []
         try:
             with self.Session() as session:
-                stmt = select(self.table)
+                stmt = select(self.table.c.id, self.table.c.user_id, self.table.c.memory)
                 if user_id is not None:
                     stmt = stmt.where(self.table.c.user_id == user_id)
 
@@ -133,21 +150,28 @@ class SqliteMemoryDb(MemoryDb):
         return memories
 
     def upsert_memory(self, memory: MemoryRow, create_and_retry: bool = True) -> None:
+        if memory.embedding is not None:
+            self.upgrade_schema()
+
+        values = dict(user_id=memory.user_id, memory=str(memory.memory))
+        if self.has_embedding_column:
+            # An updated memory without an embedding clears the embedding of the previous memory
+            values["embedding"] = json.dumps(memory.embedding) if memory.embedding is not None else None
         try:
             with self.Session() as session:
                 # Check if the memory already exists
-                existing = session.execute(select(self.table).where(self.table.c.id == memory.id)).first()
+                existing = session.execute(select(self.table.c.id).where(self.table.c.id == memory.id)).first()
 
                 if existing:
                     # Update existing memory
                     stmt = (
                         self.table.update()
                         .where(self.table.c.id == memory.id)
-                        .values(user_id=memory.user_id, memory=str(memory.memory), updated_at=text("CURRENT_TIMESTAMP"))
+                        .values(**values, updated_at=text("CURRENT_TIMESTAMP"))
                     )
                 else:
                     # Insert new memory
-                    stmt = self.table.insert().values(id=memory.id, user_id=memory.user_id, memory=str(memory.memory))  # type: ignore
+                    stmt = self.table.insert().values(id=memory.id, **values)  # type: ignore
 
                 session.execute(stmt)
                 session.commit()
@@ -162,6 +186,17 @@ class SqliteMemoryDb(MemoryDb):
             else:
                 raise
 
+    def read_memory_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        if len(ids) == 0:
+            return {}
+        self.upgrade_schema()
+
+        with self.Session() as session:
+            stmt = select(self.table.c.id, self.table.c.embedding).where(
+                self.table.c.id.in_(ids), self.table.c.embedding.isnot(None)
+            )
+            return {row.id: json.loads(row.embedding) for row in session.execute(stmt)}
+
     def delete_memory(self, id: str) -> None:
         with self.Session() as session:
             stmt = delete(self.table).where(self.table.c.id == id)
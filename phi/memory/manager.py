@@ -2,6 +2,7 @@ from typing import List, Any, Optional, cast
 
 from pydantic import BaseModel, ConfigDict
 
+from phi.embedder.base import Embedder
 from phi.model.base import Model
 from phi.model.message import Message
 from phi.memory.memory import Memory
@@ -18,6 +19,8 @@ class MemoryManager(BaseModel):
     system_prompt: Optional[str] = None
     # Memory Database
     db: Optional[MemoryDb] = None
+    # Embedder used to embed memories when they are written, for semantic retrieval
+    embedder: Optional[Embedder] = None
 
     # Do not set the input message here, it will be set by the run method
     input_message: Optional[str] = None
@@ -47,6 +50,22 @@ class MemoryManager(BaseModel):
 
         return self.db.read_memories(user_id=self.user_id)
 
+    async def aget_existing_memories(self) -> Optional[List[MemoryRow]]:
+        if self.db is None:
+            return None
+
+        return await self.db.aread_memories(user_id=self.user_id)
+
+    def get_memory_row(self, memory: str, id: Optional[str] = None) -> MemoryRow:
+        memory_row = MemoryRow(
+            id=id, user_id=self.user_id, memory=Memory(memory=memory, input=self.input_message).to_dict()
+        )
+        if self.embedder is not None:
+            from phi.memory.semantic import get_embedding
+
+            memory_row.embedding = get_embedding(self.embedder, memory)
+        return memory_row
+
     def add_memory(self, memory: str) -> str:
         """Use this function to add a memory to the database.
         Args:
@@ -56,9 +75,7 @@ class MemoryManager(BaseModel):
         """
         try:
             if self.db:
-                self.db.upsert_memory(
-                    MemoryRow(user_id=self.user_id, memory=Memory(memory=memory, input=self.input_message).to_dict())
-                )
+                self.db.upsert_memory(self.get_memory_row(memory))
             return "Memory added successfully"
         except Exception as e:
             logger.warning(f"Error storing memory in db: {e}")
@@ -89,11 +106,7 @@ class MemoryManager(BaseModel):
         """
         try:
             if self.db:
-                self.db.upsert_memory(
-                    MemoryRow(
-                        id=id, user_id=self.user_id, memory=Memory(memory=memory, input=self.input_message).to_dict()
-                    )
-                )
+                self.db.upsert_memory(self.get_memory_row(memory, id=id))
             return "Memory updated successfully"
         except Exception as e:
             logger.warning(f"Error updating memory in db: {e}")
@@ -113,7 +126,7 @@ class MemoryManager(BaseModel):
             logger.warning(f"Error clearing memory in db: {e}")
             return f"Error clearing memory: {e}"
 
-    def get_system_message(self) -> Message:
+    def get_system_message(self, existing_memories: Optional[List[MemoryRow]] = None) -> Message:
         # -*- Return a system message for the memory manager
         system_prompt_lines = [
             "Your task is to generate a concise memory for the user's message. "
@@ -126,7 +139,8 @@ class MemoryManager(BaseModel):
             "  3. Delete a memory using the `delete_memory` tool.",
             "  4. Clear all memories using the `clear_memory` tool. Use this with extreme caution, as it will remove all memories from the database.",
         ]
-        existing_memories = self.get_existing_memories()
+        if existing_memories is None:
+            existing_memories = self.get_existing_memories()
         if existing_memories and len(existing_memories) > 0:
             system_prompt_lines.extend(
                 [
@@ -175,7 +189,8 @@ class MemoryManager(BaseModel):
         self.update_model()
 
         # Prepare the List of messages to send to the Model
-        messages_for_model: List[Message] = [self.get_system_message()]
+        existing_memories = await self.aget_existing_memories()
+        messages_for_model: List[Message] = [self.get_system_message(existing_memories=existing_memories)]
         # Add the user prompt message
         user_prompt_message = Message(role="user", content=message, **kwargs) if message else None
         if user_prompt_message is not None:
@@ -1,7 +1,7 @@
 import json
 from hashlib import md5
 from datetime import datetime
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List
 from pydantic import BaseModel, ConfigDict, model_validator
 
 
@@ -14,11 +14,13 @@ class MemoryRow(BaseModel):
     updated_at: Optional[datetime] = None
     # id for this memory, auto-generated from the memory
     id: Optional[str] = None
+    # Embedding of the memory, used for semantic retrieval
+    embedding: Optional[List[float]] = None
 
     model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
 
     def serializable_dict(self) -> Dict[str, Any]:
-        _dict = self.model_dump(exclude={"created_at", "updated_at"})
+        _dict = self.model_dump(exclude={"created_at", "updated_at", "embedding"})
         _dict["created_at"] = self.created_at.isoformat() if self.created_at else None
         _dict["updated_at"] = self.updated_at.isoformat() if self.updated_at else None
         return _dict
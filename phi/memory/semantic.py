@@ -0,0 +1,143 @@
+import json
+from collections import OrderedDict
+from hashlib import md5
+from math import sqrt
+from threading import Lock
+from typing import Dict, List, Optional, Set, Tuple
+
+from phi.embedder.base import Embedder
+from phi.memory.db import MemoryDb
+from phi.memory.row import MemoryRow
+from phi.utils.log import logger
+
+# Process-wide cache of memory embeddings, keyed by the embedder and a hash of the memory text,
+# so memories that have not changed are never embedded again
+_embedding_cache: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+_embedding_cache_max_size: int = 10_000
+_embedding_cache_lock = Lock()
+
+
+def get_memory_text(row: MemoryRow) -> str:
+    """Returns the text of a memory row that is embedded."""
+    memory = row.memory.get("memory")
+    if isinstance(memory, str):
+        return memory
+    return json.dumps(row.memory, sort_keys=True)
+
+
+def get_embedder_key(embedder: Embedder) -> str:
+    model = getattr(embedder, "model", None) or getattr(embedder, "id", None)
+    return f"{embedder.__class__.__name__}:{model}:{embedder.dimensions}"
+
+
+def _get_cache_key(embedder_key: str, text: str) -> Tuple[str, str]:
+    return embedder_key, md5(text.encode()).hexdigest()
+
+
+def get_cached_embedding(embedder: Embedder, text: str) -> Optional[List[float]]:
+    key = _get_cache_key(get_embedder_key(embedder), text)
+    with _embedding_cache_lock:
+        embedding = _embedding_cache.get(key)
+        if embedding is not None:
+            _embedding_cache.move_to_end(key)
+        return embedding
+
+
+def cache_embedding(embedder: Embedder, text: str, embedding: List[float]) -> None:
+    key = _get_cache_key(get_embedder_key(embedder), text)
+    with _embedding_cache_lock:
+        _embedding_cache[key] = embedding
+        _embedding_cache.move_to_end(key)
+        while len(_embedding_cache) > _embedding_cache_max_size:
+            _embedding_cache.popitem(last=False)
+
+
+def get_embedding(embedder: Embedder, text: str) -> List[float]:
+    """Returns the embedding for the text, using the cache when the text was embedded before."""
+    embedding = get_cached_embedding(embedder, text)
+    if embedding is None:
+        embedding = embedder.get_embedding(text)
+        cache_embedding(embedder, text, embedding)
+    return embedding
+
+
+def embed_memories(db: MemoryDb, embedder: Embedder, memory_rows: List[MemoryRow]) -> None:
+    """Sets the embedding on each memory row.
+
+    Embeddings are taken from the cache, then from the embeddings stored in the db. Memories without a stored
+    embedding are embedded in one batch and the embeddings are saved to the db.
+    """
+    missing: List[MemoryRow] = []
+    for row in memory_rows:
+        if row.embedding is None:
+            row.embedding = get_cached_embedding(embedder, get_memory_text(row))
+        if row.embedding is None:
+            missing.append(row)
+    if len(missing) == 0:
+        return
+
+    stored_embeddings: Dict[str, List[float]] = db.read_memory_embeddings([row.id for row in missing if row.id])
+    to_embed: List[MemoryRow] = []
+    for row in missing:
+        stored_embedding = stored_embeddings.get(row.id) if row.id else None
+        if stored_embedding is not None:
+            row.embedding = stored_embedding
+            cache_embedding(embedder, get_memory_text(row), stored_embedding)
+        else:
+            to_embed.append(row)
+    if len(to_embed) == 0:
+        return
+
+    logger.debug(f"Embedding {len(to_embed)} memories")
+    texts = [get_memory_text(row) for row in to_embed]
+    for row, text, embedding in zip(to_embed, texts, embedder.get_embeddings(texts)):
+        row.embedding = embedding
+        cache_embedding(embedder, text, embedding)
+        try:
+            db.upsert_memory(row)
+        except Exception as e:
+            logger.debug(f"Could not save memory embedding: {e}")
+
+
+def cosine_similarity(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = sqrt(sum(x * x for x in a)) * sqrt(sum(y * y for y in b))
+    return dot / norm if norm > 0 else 0.0
+
+
+def rank_memories(
+    memory_rows: List[MemoryRow], query_embedding: List[float], limit: Optional[int] = None
+) -> List[MemoryRow]:
+    """Returns the memory rows with an embedding, most similar to the query first."""
+    scored = [(cosine_similarity(query_embedding, row.embedding), row) for row in memory_rows if row.embedding]
+    scored.sort(key=lambda item: item[0], reverse=True)
+    ranked = [row for _, row in scored]
+    return ranked[:limit] if limit is not None else ranked
+
+
+# Memory dbs with vector search whose existing memories were embedded by this process
+_embedded_memory_dbs: Set[Tuple[str, str, Optional[str]]] = set()
+
+
+def search_memories(
+    db: MemoryDb, embedder: Embedder, query: str, user_id: Optional[str] = None, limit: Optional[int] = None
+) -> List[MemoryRow]:
+    """Returns the memories of the user most relevant to the query, most relevant first.
+
+    Databases with vector search (pgvector) search the stored embeddings. For other databases,
+    the memories are ranked in process using the cached embeddings.
+    """
+    query_embedding = get_embedding(embedder, query)
+    memory_rows = db.search_memories(query_embedding, user_id=user_id, limit=limit)
+    if memory_rows is not None:
+        # Memories stored before semantic retrieval was enabled have no embedding and are embedded once
+        db_key = (db.__class__.__name__, str(getattr(db, "table_name", id(db))), user_id)
+        if db_key not in _embedded_memory_dbs:
+            embed_memories(db, embedder, db.read_memories(user_id=user_id))
+            _embedded_memory_dbs.add(db_key)
+            memory_rows = db.search_memories(query_embedding, user_id=user_id, limit=limit) or []
+        return memory_rows
+
+    memory_rows = db.read_memories(user_id=user_id)
+    embed_memories(db, embedder, memory_rows)
+    return rank_memories(memory_rows, query_embedding, limit)
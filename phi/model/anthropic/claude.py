@@ -8,6 +8,7 @@ from phi.model.message import Message
 from phi.model.response import ModelResponse
 from phi.tools.function import FunctionCall
 from phi.utils.log import logger
+from phi.utils.client_pool import get_shared_client
 from phi.utils.timer import Timer
 from phi.utils.tools import get_function_call_for_tool_call
 
@@ -99,7 +100,7 @@ class Claude(Model):
             _client_params["api_key"] = self.api_key
         if self.client_params:
             _client_params.update(self.client_params)
-        return AnthropicClient(**_client_params)
+        return get_shared_client(AnthropicClient, _client_params)
 
     @property
     def request_kwargs(self) -> Dict[str, Any]:
@@ -1,7 +1,7 @@
 from os import getenv
 from typing import Optional, Dict, Any
 from phi.model.openai.like import OpenAILike
-import httpx
+from phi.utils.client_pool import get_shared_client
 
 try:
     from openai import AzureOpenAI as AzureOpenAIClient
@@ -55,7 +55,7 @@ class AzureOpenAIChat(OpenAILike):
 
         _client_params: Dict[str, Any] = self.get_client_params()
 
-        return AzureOpenAIClient(**_client_params)
+        return get_shared_client(AzureOpenAIClient, _client_params, http_client=True)
 
     def get_async_client(self) -> AsyncAzureOpenAIClient:
         """
@@ -69,12 +69,8 @@ class AzureOpenAIChat(OpenAILike):
 
         if self.http_client:
             _client_params["http_client"] = self.http_client
-        else:
-            # Create a new async HTTP client with custom limits
-            _client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
-        return AsyncAzureOpenAIClient(**_client_params)
+        # Reuse a pooled async HTTP client bound to the running event loop
+        return get_shared_client(AsyncAzureOpenAIClient, _client_params, is_async=True, http_client=True)
 
     def get_client_params(self) -> Dict[str, Any]:
         _client_params: Dict[str, Any] = {}
@@ -1,7 +1,9 @@
+import asyncio
 import collections.abc
 
+from copy import copy
 from types import GeneratorType
-from typing import List, Iterator, Optional, Dict, Any, Callable, Union, Sequence
+from typing import List, Iterator, AsyncIterator, Optional, Dict, Any, Callable, Union, Sequence, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, ValidationInfo
 
@@ -11,6 +13,7 @@ from phi.tools import Tool, Toolkit
 from phi.tools.function import Function, FunctionCall, ToolCallException
 from phi.utils.log import logger
 from phi.utils.timer import Timer
+from phi.utils.tools import get_function_call_for_tool_call
 
 
 class Model(BaseModel):
@@ -42,6 +45,10 @@ class Model(BaseModel):
     show_tool_calls: Optional[bool] = None
     # Maximum number of tool calls allowed.
     tool_call_limit: Optional[int] = None
+    # If True, runs the tool calls from a single model response concurrently.
+    run_tools_in_parallel: bool = False
+    # Maximum number of tool calls to run concurrently. Defaults to the number of tool calls.
+    max_parallel_tool_calls: Optional[int] = None
 
     # -*- Functions available to the Model to call -*-
     # Functions extracted from the tools.
@@ -143,6 +150,9 @@ class Model(BaseModel):
                 for name, func in tool.functions.items():
                     # If the function does not exist in self.functions, add to self.tools
                     if name not in self.functions:
+                        # Add a copy so that functions shared between agents are not bound to this agent
+                        # or processed more than once
+                        func = func.model_copy()
                         func._agent = agent
                         func.process_entrypoint(strict=strict)
                         if strict and self.supports_structured_outputs:
@@ -153,6 +163,7 @@ class Model(BaseModel):
 
             elif isinstance(tool, Function):
                 if tool.name not in self.functions:
+                    tool = tool.model_copy()
                     tool._agent = agent
                     tool.process_entrypoint(strict=strict)
                     if strict and self.supports_structured_outputs:
@@ -180,9 +191,141 @@ class Model(BaseModel):
         # This is triggered when the function call limit is reached.
         self.tool_choice = "none"
 
+    def _get_messages_from_tool_call_exception(self, tce: ToolCallException) -> Tuple[bool, List[Message]]:
+        """Converts a ToolCallException into additional messages.
+
+        Returns:
+            Tuple[bool, List[Message]]: (stop_execution_after_tool_call, additional_messages_from_function_call)
+        """
+        # If True, stop execution after this function call
+        stop_execution_after_tool_call = False
+        # Additional messages from the function call that will be added to the function call results
+        additional_messages_from_function_call: List[Message] = []
+
+        if tce.user_message is not None:
+            if isinstance(tce.user_message, str):
+                additional_messages_from_function_call.append(Message(role="user", content=tce.user_message))
+            else:
+                additional_messages_from_function_call.append(tce.user_message)
+        if tce.agent_message is not None:
+            if isinstance(tce.agent_message, str):
+                additional_messages_from_function_call.append(Message(role="assistant", content=tce.agent_message))
+            else:
+                additional_messages_from_function_call.append(tce.agent_message)
+        if tce.messages is not None and len(tce.messages) > 0:
+            for m in tce.messages:
+                if isinstance(m, Message):
+                    additional_messages_from_function_call.append(m)
+                elif isinstance(m, dict):
+                    try:
+                        additional_messages_from_function_call.append(Message(**m))
+                    except Exception as e:
+                        logger.warning(f"Failed to convert dict to Message: {e}")
+        if tce.stop_execution:
+            stop_execution_after_tool_call = True
+            if len(additional_messages_from_function_call) > 0:
+                for m in additional_messages_from_function_call:
+                    m.stop_after_tool_call = True
+        return stop_execution_after_tool_call, additional_messages_from_function_call
+
+    def _execute_function_call(self, function_call: FunctionCall) -> Tuple[bool, bool, List[Message]]:
+        """Runs a function call and converts a ToolCallException into additional messages.
+
+        Returns:
+            Tuple[bool, bool, List[Message]]: (function_call_success, stop_execution_after_tool_call,
+                additional_messages_from_function_call)
+        """
+        try:
+            return function_call.execute(), False, []
+        except ToolCallException as tce:
+            stop_execution_after_tool_call, additional_messages = self._get_messages_from_tool_call_exception(tce)
+            return False, stop_execution_after_tool_call, additional_messages
+
+    async def _aexecute_function_call(self, function_call: FunctionCall) -> Tuple[bool, bool, List[Message]]:
+        """Async version of _execute_function_call that does not block the event loop."""
+        try:
+            return await function_call.aexecute(), False, []
+        except ToolCallException as tce:
+            stop_execution_after_tool_call, additional_messages = self._get_messages_from_tool_call_exception(tce)
+            return False, stop_execution_after_tool_call, additional_messages
+
+    def _get_function_call_started_response(self, function_call: FunctionCall, tool_role: str) -> ModelResponse:
+        return ModelResponse(
+            content=function_call.get_call_str(),
+            tool_call={
+                "role": tool_role,
+                "tool_call_id": function_call.call_id,
+                "tool_name": function_call.function.name,
+                "tool_args": function_call.arguments,
+            },
+            event=ModelResponseEvent.tool_call_started.value,
+        )
+
+    def _add_function_call_result(
+        self,
+        function_call: FunctionCall,
+        function_call_output: Optional[Union[List[Any], str]],
+        function_call_success: bool,
+        stop_execution_after_tool_call: bool,
+        additional_messages_from_function_call: List[Message],
+        function_call_time: float,
+        function_call_results: List[Message],
+        tool_role: str,
+    ) -> Iterator[ModelResponse]:
+        if self.function_call_stack is None:
+            self.function_call_stack = []
+
+        # -*- Create function call result message
+        function_call_result = Message(
+            role=tool_role,
+            content=function_call_output if function_call_success else function_call.error,
+            tool_call_id=function_call.call_id,
+            tool_name=function_call.function.name,
+            tool_args=function_call.arguments,
+            tool_call_error=not function_call_success,
+            stop_after_tool_call=function_call.function.stop_after_tool_call or stop_execution_after_tool_call,
+            metrics={"time": function_call_time},
+        )
+
+        # -*- Yield function call result
+        yield ModelResponse(
+            content=f"{function_call.get_call_str()} completed in {function_call_time:.4f}s.",
+            tool_call=function_call_result.model_dump(
+                include={
+                    "content",
+                    "tool_call_id",
+                    "tool_name",
+                    "tool_args",
+                    "tool_call_error",
+                    "metrics",
+                    "created_at",
+                }
+            ),
+            event=ModelResponseEvent.tool_call_completed.value,
+        )
+
+        # Add metrics to the model
+        if "tool_call_times" not in self.metrics:
+            self.metrics["tool_call_times"] = {}
+        if function_call.function.name not in self.metrics["tool_call_times"]:
+            self.metrics["tool_call_times"][function_call.function.name] = []
+        self.metrics["tool_call_times"][function_call.function.name].append(function_call_time)
+
+        # Add the function call result to the function call results
+        function_call_results.append(function_call_result)
+        if len(additional_messages_from_function_call) > 0:
+            function_call_results.extend(additional_messages_from_function_call)
+        self.function_call_stack.append(function_call)
+
     def run_function_calls(
         self, function_calls: List[FunctionCall], function_call_results: List[Message], tool_role: str = "tool"
     ) -> Iterator[ModelResponse]:
+        if self.run_tools_in_parallel and len(function_calls) > 1:
+            yield from self._run_function_calls_in_parallel(
+                function_calls=function_calls, function_call_results=function_call_results, tool_role=tool_role
+            )
+            return
+
         for function_call in function_calls:
             if self.function_call_stack is None:
                 self.function_call_stack = []
@@ -190,54 +333,12 @@ class Model(BaseModel):
             # -*- Start function call
             function_call_timer = Timer()
             function_call_timer.start()
-            yield ModelResponse(
-                content=function_call.get_call_str(),
-                tool_call={
-                    "role": tool_role,
-                    "tool_call_id": function_call.call_id,
-                    "tool_name": function_call.function.name,
-                    "tool_args": function_call.arguments,
-                },
-                event=ModelResponseEvent.tool_call_started.value,
-            )
-
-            # Track if the function call was successful
-            function_call_success = False
-            # If True, stop execution after this function call
-            stop_execution_after_tool_call = False
-            # Additional messages from the function call that will be added to the function call results
-            additional_messages_from_function_call = []
+            yield self._get_function_call_started_response(function_call, tool_role)
 
             # -*- Run function call
-            try:
-                function_call_success = function_call.execute()
-            except ToolCallException as tce:
-                if tce.user_message is not None:
-                    if isinstance(tce.user_message, str):
-                        additional_messages_from_function_call.append(Message(role="user", content=tce.user_message))
-                    else:
-                        additional_messages_from_function_call.append(tce.user_message)
-                if tce.agent_message is not None:
-                    if isinstance(tce.agent_message, str):
-                        additional_messages_from_function_call.append(
-                            Message(role="assistant", content=tce.agent_message)
-                        )
-                    else:
-                        additional_messages_from_function_call.append(tce.agent_message)
-                if tce.messages is not None and len(tce.messages) > 0:
-                    for m in tce.messages:
-                        if isinstance(m, Message):
-                            additional_messages_from_function_call.append(m)
-                        elif isinstance(m, dict):
-                            try:
-                                additional_messages_from_function_call.append(Message(**m))
-                            except Exception as e:
-                                logger.warning(f"Failed to convert dict to Message: {e}")
-                if tce.stop_execution:
-                    stop_execution_after_tool_call = True
-                    if len(additional_messages_from_function_call) > 0:
-                        for m in additional_messages_from_function_call:
-                            m.stop_after_tool_call = True
+            function_call_success, stop_execution_after_tool_call, additional_messages_from_function_call = (
+                self._execute_function_call(function_call)
+            )
 
             function_call_output: Optional[Union[List[Any], str]] = ""
             if isinstance(function_call.result, (GeneratorType, collections.abc.Iterator)):
@@ -253,53 +354,303 @@ class Model(BaseModel):
             # -*- Stop function call timer
             function_call_timer.stop()
 
-            # -*- Create function call result message
-            function_call_result = Message(
-                role=tool_role,
-                content=function_call_output if function_call_success else function_call.error,
-                tool_call_id=function_call.call_id,
-                tool_name=function_call.function.name,
-                tool_args=function_call.arguments,
-                tool_call_error=not function_call_success,
-                stop_after_tool_call=function_call.function.stop_after_tool_call or stop_execution_after_tool_call,
-                metrics={"time": function_call_timer.elapsed},
+            yield from self._add_function_call_result(
+                function_call=function_call,
+                function_call_output=function_call_output,
+                function_call_success=function_call_success,
+                stop_execution_after_tool_call=stop_execution_after_tool_call,
+                additional_messages_from_function_call=additional_messages_from_function_call,
+                function_call_time=function_call_timer.elapsed,
+                function_call_results=function_call_results,
+                tool_role=tool_role,
             )
 
-            # -*- Yield function call result
-            yield ModelResponse(
-                content=f"{function_call.get_call_str()} completed in {function_call_timer.elapsed:.4f}s.",
-                tool_call=function_call_result.model_dump(
-                    include={
-                        "content",
-                        "tool_call_id",
-                        "tool_name",
-                        "tool_args",
-                        "tool_call_error",
-                        "metrics",
-                        "created_at",
-                    }
-                ),
-                event=ModelResponseEvent.tool_call_completed.value,
-            )
+            # -*- Check function call limit
+            if self.tool_call_limit and len(self.function_call_stack) >= self.tool_call_limit:
+                self.deactivate_function_calls()
+                break  # Exit early if we reach the function call limit
+
+    def _run_function_calls_in_parallel(
+        self, function_calls: List[FunctionCall], function_call_results: List[Message], tool_role: str = "tool"
+    ) -> Iterator[ModelResponse]:
+        """Runs independent function calls concurrently in a thread pool.
+
+        Results are added in the same order as the function calls, so the messages sent back to the model
+        match the serial behaviour.
+        """
+        from concurrent.futures import ThreadPoolExecutor
 
-            # Add metrics to the model
-            if "tool_call_times" not in self.metrics:
-                self.metrics["tool_call_times"] = {}
-            if function_call.function.name not in self.metrics["tool_call_times"]:
-                self.metrics["tool_call_times"][function_call.function.name] = []
-            self.metrics["tool_call_times"][function_call.function.name].append(function_call_timer.elapsed)
+        if self.function_call_stack is None:
+            self.function_call_stack = []
 
-            # Add the function call result to the function call results
-            function_call_results.append(function_call_result)
-            if len(additional_messages_from_function_call) > 0:
-                function_call_results.extend(additional_messages_from_function_call)
-            self.function_call_stack.append(function_call)
+        # Only run the function calls that fit within the tool call limit
+        if self.tool_call_limit:
+            remaining_calls = max(self.tool_call_limit - len(self.function_call_stack), 0)
+            function_calls = function_calls[:remaining_calls]
+        if len(function_calls) == 0:
+            self.deactivate_function_calls()
+            return
+
+        def _run(function_call: FunctionCall) -> Tuple[bool, bool, List[Message], Optional[List[Any]], float]:
+            function_call_timer = Timer()
+            function_call_timer.start()
+            success, stop_execution, additional_messages = self._execute_function_call(function_call)
+            # Consume generator results in the worker so they also run concurrently
+            streamed_output: Optional[List[Any]] = None
+            if isinstance(function_call.result, (GeneratorType, collections.abc.Iterator)):
+                streamed_output = list(function_call.result)
+            function_call_timer.stop()
+            return success, stop_execution, additional_messages, streamed_output, function_call_timer.elapsed
+
+        # -*- Start function calls
+        for function_call in function_calls:
+            yield self._get_function_call_started_response(function_call, tool_role)
+
+        max_workers = min(self.max_parallel_tool_calls or len(function_calls), len(function_calls))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="phi-tool") as executor:
+            futures = [executor.submit(_run, function_call) for function_call in function_calls]
+            for function_call, future in zip(function_calls, futures):
+                (
+                    function_call_success,
+                    stop_execution_after_tool_call,
+                    additional_messages_from_function_call,
+                    streamed_output,
+                    function_call_time,
+                ) = future.result()
+
+                function_call_output: Optional[Union[List[Any], str]] = ""
+                if streamed_output is not None:
+                    for item in streamed_output:
+                        function_call_output += item
+                        if function_call.function.show_result:
+                            yield ModelResponse(content=item)
+                else:
+                    function_call_output = function_call.result
+                    if function_call.function.show_result:
+                        yield ModelResponse(content=function_call_output)
+
+                yield from self._add_function_call_result(
+                    function_call=function_call,
+                    function_call_output=function_call_output,
+                    function_call_success=function_call_success,
+                    stop_execution_after_tool_call=stop_execution_after_tool_call,
+                    additional_messages_from_function_call=additional_messages_from_function_call,
+                    function_call_time=function_call_time,
+                    function_call_results=function_call_results,
+                    tool_role=tool_role,
+                )
+
+        # -*- Check function call limit
+        if self.tool_call_limit and len(self.function_call_stack) >= self.tool_call_limit:
+            self.deactivate_function_calls()
+
+    async def _aget_function_call_output(self, function_call: FunctionCall) -> Optional[List[Any]]:
+        """Consumes a generator result without blocking the event loop, returning its items."""
+        from phi.tools.function import get_tool_executor
+
+        if isinstance(function_call.result, collections.abc.AsyncIterator):
+            return [item async for item in function_call.result]
+        if isinstance(function_call.result, (GeneratorType, collections.abc.Iterator)):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(get_tool_executor(), list, function_call.result)
+        return None
+
+    async def arun_function_calls(
+        self, function_calls: List[FunctionCall], function_call_results: List[Message], tool_role: str = "tool"
+    ) -> AsyncIterator[ModelResponse]:
+        """Async version of run_function_calls.
+
+        Async tools are awaited and sync tools are run in a bounded executor, so the event loop is never blocked.
+        If run_tools_in_parallel is True, the tool calls are run concurrently using asyncio.gather.
+        """
+        if self.function_call_stack is None:
+            self.function_call_stack = []
+
+        async def _run(function_call: FunctionCall) -> Tuple[bool, bool, List[Message], Optional[List[Any]], float]:
+            function_call_timer = Timer()
+            function_call_timer.start()
+            success, stop_execution, additional_messages = await self._aexecute_function_call(function_call)
+            streamed_output = await self._aget_function_call_output(function_call)
+            function_call_timer.stop()
+            return success, stop_execution, additional_messages, streamed_output, function_call_timer.elapsed
+
+        if self.run_tools_in_parallel and len(function_calls) > 1:
+            # Only run the function calls that fit within the tool call limit
+            if self.tool_call_limit:
+                remaining_calls = max(self.tool_call_limit - len(self.function_call_stack), 0)
+                function_calls = function_calls[:remaining_calls]
+            if len(function_calls) == 0:
+                self.deactivate_function_calls()
+                return
+
+            # -*- Start function calls
+            for function_call in function_calls:
+                yield self._get_function_call_started_response(function_call, tool_role)
+
+            semaphore = asyncio.Semaphore(self.max_parallel_tool_calls or len(function_calls))
+
+            async def _run_with_limit(function_call: FunctionCall):
+                async with semaphore:
+                    return await _run(function_call)
+
+            outcomes = await asyncio.gather(*[_run_with_limit(function_call) for function_call in function_calls])
+        else:
+            outcomes = []
+
+        for i, function_call in enumerate(function_calls):
+            if len(outcomes) > 0:
+                outcome = outcomes[i]
+            else:
+                # -*- Start function call
+                yield self._get_function_call_started_response(function_call, tool_role)
+                outcome = await _run(function_call)
+
+            (
+                function_call_success,
+                stop_execution_after_tool_call,
+                additional_messages_from_function_call,
+                streamed_output,
+                function_call_time,
+            ) = outcome
+
+            function_call_output: Optional[Union[List[Any], str]] = ""
+            if streamed_output is not None:
+                for item in streamed_output:
+                    function_call_output += item
+                    if function_call.function.show_result:
+                        yield ModelResponse(content=item)
+            else:
+                function_call_output = function_call.result
+                if function_call.function.show_result:
+                    yield ModelResponse(content=function_call_output)
+
+            for function_call_response in self._add_function_call_result(
+                function_call=function_call,
+                function_call_output=function_call_output,
+                function_call_success=function_call_success,
+                stop_execution_after_tool_call=stop_execution_after_tool_call,
+                additional_messages_from_function_call=additional_messages_from_function_call,
+                function_call_time=function_call_time,
+                function_call_results=function_call_results,
+                tool_role=tool_role,
+            ):
+                yield function_call_response
 
             # -*- Check function call limit
             if self.tool_call_limit and len(self.function_call_stack) >= self.tool_call_limit:
                 self.deactivate_function_calls()
                 break  # Exit early if we reach the function call limit
 
+    def get_function_calls_to_run(self, assistant_message: Message, messages: List[Message]) -> List[FunctionCall]:
+        """
+        Get the function calls to run from the assistant message.
+        Tool calls that cannot be run are answered with an error message added to messages.
+
+        Args:
+            assistant_message (Message): The assistant message.
+            messages (List[Message]): The list of messages.
+
+        Returns:
+            List[FunctionCall]: The function calls to run.
+        """
+        function_calls_to_run: List[FunctionCall] = []
+        if assistant_message.tool_calls is None:
+            return function_calls_to_run
+        for tool_call in assistant_message.tool_calls:
+            _tool_call_id = tool_call.get("id")
+            _function_call = get_function_call_for_tool_call(tool_call, self.functions)
+            if _function_call is None:
+                messages.append(
+                    Message(role="tool", tool_call_id=_tool_call_id, content="Could not find function to call.")
+                )
+                continue
+            if _function_call.error is not None:
+                messages.append(Message(role="tool", tool_call_id=_tool_call_id, content=_function_call.error))
+                continue
+            function_calls_to_run.append(_function_call)
+        return function_calls_to_run
+
+    def get_tool_calls_content(self, function_calls: List[FunctionCall]) -> List[str]:
+        """Returns the content added to the response when show_tool_calls is True."""
+        return ["\nRunning:"] + [f"\n - {_f.get_call_str()}" for _f in function_calls] + ["\n\n"]
+
+    def add_function_call_results(self, function_call_results: List[Message], messages: List[Message]) -> None:
+        """Adds the function call results to the messages sent back to the model."""
+        if len(function_call_results) > 0:
+            messages.extend(function_call_results)
+
+    async def ahandle_tool_calls(
+        self,
+        assistant_message: Message,
+        messages: List[Message],
+        model_response: ModelResponse,
+        tool_role: str = "tool",
+    ) -> Optional[ModelResponse]:
+        """
+        Handle tool calls in the assistant message without blocking the event loop.
+
+        Args:
+            assistant_message (Message): The assistant message.
+            messages (List[Message]): The list of messages.
+            model_response (ModelResponse): The model response.
+            tool_role (str): The role of the tool call. Defaults to "tool".
+
+        Returns:
+            Optional[ModelResponse]: The model response after handling tool calls.
+        """
+        if assistant_message.tool_calls is None or len(assistant_message.tool_calls) == 0 or not self.run_tools:
+            return None
+
+        if model_response.content is None:
+            model_response.content = ""
+        function_calls_to_run = self.get_function_calls_to_run(assistant_message, messages)
+        function_call_results: List[Message] = []
+
+        if self.show_tool_calls:
+            model_response.content += "".join(self.get_tool_calls_content(function_calls_to_run))
+
+        async for _ in self.arun_function_calls(
+            function_calls=function_calls_to_run, function_call_results=function_call_results, tool_role=tool_role
+        ):
+            pass
+
+        self.add_function_call_results(function_call_results, messages)
+        return model_response
+
+    async def ahandle_stream_tool_calls(
+        self,
+        assistant_message: Message,
+        messages: List[Message],
+        tool_role: str = "tool",
+    ) -> AsyncIterator[ModelResponse]:
+        """
+        Handle tool calls for async response stream without blocking the event loop.
+
+        Args:
+            assistant_message (Message): The assistant message.
+            messages (List[Message]): The list of messages.
+            tool_role (str): The role of the tool call. Defaults to "tool".
+
+        Returns:
+            AsyncIterator[ModelResponse]: An async iterator of the model response.
+        """
+        if assistant_message.tool_calls is None or len(assistant_message.tool_calls) == 0 or not self.run_tools:
+            return
+
+        function_calls_to_run = self.get_function_calls_to_run(assistant_message, messages)
+        function_call_results: List[Message] = []
+
+        if self.show_tool_calls:
+            for content in self.get_tool_calls_content(function_calls_to_run):
+                yield ModelResponse(content=content)
+
+        async for function_call_response in self.arun_function_calls(
+            function_calls=function_calls_to_run, function_call_results=function_call_results, tool_role=tool_role
+        ):
+            yield function_call_response
+
+        self.add_function_call_results(function_call_results, messages)
+
     def handle_post_tool_call_messages(self, messages: List[Message], model_response: ModelResponse) -> ModelResponse:
         last_message = messages[-1]
         if last_message.stop_after_tool_call:
@@ -525,3 +876,17 @@ class Model(BaseModel):
         # Clear the new model to remove any references to the old model
         new_model.clear()
         return new_model
+
+    def copy_for_run(self, *, update: Optional[Dict[str, Any]] = None) -> "Model":
+        """Create a lightweight copy of this Model for a single run.
+
+        Configuration and clients are shared with this Model. List and dict fields are copied so that tools and
+        functions added for the run are not added to this Model, and the run state is cleared.
+        """
+        new_model = self.model_copy(update=update)
+        for field_name in self.__class__.model_fields:
+            field_value = getattr(new_model, field_name, None)
+            if isinstance(field_value, (list, dict)):
+                setattr(new_model, field_name, copy(field_value))
+        new_model.clear()
+        return new_model
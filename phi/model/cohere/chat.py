@@ -8,6 +8,7 @@ from phi.model.message import Message
 from phi.model.response import ModelResponse
 from phi.tools.function import FunctionCall
 from phi.utils.log import logger
+from phi.utils.client_pool import get_shared_client
 from phi.utils.timer import Timer
 from phi.utils.tools import get_function_call_for_tool_call
 
@@ -79,7 +80,7 @@ class CohereChat(Model):
 
         if self.api_key:
             _client_params["api_key"] = self.api_key
-        return CohereClient(**_client_params)
+        return get_shared_client(CohereClient, _client_params)
 
     @property
     def request_kwargs(self) -> Dict[str, Any]:
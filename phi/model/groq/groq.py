@@ -9,6 +9,7 @@ from phi.model.message import Message
 from phi.model.response import ModelResponse
 from phi.tools.function import FunctionCall
 from phi.utils.log import logger
+from phi.utils.client_pool import get_shared_client
 from phi.utils.timer import Timer
 from phi.utils.tools import get_function_call_for_tool_call
 
@@ -138,7 +139,7 @@ class Groq(Model):
         client_params: Dict[str, Any] = self.get_client_params()
         if self.http_client is not None:
             client_params["http_client"] = self.http_client
-        return GroqClient(**client_params)
+        return get_shared_client(GroqClient, client_params, http_client=True)
 
     def get_async_client(self) -> AsyncGroqClient:
         """
@@ -153,12 +154,8 @@ class Groq(Model):
         client_params: Dict[str, Any] = self.get_client_params()
         if self.http_client:
             client_params["http_client"] = self.http_client
-        else:
-            # Create a new async HTTP client with custom limits
-            client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
-        return AsyncGroqClient(**client_params)
+        # Reuse a pooled async HTTP client bound to the running event loop
+        return get_shared_client(AsyncGroqClient, client_params, is_async=True, http_client=True)
 
     @property
     def request_kwargs(self) -> Dict[str, Any]:
@@ -588,7 +585,7 @@ class Groq(Model):
         # -*- Handle tool calls
         tool_role = "tool"
         if (
-            self.handle_tool_calls(
+            await self.ahandle_tool_calls(
                 assistant_message=assistant_message,
                 messages=messages,
                 model_response=model_response,
@@ -844,7 +841,7 @@ class Groq(Model):
         # -*- Handle tool calls
         if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
             tool_role = "tool"
-            for tool_call_response in self.handle_stream_tool_calls(
+            async for tool_call_response in self.ahandle_stream_tool_calls(
                 assistant_message=assistant_message, messages=messages, tool_role=tool_role
             ):
                 yield tool_call_response
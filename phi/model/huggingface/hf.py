@@ -10,6 +10,7 @@ from phi.model.message import Message
 from phi.model.response import ModelResponse
 from phi.tools.function import FunctionCall
 from phi.utils.log import logger
+from phi.utils.client_pool import get_shared_client
 from phi.utils.timer import Timer
 from phi.utils.tools import get_function_call_for_tool_call
 
@@ -163,7 +164,7 @@ class HuggingFaceChat(Model):
         _client_params: Dict[str, Any] = self.get_client_params()
         if self.http_client is not None:
             _client_params["http_client"] = self.http_client
-        return InferenceClient(**_client_params)
+        return get_shared_client(InferenceClient, _client_params)
 
     def get_async_client(self) -> AsyncInferenceClient:
         """
@@ -179,12 +180,8 @@ class HuggingFaceChat(Model):
 
         if self.http_client:
             _client_params["http_client"] = self.http_client
-        else:
-            # Create a new async HTTP client with custom limits
-            _client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
-        return AsyncInferenceClient(**_client_params)
+        # Reuse a client bound to the running event loop
+        return get_shared_client(AsyncInferenceClient, _client_params, is_async=True)
 
     @property
     def request_kwargs(self) -> Dict[str, Any]:
@@ -584,7 +581,7 @@ class HuggingFaceChat(Model):
         metrics.log()
 
         # -*- Handle tool calls
-        if self._handle_tool_calls(assistant_message, messages, model_response):
+        if await self.ahandle_tool_calls(assistant_message, messages, model_response):
             response_after_tool_calls = await self.aresponse(messages=messages)
             if response_after_tool_calls.content is not None:
                 if model_response.content is None:
@@ -804,7 +801,7 @@ class HuggingFaceChat(Model):
 
         # -*- Handle tool calls
         if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
-            for model_response in self._handle_stream_tool_calls(assistant_message, messages):
+            async for model_response in self.ahandle_stream_tool_calls(assistant_message, messages):
                 yield model_response
             async for model_response in self.aresponse_stream(messages=messages):
                 yield model_response
@@ -1,10 +1,13 @@
 import json
 from time import time
-from typing import Optional, Any, Dict, List, Union, Sequence
-from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Any, Dict, List, Tuple, Union, Sequence, TYPE_CHECKING
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from phi.utils.log import logger
 
+if TYPE_CHECKING:
+    from phi.utils.tokens import Tokenizer
+
 
 class MessageReferences(BaseModel):
     """The references added to user message for RAG"""
@@ -58,8 +61,28 @@ class Message(BaseModel):
     # The Unix timestamp the message was created.
     created_at: int = Field(default_factory=lambda: int(time()))
 
+    # Token count cached by get_token_count(), with the tokenizer and the content it was counted for.
+    _token_count: Optional[Tuple[str, Any, Any, int]] = PrivateAttr(default=None)
+
     model_config = ConfigDict(extra="allow", populate_by_name=True)
 
+    def get_token_count(self, tokenizer: "Tokenizer") -> int:
+        """Returns the number of tokens in the message.
+
+        The count is cached on the message, so messages from the history are not re-tokenized every run.
+        """
+        cached = self._token_count
+        if (
+            cached is not None
+            and cached[0] == tokenizer.name
+            and cached[1] is self.content
+            and cached[2] is self.tool_calls
+        ):
+            return cached[3]
+        num_tokens = tokenizer.count_message(self)
+        self._token_count = (tokenizer.name, self.content, self.tool_calls, num_tokens)
+        return num_tokens
+
     def get_content_string(self) -> str:
         """Returns the content as a string."""
         if isinstance(self.content, str):
@@ -7,6 +7,7 @@ from phi.model.message import Message
 from phi.model.response import ModelResponse
 from phi.tools.function import FunctionCall
 from phi.utils.log import logger
+from phi.utils.client_pool import get_shared_client
 from phi.utils.timer import Timer
 from phi.utils.tools import get_function_call_for_tool_call
 
@@ -106,7 +107,7 @@ class MistralChat(Model):
             _client_params["timeout"] = self.timeout
         if self.client_params:
             _client_params.update(self.client_params)
-        return Mistral(**_client_params)
+        return get_shared_client(Mistral, _client_params)
 
     @property
     def api_kwargs(self) -> Dict[str, Any]:
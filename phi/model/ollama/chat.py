@@ -1,6 +1,6 @@
 import json
 from dataclasses import dataclass, field
-from typing import Optional, List, Iterator, Dict, Any, Mapping, Union
+from typing import Optional, List, Iterator, AsyncIterator, Dict, Any, Mapping, Union
 
 from pydantic import BaseModel
 
@@ -9,6 +9,7 @@ from phi.model.message import Message
 from phi.model.response import ModelResponse
 from phi.tools.function import FunctionCall
 from phi.utils.log import logger
+from phi.utils.client_pool import get_shared_client
 from phi.utils.timer import Timer
 from phi.utils.tools import get_function_call_for_tool_call
 
@@ -103,7 +104,7 @@ class Ollama(Model):
         if self.client is not None:
             return self.client
 
-        return OllamaClient(**self.get_client_params())
+        return get_shared_client(OllamaClient, self.get_client_params())
 
     def get_async_client(self) -> AsyncOllamaClient:
         """
@@ -115,7 +116,7 @@ class Ollama(Model):
         if self.async_client is not None:
             return self.async_client
 
-        return AsyncOllamaClient(**self.get_client_params())
+        return get_shared_client(AsyncOllamaClient, self.get_client_params(), is_async=True)
 
     @property
     def request_kwargs(self) -> Dict[str, Any]:
@@ -307,6 +308,29 @@ class Ollama(Model):
             return model_response
         return None
 
+    async def ahandle_tool_calls(
+        self,
+        assistant_message: Message,
+        messages: List[Message],
+        model_response: ModelResponse,
+        tool_role: str = "tool",
+    ) -> Optional[ModelResponse]:
+        """
+        Handle tool calls in the assistant message without blocking the event loop.
+
+        Args:
+            assistant_message (Message): The assistant message.
+            messages (List[Message]): The list of messages.
+            model_response (ModelResponse): The model response.
+            tool_role (str): The role of the tool call. Defaults to "tool".
+
+        Returns:
+            Optional[ModelResponse]: The model response.
+        """
+        if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
+            model_response.content = assistant_message.get_content_string() + "\n\n"
+        return await super().ahandle_tool_calls(assistant_message, messages, model_response, tool_role)
+
     def update_usage_metrics(
         self,
         assistant_message: Message,
@@ -378,6 +402,16 @@ class Ollama(Model):
             for _fcr in function_call_results:
                 messages.append(_fcr)
 
+    def add_function_call_results(self, function_call_results: List[Message], messages: List[Message]) -> None:
+        self.format_function_call_results(function_call_results, messages)
+
+    def get_tool_calls_content(self, function_calls: List[FunctionCall]) -> List[str]:
+        if len(function_calls) == 1:
+            return [f" - Running: {function_calls[0].get_call_str()}\n\n"]
+        if len(function_calls) > 1:
+            return ["Running:"] + [f"\n - {_f.get_call_str()}" for _f in function_calls] + ["\n\n"]
+        return []
+
     def create_assistant_message(self, response: Mapping[str, Any], metrics: Metrics) -> Message:
         """
         Create an assistant message from the response.
@@ -536,7 +570,7 @@ class Ollama(Model):
 
         # -*- Handle tool calls
         if (
-            self.handle_tool_calls(
+            await self.ahandle_tool_calls(
                 assistant_message=assistant_message, messages=messages, model_response=model_response
             )
             is not None
@@ -582,6 +616,30 @@ class Ollama(Model):
 
             self.format_function_call_results(function_call_results, messages)
 
+    async def ahandle_stream_tool_calls(
+        self,
+        assistant_message: Message,
+        messages: List[Message],
+        tool_role: str = "tool",
+    ) -> AsyncIterator[ModelResponse]:
+        """
+        Handle tool calls for response stream without blocking the event loop.
+
+        Args:
+            assistant_message (Message): The assistant message.
+            messages (List[Message]): The list of messages.
+            tool_role (str): The role of the tool call. Defaults to "tool".
+
+        Returns:
+            AsyncIterator[ModelResponse]: An async iterator of the model response.
+        """
+        if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
+            yield ModelResponse(content="\n\n")
+        async for intermediate_model_response in super().ahandle_stream_tool_calls(
+            assistant_message, messages, tool_role
+        ):
+            yield intermediate_model_response
+
     def response_stream(self, messages: List[Message]) -> Iterator[ModelResponse]:
         """
         Generate a streaming response from Ollama.
@@ -717,7 +775,7 @@ class Ollama(Model):
 
         # -*- Handle tool calls
         if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
-            for tool_call_response in self.handle_stream_tool_calls(assistant_message, messages):
+            async for tool_call_response in self.ahandle_stream_tool_calls(assistant_message, messages):
                 yield tool_call_response
             async for post_tool_call_response in self.ahandle_post_tool_call_messages_stream(messages=messages):
                 yield post_tool_call_response
@@ -219,7 +219,7 @@ class Hermes(Ollama):
 
         # -*- Handle tool calls
         if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
-            for tool_call_response in self.handle_stream_tool_calls(assistant_message, messages):
+            async for tool_call_response in self.ahandle_stream_tool_calls(assistant_message, messages):
                 yield tool_call_response
             async for post_tool_call_response in self.ahandle_post_tool_call_messages_stream(messages=messages):
                 yield post_tool_call_response
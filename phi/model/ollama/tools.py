@@ -180,6 +180,30 @@ class OllamaTools(Ollama):
             return model_response
         return None
 
+    async def ahandle_tool_calls(
+        self,
+        assistant_message: Message,
+        messages: List[Message],
+        model_response: ModelResponse,
+        tool_role: str = "tool",
+    ) -> Optional[ModelResponse]:
+        """
+        Handle tool calls in the assistant message without blocking the event loop.
+
+        Args:
+            assistant_message (Message): The assistant message.
+            messages (List[Message]): The list of messages.
+            model_response (ModelResponse): The model response.
+            tool_role (str): The role of the tool call. Defaults to "tool".
+
+        Returns:
+            Optional[ModelResponse]: The model response.
+        """
+        if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
+            model_response.content = str(remove_tool_calls_from_string(assistant_message.get_content_string()))
+            model_response.content += "\n\n"
+        return await super(Ollama, self).ahandle_tool_calls(assistant_message, messages, model_response, tool_role)
+
     def response_stream(self, messages: List[Message]) -> Iterator[ModelResponse]:
         """
         Generate a streaming response from OllamaTools.
@@ -10,6 +10,7 @@ from phi.model.message import Message
 from phi.model.response import ModelResponse
 from phi.tools.function import FunctionCall
 from phi.utils.log import logger
+from phi.utils.client_pool import get_shared_client
 from phi.utils.timer import Timer
 from phi.utils.tools import get_function_call_for_tool_call
 
@@ -170,7 +171,7 @@ class OpenAIChat(Model):
         client_params: Dict[str, Any] = self.get_client_params()
         if self.http_client is not None:
             client_params["http_client"] = self.http_client
-        return OpenAIClient(**client_params)
+        return get_shared_client(OpenAIClient, client_params, http_client=True)
 
     def get_async_client(self) -> AsyncOpenAIClient:
         """
@@ -185,12 +186,8 @@ class OpenAIChat(Model):
         client_params: Dict[str, Any] = self.get_client_params()
         if self.http_client:
             client_params["http_client"] = self.http_client
-        else:
-            # Create a new async HTTP client with custom limits
-            client_params["http_client"] = httpx.AsyncClient(
-                limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100)
-            )
-        return AsyncOpenAIClient(**client_params)
+        # Reuse a pooled async HTTP client bound to the running event loop
+        return get_shared_client(AsyncOpenAIClient, client_params, is_async=True, http_client=True)
 
     @property
     def request_kwargs(self) -> Dict[str, Any]:
@@ -421,6 +418,48 @@ class OpenAIChat(Model):
         async for chunk in async_stream:  # type: ignore
             yield chunk
 
+    def get_function_calls_to_run(
+        self, assistant_message: Message, messages: List[Message], tool_role: str = "tool"
+    ) -> List[FunctionCall]:
+        """
+        Get the function calls to run from the assistant message.
+        Tool calls that cannot be run are answered with an error message added to messages.
+
+        Args:
+            assistant_message (Message): The assistant message.
+            messages (List[Message]): The list of messages.
+            tool_role (str): The role of the tool call. Defaults to "tool".
+
+        Returns:
+            List[FunctionCall]: The function calls to run.
+        """
+        function_calls_to_run: List[FunctionCall] = []
+        if assistant_message.tool_calls is None:
+            return function_calls_to_run
+        for tool_call in assistant_message.tool_calls:
+            _tool_call_id = tool_call.get("id")
+            _function_call = get_function_call_for_tool_call(tool_call, self.functions)
+            if _function_call is None:
+                messages.append(
+                    Message(
+                        role=tool_role,
+                        tool_call_id=_tool_call_id,
+                        content="Could not find function to call.",
+                    )
+                )
+                continue
+            if _function_call.error is not None:
+                messages.append(
+                    Message(
+                        role=tool_role,
+                        tool_call_id=_tool_call_id,
+                        content=_function_call.error,
+                    )
+                )
+                continue
+            function_calls_to_run.append(_function_call)
+        return function_calls_to_run
+
     def handle_tool_calls(
         self,
         assistant_message: Message,
@@ -444,29 +483,9 @@ class OpenAIChat(Model):
             if model_response.content is None:
                 model_response.content = ""
             function_call_results: List[Message] = []
-            function_calls_to_run: List[FunctionCall] = []
-            for tool_call in assistant_message.tool_calls:
-                _tool_call_id = tool_call.get("id")
-                _function_call = get_function_call_for_tool_call(tool_call, self.functions)
-                if _function_call is None:
-                    messages.append(
-                        Message(
-                            role="tool",
-                            tool_call_id=_tool_call_id,
-                            content="Could not find function to call.",
-                        )
-                    )
-                    continue
-                if _function_call.error is not None:
-                    messages.append(
-                        Message(
-                            role="tool",
-                            tool_call_id=_tool_call_id,
-                            content=_function_call.error,
-                        )
-                    )
-                    continue
-                function_calls_to_run.append(_function_call)
+            function_calls_to_run: List[FunctionCall] = self.get_function_calls_to_run(
+                assistant_message=assistant_message, messages=messages
+            )
 
             if self.show_tool_calls:
                 model_response.content += "\nRunning:"
@@ -723,7 +742,7 @@ class OpenAIChat(Model):
         # -*- Handle tool calls
         tool_role = "tool"
         if (
-            self.handle_tool_calls(
+            await self.ahandle_tool_calls(
                 assistant_message=assistant_message,
                 messages=messages,
                 model_response=model_response,
@@ -813,30 +832,10 @@ class OpenAIChat(Model):
             Iterator[ModelResponse]: An iterator of the model response.
         """
         if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
-            function_calls_to_run: List[FunctionCall] = []
+            function_calls_to_run: List[FunctionCall] = self.get_function_calls_to_run(
+                assistant_message=assistant_message, messages=messages, tool_role=tool_role
+            )
             function_call_results: List[Message] = []
-            for tool_call in assistant_message.tool_calls:
-                _tool_call_id = tool_call.get("id")
-                _function_call = get_function_call_for_tool_call(tool_call, self.functions)
-                if _function_call is None:
-                    messages.append(
-                        Message(
-                            role=tool_role,
-                            tool_call_id=_tool_call_id,
-                            content="Could not find function to call.",
-                        )
-                    )
-                    continue
-                if _function_call.error is not None:
-                    messages.append(
-                        Message(
-                            role=tool_role,
-                            tool_call_id=_tool_call_id,
-                            content=_function_call.error,
-                        )
-                    )
-                    continue
-                function_calls_to_run.append(_function_call)
 
             if self.show_tool_calls:
                 yield ModelResponse(content="\nRunning:")
@@ -995,7 +994,7 @@ class OpenAIChat(Model):
         # -*- Handle tool calls
         if assistant_message.tool_calls is not None and len(assistant_message.tool_calls) > 0 and self.run_tools:
             tool_role = "tool"
-            for tool_call_response in self.handle_stream_tool_calls(
+            async for tool_call_response in self.ahandle_stream_tool_calls(
                 assistant_message=assistant_message, messages=messages, tool_role=tool_role
             ):
                 yield tool_call_response
@@ -213,6 +213,9 @@ class Gemini(Model):
                 for name, func in tool.functions.items():
                     # If the function does not exist in self.functions, add to self.tools
                     if name not in self.functions:
+                        # Add a copy so that functions shared between agents are not bound to this agent
+                        # or processed more than once
+                        func = func.model_copy()
                         func._agent = agent
                         func.process_entrypoint()
                         self.functions[name] = func
@@ -226,6 +229,7 @@ class Gemini(Model):
 
             elif isinstance(tool, Function):
                 if tool.name not in self.functions:
+                    tool = tool.model_copy()
                     tool._agent = agent
                     tool.process_entrypoint()
                     self.functions[tool.name] = tool
@@ -0,0 +1,121 @@
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from threading import Lock
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+from phi.document import Document
+from phi.knowledge.agent import AgentKnowledge
+from phi.playground.schemas import IngestJobResponse
+from phi.utils.log import logger
+
+SUPPORTED_FILE_TYPES = (
+    "application/pdf",
+    "text/csv",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "text/plain",
+)
+# Status of the jobs that are done, which are forgotten first when there are more than max_jobs
+FINISHED_STATUSES = ("completed", "failed")
+
+
+def read_file_documents(contents: bytes, filename: Optional[str], content_type: Optional[str]) -> List[Document]:
+    """Parse an uploaded file into documents using the reader for its content type."""
+    file = BytesIO(contents)
+    file.name = filename  # type: ignore
+    if content_type == "application/pdf":
+        from phi.document.reader.pdf import PDFReader
+
+        return PDFReader().read(file)
+    elif content_type == "text/csv":
+        from phi.document.reader.csv_reader import CSVReader
+
+        return CSVReader().read(file)
+    elif content_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+        from phi.document.reader.docx import DocxReader
+
+        return DocxReader().read(file)
+    elif content_type == "text/plain":
+        from phi.document.reader.text import TextReader
+
+        return TextReader().read(file)
+    raise ValueError(f"Unsupported file type: {content_type}")
+
+
+class IngestQueue:
+    """Parses and loads uploaded files into a knowledge base on a bounded pool of worker threads.
+
+    Parsing, embedding and inserting a large file can take minutes, so running it here keeps the event loop free
+    to serve other requests. Ingest throughput is set by `max_workers`, independently of request handling.
+    """
+
+    def __init__(self, max_workers: int = 4, max_jobs: int = 1000):
+        self.max_workers: int = max_workers
+        # Number of finished jobs to keep for status lookups
+        self.max_jobs: int = max_jobs
+        self.jobs: "OrderedDict[str, IngestJobResponse]" = OrderedDict()
+        # Guards self.jobs, which is read and written from request handlers and worker threads
+        self._jobs_lock = Lock()
+        self._tasks: Dict[str, asyncio.Future] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="phi-ingest")
+        return self._executor
+
+    def _ingest(self, job: IngestJobResponse, knowledge: AgentKnowledge, contents: bytes, content_type: str) -> None:
+        job.status = "running"
+        try:
+            documents = read_file_documents(contents, job.filename, content_type)
+            knowledge.load_documents(documents)
+            job.num_documents = len(documents)
+            job.status = "completed"
+        except Exception as e:
+            logger.error(f"Error ingesting {job.filename}: {e}")
+            job.error = str(e)
+            job.status = "failed"
+        with self._jobs_lock:
+            self._remove_finished_jobs()
+
+    def _remove_finished_jobs(self) -> None:
+        """Forget the oldest finished jobs over max_jobs. Queued and running jobs are always kept."""
+        finished = [job_id for job_id, job in self.jobs.items() if job.status in FINISHED_STATUSES]
+        for job_id in finished[: max(len(finished) - self.max_jobs, 0)]:
+            del self.jobs[job_id]
+
+    def submit(
+        self, agent_id: str, knowledge: AgentKnowledge, contents: bytes, filename: Optional[str], content_type: str
+    ) -> IngestJobResponse:
+        """Queue a file for ingestion and return its job. Must be called from the event loop."""
+        job = IngestJobResponse(job_id=str(uuid4()), agent_id=agent_id, filename=filename)
+        with self._jobs_lock:
+            self.jobs[job.job_id] = job
+
+        loop = asyncio.get_running_loop()
+        task = loop.run_in_executor(self.executor, self._ingest, job, knowledge, contents, content_type)
+        self._tasks[job.job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job.job_id, None))
+        return job
+
+    def get(self, job_id: str) -> Optional[IngestJobResponse]:
+        with self._jobs_lock:
+            return self.jobs.get(job_id)
+
+    async def wait(self, job_ids: List[str]) -> None:
+        """Wait until the given jobs have finished."""
+        tasks = [self._tasks[job_id] for job_id in job_ids if job_id in self._tasks]
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    def shutdown(self) -> None:
+        """Shut down the worker threads without waiting for the queued jobs. Called when the server shuts down.
+
+        The queued jobs still run to completion in the background before the threads exit.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
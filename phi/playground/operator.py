@@ -1,9 +1,7 @@
 from typing import List, Optional
 
-from phi.agent.agent import Agent, Tool, Toolkit, Function, AgentRun
-from phi.agent.session import AgentSession
+from phi.agent.agent import Agent, Tool, Toolkit, Function
 from phi.utils.log import logger
-from phi.workflow.session import WorkflowSession
 from phi.workflow.workflow import Workflow
 
 
@@ -38,52 +36,6 @@ def get_agent_by_id(agent_id: str, agents: Optional[List[Agent]] = None) -> Opti
     return None
 
 
-def get_session_title(session: AgentSession) -> str:
-    if session is None:
-        return "Unnamed session"
-    session_name = session.session_data.get("session_name") if session.session_data is not None else None
-    if session_name is not None:
-        return session_name
-    memory = session.memory
-    if memory is not None:
-        runs = memory.get("runs") or memory.get("chats")
-        if isinstance(runs, list):
-            for _run in runs:
-                try:
-                    run_parsed = AgentRun.model_validate(_run)
-                    if run_parsed.message is not None and run_parsed.message.role == "user":
-                        content = run_parsed.message.get_content_string()
-                        if content:
-                            return content
-                        else:
-                            return "No title"
-                except Exception as e:
-                    logger.error(f"Error parsing chat: {e}")
-    return "Unnamed session"
-
-
-def get_session_title_from_workflow_session(workflow_session: WorkflowSession) -> str:
-    if workflow_session is None:
-        return "Unnamed session"
-    session_name = (
-        workflow_session.session_data.get("session_name") if workflow_session.session_data is not None else None
-    )
-    if session_name is not None:
-        return session_name
-    memory = workflow_session.memory
-    if memory is not None:
-        runs = memory.get("runs")
-        if isinstance(runs, list):
-            for _run in runs:
-                try:
-                    response = _run.get("response")
-                    content = response.get("content") if response else None
-                    return content.split("\n")[0] if content else "No title"
-                except Exception as e:
-                    logger.error(f"Error parsing chat: {e}")
-    return "Unnamed session"
-
-
 def get_workflow_by_id(workflow_id: str, workflows: Optional[List[Workflow]] = None) -> Optional[Workflow]:
     if workflows is None or workflow_id is None:
         return None
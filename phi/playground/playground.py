@@ -6,8 +6,10 @@ from fastapi.routing import APIRouter
 from phi.agent.agent import Agent
 from phi.workflow.workflow import Workflow
 from phi.api.playground import create_playground_endpoint, PlaygroundEndpointCreate
+from phi.playground.ingest import IngestQueue
 from phi.playground.router import get_playground_router, get_async_playground_router
 from phi.playground.settings import PlaygroundSettings
+from phi.utils.client_pool import aclose_client_pool
 from phi.utils.log import logger
 
 
@@ -34,7 +36,9 @@ class Playground:
         return get_playground_router(self.agents, self.workflows)
 
     def get_async_router(self) -> APIRouter:
-        return get_async_playground_router(self.agents, self.workflows)
+        return get_async_playground_router(
+            self.agents, self.workflows, ingest_queue=IngestQueue(max_workers=self.settings.ingest_max_workers)
+        )
 
     def get_app(self, use_async: bool = True, prefix: str = "/v1") -> FastAPI:
         from starlette.middleware.cors import CORSMiddleware
@@ -60,6 +64,8 @@ class Playground:
             self.router.include_router(self.get_async_router())
         else:
             self.router.include_router(self.get_router())
+        # Close the shared model clients when the server shuts down
+        self.router.add_event_handler("shutdown", aclose_client_pool)
         self.api_app.include_router(self.router)
 
         self.api_app.add_middleware(
@@ -70,7 +76,6 @@ class Playground:
             allow_headers=["*"],
             expose_headers=["*"],
         )
-
         return self.api_app
 
     def create_endpoint(self, endpoint: str, prefix: str = "/v1") -> None:
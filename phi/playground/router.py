@@ -2,7 +2,7 @@ import base64
 from io import BytesIO
 from typing import Any, List, Optional, AsyncGenerator, Dict, cast, Union, Generator
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Response, UploadFile
 from fastapi.responses import StreamingResponse, JSONResponse
 
 from phi.agent.agent import Agent, RunResponse
@@ -12,11 +12,12 @@ from phi.workflow.session import WorkflowSession
 from phi.playground.operator import (
     format_tools,
     get_agent_by_id,
-    get_session_title,
-    get_session_title_from_workflow_session,
     get_workflow_by_id,
 )
+from phi.playground.ingest import IngestQueue, SUPPORTED_FILE_TYPES
+from phi.run.stream import RunEventEncoder, StreamFormat, STREAM_MEDIA_TYPES
 from phi.utils.log import logger
+from phi.utils.threads import run_in_thread
 
 from phi.playground.schemas import (
     AgentGetResponse,
@@ -25,12 +26,25 @@ from phi.playground.schemas import (
     AgentRenameRequest,
     AgentModel,
     AgentSessionDeleteRequest,
+    IngestJobResponse,
     WorkflowRunRequest,
     WorkflowSessionsRequest,
     WorkflowRenameRequest,
 )
 
 
+def get_stream_encoder(stream_format: str) -> Optional[RunEventEncoder]:
+    """Return the encoder for a streamed agent run.
+
+    "ndjson" and "sse" send compact delta events. "json" sends the full RunResponse for every chunk.
+    """
+    if stream_format == "json":
+        return None
+    if stream_format not in STREAM_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported stream format: {stream_format}")
+    return RunEventEncoder(format=cast(StreamFormat, stream_format))
+
+
 def get_playground_router(
     agents: Optional[List[Agent]] = None, workflows: Optional[List[Workflow]] = None
 ) -> APIRouter:
@@ -87,9 +101,15 @@ def get_playground_router(
         return agent_list
 
     def chat_response_streamer(
-        agent: Agent, message: str, images: Optional[List[Union[str, Dict]]] = None
+        agent: Agent,
+        message: str,
+        images: Optional[List[Union[str, Dict]]] = None,
+        encoder: Optional[RunEventEncoder] = None,
     ) -> Generator:
         run_response = agent.run(message, images=images, stream=True, stream_intermediate_steps=True)
+        if encoder is not None:
+            yield from encoder.stream(run_response, final_response=lambda: agent.run_response)
+            return
         for run_response_chunk in run_response:
             run_response_chunk = cast(RunResponse, run_response_chunk)
             yield run_response_chunk.to_json()
@@ -111,11 +131,13 @@ def get_playground_router(
         user_id: Optional[str] = Form(None),
         files: Optional[List[UploadFile]] = File(None),
         image: Optional[UploadFile] = File(None),
+        stream_format: str = Form("ndjson"),
     ):
         logger.debug(f"AgentRunRequest: {message} {agent_id} {stream} {monitor} {session_id} {user_id} {files}")
         agent = get_agent_by_id(agent_id, agents)
         if agent is None:
             raise HTTPException(status_code=404, detail="Agent not found")
+        encoder = get_stream_encoder(stream_format) if stream else None
 
         if files:
             if agent.knowledge is None:
@@ -127,7 +149,7 @@ def get_playground_router(
             logger.debug("Creating new session")
 
         # Create a new instance of this agent
-        new_agent_instance = agent.deep_copy(update={"session_id": session_id})
+        new_agent_instance = agent.copy_for_run(update={"session_id": session_id})
         if user_id is not None:
             new_agent_instance.user_id = user_id
 
@@ -183,8 +205,8 @@ def get_playground_router(
 
         if stream:
             return StreamingResponse(
-                chat_response_streamer(new_agent_instance, message, images=base64_image),
-                media_type="text/event-stream",
+                chat_response_streamer(new_agent_instance, message, images=base64_image, encoder=encoder),
+                media_type=encoder.media_type if encoder is not None else "text/event-stream",
             )
         else:
             run_response = cast(
@@ -198,7 +220,7 @@ def get_playground_router(
             return run_response.model_dump_json()
 
     @playground_router.post("/agent/sessions/all")
-    def get_agent_sessions(body: AgentSessionsRequest):
+    def get_agent_sessions(body: AgentSessionsRequest, response: Response):
         logger.debug(f"AgentSessionsRequest: {body}")
         agent = get_agent_by_id(body.agent_id, agents)
         if agent is None:
@@ -207,19 +229,26 @@ def get_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        agent_sessions: List[AgentSessionsResponse] = []
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=body.user_id)
-        for session in all_agent_sessions:
-            title = get_session_title(session)
-            agent_sessions.append(
-                AgentSessionsResponse(
-                    title=title,
-                    session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
-                    created_at=session.created_at,
-                )
+        # Only the session summaries are read, one page at a time. The cursor to the next page is
+        # returned in the X-Next-Cursor header.
+        try:
+            session_summaries, next_cursor = agent.storage.list_sessions(
+                user_id=body.user_id, limit=body.limit, cursor=body.cursor
             )
-        return agent_sessions
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = next_cursor
+
+        return [
+            AgentSessionsResponse(
+                title=summary.title,
+                session_id=summary.session_id,
+                session_name=summary.session_name,
+                created_at=summary.created_at,
+            )
+            for summary in session_summaries
+        ]
 
     @playground_router.post("/agent/sessions/{session_id}")
     def get_agent_session(session_id: str, body: AgentSessionsRequest):
@@ -324,7 +353,7 @@ def get_playground_router(
             raise HTTPException(status_code=500, detail=f"Error running workflow: {str(e)}")
 
     @playground_router.post("/workflow/{workflow_id}/session/all")
-    def get_all_workflow_sessions(workflow_id: str, body: WorkflowSessionsRequest):
+    def get_all_workflow_sessions(workflow_id: str, body: WorkflowSessionsRequest, response: Response):
         # Retrieve the workflow by ID
         workflow = get_workflow_by_id(workflow_id, workflows)
         if not workflow:
@@ -334,23 +363,27 @@ def get_playground_router(
         if not workflow.storage:
             raise HTTPException(status_code=404, detail="Workflow does not have storage enabled")
 
-        # Retrieve all sessions for the given workflow and user
+        # Retrieve a page of session summaries for the given workflow and user
         try:
-            all_workflow_sessions: List[WorkflowSession] = workflow.storage.get_all_sessions(
-                user_id=body.user_id, workflow_id=workflow_id
+            session_summaries, next_cursor = workflow.storage.list_sessions(
+                user_id=body.user_id, workflow_id=workflow_id, limit=body.limit, cursor=body.cursor
             )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = next_cursor
 
         # Return the sessions
         return [
             {
-                "title": get_session_title_from_workflow_session(session),
-                "session_id": session.session_id,
-                "session_name": session.session_data.get("session_name") if session.session_data else None,
-                "created_at": session.created_at,
+                "title": summary.title,
+                "session_id": summary.session_id,
+                "session_name": summary.session_name,
+                "created_at": summary.created_at,
             }
-            for session in all_workflow_sessions
+            for summary in session_summaries
         ]
 
     @playground_router.post("/workflow/{workflow_id}/session/{session_id}")
@@ -398,13 +431,19 @@ def get_playground_router(
 
 
 def get_async_playground_router(
-    agents: Optional[List[Agent]] = None, workflows: Optional[List[Workflow]] = None
+    agents: Optional[List[Agent]] = None,
+    workflows: Optional[List[Workflow]] = None,
+    ingest_queue: Optional[IngestQueue] = None,
 ) -> APIRouter:
     playground_router = APIRouter(prefix="/playground", tags=["Playground"])
 
     if agents is None and workflows is None:
         raise ValueError("Either agents or workflows must be provided.")
 
+    # Uploaded files are parsed and loaded into the knowledge base on this pool, off the event loop
+    _ingest_queue: IngestQueue = ingest_queue or IngestQueue()
+    playground_router.add_event_handler("shutdown", _ingest_queue.shutdown)
+
     @playground_router.get("/status")
     async def playground_status():
         return {"playground": "available"}
@@ -459,7 +498,11 @@ def get_async_playground_router(
         images: Optional[List[Union[str, Dict]]] = None,
         audio_file_content: Optional[Any] = None,
         video_file_content: Optional[Any] = None,
+        ingest_job_ids: Optional[List[str]] = None,
+        encoder: Optional[RunEventEncoder] = None,
     ) -> AsyncGenerator:
+        if ingest_job_ids:
+            await _ingest_queue.wait(ingest_job_ids)
         run_response = await agent.arun(
             message,
             images=images,
@@ -468,6 +511,10 @@ def get_async_playground_router(
             stream=True,
             stream_intermediate_steps=True,
         )
+        if encoder is not None:
+            async for event in encoder.astream(run_response, final_response=lambda: agent.run_response):
+                yield event
+            return
         async for run_response_chunk in run_response:
             run_response_chunk = cast(RunResponse, run_response_chunk)
             yield run_response_chunk.to_json()
@@ -482,6 +529,7 @@ def get_async_playground_router(
 
     @playground_router.post("/agent/run")
     async def agent_run(
+        response: Response,
         message: str = Form(...),
         agent_id: str = Form(...),
         stream: bool = Form(True),
@@ -490,15 +538,21 @@ def get_async_playground_router(
         user_id: Optional[str] = Form(None),
         files: Optional[List[UploadFile]] = File(None),
         image: Optional[UploadFile] = File(None),
+        wait_for_ingest: bool = Form(True),
+        stream_format: str = Form("ndjson"),
     ):
         logger.debug(f"AgentRunRequest: {message} {session_id} {user_id} {agent_id}")
         agent = get_agent_by_id(agent_id, agents)
         if agent is None:
             raise HTTPException(status_code=404, detail="Agent not found")
+        encoder = get_stream_encoder(stream_format) if stream else None
 
         if files:
             if agent.knowledge is None:
                 raise HTTPException(status_code=404, detail="KnowledgeBase not found")
+            for file in files:
+                if file.content_type not in SUPPORTED_FILE_TYPES:
+                    raise HTTPException(status_code=400, detail="Unsupported file type")
 
         if session_id is not None:
             logger.debug(f"Continuing session: {session_id}")
@@ -506,7 +560,7 @@ def get_async_playground_router(
             logger.debug("Creating new session")
 
         # Create a new instance of this agent
-        new_agent_instance = agent.deep_copy(update={"session_id": session_id})
+        new_agent_instance = agent.copy_for_run(update={"session_id": session_id})
         if user_id is not None:
             new_agent_instance.user_id = user_id
 
@@ -519,53 +573,39 @@ def get_async_playground_router(
         if image:
             base64_image = await process_image(image)
 
-        if files:
+        # Parse and load the files on the ingest pool. The run waits for them unless wait_for_ingest is False.
+        ingest_job_ids: List[str] = []
+        if files and agent.knowledge is not None:
             for file in files:
-                if file.content_type == "application/pdf":
-                    from phi.document.reader.pdf import PDFReader
-
-                    contents = await file.read()
-                    pdf_file = BytesIO(contents)
-                    pdf_file.name = file.filename
-                    file_content = PDFReader().read(pdf_file)
-                    if agent.knowledge is not None:
-                        agent.knowledge.load_documents(file_content)
-                elif file.content_type == "text/csv":
-                    from phi.document.reader.csv_reader import CSVReader
-
-                    contents = await file.read()
-                    csv_file = BytesIO(contents)
-                    csv_file.name = file.filename
-                    file_content = CSVReader().read(csv_file)
-                    if agent.knowledge is not None:
-                        agent.knowledge.load_documents(file_content)
-                elif file.content_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                    from phi.document.reader.docx import DocxReader
-
-                    contents = await file.read()
-                    docx_file = BytesIO(contents)
-                    docx_file.name = file.filename
-                    file_content = DocxReader().read(docx_file)
-                    if agent.knowledge is not None:
-                        agent.knowledge.load_documents(file_content)
-                elif file.content_type == "text/plain":
-                    from phi.document.reader.text import TextReader
-
-                    contents = await file.read()
-                    text_file = BytesIO(contents)
-                    text_file.name = file.filename
-                    file_content = TextReader().read(text_file)
-                    if agent.knowledge is not None:
-                        agent.knowledge.load_documents(file_content)
-                else:
-                    raise HTTPException(status_code=400, detail="Unsupported file type")
+                contents = await file.read()
+                job = _ingest_queue.submit(
+                    agent_id=agent_id,
+                    knowledge=agent.knowledge,
+                    contents=contents,
+                    filename=file.filename,
+                    content_type=cast(str, file.content_type),
+                )
+                ingest_job_ids.append(job.job_id)
+        headers = {"X-Ingest-Job-Ids": ",".join(ingest_job_ids)} if ingest_job_ids else None
+        jobs_to_wait_for = ingest_job_ids if wait_for_ingest else None
 
         if stream:
             return StreamingResponse(
-                chat_response_streamer(new_agent_instance, message, images=base64_image),
-                media_type="text/event-stream",
+                chat_response_streamer(
+                    new_agent_instance,
+                    message,
+                    images=base64_image,
+                    ingest_job_ids=jobs_to_wait_for,
+                    encoder=encoder,
+                ),
+                media_type=encoder.media_type if encoder is not None else "text/event-stream",
+                headers=headers,
             )
         else:
+            if headers:
+                response.headers.update(headers)
+            if jobs_to_wait_for:
+                await _ingest_queue.wait(jobs_to_wait_for)
             run_response = cast(
                 RunResponse,
                 await new_agent_instance.arun(
@@ -576,8 +616,15 @@ def get_async_playground_router(
             )
             return run_response.model_dump_json()
 
+    @playground_router.get("/agent/ingest/{job_id}", response_model=IngestJobResponse)
+    async def get_ingest_job(job_id: str):
+        job = _ingest_queue.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Ingest job not found")
+        return job
+
     @playground_router.post("/agent/sessions/all")
-    async def get_agent_sessions(body: AgentSessionsRequest):
+    async def get_agent_sessions(body: AgentSessionsRequest, response: Response):
         logger.debug(f"AgentSessionsRequest: {body}")
         agent = get_agent_by_id(body.agent_id, agents)
         if agent is None:
@@ -586,19 +633,26 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        agent_sessions: List[AgentSessionsResponse] = []
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=body.user_id)
-        for session in all_agent_sessions:
-            title = get_session_title(session)
-            agent_sessions.append(
-                AgentSessionsResponse(
-                    title=title,
-                    session_id=session.session_id,
-                    session_name=session.session_data.get("session_name") if session.session_data else None,
-                    created_at=session.created_at,
-                )
+        # Only the session summaries are read, one page at a time. The cursor to the next page is
+        # returned in the X-Next-Cursor header.
+        try:
+            session_summaries, next_cursor = await agent.storage.alist_sessions(
+                user_id=body.user_id, limit=body.limit, cursor=body.cursor
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = next_cursor
+
+        return [
+            AgentSessionsResponse(
+                title=summary.title,
+                session_id=summary.session_id,
+                session_name=summary.session_name,
+                created_at=summary.created_at,
             )
-        return agent_sessions
+            for summary in session_summaries
+        ]
 
     @playground_router.post("/agent/sessions/{session_id}")
     async def get_agent_session(session_id: str, body: AgentSessionsRequest):
@@ -610,7 +664,7 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        agent_session: Optional[AgentSession] = agent.storage.read(session_id, body.user_id)
+        agent_session: Optional[AgentSession] = await agent.storage.aread(session_id, body.user_id)
         if agent_session is None:
             return JSONResponse(status_code=404, content="Session not found.")
 
@@ -623,7 +677,7 @@ def get_async_playground_router(
             return JSONResponse(status_code=404, content=f"couldn't find agent with {body.agent_id}")
 
         agent.session_id = body.session_id
-        agent.rename_session(body.name)
+        await agent.arename_session(body.name)
         return JSONResponse(content={"message": f"successfully renamed agent {agent.name}"})
 
     @playground_router.post("/agent/session/delete")
@@ -635,10 +689,10 @@ def get_async_playground_router(
         if agent.storage is None:
             return JSONResponse(status_code=404, content="Agent does not have storage enabled.")
 
-        all_agent_sessions: List[AgentSession] = agent.storage.get_all_sessions(user_id=body.user_id)
+        all_agent_sessions: List[AgentSession] = await agent.storage.aget_all_sessions(user_id=body.user_id)
         for session in all_agent_sessions:
             if session.session_id == body.session_id:
-                agent.delete_session(body.session_id)
+                await agent.adelete_session(body.session_id)
                 return JSONResponse(content={"message": f"successfully deleted agent {agent.name}"})
 
         return JSONResponse(status_code=404, content="Session not found.")
@@ -695,8 +749,8 @@ def get_async_playground_router(
         # Return based on the response type
         try:
             if new_workflow_instance._run_return_type == "RunResponse":
-                # Return as a normal response
-                return new_workflow_instance.run(**body.input)
+                # Return as a normal response, running the sync workflow in a thread
+                return await run_in_thread(new_workflow_instance.run, **body.input)
             else:
                 # Return as a streaming response
                 return StreamingResponse(
@@ -708,7 +762,7 @@ def get_async_playground_router(
             raise HTTPException(status_code=500, detail=f"Error running workflow: {str(e)}")
 
     @playground_router.post("/workflow/{workflow_id}/session/all")
-    async def get_all_workflow_sessions(workflow_id: str, body: WorkflowSessionsRequest):
+    async def get_all_workflow_sessions(workflow_id: str, body: WorkflowSessionsRequest, response: Response):
         # Retrieve the workflow by ID
         workflow = get_workflow_by_id(workflow_id, workflows)
         if not workflow:
@@ -718,23 +772,27 @@ def get_async_playground_router(
         if not workflow.storage:
             raise HTTPException(status_code=404, detail="Workflow does not have storage enabled")
 
-        # Retrieve all sessions for the given workflow and user
+        # Retrieve a page of session summaries for the given workflow and user
         try:
-            all_workflow_sessions: List[WorkflowSession] = workflow.storage.get_all_sessions(
-                user_id=body.user_id, workflow_id=workflow_id
+            session_summaries, next_cursor = await workflow.storage.alist_sessions(
+                user_id=body.user_id, workflow_id=workflow_id, limit=body.limit, cursor=body.cursor
             )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving sessions: {str(e)}")
+        if next_cursor is not None:
+            response.headers["X-Next-Cursor"] = next_cursor
 
         # Return the sessions
         return [
             {
-                "title": get_session_title_from_workflow_session(session),
-                "session_id": session.session_id,
-                "session_name": session.session_data.get("session_name") if session.session_data else None,
-                "created_at": session.created_at,
+                "title": summary.title,
+                "session_id": summary.session_id,
+                "session_name": summary.session_name,
+                "created_at": summary.created_at,
             }
-            for session in all_workflow_sessions
+            for summary in session_summaries
         ]
 
     @playground_router.post("/workflow/{workflow_id}/session/{session_id}")
@@ -750,7 +808,7 @@ def get_async_playground_router(
 
         # Retrieve the specific session
         try:
-            workflow_session: Optional[WorkflowSession] = workflow.storage.read(session_id, body.user_id)
+            workflow_session: Optional[WorkflowSession] = await workflow.storage.aread(session_id, body.user_id)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Error retrieving session: {str(e)}")
 
@@ -766,7 +824,7 @@ def get_async_playground_router(
         if workflow is None:
             raise HTTPException(status_code=404, detail="Workflow not found")
 
-        workflow.rename_session(session_id, body.name)
+        await workflow.arename_session(session_id, body.name)
         return JSONResponse(content={"message": f"successfully renamed workflow {workflow.name}"})
 
     @playground_router.post("/workflow/{workflow_id}/session/{session_id}/delete")
@@ -775,7 +833,7 @@ def get_async_playground_router(
         if workflow is None:
             raise HTTPException(status_code=404, detail="Workflow not found")
 
-        workflow.delete_session(session_id)
+        await workflow.adelete_session(session_id)
         return JSONResponse(content={"message": f"successfully deleted workflow {workflow.name}"})
 
     return playground_router
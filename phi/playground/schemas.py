@@ -48,6 +48,9 @@ class AgentSessionDeleteRequest(BaseModel):
 class AgentSessionsRequest(BaseModel):
     agent_id: str
     user_id: Optional[str] = None
+    # Page size and cursor for listing sessions. The cursor to the next page is returned in the X-Next-Cursor header.
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
 
 
 class AgentSessionsResponse(BaseModel):
@@ -59,6 +62,9 @@ class AgentSessionsResponse(BaseModel):
 
 class WorkflowSessionsRequest(BaseModel):
     user_id: Optional[str] = None
+    # Page size and cursor for listing sessions. The cursor to the next page is returned in the X-Next-Cursor header.
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
 
 
 class WorkflowRenameRequest(BaseModel):
@@ -69,3 +75,12 @@ class WorkflowRunRequest(BaseModel):
     input: Dict[str, Any]
     user_id: Optional[str] = None
     session_id: Optional[str] = None
+
+
+class IngestJobResponse(BaseModel):
+    job_id: str
+    agent_id: str
+    filename: Optional[str] = None
+    status: str = "queued"
+    num_documents: Optional[int] = None
+    error: Optional[str] = None
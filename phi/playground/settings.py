@@ -20,6 +20,9 @@ class PlaygroundSettings(BaseSettings):
 
     secret_key: Optional[str] = None
 
+    # Number of worker threads used to parse and load uploaded files into knowledge bases
+    ingest_max_workers: int = 4
+
     # Cors origin list to allow requests from.
     # This list is set using the set_cors_origin_list validator
     cors_origin_list: Optional[List[str]] = Field(None, validate_default=True)
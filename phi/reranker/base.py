@@ -9,5 +9,8 @@ class Reranker(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True, populate_by_name=True)
 
+    # Set to True if the reranker uses the document embeddings, so they are returned by the vector db search
+    requires_embeddings: bool = False
+
     def rerank(self, query: str, documents: List[Document]) -> List[Document]:
         raise NotImplementedError
@@ -0,0 +1,142 @@
+import json
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Literal, Optional, Set
+
+from pydantic import BaseModel
+
+from phi.run.response import RunEvent, RunResponse
+
+StreamFormat = Literal["ndjson", "sse"]
+
+STREAM_MEDIA_TYPES: Dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+
+def _to_jsonable(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(exclude_none=True)
+    return value
+
+
+class RunEventEncoder:
+    """Encodes the RunResponse objects yielded by a streamed run as compact delta events.
+
+    A streamed run yields the same RunResponse object for every content chunk, carrying the tool calls and,
+    once the model has responded, the messages of the run. Serializing it for every chunk resends the
+    whole conversation with each token. This encoder only sends what changed:
+
+    - the run, session and agent ids once, with the first event
+    - the content chunk for RunResponse events
+    - each tool call once when it starts and once when it completes
+    - a summary of the run, without the messages, once at the end
+
+    Events are encoded as one JSON object per line ("ndjson") or as server-sent events ("sse").
+    """
+
+    def __init__(self, format: StreamFormat = "ndjson"):
+        if format not in STREAM_MEDIA_TYPES:
+            raise ValueError(f"Unsupported stream format: {format}")
+        self.format: StreamFormat = format
+        self._sent_header: bool = False
+        self._started_tool_calls: Set[str] = set()
+        self._completed_tool_calls: Set[str] = set()
+        # The RunCompleted event is held back and sent as the final summary
+        self._completed_response: Optional[RunResponse] = None
+
+    @property
+    def media_type(self) -> str:
+        return STREAM_MEDIA_TYPES[self.format]
+
+    def encode_event(self, event: Dict[str, Any]) -> str:
+        data = json.dumps(event, separators=(",", ":"), default=str)
+        if self.format == "sse":
+            return f"event: {event.get('event')}\ndata: {data}\n\n"
+        return f"{data}\n"
+
+    def _with_header(self, run_response: RunResponse, event: Dict[str, Any]) -> Dict[str, Any]:
+        if not self._sent_header:
+            self._sent_header = True
+            header = {
+                "run_id": run_response.run_id,
+                "session_id": run_response.session_id,
+                "agent_id": run_response.agent_id,
+                "workflow_id": run_response.workflow_id,
+                "model": run_response.model,
+            }
+            event.update({k: v for k, v in header.items() if v is not None})
+        return event
+
+    def _tool_call_events(self, run_response: RunResponse, event: str) -> List[Dict[str, Any]]:
+        events: List[Dict[str, Any]] = []
+        for tool in run_response.tools or []:
+            tool_call_id = tool.get("tool_call_id")
+            if tool_call_id is None:
+                continue
+            # Completed tool calls carry their result in "content"
+            if event == RunEvent.tool_call_completed.value:
+                if "content" in tool and tool_call_id not in self._completed_tool_calls:
+                    self._completed_tool_calls.add(tool_call_id)
+                    events.append({"event": event, "tool": tool})
+            elif tool_call_id not in self._started_tool_calls:
+                self._started_tool_calls.add(tool_call_id)
+                events.append({"event": event, "tool": tool})
+        return events
+
+    def encode(self, run_response: RunResponse) -> List[str]:
+        """Encode the delta events for a RunResponse yielded by the run. May return no events."""
+        events: List[Dict[str, Any]]
+        if run_response.event == RunEvent.run_completed.value:
+            self._completed_response = run_response
+            return []
+        elif run_response.event in (RunEvent.tool_call_started.value, RunEvent.tool_call_completed.value):
+            events = self._tool_call_events(run_response, run_response.event)
+        else:
+            event: Dict[str, Any] = {"event": run_response.event}
+            if run_response.content is not None:
+                event["content"] = _to_jsonable(run_response.content)
+            events = [event]
+        if len(events) > 0:
+            self._with_header(run_response, events[0])
+        return [self.encode_event(event) for event in events]
+
+    def encode_summary(self, run_response: Optional[RunResponse] = None) -> str:
+        """Encode the RunCompleted summary: the full content, tool calls, metrics and media, without messages.
+
+        Args:
+            run_response: The final RunResponse of the run, e.g. `agent.run_response`.
+                Defaults to the RunCompleted event received from the run.
+        """
+        final_response = run_response or self._completed_response or RunResponse()
+        summary = final_response.model_dump(
+            exclude_none=True,
+            exclude={"messages", "extra_data", "event"},
+        )
+        if final_response.extra_data is not None:
+            # Only send the references, the remaining extra data repeats the messages
+            references = final_response.extra_data.references
+            if references:
+                summary["extra_data"] = {"references": [r.model_dump(exclude_none=True) for r in references]}
+        return self.encode_event(self._with_header(final_response, {"event": RunEvent.run_completed.value, **summary}))
+
+    def stream(
+        self, run_stream: Iterator[RunResponse], final_response: Optional[Callable[[], RunResponse]] = None
+    ) -> Iterator[str]:
+        """Encode a streamed run, finishing with the run summary.
+
+        Args:
+            run_stream: The iterator returned by `agent.run(stream=True)`.
+            final_response: Returns the final RunResponse once the stream is exhausted, e.g. `lambda: agent.run_response`.
+        """
+        for run_response in run_stream:
+            yield from self.encode(run_response)
+        yield self.encode_summary(final_response() if final_response is not None else None)
+
+    async def astream(
+        self, run_stream: AsyncIterator[RunResponse], final_response: Optional[Callable[[], RunResponse]] = None
+    ) -> AsyncIterator[str]:
+        """Encode a streamed async run, finishing with the run summary. See stream()."""
+        async for run_response in run_stream:
+            for event in self.encode(run_response):
+                yield event
+        yield self.encode_summary(final_response() if final_response is not None else None)
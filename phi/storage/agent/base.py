@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 
-from phi.agent.session import AgentSession
+from phi.agent.session import AgentSession, AgentSessionSummary
+from phi.utils.pagination import paginate
+from phi.utils.threads import run_in_thread
 
 
 class AgentStorage(ABC):
@@ -21,10 +23,56 @@ class AgentStorage(ABC):
     def get_all_sessions(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[AgentSession]:
         raise NotImplementedError
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AgentSessionSummary], Optional[str]]:
+        """
+        List session summaries newest first, one page at a time.
+
+        Backends should override this to select only the columns needed for the summary.
+        The default implementation reads all sessions and pages them in memory.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+            limit (Optional[int]): The maximum number of sessions to return. If None, all sessions are returned.
+            cursor (Optional[str]): The cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[AgentSessionSummary], Optional[str]]: The page of sessions and the cursor to the next page,
+                or None if this is the last page.
+        """
+        sessions = self.get_all_sessions(user_id=user_id, agent_id=agent_id)
+        return paginate([AgentSessionSummary.from_session(session) for session in sessions], limit=limit, cursor=cursor)
+
     @abstractmethod
     def upsert(self, session: AgentSession) -> Optional[AgentSession]:
         raise NotImplementedError
 
+    def update_session_memory(self, session_id: str, memory: Dict[str, Any]) -> bool:
+        """
+        Set keys of the memory of a stored session, keeping its other memory keys and columns.
+
+        Backends should override this with an atomic update. The default implementation reads the session and
+        upserts it, so changes saved between the read and the upsert are overwritten.
+
+        Args:
+            session_id (str): The ID of the session to update.
+            memory (Dict[str, Any]): The memory keys to set, e.g. "summary" and "memories".
+
+        Returns:
+            bool: True if the session was updated, False if it does not exist.
+        """
+        session = self.read(session_id=session_id)
+        if session is None:
+            return False
+        session.memory = {**(session.memory or {}), **memory}
+        return self.upsert(session) is not None
+
     @abstractmethod
     def delete_session(self, session_id: Optional[str] = None):
         raise NotImplementedError
@@ -36,3 +84,32 @@ class AgentStorage(ABC):
     @abstractmethod
     def upgrade_schema(self) -> None:
         raise NotImplementedError
+
+    # Async variants. Backends without a native async driver run the sync method in a thread
+    # so that storage I/O does not block the event loop.
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+        return await run_in_thread(self.read, session_id=session_id, user_id=user_id)
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[str]:
+        return await run_in_thread(self.get_all_session_ids, user_id=user_id, agent_id=agent_id)
+
+    async def aget_all_sessions(
+        self, user_id: Optional[str] = None, agent_id: Optional[str] = None
+    ) -> List[AgentSession]:
+        return await run_in_thread(self.get_all_sessions, user_id=user_id, agent_id=agent_id)
+
+    async def alist_sessions(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AgentSessionSummary], Optional[str]]:
+        return await run_in_thread(self.list_sessions, user_id=user_id, agent_id=agent_id, limit=limit, cursor=cursor)
+
+    async def aupsert(self, session: AgentSession) -> Optional[AgentSession]:
+        return await run_in_thread(self.upsert, session=session)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        return await run_in_thread(self.delete_session, session_id=session_id)
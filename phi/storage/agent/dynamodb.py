@@ -1,14 +1,15 @@
 import time
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from decimal import Decimal
 
-from phi.agent.session import AgentSession
+from phi.agent.session import AgentSession, AgentSessionSummary, NUM_RUNS_FOR_TITLE
 from phi.storage.agent.base import AgentStorage
 from phi.utils.log import logger
+from phi.utils.pagination import decode_cursor, get_page, paginate
 
 try:
     import boto3
-    from boto3.dynamodb.conditions import Key
+    from boto3.dynamodb.conditions import Attr, Key
     from botocore.exceptions import ClientError
 except ImportError:
     raise ImportError("`boto3` not installed. Please install using `pip install boto3`.")
@@ -230,6 +231,85 @@ class DynamoDbAgentStorage(AgentStorage):
             logger.error(f"Error retrieving sessions: {e}")
         return sessions
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AgentSessionSummary], Optional[str]]:
+        """
+        List session summaries newest first, one page at a time.
+        Only the attributes needed for the summaries are read.
+
+        Sessions of a user or an agent are read a page at a time from the user_id or agent_id index,
+        which is sorted by created_at. Listing all sessions scans the table, which is not sorted,
+        so those summaries are sorted and paged after they are read.
+
+        Args:
+            user_id (Optional[str], optional): User ID to filter by. Defaults to None.
+            agent_id (Optional[str], optional): Agent ID to filter by. Defaults to None.
+            limit (Optional[int], optional): Maximum number of sessions to return. Defaults to None (all).
+            cursor (Optional[str], optional): Cursor returned with the previous page. Defaults to None.
+
+        Returns:
+            Tuple[List[AgentSessionSummary], Optional[str]]: The sessions and the cursor to the next page, if any.
+        """
+        run_messages = ", ".join(
+            f"memory.runs[{i}].message.#role, memory.runs[{i}].message.#content" for i in range(NUM_RUNS_FOR_TITLE)
+        )
+        request: Dict[str, Any] = {
+            "ProjectionExpression": f"session_id, agent_id, user_id, session_data.session_name, {run_messages}, "
+            "created_at, updated_at",
+            "ExpressionAttributeNames": {"#role": "role", "#content": "content"},
+        }
+        # Raises a ValueError for an invalid cursor
+        position = decode_cursor(cursor) if cursor is not None else None
+        summaries: List[AgentSessionSummary] = []
+        try:
+            if user_id is None and agent_id is None:
+                while True:
+                    response = self.table.scan(**request)
+                    for item in response.get("Items", []):
+                        summaries.append(
+                            AgentSessionSummary.from_session(AgentSession.model_validate(self._deserialize_item(item)))
+                        )
+                    if "LastEvaluatedKey" not in response:
+                        break
+                    request["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+                return paginate(summaries, limit=limit, cursor=cursor)
+
+            index_key, index_value = ("user_id", user_id) if user_id is not None else ("agent_id", agent_id)
+            request.update(
+                IndexName=f"{index_key}-index",
+                KeyConditionExpression=Key(index_key).eq(index_value),
+                ScanIndexForward=False,
+            )
+            if user_id is not None and agent_id is not None:
+                request["FilterExpression"] = Attr("agent_id").eq(agent_id)
+            if position is not None:
+                created_at, session_id = position
+                request["ExclusiveStartKey"] = {
+                    "session_id": session_id,
+                    index_key: index_value,
+                    "created_at": created_at,
+                }
+            while True:
+                # One more session than the limit is read to find out if there is a next page
+                if limit is not None:
+                    request["Limit"] = limit + 1 - len(summaries)
+                response = self.table.query(**request)
+                for item in response.get("Items", []):
+                    summaries.append(
+                        AgentSessionSummary.from_session(AgentSession.model_validate(self._deserialize_item(item)))
+                    )
+                if "LastEvaluatedKey" not in response or (limit is not None and len(summaries) > limit):
+                    break
+                request["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except Exception as e:
+            logger.error(f"Error listing sessions: {e}")
+        return get_page(summaries, limit)
+
     def upsert(self, session: AgentSession) -> Optional[AgentSession]:
         """
         Create or update an AgentSession in the database.
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from uuid import UUID
 
 try:
@@ -11,8 +11,10 @@ except ImportError:
     raise ImportError("`pymongo` not installed. Please install it with `pip install pymongo`")
 
 from phi.agent import AgentSession
+from phi.agent.session import AgentSessionSummary
 from phi.storage.agent.base import AgentStorage
 from phi.utils.log import logger
+from phi.utils.pagination import decode_cursor, get_page
 
 
 class MongoAgentStorage(AgentStorage):
@@ -129,6 +131,75 @@ class MongoAgentStorage(AgentStorage):
             logger.error(f"Error getting sessions: {e}")
             return []
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AgentSessionSummary], Optional[str]]:
+        """List session summaries newest first, one page at a time, projecting only the fields they need
+        Args:
+            user_id: ID of the user to read
+            agent_id: ID of the agent to read
+            limit: Maximum number of sessions to return, all sessions if None
+            cursor: Cursor returned with the previous page
+        Returns:
+            Tuple[List[AgentSessionSummary], Optional[str]]: The sessions and the cursor to the next page, if any
+        """
+        try:
+            query: Dict[str, Any] = {}
+            if user_id is not None:
+                query["user_id"] = user_id
+            if agent_id is not None:
+                query["agent_id"] = agent_id
+            if cursor is not None:
+                created_at, session_id = decode_cursor(cursor)
+                query["$or"] = [
+                    {"created_at": {"$lt": created_at}},
+                    {"created_at": created_at, "session_id": {"$lt": session_id}},
+                ]
+
+            pipeline: List[Dict[str, Any]] = [{"$match": query}, {"$sort": {"created_at": -1, "session_id": -1}}]
+            if limit is not None:
+                pipeline.append({"$limit": limit + 1})
+            pipeline.append(
+                {
+                    "$project": {
+                        "_id": 0,
+                        "session_id": 1,
+                        "agent_id": 1,
+                        "user_id": 1,
+                        "session_name": "$session_data.session_name",
+                        "first_message": {
+                            "$arrayElemAt": [
+                                {
+                                    "$filter": {
+                                        "input": "$memory.runs.message",
+                                        "cond": {"$eq": ["$$this.role", "user"]},
+                                    }
+                                },
+                                0,
+                            ]
+                        },
+                        "created_at": 1,
+                        "updated_at": 1,
+                    }
+                }
+            )
+            summaries = [
+                AgentSessionSummary.from_first_message(
+                    first_message=doc.pop("first_message", None),
+                    session_id=str(doc.pop("session_id")),
+                    **doc,
+                )
+                for doc in self.collection.aggregate(pipeline)
+            ]
+            return get_page(summaries, limit)
+        except PyMongoError as e:
+            logger.error(f"Error listing sessions: {e}")
+            return [], None
+
     def upsert(self, session: AgentSession, create_and_retry: bool = True) -> Optional[AgentSession]:
         """Upsert an agent session
         Args:
@@ -172,6 +243,27 @@ class MongoAgentStorage(AgentStorage):
             logger.error(f"Error upserting session: {e}")
             return None
 
+    def update_session_memory(self, session_id: str, memory: Dict[str, Any]) -> bool:
+        """Set keys of the memory of a stored session, keeping the other keys and fields
+        Args:
+            session_id: ID of the session to update
+            memory: Memory keys to set, e.g. "summary" and "memories"
+        Returns:
+            bool: True if the session was updated, False if it does not exist
+        """
+        try:
+            # An update pipeline also sets the keys when the stored memory is null
+            update_data = {
+                "memory": {"$mergeObjects": [{"$ifNull": ["$memory", {}]}, {"$literal": memory}]},
+                "updated_at": int(datetime.now(timezone.utc).timestamp()),
+                "_version": {"$add": [{"$ifNull": ["$_version", 0]}, 1]},
+            }
+            result = self.collection.update_one({"session_id": session_id}, [{"$set": update_data}])
+            return result.matched_count > 0
+        except PyMongoError as e:
+            logger.error(f"Error updating session memory: {e}")
+            return False
+
     def delete_session(self, session_id: Optional[str] = None) -> None:
         """Delete an agent session
         Args:
@@ -1,5 +1,7 @@
+import json
 import time
-from typing import Optional, List
+from hashlib import md5
+from typing import Optional, List, Dict, Any, Tuple
 
 try:
     from sqlalchemy.dialects import postgresql
@@ -7,14 +9,26 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import sessionmaker, scoped_session
     from sqlalchemy.schema import MetaData, Table, Column, Index
-    from sqlalchemy.sql.expression import text, select
-    from sqlalchemy.types import String, BigInteger
+    from sqlalchemy.sql.expression import text, select, delete, update, or_, func, cast, case, null
+    from sqlalchemy.types import String, BigInteger, Integer
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
-from phi.agent.session import AgentSession
+try:
+    from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+except ImportError:
+    # The asyncio extension requires `greenlet`. Without it, async methods run the sync methods in a thread.
+    AsyncEngine = async_sessionmaker = create_async_engine = None  # type: ignore
+
+from phi.agent.session import AgentSession, AgentSessionSummary
 from phi.storage.agent.base import AgentStorage
 from phi.utils.log import logger
+from phi.utils.pagination import get_cursor_filter, get_cursor_order_by, get_page
+from phi.utils.threads import run_in_thread
+
+# Keys of the agent memory that grow with every run. From schema version 2, their items are stored one row
+# per item in a separate memory table, so an upsert only writes the items that were added or changed.
+APPEND_ONLY_MEMORY_KEYS = ("runs", "messages")
 
 
 class PgAgentStorage(AgentStorage):
@@ -26,22 +40,38 @@ class PgAgentStorage(AgentStorage):
         db_engine: Optional[Engine] = None,
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
+        async_db_url: Optional[str] = None,
+        async_db_engine: Optional[AsyncEngine] = None,
+        read_after_upsert: bool = True,
     ):
         """
         This class provides agent storage using a PostgreSQL table.
 
+        With schema_version=2, the runs and messages in the agent memory are stored in a `<table_name>_memory`
+        table with one row per item. Each upsert then only writes new or changed items instead of
+        rewriting the whole memory, and read() reassembles the same AgentSession.
+        Existing version 1 tables are migrated by upgrade_schema().
+
         The following order is used to determine the database connection:
             1. Use the db_engine if provided
             2. Use the db_url
             3. Raise an error if neither is provided
 
+        Async methods use the async_db_engine if provided, otherwise an engine created from the async_db_url,
+        otherwise an engine created from the db_url if it uses the async capable psycopg driver.
+        Without an async engine, async methods run the sync methods in a thread.
+
         Args:
             table_name (str): Name of the table to store Agent sessions.
             schema (Optional[str]): The schema to use for the table. Defaults to "ai".
             db_url (Optional[str]): The database URL to connect to.
             db_engine (Optional[Engine]): The SQLAlchemy database engine to use.
             schema_version (int): Version of the schema. Defaults to 1.
-            auto_upgrade_schema (bool): Whether to automatically upgrade the schema.
+            auto_upgrade_schema (bool): Whether to automatically upgrade the schema on initialization.
+            async_db_url (Optional[str]): The database URL for async access, e.g. "postgresql+asyncpg://...".
+            async_db_engine (Optional[AsyncEngine]): The SQLAlchemy async database engine to use.
+            read_after_upsert (bool): Read the session back after an upsert to return the stored row.
+                If False, upsert returns the session that was passed in, saving a round trip.
 
         Raises:
             ValueError: If neither db_url nor db_engine is provided.
@@ -53,6 +83,19 @@ class PgAgentStorage(AgentStorage):
         if _engine is None:
             raise ValueError("Must provide either db_url or db_engine")
 
+        _async_engine: Optional[AsyncEngine] = async_db_engine
+        if _async_engine is None and async_db_url is not None:
+            if create_async_engine is None:
+                raise ImportError("`greenlet` not installed. Please install it using `pip install greenlet`")
+            _async_engine = create_async_engine(async_db_url)
+        elif (
+            _async_engine is None
+            and create_async_engine is not None
+            and db_url is not None
+            and db_url.startswith("postgresql+psycopg://")
+        ):
+            _async_engine = create_async_engine(db_url)
+
         # Database attributes
         self.table_name: str = table_name
         self.schema: Optional[str] = schema
@@ -65,13 +108,29 @@ class PgAgentStorage(AgentStorage):
         self.schema_version: int = schema_version
         # Automatically upgrade schema if True
         self.auto_upgrade_schema: bool = auto_upgrade_schema
+        # Read the session back after an upsert
+        self.read_after_upsert: bool = read_after_upsert
+        # The title column is added by add_title_column() to tables created before the column existed
+        self.has_title_column: bool = False
+        # True once the table was checked for the title column
+        self.checked_title_column: bool = False
 
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        # Async database engine and session, if available
+        self.async_db_engine: Optional[AsyncEngine] = _async_engine
+        self.AsyncSession: Optional[async_sessionmaker] = (
+            async_sessionmaker(bind=self.async_db_engine) if self.async_db_engine is not None else None
+        )
         # Database table for storage
         self.table: Table = self.get_table()
+        # Database table for the runs and messages in the agent memory (schema version 2)
+        self.memory_table: Optional[Table] = self.get_memory_table() if self.schema_version >= 2 else None
         logger.debug(f"Created PgAgentStorage: '{self.schema}.{self.table_name}'")
 
+        if self.auto_upgrade_schema:
+            self.upgrade_schema()
+
     def get_table_v1(self) -> Table:
         """
         Define the table schema for version 1.
@@ -103,6 +162,10 @@ class PgAgentStorage(AgentStorage):
             extend_existing=True,
         )
 
+        if self.has_title_column and "title" not in table.c:
+            # Title from the first user message, stored on upsert so sessions are listed without reading the memory
+            table.append_column(Column("title", String))
+
         # Add indexes
         Index(f"idx_{self.table_name}_session_id", table.c.session_id)
         Index(f"idx_{self.table_name}_agent_id", table.c.agent_id)
@@ -120,11 +183,35 @@ class PgAgentStorage(AgentStorage):
         Raises:
             ValueError: If an unsupported schema version is specified.
         """
-        if self.schema_version == 1:
+        # Version 2 keeps the version 1 session table and adds the memory table
+        if self.schema_version in (1, 2):
             return self.get_table_v1()
         else:
             raise ValueError(f"Unsupported schema version: {self.schema_version}")
 
+    def get_memory_table(self) -> Table:
+        """
+        Define the table that stores the runs and messages in the agent memory, one row per item.
+
+        Returns:
+            Table: SQLAlchemy Table object for the memory items.
+        """
+        return Table(
+            f"{self.table_name}_memory",
+            self.metadata,
+            # Session the item belongs to
+            Column("session_id", String, primary_key=True),
+            # Memory key the item belongs to, e.g. "runs" or "messages"
+            Column("memory_key", String, primary_key=True),
+            # Position of the item in the list
+            Column("idx", Integer, primary_key=True),
+            # Digest of the item, used to skip writing unchanged items
+            Column("digest", String),
+            # The item
+            Column("item", postgresql.JSONB),
+            extend_existing=True,
+        )
+
     def table_exists(self) -> bool:
         """
         Check if the table exists in the database.
@@ -139,11 +226,29 @@ class PgAgentStorage(AgentStorage):
             logger.error(f"Error checking if table exists: {e}")
             return False
 
+    def tables_exist(self) -> bool:
+        """
+        Check if the session table and, for schema version 2, the memory table exist in the database.
+
+        Returns:
+            bool: True if the tables exist, False otherwise.
+        """
+        if not self.table_exists():
+            return False
+        if self.memory_table is None:
+            return True
+        try:
+            return inspect(self.db_engine).has_table(self.memory_table.name, schema=self.schema)
+        except Exception as e:
+            logger.error(f"Error checking if table exists: {e}")
+            return False
+
     def create(self) -> None:
         """
         Create the table if it does not exist.
         """
         if not self.table_exists():
+            self.use_title_column()
             try:
                 with self.Session() as sess, sess.begin():
                     if self.schema is not None:
@@ -153,6 +258,155 @@ class PgAgentStorage(AgentStorage):
                 self.table.create(self.db_engine, checkfirst=True)
             except Exception as e:
                 logger.error(f"Could not create table: '{self.table.fullname}': {e}")
+        if self.memory_table is not None:
+            try:
+                self.memory_table.create(self.db_engine, checkfirst=True)
+            except Exception as e:
+                logger.error(f"Could not create table: '{self.memory_table.fullname}': {e}")
+
+    def use_title_column(self) -> None:
+        """Adds the title column to the table definition, so it is created, written and selected."""
+        self.has_title_column = True
+        self.checked_title_column = True
+        if "title" not in self.table.c:
+            self.table.append_column(Column("title", String))
+
+    def add_title_column(self) -> bool:
+        """
+        Adds the title column to a table created before the column existed. The table is checked once per instance.
+
+        Returns:
+            bool: True if the table has the title column, False if it could not be added.
+        """
+        if self.checked_title_column:
+            return self.has_title_column
+        self.checked_title_column = True
+        try:
+            if self.table_exists():
+                columns = inspect(self.db_engine).get_columns(self.table.name, schema=self.schema)
+                if not any(column["name"] == "title" for column in columns):
+                    table_name = self.db_engine.dialect.identifier_preparer.format_table(self.table)
+                    with self.Session() as sess, sess.begin():
+                        sess.execute(text(f"ALTER TABLE {table_name} ADD COLUMN IF NOT EXISTS title VARCHAR;"))
+        except Exception as e:
+            logger.warning(f"Could not add the title column to '{self.table.fullname}': {e}")
+            return False
+        self.use_title_column()
+        return True
+
+    def split_memory(self, session: AgentSession) -> Tuple[Optional[Dict[str, Any]], Dict[str, List[Any]]]:
+        """
+        Split the session memory into the memory stored in the session row and the append-only items.
+
+        Args:
+            session (AgentSession): The session to split.
+
+        Returns:
+            Tuple[Optional[Dict[str, Any]], Dict[str, List[Any]]]: The memory without the append-only keys
+                and the items for each append-only key.
+        """
+        if self.memory_table is None or session.memory is None:
+            return session.memory, {}
+
+        memory = dict(session.memory)
+        items = {key: memory.pop(key, None) or [] for key in APPEND_ONLY_MEMORY_KEYS}
+        return memory, items
+
+    @staticmethod
+    def get_memory_item_digest(item: Any) -> str:
+        return md5(json.dumps(item, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def get_memory_tails_statement(self, session_id: str):
+        """Selects the last stored item of each memory key of a session."""
+        assert self.memory_table is not None
+        return (
+            select(self.memory_table.c.memory_key, self.memory_table.c.idx, self.memory_table.c.digest)
+            .where(self.memory_table.c.session_id == session_id)
+            .distinct(self.memory_table.c.memory_key)
+            .order_by(self.memory_table.c.memory_key, self.memory_table.c.idx.desc())
+        )
+
+    def get_memory_write_statements(
+        self, session_id: str, items: Dict[str, List[Any]], stored_tails: Dict[str, Tuple[int, str]]
+    ) -> List[Any]:
+        """
+        Build the statements that bring the stored memory items of a session up to date.
+
+        Runs and messages are only appended to, and only the last one is updated in place, so only the last
+        stored item and the new items are digested and written if they changed.
+        If the list is shorter than what is stored, e.g. after the memory was cleared, all items are rewritten
+        and the stored items past the end of the list are removed.
+
+        Args:
+            session_id (str): The session the items belong to.
+            items (Dict[str, List[Any]]): The items for each append-only key.
+            stored_tails (Dict[str, Tuple[int, str]]): The (idx, digest) of the last stored item by memory_key.
+
+        Returns:
+            List[Any]: The statements to execute.
+        """
+        if self.memory_table is None:
+            return []
+
+        statements: List[Any] = []
+        rows: List[Dict[str, Any]] = []
+        for key, values in items.items():
+            last_idx, last_digest = stored_tails.get(key, (-1, None))
+            start = max(last_idx, 0)
+            if len(values) <= last_idx:
+                start = 0
+                statements.append(
+                    delete(self.memory_table).where(
+                        self.memory_table.c.session_id == session_id,
+                        self.memory_table.c.memory_key == key,
+                        self.memory_table.c.idx >= len(values),
+                    )
+                )
+            for idx in range(start, len(values)):
+                digest = self.get_memory_item_digest(values[idx])
+                if idx == last_idx and digest == last_digest:
+                    continue
+                rows.append(dict(session_id=session_id, memory_key=key, idx=idx, digest=digest, item=values[idx]))
+
+        if len(rows) > 0:
+            stmt = postgresql.insert(self.memory_table).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["session_id", "memory_key", "idx"],
+                set_=dict(digest=stmt.excluded.digest, item=stmt.excluded.item),
+            )
+            statements.append(stmt)
+        return statements
+
+    def get_memory_items_statement(self, session_ids: List[str]):
+        assert self.memory_table is not None
+        return (
+            select(self.memory_table.c.session_id, self.memory_table.c.memory_key, self.memory_table.c.item)
+            .where(self.memory_table.c.session_id.in_(session_ids))
+            .order_by(self.memory_table.c.session_id, self.memory_table.c.memory_key, self.memory_table.c.idx)
+        )
+
+    def merge_memory_items(self, sessions: List[AgentSession], item_rows: Any) -> None:
+        """
+        Add the stored memory items back into the memory of each session.
+        Sessions that have not been migrated keep the items stored in their memory.
+
+        Args:
+            sessions (List[AgentSession]): The sessions read from the session table.
+            item_rows (Any): The rows returned by the memory items statement.
+        """
+        items: Dict[str, Dict[str, List[Any]]] = {}
+        for row in item_rows:
+            items.setdefault(row.session_id, {}).setdefault(row.memory_key, []).append(row.item)
+
+        for session in sessions:
+            if session.memory is None:
+                continue
+            session_items = items.get(session.session_id, {})
+            for key in APPEND_ONLY_MEMORY_KEYS:
+                if key in session_items:
+                    session.memory[key] = session_items[key]
+                else:
+                    session.memory.setdefault(key, [])
 
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
         """
@@ -171,7 +425,13 @@ class PgAgentStorage(AgentStorage):
                 if user_id:
                     stmt = stmt.where(self.table.c.user_id == user_id)
                 result = sess.execute(stmt).fetchone()
-                return AgentSession.model_validate(result) if result is not None else None
+                if result is None:
+                    return None
+                session = AgentSession.model_validate(result)
+                if self.memory_table is not None:
+                    item_rows = sess.execute(self.get_memory_items_statement([session.session_id])).fetchall()
+                    self.merge_memory_items([session], item_rows)
+                return session
         except Exception as e:
             logger.debug(f"Exception reading from table: {e}")
             logger.debug(f"Table does not exist: {self.table.name}")
@@ -233,7 +493,12 @@ class PgAgentStorage(AgentStorage):
                 stmt = stmt.order_by(self.table.c.created_at.desc())
                 # execute query
                 rows = sess.execute(stmt).fetchall()
-                return [AgentSession.model_validate(row) for row in rows] if rows is not None else []
+                sessions = [AgentSession.model_validate(row) for row in rows] if rows is not None else []
+                if self.memory_table is not None and len(sessions) > 0:
+                    session_ids = [session.session_id for session in sessions]
+                    item_rows = sess.execute(self.get_memory_items_statement(session_ids)).fetchall()
+                    self.merge_memory_items(sessions, item_rows)
+                return sessions
         except Exception as e:
             logger.debug(f"Exception reading from table: {e}")
             logger.debug(f"Table does not exist: {self.table.name}")
@@ -241,6 +506,145 @@ class PgAgentStorage(AgentStorage):
             self.create()
         return []
 
+    def get_list_sessions_statement(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ):
+        """
+        Build the statement that selects the columns of the session summaries, without the memory.
+        The title is built from the session name and the title column stored on upsert. The first user message
+        is only extracted from the memory of sessions saved before the title column existed.
+        One more row than the limit is selected to find out if there is a next page.
+        """
+        first_message: Any = func.jsonb_path_query_first(
+            self.table.c.memory,
+            cast('$.runs[*].message ? (@.role == "user")', postgresql.JSONPATH),
+            type_=postgresql.JSONB,
+        )
+        if self.memory_table is not None:
+            stored_first_message = (
+                select(self.memory_table.c.item["message"])
+                .where(
+                    self.memory_table.c.session_id == self.table.c.session_id,
+                    self.memory_table.c.memory_key == "runs",
+                    self.memory_table.c.item["message"]["role"].astext == "user",
+                )
+                .order_by(self.memory_table.c.idx)
+                .limit(1)
+                .scalar_subquery()
+            )
+            first_message = func.coalesce(stored_first_message, first_message, type_=postgresql.JSONB)
+
+        title: Any = null()
+        if self.has_title_column:
+            title = self.table.c.title
+            first_message = case((title.is_(None), first_message))
+
+        stmt = select(
+            self.table.c.session_id,
+            self.table.c.agent_id,
+            self.table.c.user_id,
+            self.table.c.session_data["session_name"].astext.label("session_name"),
+            title.label("title"),
+            first_message.label("first_message"),
+            self.table.c.created_at,
+            self.table.c.updated_at,
+        )
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if agent_id is not None:
+            stmt = stmt.where(self.table.c.agent_id == agent_id)
+        if cursor is not None:
+            stmt = stmt.where(get_cursor_filter(self.table.c.created_at, self.table.c.session_id, cursor))
+        stmt = stmt.order_by(*get_cursor_order_by(self.table.c.created_at, self.table.c.session_id))
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        return stmt
+
+    @staticmethod
+    def get_session_summary(row: Any) -> AgentSessionSummary:
+        summary = dict(
+            session_id=row.session_id,
+            agent_id=row.agent_id,
+            user_id=row.user_id,
+            session_name=row.session_name,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+        if row.title is not None:
+            return AgentSessionSummary.from_memory_title(memory_title=row.title, **summary)
+        return AgentSessionSummary.from_first_message(first_message=row.first_message, **summary)
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AgentSessionSummary], Optional[str]]:
+        """
+        List session summaries newest first, one page at a time, without reading the session memory.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+            limit (Optional[int]): The maximum number of sessions to return. If None, all sessions are returned.
+            cursor (Optional[str]): The cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[AgentSessionSummary], Optional[str]]: The page of sessions and the cursor to the next page,
+                or None if this is the last page.
+        """
+        self.add_title_column()
+        stmt = self.get_list_sessions_statement(user_id=user_id, agent_id=agent_id, limit=limit, cursor=cursor)
+        try:
+            with self.Session() as sess, sess.begin():
+                rows = sess.execute(stmt).fetchall()
+                return get_page([self.get_session_summary(row) for row in rows], limit)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            self.create()
+        return [], None
+
+    def get_upsert_statement(self, session: AgentSession, memory: Optional[Dict[str, Any]] = None):
+        """
+        Build the statement that inserts an AgentSession or updates it if the session_id already exists.
+
+        Args:
+            session (AgentSession): The session data to upsert.
+            memory (Optional[Dict[str, Any]]): The memory to store in the session row.
+                Defaults to the session memory.
+        """
+        if memory is None:
+            memory = session.memory
+
+        values: Dict[str, Any] = dict(
+            agent_id=session.agent_id,
+            user_id=session.user_id,
+            memory=memory,
+            agent_data=session.agent_data,
+            user_data=session.user_data,
+            session_data=session.session_data,
+        )
+        if self.has_title_column:
+            # The title is taken from the full session memory, which includes the items of the memory table
+            values["title"] = AgentSessionSummary.get_memory_title(session.memory)
+
+        # Create an insert statement
+        stmt = postgresql.insert(self.table).values(session_id=session.session_id, **values)
+
+        # Define the upsert if the session_id already exists
+        # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+        return stmt.on_conflict_do_update(
+            index_elements=["session_id"],
+            set_=dict(**values, updated_at=int(time.time())),  # The updated value for each column
+        )
+
     def upsert(self, session: AgentSession, create_and_retry: bool = True) -> Optional[AgentSession]:
         """
         Insert or update an AgentSession in the database.
@@ -252,45 +656,66 @@ class PgAgentStorage(AgentStorage):
         Returns:
             Optional[AgentSession]: The upserted AgentSession, or None if operation failed.
         """
+        self.add_title_column()
+        memory, items = self.split_memory(session)
         try:
             with self.Session() as sess, sess.begin():
-                # Create an insert statement
-                stmt = postgresql.insert(self.table).values(
-                    session_id=session.session_id,
-                    agent_id=session.agent_id,
-                    user_id=session.user_id,
-                    memory=session.memory,
-                    agent_data=session.agent_data,
-                    user_data=session.user_data,
-                    session_data=session.session_data,
-                )
-
-                # Define the upsert if the session_id already exists
-                # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["session_id"],
-                    set_=dict(
-                        agent_id=session.agent_id,
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        agent_data=session.agent_data,
-                        user_data=session.user_data,
-                        session_data=session.session_data,
-                        updated_at=int(time.time()),
-                    ),  # The updated value for each column
-                )
-
-                sess.execute(stmt)
+                sess.execute(self.get_upsert_statement(session, memory=memory))
+                if self.memory_table is not None and session.memory is not None:
+                    stored_tails = {
+                        row.memory_key: (row.idx, row.digest)
+                        for row in sess.execute(self.get_memory_tails_statement(session.session_id))
+                    }
+                    for stmt in self.get_memory_write_statements(session.session_id, items, stored_tails):
+                        sess.execute(stmt)
         except Exception as e:
             logger.debug(f"Exception upserting into table: {e}")
-            if create_and_retry and not self.table_exists():
+            if create_and_retry and not self.tables_exist():
                 logger.debug(f"Table does not exist: {self.table.name}")
                 logger.debug("Creating table and retrying upsert")
                 self.create()
                 return self.upsert(session, create_and_retry=False)
             return None
+        if not self.read_after_upsert:
+            return session
         return self.read(session_id=session.session_id)
 
+    def get_update_memory_statement(self, session_id: str, memory: Dict[str, Any]):
+        """Returns a statement that merges the memory keys into the stored memory, keeping the other keys"""
+        if self.memory_table is not None and any(key in memory for key in APPEND_ONLY_MEMORY_KEYS):
+            raise ValueError(f"Memory keys {APPEND_ONLY_MEMORY_KEYS} are stored in {self.memory_table.name}")
+        return (
+            update(self.table)
+            .where(self.table.c.session_id == session_id)
+            .values(
+                memory=func.coalesce(self.table.c.memory, cast({}, postgresql.JSONB)).op("||")(
+                    cast(memory, postgresql.JSONB)
+                ),
+                updated_at=int(time.time()),
+            )
+        )
+
+    def update_session_memory(self, session_id: str, memory: Dict[str, Any]) -> bool:
+        """
+        Merge keys into the memory of a stored session in a single statement,
+        so columns and memory keys saved by another writer in the meantime are kept.
+
+        Args:
+            session_id (str): The ID of the session to update.
+            memory (Dict[str, Any]): The memory keys to set, e.g. "summary" and "memories".
+
+        Returns:
+            bool: True if the session was updated, False if it does not exist.
+        """
+        stmt = self.get_update_memory_statement(session_id, memory)
+        try:
+            with self.Session() as sess, sess.begin():
+                result = sess.execute(stmt)
+        except Exception as e:
+            logger.debug(f"Exception updating session memory: {e}")
+            return False
+        return result.rowcount > 0
+
     def delete_session(self, session_id: Optional[str] = None):
         """
         Delete a session from the database.
@@ -310,6 +735,204 @@ class PgAgentStorage(AgentStorage):
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
                 result = sess.execute(delete_stmt)
+                if self.memory_table is not None:
+                    sess.execute(self.memory_table.delete().where(self.memory_table.c.session_id == session_id))
+                if result.rowcount == 0:
+                    logger.debug(f"No session found with session_id: {session_id}")
+                else:
+                    logger.debug(f"Successfully deleted session with session_id: {session_id}")
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
+        """
+        Read an AgentSession from the database without blocking the event loop.
+
+        Args:
+            session_id (str): ID of the session to read.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+
+        Returns:
+            Optional[AgentSession]: AgentSession object if found, None otherwise.
+        """
+        if self.AsyncSession is None:
+            return await super().aread(session_id=session_id, user_id=user_id)
+
+        try:
+            async with self.AsyncSession() as sess:
+                stmt = select(self.table).where(self.table.c.session_id == session_id)
+                if user_id:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                result = (await sess.execute(stmt)).fetchone()
+                if result is None:
+                    return None
+                session = AgentSession.model_validate(result)
+                if self.memory_table is not None:
+                    item_rows = (await sess.execute(self.get_memory_items_statement([session.session_id]))).fetchall()
+                    self.merge_memory_items([session], item_rows)
+                return session
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await run_in_thread(self.create)
+        return None
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, agent_id: Optional[str] = None) -> List[str]:
+        """
+        Get all session IDs without blocking the event loop, optionally filtered by user_id and/or agent_id.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+
+        Returns:
+            List[str]: List of session IDs matching the criteria.
+        """
+        if self.AsyncSession is None:
+            return await super().aget_all_session_ids(user_id=user_id, agent_id=agent_id)
+
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                stmt = select(self.table.c.session_id)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if agent_id is not None:
+                    stmt = stmt.where(self.table.c.agent_id == agent_id)
+                stmt = stmt.order_by(self.table.c.created_at.desc())
+                rows = (await sess.execute(stmt)).fetchall()
+                return [row[0] for row in rows] if rows is not None else []
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await run_in_thread(self.create)
+        return []
+
+    async def aget_all_sessions(
+        self, user_id: Optional[str] = None, agent_id: Optional[str] = None
+    ) -> List[AgentSession]:
+        """
+        Get all sessions without blocking the event loop, optionally filtered by user_id and/or agent_id.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+
+        Returns:
+            List[AgentSession]: List of AgentSession objects matching the criteria.
+        """
+        if self.AsyncSession is None:
+            return await super().aget_all_sessions(user_id=user_id, agent_id=agent_id)
+
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                stmt = select(self.table)
+                if user_id is not None:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if agent_id is not None:
+                    stmt = stmt.where(self.table.c.agent_id == agent_id)
+                stmt = stmt.order_by(self.table.c.created_at.desc())
+                rows = (await sess.execute(stmt)).fetchall()
+                sessions = [AgentSession.model_validate(row) for row in rows] if rows is not None else []
+                if self.memory_table is not None and len(sessions) > 0:
+                    session_ids = [session.session_id for session in sessions]
+                    item_rows = (await sess.execute(self.get_memory_items_statement(session_ids))).fetchall()
+                    self.merge_memory_items(sessions, item_rows)
+                return sessions
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await run_in_thread(self.create)
+        return []
+
+    async def alist_sessions(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AgentSessionSummary], Optional[str]]:
+        """
+        List session summaries newest first without blocking the event loop. See list_sessions().
+        """
+        if self.AsyncSession is None:
+            return await super().alist_sessions(user_id=user_id, agent_id=agent_id, limit=limit, cursor=cursor)
+
+        if not self.checked_title_column:
+            await run_in_thread(self.add_title_column)
+        stmt = self.get_list_sessions_statement(user_id=user_id, agent_id=agent_id, limit=limit, cursor=cursor)
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                rows = (await sess.execute(stmt)).fetchall()
+                return get_page([self.get_session_summary(row) for row in rows], limit)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await run_in_thread(self.create)
+        return [], None
+
+    async def aupsert(self, session: AgentSession, create_and_retry: bool = True) -> Optional[AgentSession]:
+        """
+        Insert or update an AgentSession in the database without blocking the event loop.
+
+        Args:
+            session (AgentSession): The session data to upsert.
+            create_and_retry (bool): Retry upsert if table does not exist.
+
+        Returns:
+            Optional[AgentSession]: The upserted AgentSession, or None if operation failed.
+        """
+        if self.AsyncSession is None:
+            return await run_in_thread(self.upsert, session=session, create_and_retry=create_and_retry)
+
+        if not self.checked_title_column:
+            await run_in_thread(self.add_title_column)
+        memory, items = self.split_memory(session)
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                await sess.execute(self.get_upsert_statement(session, memory=memory))
+                if self.memory_table is not None and session.memory is not None:
+                    stored_tails = {
+                        row.memory_key: (row.idx, row.digest)
+                        for row in await sess.execute(self.get_memory_tails_statement(session.session_id))
+                    }
+                    for stmt in self.get_memory_write_statements(session.session_id, items, stored_tails):
+                        await sess.execute(stmt)
+        except Exception as e:
+            logger.debug(f"Exception upserting into table: {e}")
+            if create_and_retry and not await run_in_thread(self.tables_exist):
+                logger.debug(f"Table does not exist: {self.table.name}")
+                logger.debug("Creating table and retrying upsert")
+                await run_in_thread(self.create)
+                return await self.aupsert(session, create_and_retry=False)
+            return None
+        if not self.read_after_upsert:
+            return session
+        return await self.aread(session_id=session.session_id)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        """
+        Delete a session from the database without blocking the event loop.
+
+        Args:
+            session_id (Optional[str], optional): ID of the session to delete. Defaults to None.
+        """
+        if self.AsyncSession is None:
+            return await super().adelete_session(session_id=session_id)
+
+        if session_id is None:
+            logger.warning("No session_id provided for deletion.")
+            return
+
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
+                result = await sess.execute(delete_stmt)
+                if self.memory_table is not None:
+                    await sess.execute(self.memory_table.delete().where(self.memory_table.c.session_id == session_id))
                 if result.rowcount == 0:
                     logger.debug(f"No session found with session_id: {session_id}")
                 else:
@@ -324,13 +947,36 @@ class PgAgentStorage(AgentStorage):
         if self.table_exists():
             logger.debug(f"Deleting table: {self.table_name}")
             self.table.drop(self.db_engine)
+        if self.memory_table is not None:
+            self.memory_table.drop(self.db_engine, checkfirst=True)
 
     def upgrade_schema(self) -> None:
         """
-        Upgrade the schema to the latest version.
-        This method is currently a placeholder and does not perform any actions.
+        Upgrade the table to the configured schema version.
+
+        Version 2 creates the memory table and moves the runs and messages stored in the memory column
+        of existing sessions into it.
         """
-        pass
+        if self.memory_table is None:
+            return
+
+        self.create()
+        migrated = 0
+        with self.Session() as sess, sess.begin():
+            stmt = select(self.table.c.session_id, self.table.c.memory).where(
+                or_(*[self.table.c.memory.has_key(key) for key in APPEND_ONLY_MEMORY_KEYS])
+            )
+            for row in sess.execute(stmt).fetchall():
+                memory, items = self.split_memory(AgentSession(session_id=row.session_id, memory=row.memory))
+                stored_tails = {
+                    r.memory_key: (r.idx, r.digest)
+                    for r in sess.execute(self.get_memory_tails_statement(row.session_id))
+                }
+                for write_stmt in self.get_memory_write_statements(row.session_id, items, stored_tails):
+                    sess.execute(write_stmt)
+                sess.execute(update(self.table).where(self.table.c.session_id == row.session_id).values(memory=memory))
+                migrated += 1
+        logger.debug(f"Upgraded {self.table.fullname} to schema version {self.schema_version}: {migrated} sessions")
 
     def __deepcopy__(self, memo):
         """
@@ -351,10 +997,10 @@ class PgAgentStorage(AgentStorage):
 
         # Deep copy attributes
         for k, v in self.__dict__.items():
-            if k in {"metadata", "table", "inspector"}:
+            if k in {"metadata", "table", "memory_table", "inspector"}:
                 continue
             # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "Session"}:
+            elif k in {"db_engine", "Session", "async_db_engine", "AsyncSession"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
@@ -363,5 +1009,6 @@ class PgAgentStorage(AgentStorage):
         copied_obj.metadata = MetaData(schema=copied_obj.schema)
         copied_obj.inspector = inspect(copied_obj.db_engine)
         copied_obj.table = copied_obj.get_table()
+        copied_obj.memory_table = copied_obj.get_memory_table() if copied_obj.schema_version >= 2 else None
 
         return copied_obj
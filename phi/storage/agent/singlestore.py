@@ -1,4 +1,4 @@
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Tuple
 import json
 
 try:
@@ -8,13 +8,14 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, sessionmaker
     from sqlalchemy.schema import MetaData, Table, Column
-    from sqlalchemy.sql.expression import text, select
+    from sqlalchemy.sql.expression import text, select, func
 except ImportError:
     raise ImportError("`sqlalchemy` not installed")
 
-from phi.agent.session import AgentSession
+from phi.agent.session import AgentSession, AgentSessionSummary, NUM_RUNS_FOR_TITLE
 from phi.storage.agent.base import AgentStorage
 from phi.utils.log import logger
+from phi.utils.pagination import get_cursor_filter, get_cursor_order_by, get_page
 
 
 class S2AgentStorage(AgentStorage):
@@ -170,6 +171,63 @@ class S2AgentStorage(AgentStorage):
             logger.debug(f"Table does not exist: {self.table.name}")
         return sessions
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AgentSessionSummary], Optional[str]]:
+        """
+        List session summaries newest first, one page at a time, without reading the session memory.
+        The title is the first user message among the messages of the first runs.
+        """
+        stmt = select(
+            self.table.c.session_id,
+            self.table.c.agent_id,
+            self.table.c.user_id,
+            func.JSON_EXTRACT_STRING(self.table.c.session_data, "session_name").label("session_name"),
+            *[
+                func.JSON_EXTRACT_JSON(self.table.c.memory, "runs", i, "message").label(f"run_message_{i}")
+                for i in range(NUM_RUNS_FOR_TITLE)
+            ],
+            self.table.c.created_at,
+            self.table.c.updated_at,
+        )
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if agent_id is not None:
+            stmt = stmt.where(self.table.c.agent_id == agent_id)
+        if cursor is not None:
+            stmt = stmt.where(get_cursor_filter(self.table.c.created_at, self.table.c.session_id, cursor))
+        stmt = stmt.order_by(*get_cursor_order_by(self.table.c.created_at, self.table.c.session_id))
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+
+        summaries: List[AgentSessionSummary] = []
+        try:
+            with self.Session.begin() as sess:
+                rows = sess.execute(stmt).fetchall()
+                for row in rows:
+                    # JSON_EXTRACT_JSON returns the messages as JSON text
+                    run_messages = [getattr(row, f"run_message_{i}") for i in range(NUM_RUNS_FOR_TITLE)]
+                    summaries.append(
+                        AgentSessionSummary.from_first_message(
+                            first_message=AgentSessionSummary.get_first_user_message(
+                                [json.loads(message) for message in run_messages if message]
+                            ),
+                            session_id=row.session_id,
+                            agent_id=row.agent_id,
+                            user_id=row.user_id,
+                            session_name=row.session_name,
+                            created_at=row.created_at,
+                            updated_at=row.updated_at,
+                        )
+                    )
+        except Exception:
+            logger.debug(f"Table does not exist: {self.table.name}")
+        return get_page(summaries, limit)
+
     def upsert(self, session: AgentSession) -> Optional[AgentSession]:
         """
         Create a new session if it does not exist, otherwise update the existing session.
@@ -1,21 +1,24 @@
+import json
 import time
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple, cast
 
 try:
     from sqlalchemy.dialects import sqlite
-    from sqlalchemy.engine import create_engine, Engine
+    from sqlalchemy.engine import create_engine, CursorResult, Engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, sessionmaker
     from sqlalchemy.schema import MetaData, Table, Column
-    from sqlalchemy.sql.expression import select
+    from sqlalchemy.sql.expression import select, text, update, func, case, null
     from sqlalchemy.types import String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
 from phi.agent import AgentSession
+from phi.agent.session import AgentSessionSummary
 from phi.storage.agent.base import AgentStorage
 from phi.utils.log import logger
+from phi.utils.pagination import get_cursor_filter, get_cursor_order_by, get_page
 
 
 class SqlAgentStorage(AgentStorage):
@@ -69,6 +72,10 @@ class SqlAgentStorage(AgentStorage):
         self.schema_version: int = schema_version
         # Automatically upgrade schema if True
         self.auto_upgrade_schema: bool = auto_upgrade_schema
+        # The title column is added by add_title_column() to tables created before the column existed
+        self.has_title_column: bool = False
+        # True once the table was checked for the title column
+        self.checked_title_column: bool = False
 
         # Database session
         self.Session: sessionmaker[Session] = sessionmaker(bind=self.db_engine)
@@ -82,7 +89,7 @@ class SqlAgentStorage(AgentStorage):
         Returns:
             Table: SQLAlchemy Table object representing the schema.
         """
-        return Table(
+        table = Table(
             self.table_name,
             self.metadata,
             # Session UUID: Primary Key
@@ -106,6 +113,10 @@ class SqlAgentStorage(AgentStorage):
             extend_existing=True,
             sqlite_autoincrement=True,
         )
+        if self.has_title_column and "title" not in table.c:
+            # Title from the first user message, stored on upsert so sessions are listed without reading the memory
+            table.append_column(Column("title", String))
+        return table
 
     def get_table(self) -> Table:
         """
@@ -141,9 +152,40 @@ class SqlAgentStorage(AgentStorage):
         Create the table if it doesn't exist.
         """
         if not self.table_exists():
+            self.use_title_column()
             logger.debug(f"Creating table: {self.table.name}")
             self.table.create(self.db_engine, checkfirst=True)
 
+    def use_title_column(self) -> None:
+        """Adds the title column to the table definition, so it is created, written and selected."""
+        self.has_title_column = True
+        self.checked_title_column = True
+        if "title" not in self.table.c:
+            self.table.append_column(Column("title", String))
+
+    def add_title_column(self) -> bool:
+        """
+        Adds the title column to a table created before the column existed. The table is checked once per instance.
+
+        Returns:
+            bool: True if the table has the title column, False if it could not be added.
+        """
+        if self.checked_title_column:
+            return self.has_title_column
+        self.checked_title_column = True
+        try:
+            if self.table_exists():
+                columns = inspect(self.db_engine).get_columns(self.table.name)
+                if not any(column["name"] == "title" for column in columns):
+                    table_name = self.db_engine.dialect.identifier_preparer.format_table(self.table)
+                    with self.Session() as sess, sess.begin():
+                        sess.execute(text(f"ALTER TABLE {table_name} ADD COLUMN title VARCHAR"))
+        except Exception as e:
+            logger.warning(f"Could not add the title column to '{self.table.name}': {e}")
+            return False
+        self.use_title_column()
+        return True
+
     def read(self, session_id: str, user_id: Optional[str] = None) -> Optional[AgentSession]:
         """
         Read an AgentSession from the database.
@@ -231,6 +273,92 @@ class SqlAgentStorage(AgentStorage):
             self.create()
         return []
 
+    def get_first_user_message_column(self):
+        """Selects the message of the first run with a user message, as JSON text."""
+        runs = func.json_each(self.table.c.memory, "$.runs").table_valued("key", "value")
+        return (
+            select(func.json_extract(runs.c.value, "$.message"))
+            .where(func.json_extract(runs.c.value, "$.message.role") == "user")
+            .order_by(runs.c.key)
+            .limit(1)
+            .scalar_subquery()
+        )
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[AgentSessionSummary], Optional[str]]:
+        """
+        List session summaries newest first, one page at a time, without reading the session memory.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            agent_id (Optional[str]): The ID of the agent to filter by.
+            limit (Optional[int]): The maximum number of sessions to return. If None, all sessions are returned.
+            cursor (Optional[str]): The cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[AgentSessionSummary], Optional[str]]: The page of sessions and the cursor to the next page,
+                or None if this is the last page.
+        """
+        # The first user message is only extracted from the memory of sessions saved before the title column existed
+        title: Any = null()
+        first_message: Any = self.get_first_user_message_column()
+        if self.add_title_column():
+            title = self.table.c.title
+            first_message = case((title.is_(None), first_message))
+        stmt = select(
+            self.table.c.session_id,
+            self.table.c.agent_id,
+            self.table.c.user_id,
+            func.json_extract(self.table.c.session_data, "$.session_name").label("session_name"),
+            title.label("title"),
+            first_message.label("first_message"),
+            self.table.c.created_at,
+            self.table.c.updated_at,
+        )
+        if user_id is not None:
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if agent_id is not None:
+            stmt = stmt.where(self.table.c.agent_id == agent_id)
+        if cursor is not None:
+            stmt = stmt.where(get_cursor_filter(self.table.c.created_at, self.table.c.session_id, cursor))
+        stmt = stmt.order_by(*get_cursor_order_by(self.table.c.created_at, self.table.c.session_id))
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        try:
+            with self.Session() as sess, sess.begin():
+                rows = sess.execute(stmt).fetchall()
+                summaries = []
+                for row in rows:
+                    summary = dict(
+                        session_id=row.session_id,
+                        agent_id=row.agent_id,
+                        user_id=row.user_id,
+                        session_name=row.session_name,
+                        created_at=row.created_at,
+                        updated_at=row.updated_at,
+                    )
+                    if row.title is not None:
+                        summaries.append(AgentSessionSummary.from_memory_title(memory_title=row.title, **summary))
+                    else:
+                        summaries.append(
+                            AgentSessionSummary.from_first_message(
+                                first_message=json.loads(row.first_message) if row.first_message else None,
+                                **summary,
+                            )
+                        )
+                return get_page(summaries, limit)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            self.create()
+        return [], None
+
     def upsert(self, session: AgentSession, create_and_retry: bool = True) -> Optional[AgentSession]:
         """
         Insert or update an AgentSession in the database.
@@ -242,32 +370,27 @@ class SqlAgentStorage(AgentStorage):
         Returns:
             Optional[AgentSession]: The upserted AgentSession, or None if operation failed.
         """
+        self.add_title_column()
+        values: Dict[str, Any] = dict(
+            agent_id=session.agent_id,
+            user_id=session.user_id,
+            memory=session.memory,
+            agent_data=session.agent_data,
+            user_data=session.user_data,
+            session_data=session.session_data,
+        )
+        if self.has_title_column:
+            values["title"] = AgentSessionSummary.get_memory_title(session.memory)
         try:
             with self.Session() as sess, sess.begin():
                 # Create an insert statement
-                stmt = sqlite.insert(self.table).values(
-                    session_id=session.session_id,
-                    agent_id=session.agent_id,
-                    user_id=session.user_id,
-                    memory=session.memory,
-                    agent_data=session.agent_data,
-                    user_data=session.user_data,
-                    session_data=session.session_data,
-                )
+                stmt = sqlite.insert(self.table).values(session_id=session.session_id, **values)
 
                 # Define the upsert if the session_id already exists
                 # See: https://docs.sqlalchemy.org/en/20/dialects/sqlite.html#insert-on-conflict-upsert
                 stmt = stmt.on_conflict_do_update(
                     index_elements=["session_id"],
-                    set_=dict(
-                        agent_id=session.agent_id,
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        agent_data=session.agent_data,
-                        user_data=session.user_data,
-                        session_data=session.session_data,
-                        updated_at=int(time.time()),
-                    ),  # The updated value for each column
+                    set_=dict(**values, updated_at=int(time.time())),  # The updated value for each column
                 )
 
                 sess.execute(stmt)
@@ -281,6 +404,39 @@ class SqlAgentStorage(AgentStorage):
             return None
         return self.read(session_id=session.session_id)
 
+    def get_update_memory_statement(self, session_id: str, memory: Dict[str, Any]):
+        """Returns a statement that sets the memory keys in the stored memory with json_set, keeping the other keys"""
+        args: List[Any] = [func.coalesce(self.table.c.memory, "{}")]
+        for key, value in memory.items():
+            args.extend([f'$."{key}"', func.json(json.dumps(value))])
+        return (
+            update(self.table)
+            .where(self.table.c.session_id == session_id)
+            .values(memory=func.json_set(*args), updated_at=int(time.time()))
+        )
+
+    def update_session_memory(self, session_id: str, memory: Dict[str, Any]) -> bool:
+        """
+        Set keys of the memory of a stored session in a single statement,
+        so columns and memory keys saved by another writer in the meantime are kept.
+
+        Args:
+            session_id (str): The ID of the session to update.
+            memory (Dict[str, Any]): The memory keys to set, e.g. "summary" and "memories".
+
+        Returns:
+            bool: True if the session was updated, False if it does not exist.
+        """
+        if not memory:
+            return self.read(session_id=session_id) is not None
+        try:
+            with self.Session() as sess, sess.begin():
+                result = cast(CursorResult, sess.execute(self.get_update_memory_statement(session_id, memory)))
+        except Exception as e:
+            logger.debug(f"Exception updating session memory: {e}")
+            return False
+        return result.rowcount > 0
+
     def delete_session(self, session_id: Optional[str] = None):
         """
         Delete a workflow session from the database.
@@ -299,7 +455,7 @@ class SqlAgentStorage(AgentStorage):
             with self.Session() as sess, sess.begin():
                 # Delete the session with the given session_id
                 delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
-                result = sess.execute(delete_stmt)
+                result = cast(CursorResult, sess.execute(delete_stmt))
                 if result.rowcount == 0:
                     logger.debug(f"No session found with session_id: {session_id}")
                 else:
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
-from phi.workflow.session import WorkflowSession
+from phi.workflow.session import WorkflowSession, WorkflowSessionSummary
+from phi.utils.pagination import paginate
+from phi.utils.threads import run_in_thread
 
 
 class WorkflowStorage(ABC):
@@ -23,6 +25,34 @@ class WorkflowStorage(ABC):
     ) -> List[WorkflowSession]:
         raise NotImplementedError
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[WorkflowSessionSummary], Optional[str]]:
+        """
+        List session summaries newest first, one page at a time.
+
+        Backends should override this to select only the columns needed for the summary.
+        The default implementation reads all sessions and pages them in memory.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            workflow_id (Optional[str]): The ID of the workflow to filter by.
+            limit (Optional[int]): The maximum number of sessions to return. If None, all sessions are returned.
+            cursor (Optional[str]): The cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[WorkflowSessionSummary], Optional[str]]: The page of sessions and the cursor to the next page,
+                or None if this is the last page.
+        """
+        sessions = self.get_all_sessions(user_id=user_id, workflow_id=workflow_id)
+        return paginate(
+            [WorkflowSessionSummary.from_session(session) for session in sessions], limit=limit, cursor=cursor
+        )
+
     @abstractmethod
     def upsert(self, session: WorkflowSession) -> Optional[WorkflowSession]:
         raise NotImplementedError
@@ -38,3 +68,34 @@ class WorkflowStorage(ABC):
     @abstractmethod
     def upgrade_schema(self) -> None:
         raise NotImplementedError
+
+    # Async variants. Backends without a native async driver run the sync method in a thread
+    # so that storage I/O does not block the event loop.
+
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[WorkflowSession]:
+        return await run_in_thread(self.read, session_id=session_id, user_id=user_id)
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, workflow_id: Optional[str] = None) -> List[str]:
+        return await run_in_thread(self.get_all_session_ids, user_id=user_id, workflow_id=workflow_id)
+
+    async def aget_all_sessions(
+        self, user_id: Optional[str] = None, workflow_id: Optional[str] = None
+    ) -> List[WorkflowSession]:
+        return await run_in_thread(self.get_all_sessions, user_id=user_id, workflow_id=workflow_id)
+
+    async def alist_sessions(
+        self,
+        user_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[WorkflowSessionSummary], Optional[str]]:
+        return await run_in_thread(
+            self.list_sessions, user_id=user_id, workflow_id=workflow_id, limit=limit, cursor=cursor
+        )
+
+    async def aupsert(self, session: WorkflowSession) -> Optional[WorkflowSession]:
+        return await run_in_thread(self.upsert, session=session)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        return await run_in_thread(self.delete_session, session_id=session_id)
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from uuid import UUID
 
 try:
@@ -11,8 +11,10 @@ except ImportError:
     raise ImportError("`pymongo` not installed. Please install it with `pip install pymongo`")
 
 from phi.workflow import WorkflowSession
+from phi.workflow.session import WorkflowSessionSummary
 from phi.storage.workflow.base import WorkflowStorage
 from phi.utils.log import logger
+from phi.utils.pagination import decode_cursor, get_page
 
 
 class MongoWorkflowStorage(WorkflowStorage):
@@ -134,6 +136,67 @@ class MongoWorkflowStorage(WorkflowStorage):
             logger.error(f"Error getting sessions: {e}")
             return []
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[WorkflowSessionSummary], Optional[str]]:
+        """List session summaries newest first, one page at a time, projecting only the fields they need
+        Args:
+            user_id: ID of the user to read
+            workflow_id: ID of the workflow to read
+            limit: Maximum number of sessions to return, all sessions if None
+            cursor: Cursor returned with the previous page
+        Returns:
+            Tuple[List[WorkflowSessionSummary], Optional[str]]: The sessions and the cursor to the next page, if any
+        """
+        try:
+            query: Dict[str, Any] = {}
+            if user_id is not None:
+                query["user_id"] = user_id
+            if workflow_id is not None:
+                query["workflow_id"] = workflow_id
+            if cursor is not None:
+                created_at, session_id = decode_cursor(cursor)
+                query["$or"] = [
+                    {"created_at": {"$lt": created_at}},
+                    {"created_at": created_at, "session_id": {"$lt": session_id}},
+                ]
+
+            pipeline: List[Dict[str, Any]] = [{"$match": query}, {"$sort": {"created_at": -1, "session_id": -1}}]
+            if limit is not None:
+                pipeline.append({"$limit": limit + 1})
+            pipeline.append(
+                {
+                    "$project": {
+                        "_id": 0,
+                        "session_id": 1,
+                        "workflow_id": 1,
+                        "user_id": 1,
+                        "session_name": "$session_data.session_name",
+                        "has_runs": {"$gt": [{"$size": {"$ifNull": ["$memory.runs", []]}}, 0]},
+                        "first_response_content": {"$arrayElemAt": ["$memory.runs.response.content", 0]},
+                        "created_at": 1,
+                        "updated_at": 1,
+                    }
+                }
+            )
+            summaries = [
+                WorkflowSessionSummary.from_first_response(
+                    has_runs=doc.pop("has_runs", False),
+                    first_response_content=doc.pop("first_response_content", None),
+                    session_id=str(doc.pop("session_id")),
+                    **doc,
+                )
+                for doc in self.collection.aggregate(pipeline)
+            ]
+            return get_page(summaries, limit)
+        except PyMongoError as e:
+            logger.error(f"Error listing sessions: {e}")
+            return [], None
+
     def upsert(self, session: WorkflowSession, create_and_retry: bool = True) -> Optional[WorkflowSession]:
         """Upsert a workflow session
         Args:
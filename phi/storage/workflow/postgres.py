@@ -1,5 +1,5 @@
 import time
-from typing import Optional, List
+from typing import Optional, List, Tuple, Any
 
 try:
     from sqlalchemy import create_engine, Engine, MetaData, Table, Column, String, BigInteger, inspect, Index
@@ -9,9 +9,18 @@ try:
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it with `pip install sqlalchemy`")
 
+try:
+    from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+except ImportError:
+    # The asyncio extension requires `greenlet`. Without it, async methods run the sync methods in a thread.
+    AsyncEngine = async_sessionmaker = create_async_engine = None  # type: ignore
+
 from phi.workflow import WorkflowSession
+from phi.workflow.session import WorkflowSessionSummary
 from phi.storage.workflow.base import WorkflowStorage
 from phi.utils.log import logger
+from phi.utils.pagination import get_cursor_filter, get_cursor_order_by, get_page
+from phi.utils.threads import run_in_thread
 
 
 class PgWorkflowStorage(WorkflowStorage):
@@ -23,6 +32,8 @@ class PgWorkflowStorage(WorkflowStorage):
         db_engine: Optional[Engine] = None,
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
+        async_db_url: Optional[str] = None,
+        async_db_engine: Optional[AsyncEngine] = None,
     ):
         """
         This class provides workflow storage using a PostgreSQL database.
@@ -32,6 +43,10 @@ class PgWorkflowStorage(WorkflowStorage):
             2. Use the db_url
             3. Raise an error if neither is provided
 
+        Async methods use the async_db_engine if provided, otherwise an engine created from the async_db_url,
+        otherwise an engine created from the db_url if it uses the async capable psycopg driver.
+        Without an async engine, async methods run the sync methods in a thread.
+
         Args:
             table_name (str): The name of the table to store Workflow sessions.
             schema (Optional[str]): The schema to use for the table. Defaults to "ai".
@@ -39,6 +54,8 @@ class PgWorkflowStorage(WorkflowStorage):
             db_engine (Optional[Engine]): The SQLAlchemy database engine to use.
             schema_version (int): Version of the schema. Defaults to 1.
             auto_upgrade_schema (bool): Whether to automatically upgrade the schema.
+            async_db_url (Optional[str]): The database URL for async access, e.g. "postgresql+asyncpg://...".
+            async_db_engine (Optional[AsyncEngine]): The SQLAlchemy async database engine to use.
 
         Raises:
             ValueError: If neither db_url nor db_engine is provided.
@@ -50,6 +67,19 @@ class PgWorkflowStorage(WorkflowStorage):
         if _engine is None:
             raise ValueError("Must provide either db_url or db_engine")
 
+        _async_engine: Optional[AsyncEngine] = async_db_engine
+        if _async_engine is None and async_db_url is not None:
+            if create_async_engine is None:
+                raise ImportError("`greenlet` not installed. Please install it using `pip install greenlet`")
+            _async_engine = create_async_engine(async_db_url)
+        elif (
+            _async_engine is None
+            and create_async_engine is not None
+            and db_url is not None
+            and db_url.startswith("postgresql+psycopg://")
+        ):
+            _async_engine = create_async_engine(db_url)
+
         # Database attributes
         self.table_name: str = table_name
         self.schema: Optional[str] = schema
@@ -65,6 +95,11 @@ class PgWorkflowStorage(WorkflowStorage):
 
         # Database session
         self.Session: scoped_session = scoped_session(sessionmaker(bind=self.db_engine))
+        # Async database engine and session, if available
+        self.async_db_engine: Optional[AsyncEngine] = _async_engine
+        self.AsyncSession: Optional[async_sessionmaker] = (
+            async_sessionmaker(bind=self.async_db_engine) if self.async_db_engine is not None else None
+        )
         # Database table for storage
         self.table: Table = self.get_table()
         logger.debug(f"Created PgWorkflowStorage: '{self.schema}.{self.table_name}'")
@@ -240,6 +275,118 @@ class PgWorkflowStorage(WorkflowStorage):
             self.create()
         return []
 
+    def get_list_sessions_statement(
+        self,
+        user_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ):
+        """
+        Build the statement that selects the columns of the session summaries, without the memory.
+        The title is built from the session name and the response of the first run, extracted in the database.
+        One more row than the limit is selected to find out if there is a next page.
+        """
+        first_run = self.table.c.memory["runs"][0]
+        stmt = select(
+            self.table.c.session_id,
+            self.table.c.workflow_id,
+            self.table.c.user_id,
+            self.table.c.session_data["session_name"].astext.label("session_name"),
+            first_run.isnot(None).label("has_runs"),
+            first_run["response"]["content"].astext.label("first_response_content"),
+            self.table.c.created_at,
+            self.table.c.updated_at,
+        )
+        if user_id is not None and user_id != "":
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if workflow_id is not None:
+            stmt = stmt.where(self.table.c.workflow_id == workflow_id)
+        if cursor is not None:
+            stmt = stmt.where(get_cursor_filter(self.table.c.created_at, self.table.c.session_id, cursor))
+        stmt = stmt.order_by(*get_cursor_order_by(self.table.c.created_at, self.table.c.session_id))
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        return stmt
+
+    @staticmethod
+    def get_session_summary(row: Any) -> WorkflowSessionSummary:
+        return WorkflowSessionSummary.from_first_response(
+            has_runs=bool(row.has_runs),
+            first_response_content=row.first_response_content,
+            session_id=row.session_id,
+            workflow_id=row.workflow_id,
+            user_id=row.user_id,
+            session_name=row.session_name,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[WorkflowSessionSummary], Optional[str]]:
+        """
+        List session summaries newest first, one page at a time, without reading the session memory.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            workflow_id (Optional[str]): The ID of the workflow to filter by.
+            limit (Optional[int]): The maximum number of sessions to return. If None, all sessions are returned.
+            cursor (Optional[str]): The cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[WorkflowSessionSummary], Optional[str]]: The page of sessions and the cursor to the next page,
+                or None if this is the last page.
+        """
+        stmt = self.get_list_sessions_statement(user_id=user_id, workflow_id=workflow_id, limit=limit, cursor=cursor)
+        try:
+            with self.Session() as sess, sess.begin():
+                rows = sess.execute(stmt).fetchall()
+                return get_page([self.get_session_summary(row) for row in rows], limit)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            self.create()
+        return [], None
+
+    def get_upsert_statement(self, session: WorkflowSession):
+        """
+        Build the statement that inserts a WorkflowSession or updates it if the session_id already exists.
+
+        Args:
+            session (WorkflowSession): The session data to upsert.
+        """
+        # Create an insert statement
+        stmt = postgresql.insert(self.table).values(
+            session_id=session.session_id,
+            workflow_id=session.workflow_id,
+            user_id=session.user_id,
+            memory=session.memory,
+            workflow_data=session.workflow_data,
+            user_data=session.user_data,
+            session_data=session.session_data,
+        )
+
+        # Define the upsert if the session_id already exists
+        # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
+        return stmt.on_conflict_do_update(
+            index_elements=["session_id"],
+            set_=dict(
+                workflow_id=session.workflow_id,
+                user_id=session.user_id,
+                memory=session.memory,
+                workflow_data=session.workflow_data,
+                user_data=session.user_data,
+                session_data=session.session_data,
+                updated_at=int(time.time()),
+            ),  # The updated value for each column
+        )
+
     def upsert(self, session: WorkflowSession, create_and_retry: bool = True) -> Optional[WorkflowSession]:
         """
         Insert or update a WorkflowSession in the database.
@@ -253,33 +400,7 @@ class PgWorkflowStorage(WorkflowStorage):
         """
         try:
             with self.Session() as sess, sess.begin():
-                # Create an insert statement
-                stmt = postgresql.insert(self.table).values(
-                    session_id=session.session_id,
-                    workflow_id=session.workflow_id,
-                    user_id=session.user_id,
-                    memory=session.memory,
-                    workflow_data=session.workflow_data,
-                    user_data=session.user_data,
-                    session_data=session.session_data,
-                )
-
-                # Define the upsert if the session_id already exists
-                # See: https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#postgresql-insert-on-conflict
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=["session_id"],
-                    set_=dict(
-                        workflow_id=session.workflow_id,
-                        user_id=session.user_id,
-                        memory=session.memory,
-                        workflow_data=session.workflow_data,
-                        user_data=session.user_data,
-                        session_data=session.session_data,
-                        updated_at=int(time.time()),
-                    ),  # The updated value for each column
-                )
-
-                sess.execute(stmt)
+                sess.execute(self.get_upsert_statement(session))
         except Exception as e:
             logger.debug(f"Exception upserting into table: {e}")
             if create_and_retry and not self.table_exists():
@@ -316,6 +437,175 @@ class PgWorkflowStorage(WorkflowStorage):
         except Exception as e:
             logger.error(f"Error deleting session: {e}")
 
+    async def aread(self, session_id: str, user_id: Optional[str] = None) -> Optional[WorkflowSession]:
+        """
+        Read a WorkflowSession from the database without blocking the event loop.
+
+        Args:
+            session_id (str): ID of the session to read.
+            user_id (Optional[str]): User ID to filter by. Defaults to None.
+
+        Returns:
+            Optional[WorkflowSession]: WorkflowSession object if found, None otherwise.
+        """
+        if self.AsyncSession is None:
+            return await super().aread(session_id=session_id, user_id=user_id)
+
+        try:
+            async with self.AsyncSession() as sess:
+                stmt = select(self.table).where(self.table.c.session_id == session_id)
+                if user_id:
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                result = (await sess.execute(stmt)).fetchone()
+                return WorkflowSession.model_validate(result) if result is not None else None
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await run_in_thread(self.create)
+        return None
+
+    async def aget_all_session_ids(self, user_id: Optional[str] = None, workflow_id: Optional[str] = None) -> List[str]:
+        """
+        Get all session IDs without blocking the event loop, optionally filtered by user_id and/or workflow_id.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            workflow_id (Optional[str]): The ID of the workflow to filter by.
+
+        Returns:
+            List[str]: List of session IDs matching the criteria.
+        """
+        if self.AsyncSession is None:
+            return await super().aget_all_session_ids(user_id=user_id, workflow_id=workflow_id)
+
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                stmt = select(self.table.c.session_id)
+                if user_id is not None and user_id != "":
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if workflow_id is not None:
+                    stmt = stmt.where(self.table.c.workflow_id == workflow_id)
+                stmt = stmt.order_by(self.table.c.created_at.desc())
+                rows = (await sess.execute(stmt)).fetchall()
+                return [row[0] for row in rows] if rows is not None else []
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await run_in_thread(self.create)
+        return []
+
+    async def aget_all_sessions(
+        self, user_id: Optional[str] = None, workflow_id: Optional[str] = None
+    ) -> List[WorkflowSession]:
+        """
+        Get all sessions without blocking the event loop, optionally filtered by user_id and/or workflow_id.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            workflow_id (Optional[str]): The ID of the workflow to filter by.
+
+        Returns:
+            List[WorkflowSession]: List of WorkflowSession objects matching the criteria.
+        """
+        if self.AsyncSession is None:
+            return await super().aget_all_sessions(user_id=user_id, workflow_id=workflow_id)
+
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                stmt = select(self.table)
+                if user_id is not None and user_id != "":
+                    stmt = stmt.where(self.table.c.user_id == user_id)
+                if workflow_id is not None:
+                    stmt = stmt.where(self.table.c.workflow_id == workflow_id)
+                stmt = stmt.order_by(self.table.c.created_at.desc())
+                rows = (await sess.execute(stmt)).fetchall()
+                return [WorkflowSession.model_validate(row) for row in rows] if rows is not None else []
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await run_in_thread(self.create)
+        return []
+
+    async def alist_sessions(
+        self,
+        user_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[WorkflowSessionSummary], Optional[str]]:
+        """
+        List session summaries newest first without blocking the event loop. See list_sessions().
+        """
+        if self.AsyncSession is None:
+            return await super().alist_sessions(user_id=user_id, workflow_id=workflow_id, limit=limit, cursor=cursor)
+
+        stmt = self.get_list_sessions_statement(user_id=user_id, workflow_id=workflow_id, limit=limit, cursor=cursor)
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                rows = (await sess.execute(stmt)).fetchall()
+                return get_page([self.get_session_summary(row) for row in rows], limit)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            await run_in_thread(self.create)
+        return [], None
+
+    async def aupsert(self, session: WorkflowSession, create_and_retry: bool = True) -> Optional[WorkflowSession]:
+        """
+        Insert or update a WorkflowSession in the database without blocking the event loop.
+
+        Args:
+            session (WorkflowSession): The session data to upsert.
+            create_and_retry (bool): Retry upsert if table does not exist.
+
+        Returns:
+            Optional[WorkflowSession]: The upserted WorkflowSession, or None if operation failed.
+        """
+        if self.AsyncSession is None:
+            return await run_in_thread(self.upsert, session=session, create_and_retry=create_and_retry)
+
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                await sess.execute(self.get_upsert_statement(session))
+        except Exception as e:
+            logger.debug(f"Exception upserting into table: {e}")
+            if create_and_retry and not await run_in_thread(self.table_exists):
+                logger.debug(f"Table does not exist: {self.table.name}")
+                logger.debug("Creating table and retrying upsert")
+                await run_in_thread(self.create)
+                return await self.aupsert(session, create_and_retry=False)
+            return None
+        return await self.aread(session_id=session.session_id)
+
+    async def adelete_session(self, session_id: Optional[str] = None):
+        """
+        Delete a session from the database without blocking the event loop.
+
+        Args:
+            session_id (Optional[str], optional): ID of the session to delete. Defaults to None.
+        """
+        if self.AsyncSession is None:
+            return await super().adelete_session(session_id=session_id)
+
+        if session_id is None:
+            logger.warning("No session_id provided for deletion.")
+            return
+
+        try:
+            async with self.AsyncSession() as sess, sess.begin():
+                delete_stmt = self.table.delete().where(self.table.c.session_id == session_id)
+                result = await sess.execute(delete_stmt)
+                if result.rowcount == 0:
+                    logger.debug(f"No session found with session_id: {session_id}")
+                else:
+                    logger.debug(f"Successfully deleted session with session_id: {session_id}")
+        except Exception as e:
+            logger.error(f"Error deleting session: {e}")
+
     def drop(self) -> None:
         """
         Drop the table from the database if it exists.
@@ -353,7 +643,7 @@ class PgWorkflowStorage(WorkflowStorage):
             if k in {"metadata", "table", "inspector"}:
                 continue
             # Reuse db_engine and Session without copying
-            elif k in {"db_engine", "Session"}:
+            elif k in {"db_engine", "Session", "async_db_engine", "AsyncSession"}:
                 setattr(copied_obj, k, v)
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
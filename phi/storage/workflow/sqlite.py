@@ -1,6 +1,6 @@
 import time
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 try:
     from sqlalchemy.dialects import sqlite
@@ -8,14 +8,16 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, sessionmaker
     from sqlalchemy.schema import MetaData, Table, Column
-    from sqlalchemy.sql.expression import select
+    from sqlalchemy.sql.expression import select, func
     from sqlalchemy.types import String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install it using `pip install sqlalchemy`")
 
 from phi.workflow import WorkflowSession
+from phi.workflow.session import WorkflowSessionSummary
 from phi.storage.workflow.base import WorkflowStorage
 from phi.utils.log import logger
+from phi.utils.pagination import get_cursor_filter, get_cursor_order_by, get_page
 
 
 class SqlWorkflowStorage(WorkflowStorage):
@@ -233,6 +235,69 @@ class SqlWorkflowStorage(WorkflowStorage):
             self.create()
         return []
 
+    def list_sessions(
+        self,
+        user_id: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[WorkflowSessionSummary], Optional[str]]:
+        """
+        List session summaries newest first, one page at a time, without reading the session memory.
+
+        Args:
+            user_id (Optional[str]): The ID of the user to filter by.
+            workflow_id (Optional[str]): The ID of the workflow to filter by.
+            limit (Optional[int]): The maximum number of sessions to return. If None, all sessions are returned.
+            cursor (Optional[str]): The cursor returned with the previous page.
+
+        Returns:
+            Tuple[List[WorkflowSessionSummary], Optional[str]]: The page of sessions and the cursor to the next page,
+                or None if this is the last page.
+        """
+        stmt = select(
+            self.table.c.session_id,
+            self.table.c.workflow_id,
+            self.table.c.user_id,
+            func.json_extract(self.table.c.session_data, "$.session_name").label("session_name"),
+            func.json_extract(self.table.c.memory, "$.runs[0]").isnot(None).label("has_runs"),
+            func.json_extract(self.table.c.memory, "$.runs[0].response.content").label("first_response_content"),
+            self.table.c.created_at,
+            self.table.c.updated_at,
+        )
+        if user_id is not None and user_id != "":
+            stmt = stmt.where(self.table.c.user_id == user_id)
+        if workflow_id is not None:
+            stmt = stmt.where(self.table.c.workflow_id == workflow_id)
+        if cursor is not None:
+            stmt = stmt.where(get_cursor_filter(self.table.c.created_at, self.table.c.session_id, cursor))
+        stmt = stmt.order_by(*get_cursor_order_by(self.table.c.created_at, self.table.c.session_id))
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        try:
+            with self.Session() as sess, sess.begin():
+                rows = sess.execute(stmt).fetchall()
+                summaries = [
+                    WorkflowSessionSummary.from_first_response(
+                        has_runs=bool(row.has_runs),
+                        first_response_content=row.first_response_content,
+                        session_id=row.session_id,
+                        workflow_id=row.workflow_id,
+                        user_id=row.user_id,
+                        session_name=row.session_name,
+                        created_at=row.created_at,
+                        updated_at=row.updated_at,
+                    )
+                    for row in rows
+                ]
+                return get_page(summaries, limit)
+        except Exception as e:
+            logger.debug(f"Exception reading from table: {e}")
+            logger.debug(f"Table does not exist: {self.table.name}")
+            logger.debug("Creating table for future transactions")
+            self.create()
+        return [], None
+
     def upsert(self, session: WorkflowSession, create_and_retry: bool = True) -> Optional[WorkflowSession]:
         """
         Insert or update a WorkflowSession in the database.
@@ -1,10 +1,15 @@
 import csv
 import json
+import re
+from hashlib import md5
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List, Union, Any, Dict
+from threading import RLock
+from typing import Optional, List, Union, Any, Dict, Tuple
 
 from phi.tools import Toolkit
 from phi.utils.log import logger
+from phi.utils.query_result import QueryResultFormatter, is_arrow_available
 
 
 class CsvTools(Toolkit):
@@ -18,6 +23,8 @@ class CsvTools(Toolkit):
         read_column_names: bool = True,
         duckdb_connection: Optional[Any] = None,
         duckdb_kwargs: Optional[Dict[str, Any]] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+        result_formatter: Optional[QueryResultFormatter] = None,
     ):
         super().__init__(name="csv_tools")
 
@@ -33,6 +40,14 @@ class CsvTools(Toolkit):
         self.row_limit = row_limit
         self.duckdb_connection: Optional[Any] = duckdb_connection
         self.duckdb_kwargs: Optional[Dict[str, Any]] = duckdb_kwargs
+        # If provided, csv files are converted to Parquet files in this directory once, and reused across runs
+        self.cache_dir: Optional[Path] = Path(cache_dir) if cache_dir is not None else None
+        # Limits the rows of query results returned to the model
+        self.result_formatter: QueryResultFormatter = result_formatter or QueryResultFormatter()
+        # Maps the table name of each csv loaded into duckdb to the (path, mtime, size) it was loaded from
+        self._loaded_csvs: Dict[str, Tuple[str, float, int]] = {}
+        # duckdb connections must not be used from multiple threads at the same time
+        self._duckdb_lock = RLock()
 
         if read_csvs:
             self.register(self.read_csv_file)
@@ -46,6 +61,8 @@ class CsvTools(Toolkit):
             except ImportError:
                 raise ImportError("`duckdb` not installed. Please install using `pip install duckdb`.")
             self.register(self.query_csv_file)
+            if self.result_formatter.spill_dir is not None:
+                self.register(self.result_formatter.read_query_result)
 
     def list_csv_files(self) -> str:
         """Returns a list of available csv files
@@ -55,12 +72,13 @@ class CsvTools(Toolkit):
         """
         return json.dumps([_csv.stem for _csv in self.csvs])
 
-    def read_csv_file(self, csv_name: str, row_limit: Optional[int] = None) -> str:
+    def read_csv_file(self, csv_name: str, row_limit: Optional[int] = None, offset: int = 0) -> str:
         """Use this function to read the contents of a csv file `name` without the extension.
 
         Args:
             csv_name (str): The name of the csv file to read without the extension.
             row_limit (Optional[int]): The number of rows to return. None returns all rows. Defaults to None.
+            offset (int): The number of rows to skip, to read the file page by page. Defaults to 0.
 
         Returns:
             str: The contents of the csv file if successful, otherwise returns an error message.
@@ -72,15 +90,12 @@ class CsvTools(Toolkit):
             logger.info(f"Reading file: {csv_name}")
             file_path = [_csv for _csv in self.csvs if _csv.stem == csv_name][0]
 
-            # Read the csv file
-            csv_data = []
+            # Read the csv file, stopping after the rows to return
             _row_limit = row_limit or self.row_limit
+            stop = offset + _row_limit if _row_limit is not None else None
             with open(str(file_path), newline="") as csvfile:
                 reader = csv.DictReader(csvfile)
-                if _row_limit is not None:
-                    csv_data = [row for row in reader][:_row_limit]
-                else:
-                    csv_data = [row for row in reader]
+                csv_data = list(islice(reader, offset, stop))
             return json.dumps(csv_data)
         except Exception as e:
             logger.error(f"Error reading csv: {e}")
@@ -112,6 +127,57 @@ class CsvTools(Toolkit):
             logger.error(f"Error getting columns: {e}")
             return f"Error getting columns: {e}"
 
+    @property
+    def connection(self) -> Any:
+        """Returns the duckdb connection, which is created once and reused across queries"""
+        if self.duckdb_connection is None:
+            import duckdb
+
+            self.duckdb_connection = duckdb.connect(**(self.duckdb_kwargs or {}))
+        return self.duckdb_connection
+
+    def _get_parquet_path(self, file_path: Path, mtime: float, size: int) -> Path:
+        if self.cache_dir is None:
+            raise ValueError("cache_dir is not set")
+        cache_key = md5(f"{file_path.resolve()}:{mtime}:{size}".encode()).hexdigest()
+        return self.cache_dir.joinpath(f"{file_path.stem}-{cache_key}.parquet")
+
+    def load_csv(self, csv_name: str, file_path: Path) -> None:
+        """Loads a csv file into duckdb as a table named `csv_name`.
+
+        The file is only read again when its modification time or size changes. If `cache_dir` is set,
+        the file is converted to Parquet once and the table is a view over the Parquet file.
+        """
+        stat = file_path.stat()
+        source = (str(file_path.resolve()), stat.st_mtime, stat.st_size)
+        with self._duckdb_lock:
+            if self._loaded_csvs.get(csv_name) == source:
+                return
+
+            table_name = '"' + csv_name.replace('"', '""') + '"'
+            csv_path = str(file_path).replace("'", "''")
+            con = self.connection
+            if self.cache_dir is not None:
+                parquet_path = self._get_parquet_path(file_path, stat.st_mtime, stat.st_size)
+                if not parquet_path.exists():
+                    logger.info(f"Caching csv file: {csv_name} to {parquet_path}")
+                    parquet_path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = parquet_path.with_name(parquet_path.name + ".tmp")
+                    tmp_file = str(tmp_path).replace("'", "''")
+                    con.execute(f"COPY (SELECT * FROM read_csv_auto('{csv_path}')) TO '{tmp_file}' (FORMAT PARQUET)")
+                    tmp_path.replace(parquet_path)
+                    # Remove the files cached for previous versions of the csv file
+                    cached_name = re.compile(re.escape(file_path.stem) + r"-[0-9a-f]{32}\.parquet")
+                    for stale_path in self.cache_dir.iterdir():
+                        if stale_path != parquet_path and cached_name.fullmatch(stale_path.name):
+                            stale_path.unlink(missing_ok=True)
+                parquet_file = str(parquet_path).replace("'", "''")
+                con.execute(f"CREATE OR REPLACE VIEW {table_name} AS SELECT * FROM read_parquet('{parquet_file}')")
+            else:
+                logger.info(f"Loading csv file: {csv_name}")
+                con.execute(f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM read_csv_auto('{csv_path}')")
+            self._loaded_csvs[csv_name] = source
+
     def query_csv_file(self, csv_name: str, sql_query: str) -> str:
         """Use this function to run a SQL query on csv file `csv_name` without the extension.
         The Table name is the name of the csv file without the extension.
@@ -125,25 +191,12 @@ class CsvTools(Toolkit):
             str: The query results if successful, otherwise returns an error message.
         """
         try:
-            import duckdb
-
             if csv_name not in [_csv.stem for _csv in self.csvs]:
                 return f"File: {csv_name} not found, please use one of {self.list_csv_files()}"
 
-            # Load the csv file into duckdb
-            logger.info(f"Loading csv file: {csv_name}")
+            # Load the csv file into duckdb, if it was not loaded already
             file_path = [_csv for _csv in self.csvs if _csv.stem == csv_name][0]
-
-            # Create duckdb connection
-            con = self.duckdb_connection
-            if not self.duckdb_connection:
-                con = duckdb.connect(**(self.duckdb_kwargs or {}))
-            if con is None:
-                logger.error("Error connecting to DuckDB")
-                return "Error connecting to DuckDB, please check the connection."
-
-            # Create a table from the csv file
-            con.execute(f"CREATE TABLE {csv_name} AS SELECT * FROM read_csv_auto('{file_path}')")
+            self.load_csv(csv_name, file_path)
 
             # -*- Format the SQL Query
             # Remove backticks
@@ -152,22 +205,26 @@ class CsvTools(Toolkit):
             formatted_sql = formatted_sql.split(";")[0]
             # -*- Run the SQL Query
             logger.info(f"Running query: {formatted_sql}")
-            query_result = con.sql(formatted_sql)
-            result_output = "No output"
-            if query_result is not None:
-                try:
-                    results_as_python_objects = query_result.fetchall()
-                    result_rows = []
-                    for row in results_as_python_objects:
-                        if len(row) == 1:
-                            result_rows.append(str(row[0]))
+            with self._duckdb_lock:
+                query_result = self.connection.sql(formatted_sql)
+                result_output = "No output"
+                if query_result is not None:
+                    try:
+                        # Fetch the result as Arrow record batches if pyarrow is installed
+                        if is_arrow_available():
+                            # fetch_arrow_reader is deprecated in favor of to_arrow_reader in newer duckdb versions
+                            to_arrow_reader = getattr(query_result, "to_arrow_reader", None)
+                            if to_arrow_reader is None:
+                                to_arrow_reader = query_result.fetch_arrow_reader
+                            result_output = self.result_formatter.format_record_batches(
+                                query_result.columns, to_arrow_reader(self.result_formatter.fetch_size)
+                            )
                         else:
-                            result_rows.append(",".join(str(x) for x in row))
-
-                    result_data = "\n".join(result_rows)
-                    result_output = ",".join(query_result.columns) + "\n" + result_data
-                except AttributeError:
-                    result_output = str(query_result)
+                            result_output = self.result_formatter.format_rows(
+                                query_result.columns, query_result.fetchmany
+                            )
+                    except AttributeError:
+                        result_output = str(query_result)
 
             logger.debug(f"Query result: {result_output}")
             return result_output
@@ -1,4 +1,5 @@
 from functools import wraps, update_wrapper
+from inspect import iscoroutinefunction
 from typing import Union, Callable, Any, TypeVar, overload, Optional
 
 from phi.tools.function import Function
@@ -89,6 +90,21 @@ def tool(*args, **kwargs) -> Union[Function, Callable[[F], Function]]:
                 )
                 raise
 
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                logger.error(
+                    f"Error in tool {func.__name__!r}: {e!r}",
+                    exc_info=True,  # Include stack trace
+                )
+                raise
+
+        # Keep async tools async so they can be awaited on the event loop
+        if iscoroutinefunction(func):
+            wrapper = async_wrapper  # type: ignore
+
         # Preserve the original signature
         update_wrapper(wrapper, func)
 
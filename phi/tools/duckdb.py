@@ -2,6 +2,7 @@ from typing import Optional, Tuple, List, Dict, Any
 
 from phi.tools import Toolkit
 from phi.utils.log import logger
+from phi.utils.query_result import QueryResultFormatter, is_arrow_available
 
 try:
     import duckdb
@@ -22,6 +23,7 @@ class DuckDbTools(Toolkit):
         create_tables: bool = True,
         summarize_tables: bool = True,
         export_tables: bool = False,
+        result_formatter: Optional[QueryResultFormatter] = None,
     ):
         super().__init__(name="duckdb_tools")
 
@@ -30,6 +32,8 @@ class DuckDbTools(Toolkit):
         self.config: Optional[dict] = config
         self._connection: Optional[duckdb.DuckDBPyConnection] = connection
         self.init_commands: Optional[List] = init_commands
+        # Limits the rows of query results returned to the model
+        self.result_formatter: QueryResultFormatter = result_formatter or QueryResultFormatter()
 
         self.register(self.show_tables)
         self.register(self.describe_table)
@@ -43,6 +47,8 @@ class DuckDbTools(Toolkit):
             self.register(self.summarize_table)
         if export_tables:
             self.register(self.export_table_to_path)
+        if self.result_formatter.spill_dir is not None:
+            self.register(self.result_formatter.read_query_result)
 
     @property
     def connection(self) -> duckdb.DuckDBPyConnection:
@@ -127,16 +133,13 @@ class DuckDbTools(Toolkit):
             result_output = "No output"
             if query_result is not None:
                 try:
-                    results_as_python_objects = query_result.fetchall()
-                    result_rows = []
-                    for row in results_as_python_objects:
-                        if len(row) == 1:
-                            result_rows.append(str(row[0]))
-                        else:
-                            result_rows.append(",".join(str(x) for x in row))
-
-                    result_data = "\n".join(result_rows)
-                    result_output = ",".join(query_result.columns) + "\n" + result_data
+                    # Fetch the result as Arrow record batches if pyarrow is installed
+                    if is_arrow_available():
+                        result_output = self.result_formatter.format_record_batches(
+                            query_result.columns, query_result.fetch_arrow_reader(self.result_formatter.fetch_size)
+                        )
+                    else:
+                        result_output = self.result_formatter.format_rows(query_result.columns, query_result.fetchmany)
                 except AttributeError:
                     result_output = str(query_result)
 
@@ -1,12 +1,47 @@
-from typing import Any, Dict, Optional, Callable, get_type_hints, Type, TypeVar, Union, List
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import partial
+from inspect import isawaitable, iscoroutinefunction, isfunction, ismethod
+from threading import Lock
+from types import MethodType
+from typing import Any, Dict, Optional, Callable, get_type_hints, Type, TypeVar, Union, List, Tuple
+from weakref import WeakKeyDictionary, WeakSet
 from pydantic import BaseModel, Field, validate_call
 from docstring_parser import parse
 
 from phi.model.message import Message
 from phi.utils.log import logger
+from phi.utils.threads import run_coroutine_sync, run_in_thread
 
 T = TypeVar("T")
 
+# Bounded executor used to run sync tools from async code, so they never block the event loop
+_tool_executor: Optional[ThreadPoolExecutor] = None
+_tool_executor_max_workers: int = 32
+_tool_executor_lock = Lock()
+
+
+def set_tool_executor_max_workers(max_workers: int) -> None:
+    """Set the number of threads used to run sync tools from async code."""
+    global _tool_executor, _tool_executor_max_workers
+    with _tool_executor_lock:
+        _tool_executor_max_workers = max_workers
+        if _tool_executor is not None:
+            _tool_executor.shutdown(wait=False)
+            _tool_executor = None
+
+
+def get_tool_executor() -> ThreadPoolExecutor:
+    global _tool_executor
+    if _tool_executor is None:
+        with _tool_executor_lock:
+            if _tool_executor is None:
+                _tool_executor = ThreadPoolExecutor(
+                    max_workers=_tool_executor_max_workers, thread_name_prefix="phi-tool"
+                )
+    return _tool_executor
+
 
 class ToolCallException(Exception):
     def __init__(
@@ -62,6 +97,149 @@ def get_entrypoint_docstring(entrypoint: Callable) -> str:
     return "\n".join(lines)
 
 
+class EntrypointSchema:
+    """The schema derived from a callable, shared by every Function that wraps it."""
+
+    def __init__(self, description: str, parameters: Dict[str, Any]):
+        self.description: str = description
+        # JSON schema for the parameters. Shared, so it must not be modified.
+        self.parameters: Dict[str, Any] = parameters
+
+
+# Process-wide caches of the schemas and parameters derived from callables, so that adding tools to a model
+# and running tool calls does not repeat signature inspection, docstring parsing and JSON schema generation.
+# Keyed weakly by the underlying function, so methods of every toolkit instance share one entry.
+_entrypoint_schemas: "WeakKeyDictionary[Callable, Dict[Tuple[bool, bool], EntrypointSchema]]" = WeakKeyDictionary()
+_call_parameters: "WeakKeyDictionary[Callable, Tuple[bool, bool]]" = WeakKeyDictionary()
+# Entrypoints already wrapped with validate_call
+_validated_entrypoints: "WeakSet[Callable]" = WeakSet()
+_function_cache_lock = Lock()
+
+
+def _get_cache_key(c: Callable) -> Callable:
+    return c.__func__ if ismethod(c) else c
+
+
+def _build_entrypoint_schema(c: Callable, strict: bool = False) -> EntrypointSchema:
+    from inspect import getdoc, signature
+    from phi.utils.json_schema import get_json_schema
+
+    parameters = {"type": "object", "properties": {}, "required": []}
+    try:
+        sig = signature(c)
+        type_hints = get_type_hints(c)
+
+        # If function has an the agent argument, remove the agent parameter from the type hints
+        if "agent" in sig.parameters:
+            del type_hints["agent"]
+        # logger.info(f"Type hints for {c.__name__}: {type_hints}")
+
+        # Filter out return type and only process parameters
+        param_type_hints = {
+            name: type_hints.get(name) for name in sig.parameters if name != "return" and name != "agent"
+        }
+
+        # Parse docstring for parameters
+        param_descriptions = {}
+        if docstring := getdoc(c):
+            parsed_doc = parse(docstring)
+            param_docs = parsed_doc.params
+
+            if param_docs is not None:
+                for param in param_docs:
+                    param_name = param.arg_name
+                    param_type = param.type_name
+
+                    # TODO: We should use type hints first, then map param types in docs to json schema types.
+                    # This is temporary to not lose information
+                    param_descriptions[param_name] = f"({param_type}) {param.description}"
+
+        # logger.info(f"Arguments for {c.__name__}: {param_type_hints}")
+
+        # Get JSON schema for parameters only
+        parameters = get_json_schema(type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict)
+
+        # If strict=True mark all fields as required
+        # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
+        if strict:
+            parameters["required"] = [name for name in parameters["properties"] if name != "agent"]
+        else:
+            # Mark a field as required if it has no default value
+            parameters["required"] = [
+                name
+                for name, param in sig.parameters.items()
+                if param.default == param.empty and name != "self" and name != "agent"
+            ]
+
+        # logger.debug(f"JSON schema for {c.__name__}: {parameters}")
+    except Exception as e:
+        logger.warning(f"Could not parse args for {c.__name__}: {e}", exc_info=True)
+
+    return EntrypointSchema(description=get_entrypoint_docstring(entrypoint=c), parameters=parameters)
+
+
+def get_validated_entrypoint(c: Callable) -> Callable:
+    """Returns the callable wrapped with validate_call. Methods are validated once and bound to each instance."""
+    target = _get_cache_key(c)
+    if target in _validated_entrypoints:
+        return c
+
+    # The validated function is stored on the function it wraps, so it lives exactly as long as the function
+    validated = getattr(target, "_phi_validated_entrypoint", None)
+    if validated is None or getattr(validated, "__wrapped__", None) is not target:
+        validated = validate_call(target)
+        if isfunction(target):
+            setattr(target, "_phi_validated_entrypoint", validated)
+            with _function_cache_lock:
+                _validated_entrypoints.add(validated)
+    if ismethod(c):
+        return MethodType(validated, c.__self__)
+    return validated
+
+
+def get_entrypoint_schema(c: Callable, strict: bool = False) -> EntrypointSchema:
+    """Returns the schema for a callable, building it on first use."""
+    key = _get_cache_key(c)
+    variant = (strict, ismethod(c))
+    try:
+        with _function_cache_lock:
+            schema = _entrypoint_schemas.get(key, {}).get(variant)
+    except TypeError:
+        # The callable does not support weak references and is not cached
+        return _build_entrypoint_schema(c, strict=strict)
+    if schema is not None:
+        return schema
+
+    schema = _build_entrypoint_schema(c, strict=strict)
+    with _function_cache_lock:
+        _entrypoint_schemas.setdefault(key, {})[variant] = schema
+    return schema
+
+
+def get_call_parameters(c: Callable) -> Tuple[bool, bool]:
+    """Returns whether a tool entrypoint or hook accepts the `agent` and `fc` arguments."""
+    from inspect import signature
+
+    key = _get_cache_key(c)
+    # None if the callable cannot be weakly referenced, and so is not cached
+    cache_key: Optional[Callable] = None
+    try:
+        with _function_cache_lock:
+            cached = _call_parameters.get(key)
+        cache_key = key
+    except TypeError:
+        cached = None
+    if cached is not None:
+        return cached
+
+    parameters = signature(c).parameters
+    call_parameters = ("agent" in parameters, "fc" in parameters)
+    if cache_key is not None:
+        with _function_cache_lock:
+            _call_parameters[cache_key] = call_parameters
+    return call_parameters
+
+
 class Function(BaseModel):
     """Model for storing functions that can be called by an agent."""
 
@@ -102,137 +280,28 @@ class Function(BaseModel):
 
     @classmethod
     def from_callable(cls, c: Callable, strict: bool = False) -> "Function":
-        from inspect import getdoc, signature
-        from phi.utils.json_schema import get_json_schema
-
-        function_name = c.__name__
-        parameters = {"type": "object", "properties": {}, "required": []}
-        try:
-            sig = signature(c)
-            type_hints = get_type_hints(c)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            # logger.info(f"Type hints for {function_name}: {type_hints}")
-
-            param_type_hints = {
-                name: type_hints.get(name) for name in sig.parameters if name != "return" and name != "agent"
-            }
-
-            # Parse docstring for parameters
-            param_descriptions = {}
-            if docstring := getdoc(c):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-
-                        param_descriptions[param_name] = f"({param_type}) {param.description}"
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
-
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [name for name in parameters["properties"] if name != "agent"]
-            else:
-                # Mark a field as required if it has no default value
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name != "agent"
-                ]
-
-            # logger.debug(f"JSON schema for {function_name}: {parameters}")
-        except Exception as e:
-            logger.warning(f"Could not parse args for {function_name}: {e}", exc_info=True)
-
+        schema = get_entrypoint_schema(c, strict=strict)
         return cls(
-            name=function_name,
-            description=get_entrypoint_docstring(entrypoint=c),
-            parameters=parameters,
-            entrypoint=validate_call(c),
+            name=c.__name__,
+            description=schema.description,
+            parameters=deepcopy(schema.parameters),
+            entrypoint=get_validated_entrypoint(c),
         )
 
     def process_entrypoint(self, strict: bool = False):
         """Process the entrypoint and make it ready for use by an agent."""
-        from inspect import getdoc, signature
-        from phi.utils.json_schema import get_json_schema
-
         if self.entrypoint is None:
             return
 
-        parameters = {"type": "object", "properties": {}, "required": []}
+        schema = get_entrypoint_schema(self.entrypoint, strict=strict)
 
-        params_set_by_user = False
+        self.description = self.description or schema.description
         # If the user set the parameters (i.e. they are different from the default), we should keep them
-        if self.parameters != parameters:
-            params_set_by_user = True
-
-        try:
-            sig = signature(self.entrypoint)
-            type_hints = get_type_hints(self.entrypoint)
-
-            # If function has an the agent argument, remove the agent parameter from the type hints
-            if "agent" in sig.parameters:
-                del type_hints["agent"]
-            # logger.info(f"Type hints for {self.name}: {type_hints}")
-
-            # Filter out return type and only process parameters
-            param_type_hints = {
-                name: type_hints.get(name) for name in sig.parameters if name != "return" and name != "agent"
-            }
-
-            # Parse docstring for parameters
-            param_descriptions = {}
-            if docstring := getdoc(self.entrypoint):
-                parsed_doc = parse(docstring)
-                param_docs = parsed_doc.params
-
-                if param_docs is not None:
-                    for param in param_docs:
-                        param_name = param.arg_name
-                        param_type = param.type_name
-
-                        # TODO: We should use type hints first, then map param types in docs to json schema types.
-                        # This is temporary to not lose information
-                        param_descriptions[param_name] = f"({param_type}) {param.description}"
-
-            # logger.info(f"Arguments for {self.name}: {param_type_hints}")
-
-            # Get JSON schema for parameters only
-            parameters = get_json_schema(
-                type_hints=param_type_hints, param_descriptions=param_descriptions, strict=strict
-            )
-
-            # If strict=True mark all fields as required
-            # See: https://platform.openai.com/docs/guides/structured-outputs/supported-schemas#all-fields-must-be-required
-            if strict:
-                parameters["required"] = [name for name in parameters["properties"] if name != "agent"]
-            else:
-                # Mark a field as required if it has no default value
-                parameters["required"] = [
-                    name
-                    for name, param in sig.parameters.items()
-                    if param.default == param.empty and name != "self" and name != "agent"
-                ]
-
-            # logger.debug(f"JSON schema for {self.name}: {parameters}")
-        except Exception as e:
-            logger.warning(f"Could not parse args for {self.name}: {e}", exc_info=True)
+        if self.parameters == {"type": "object", "properties": {}, "required": []}:
+            # Models may adjust the parameters in place, so each Function gets its own copy
+            self.parameters = deepcopy(schema.parameters)
 
-        self.description = self.description or get_entrypoint_docstring(self.entrypoint)
-        if not params_set_by_user:
-            self.parameters = parameters
-
-        self.entrypoint = validate_call(self.entrypoint)
+        self.entrypoint = get_validated_entrypoint(self.entrypoint)
 
     def get_type_name(self, t: Type[T]):
         name = str(t)
@@ -300,14 +369,54 @@ class FunctionCall(BaseModel):
         call_str = f"{self.function.name}({', '.join([f'{k}={v}' for k, v in trimmed_arguments.items()])})"
         return call_str
 
+    def _get_call_args(self, c: Callable) -> Dict[str, Any]:
+        """Returns the agent and fc arguments accepted by a hook or entrypoint."""
+        call_args: Dict[str, Any] = {}
+        takes_agent, takes_fc = get_call_parameters(c)
+        # Check if the callable has an agent argument
+        if takes_agent:
+            call_args["agent"] = self.function._agent
+        # Check if the callable has an fc argument
+        if takes_fc:
+            call_args["fc"] = self
+        return call_args
+
+    def _run_hook(self, hook: Callable, hook_name: str) -> None:
+        try:
+            hook_result = hook(**self._get_call_args(hook))
+            if isawaitable(hook_result):
+                run_coroutine_sync(hook_result)
+        except ToolCallException as e:
+            logger.debug(f"{e.__class__.__name__}: {e}")
+            self.error = str(e)
+            raise
+        except Exception as e:
+            logger.warning(f"Error in {hook_name} callback: {e}")
+            logger.exception(e)
+
+    async def _arun_hook(self, hook: Callable, hook_name: str) -> None:
+        try:
+            if iscoroutinefunction(hook):
+                hook_result = hook(**self._get_call_args(hook))
+            else:
+                # Sync hooks are run in a thread so they do not block the event loop
+                hook_result = await run_in_thread(hook, **self._get_call_args(hook))
+            if isawaitable(hook_result):
+                await hook_result
+        except ToolCallException as e:
+            logger.debug(f"{e.__class__.__name__}: {e}")
+            self.error = str(e)
+            raise
+        except Exception as e:
+            logger.warning(f"Error in {hook_name} callback: {e}")
+            logger.exception(e)
+
     def execute(self) -> bool:
         """Runs the function call.
 
         Returns True if the function call was successful, False otherwise.
         The result of the function call is stored in self.result.
         """
-        from inspect import signature
-
         if self.function.entrypoint is None:
             return False
 
@@ -316,84 +425,76 @@ class FunctionCall(BaseModel):
 
         # Execute pre-hook if it exists
         if self.function.pre_hook is not None:
-            try:
-                pre_hook_args = {}
-                # Check if the pre-hook has and agent argument
-                if "agent" in signature(self.function.pre_hook).parameters:
-                    pre_hook_args["agent"] = self.function._agent
-                # Check if the pre-hook has an fc argument
-                if "fc" in signature(self.function.pre_hook).parameters:
-                    pre_hook_args["fc"] = self
-                self.function.pre_hook(**pre_hook_args)
-            except ToolCallException as e:
-                logger.debug(f"{e.__class__.__name__}: {e}")
-                self.error = str(e)
-                raise
-            except Exception as e:
-                logger.warning(f"Error in pre-hook callback: {e}")
-                logger.exception(e)
+            self._run_hook(self.function.pre_hook, "pre-hook")
 
         # Call the function with no arguments if none are provided.
-        if self.arguments is None:
-            try:
-                entrypoint_args = {}
-                # Check if the entrypoint has and agent argument
-                if "agent" in signature(self.function.entrypoint).parameters:
-                    entrypoint_args["agent"] = self.function._agent
-                # Check if the entrypoint has an fc argument
-                if "fc" in signature(self.function.entrypoint).parameters:
-                    entrypoint_args["fc"] = self
-
-                self.result = self.function.entrypoint(**entrypoint_args)
-                function_call_success = True
-            except ToolCallException as e:
-                logger.debug(f"{e.__class__.__name__}: {e}")
-                self.error = str(e)
-                raise
-            except Exception as e:
-                logger.warning(f"Could not run function {self.get_call_str()}")
-                logger.exception(e)
-                self.error = str(e)
-                return function_call_success
-        else:
-            try:
-                entrypoint_args = {}
-                # Check if the entrypoint has and agent argument
-                if "agent" in signature(self.function.entrypoint).parameters:
-                    entrypoint_args["agent"] = self.function._agent
-                # Check if the entrypoint has an fc argument
-                if "fc" in signature(self.function.entrypoint).parameters:
-                    entrypoint_args["fc"] = self
-
-                self.result = self.function.entrypoint(**entrypoint_args, **self.arguments)
-                function_call_success = True
-            except ToolCallException as e:
-                logger.debug(f"{e.__class__.__name__}: {e}")
-                self.error = str(e)
-                raise
-            except Exception as e:
-                logger.warning(f"Could not run function {self.get_call_str()}")
-                logger.exception(e)
-                self.error = str(e)
-                return function_call_success
+        try:
+            entrypoint_args = self._get_call_args(self.function.entrypoint)
+            result = self.function.entrypoint(**entrypoint_args, **(self.arguments or {}))
+            # Async entrypoints return a coroutine that is run to completion here
+            if isawaitable(result):
+                result = run_coroutine_sync(result)
+            self.result = result
+            function_call_success = True
+        except ToolCallException as e:
+            logger.debug(f"{e.__class__.__name__}: {e}")
+            self.error = str(e)
+            raise
+        except Exception as e:
+            logger.warning(f"Could not run function {self.get_call_str()}")
+            logger.exception(e)
+            self.error = str(e)
+            return function_call_success
+
+        # Execute post-hook if it exists
+        if self.function.post_hook is not None:
+            self._run_hook(self.function.post_hook, "post-hook")
+
+        return function_call_success
+
+    async def aexecute(self) -> bool:
+        """Runs the function call without blocking the event loop.
+
+        Async entrypoints are awaited directly, sync entrypoints are run in the shared tool executor.
+        Returns True if the function call was successful, False otherwise.
+        The result of the function call is stored in self.result.
+        """
+        if self.function.entrypoint is None:
+            return False
+
+        logger.debug(f"Running: {self.get_call_str()}")
+        function_call_success = False
+
+        # Execute pre-hook if it exists
+        if self.function.pre_hook is not None:
+            await self._arun_hook(self.function.pre_hook, "pre-hook")
+
+        try:
+            entrypoint = self.function.entrypoint
+            entrypoint_args = self._get_call_args(entrypoint)
+            if iscoroutinefunction(entrypoint):
+                result = await entrypoint(**entrypoint_args, **(self.arguments or {}))
+            else:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    get_tool_executor(), partial(entrypoint, **entrypoint_args, **(self.arguments or {}))
+                )
+                if isawaitable(result):
+                    result = await result
+            self.result = result
+            function_call_success = True
+        except ToolCallException as e:
+            logger.debug(f"{e.__class__.__name__}: {e}")
+            self.error = str(e)
+            raise
+        except Exception as e:
+            logger.warning(f"Could not run function {self.get_call_str()}")
+            logger.exception(e)
+            self.error = str(e)
+            return function_call_success
 
         # Execute post-hook if it exists
         if self.function.post_hook is not None:
-            try:
-                post_hook_args = {}
-                # Check if the post-hook has and agent argument
-                if "agent" in signature(self.function.post_hook).parameters:
-                    post_hook_args["agent"] = self.function._agent
-                # Check if the post-hook has an fc argument
-                if "fc" in signature(self.function.post_hook).parameters:
-                    post_hook_args["fc"] = self
-                self.function.post_hook(**post_hook_args)
-            except ToolCallException as e:
-                logger.debug(f"{e.__class__.__name__}: {e}")
-                self.error = str(e)
-                raise
-            except Exception as e:
-                logger.warning(f"Error in post-hook callback: {e}")
-                logger.exception(e)
+            await self._arun_hook(self.function.post_hook, "post-hook")
 
         return function_call_success
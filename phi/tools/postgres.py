@@ -1,4 +1,5 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+from uuid import uuid4
 
 try:
     import psycopg2
@@ -9,6 +10,7 @@ except ImportError:
 
 from phi.tools import Toolkit
 from phi.utils.log import logger
+from phi.utils.query_result import QueryResultFormatter
 
 
 class PostgresTools(Toolkit):
@@ -27,6 +29,7 @@ class PostgresTools(Toolkit):
         summarize_tables: bool = True,
         export_tables: bool = False,
         table_schema: str = "public",
+        result_formatter: Optional[QueryResultFormatter] = None,
     ):
         super().__init__(name="postgres_tools")
         self._connection: Optional[psycopg2.extensions.connection] = connection
@@ -36,6 +39,8 @@ class PostgresTools(Toolkit):
         self.host: Optional[str] = host
         self.port: Optional[int] = port
         self.table_schema: str = table_schema
+        # Limits the rows of query results returned to the model
+        self.result_formatter: QueryResultFormatter = result_formatter or QueryResultFormatter()
 
         self.register(self.show_tables)
         self.register(self.describe_table)
@@ -47,6 +52,8 @@ class PostgresTools(Toolkit):
             self.register(self.summarize_table)
         if export_tables:
             self.register(self.export_table_to_path)
+        if self.result_formatter.spill_dir is not None:
+            self.register(self.result_formatter.read_query_result)
 
     @property
     def connection(self) -> psycopg2.extensions.connection:
@@ -217,25 +224,27 @@ class PostgresTools(Toolkit):
         try:
             logger.info(f"Running: {formatted_sql}")
 
-            cursor = self.connection.cursor()
-            cursor.execute(query)
-            query_result = cursor.fetchall()
-
-            result_output = "No output"
-            if query_result is not None:
-                try:
-                    results_as_python_objects = query_result
-                    result_rows = []
-                    for row in results_as_python_objects:
-                        if len(row) == 1:
-                            result_rows.append(str(row[0]))
-                        else:
-                            result_rows.append(",".join(str(x) for x in row))
-
-                    result_data = "\n".join(result_rows)
-                    result_output = ",".join(query_result.columns) + "\n" + result_data
-                except AttributeError:
-                    result_output = str(query_result)
+            # Fetch the rows of queries with a server-side cursor, so rows are only transferred as they are fetched
+            is_select = (formatted_sql.split() or [""])[0].upper() in ("SELECT", "WITH", "VALUES", "TABLE")
+            cursor = self.connection.cursor(name=f"phi_{uuid4().hex}") if is_select else self.connection.cursor()
+            try:
+                cursor.execute(formatted_sql)
+                # The description of a server-side cursor is only available after the first fetch
+                first_rows = cursor.fetchmany(self.result_formatter.fetch_size) if is_select else []
+                result_output = "No output"
+                if cursor.description is not None:
+                    columns = [column[0] for column in cursor.description]
+
+                    pending_rows = [first_rows] if first_rows else []
+
+                    def fetchmany(size: int) -> List[Tuple]:
+                        return pending_rows.pop() if pending_rows else cursor.fetchmany(size)
+
+                    result_output = self.result_formatter.format_rows(columns, fetchmany)
+            finally:
+                cursor.close()
+                # End the read-only transaction, which also recovers the connection after a failed query
+                self.connection.rollback()
 
             logger.debug(f"Query result: {result_output}")
 
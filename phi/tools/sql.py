@@ -1,11 +1,13 @@
 import json
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any, cast
 
 from phi.tools import Toolkit
 from phi.utils.log import logger
+from phi.utils.query_result import QueryResultFormatter
 
 try:
     from sqlalchemy import create_engine, Engine
+    from sqlalchemy.engine import CursorResult
     from sqlalchemy.orm import Session, sessionmaker
     from sqlalchemy.inspection import inspect
     from sqlalchemy.sql.expression import text
@@ -28,6 +30,8 @@ class SQLTools(Toolkit):
         list_tables: bool = True,
         describe_table: bool = True,
         run_sql_query: bool = True,
+        result_format: Literal["json", "csv"] = "json",
+        result_formatter: Optional[QueryResultFormatter] = None,
     ):
         super().__init__(name="sql_tools")
 
@@ -50,6 +54,11 @@ class SQLTools(Toolkit):
 
         # Tables this toolkit can access
         self.tables: Optional[Dict[str, Any]] = tables
+        # Format of query results: "json" returns a JSON list of row objects,
+        # "csv" streams the rows as CSV lines within the row and byte budget of the result_formatter
+        self.result_format: Literal["json", "csv"] = result_format
+        # Limits the rows of CSV query results returned to the model
+        self.result_formatter: QueryResultFormatter = result_formatter or QueryResultFormatter()
 
         # Register functions in the toolkit
         if list_tables:
@@ -58,6 +67,8 @@ class SQLTools(Toolkit):
             self.register(self.describe_table)
         if run_sql_query:
             self.register(self.run_sql_query)
+            if self.result_format == "csv" and self.result_formatter.spill_dir is not None:
+                self.register(self.result_formatter.read_query_result)
 
     def list_tables(self) -> str:
         """Use this function to get a list of table names in the database.
@@ -107,7 +118,16 @@ class SQLTools(Toolkit):
         """
 
         try:
-            return json.dumps(self.run_sql(sql=query, limit=limit), default=str)
+            if self.result_format == "json":
+                return json.dumps(self.run_sql(sql=query, limit=limit), default=str)
+
+            logger.debug(f"Running sql |\n{query}")
+            with self.Session() as sess, sess.begin():
+                # Stream the result with a server-side cursor where the database supports it
+                result = cast(CursorResult, sess.execute(text(query), execution_options={"stream_results": True}))
+                if not result.returns_rows:
+                    return "No output"
+                return self.result_formatter.format_rows(list(result.keys()), result.fetchmany, max_rows=limit)
         except Exception as e:
             logger.error(f"Error running query: {e}")
             return f"Error running query: {e}"
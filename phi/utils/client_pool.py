@@ -0,0 +1,148 @@
+import asyncio
+import atexit
+import inspect
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+import httpx
+
+from phi.utils.log import logger
+
+T = TypeVar("T")
+
+# Connection pool limits used for the HTTP clients created by the pool
+_limits: httpx.Limits = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=60)
+# Shared clients keyed by (client type, event loop id, client params)
+ClientKey = Tuple[Any, Optional[int], Hashable]
+_clients: Dict[ClientKey, Any] = {}
+# Event loops that async clients are bound to, keyed by loop id
+_loops: Dict[int, asyncio.AbstractEventLoop] = {}
+_lock = Lock()
+
+
+def configure_client_pool(
+    max_connections: Optional[int] = 1000,
+    max_keepalive_connections: Optional[int] = 100,
+    keepalive_expiry: Optional[float] = 60,
+) -> None:
+    """Set the connection pool limits used for HTTP clients created from now on."""
+    global _limits
+    _limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def get_pool_limits() -> httpx.Limits:
+    return _limits
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert client params into a hashable value that can be used as a registry key."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        # Unhashable objects are keyed by identity. The registry holds a reference to the params,
+        # so the id cannot be reused while the client is alive.
+        return (type(value).__qualname__, id(value))
+
+
+def _current_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _evict_closed_loops() -> None:
+    closed = [loop_id for loop_id, loop in _loops.items() if loop.is_closed()]
+    for loop_id in closed:
+        _loops.pop(loop_id, None)
+        for key in [k for k in _clients if k[1] == loop_id]:
+            _clients.pop(key, None)
+
+
+def get_shared_client(
+    client_class: Callable[..., T],
+    client_params: Dict[str, Any],
+    is_async: bool = False,
+    http_client: bool = False,
+) -> T:
+    """
+    Return a process-wide client for `client_class(**client_params)`, creating it on first use.
+
+    Clients with identical params (provider, base_url, api_key, timeout, ...) share one instance, and therefore one
+    connection pool, so TLS sessions and keep-alive connections are reused across calls.
+    Async clients are bound to the running event loop and are recreated for each new loop.
+
+    Args:
+        client_class: The SDK client class or factory.
+        client_params: Keyword arguments used to create the client.
+        is_async: True if the client is used from async code.
+        http_client: If True and no `http_client` is provided in the params,
+            create one with the configured pool limits.
+    """
+    loop = _current_loop() if is_async else None
+    loop_id = id(loop) if loop is not None else None
+    key: ClientKey = (client_class, loop_id, _freeze(client_params))
+
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        _evict_closed_loops()
+        client = _clients.get(key)
+        if client is None:
+            _params = dict(client_params)
+            if http_client and _params.get("http_client") is None:
+                _params["http_client"] = httpx.AsyncClient(limits=_limits) if is_async else httpx.Client(limits=_limits)
+            logger.debug(f"Creating shared client: {getattr(client_class, '__name__', client_class)}")
+            client = client_class(**_params)
+            _clients[key] = client
+            if loop is not None and loop_id is not None:
+                _loops[loop_id] = loop
+    return client
+
+
+def _pop_clients(loop_id: Optional[int] = None, all_loops: bool = False) -> List[Tuple[ClientKey, Any]]:
+    with _lock:
+        keys = [k for k in _clients if all_loops or k[1] == loop_id]
+        return [(k, _clients.pop(k)) for k in keys]
+
+
+def close_client_pool() -> None:
+    """Close all shared sync clients. Async clients are dropped; use `aclose_client_pool` to close them."""
+    for key, client in _pop_clients(all_loops=True):
+        close = getattr(client, "close", None)
+        if close is None or inspect.iscoroutinefunction(close):
+            continue
+        try:
+            close()
+        except Exception as e:
+            logger.debug(f"Error closing client: {e}")
+    _loops.clear()
+
+
+async def aclose_client_pool() -> None:
+    """Close the shared async clients bound to the running event loop, e.g. on application shutdown."""
+    loop = _current_loop()
+    for key, client in _pop_clients(loop_id=id(loop) if loop is not None else None):
+        close = getattr(client, "close", None)
+        if close is None:
+            continue
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.debug(f"Error closing client: {e}")
+
+
+atexit.register(close_client_pool)
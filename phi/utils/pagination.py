@@ -0,0 +1,71 @@
+import base64
+import json
+from typing import Any, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def encode_cursor(created_at: Optional[int], session_id: str) -> str:
+    """Encode the position of a session in a listing ordered by (created_at, session_id) descending."""
+    return base64.urlsafe_b64encode(json.dumps([created_at or 0, session_id]).encode("utf-8")).decode("utf-8")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, str]:
+    """Decode a cursor returned by `encode_cursor`. Raises a ValueError if the cursor is invalid."""
+    try:
+        created_at, session_id = json.loads(base64.urlsafe_b64decode(cursor.encode("utf-8")))
+        return int(created_at), str(session_id)
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+
+def get_page(items: List[T], limit: Optional[int]) -> Tuple[List[T], Optional[str]]:
+    """
+    Return the first `limit` items and the cursor to the next page.
+
+    Args:
+        items (List[T]): Up to `limit + 1` items with `created_at` and `session_id` attributes, newest first.
+        limit (Optional[int]): The page size. If None, all items are returned.
+
+    Returns:
+        Tuple[List[T], Optional[str]]: The page and the cursor to the next page, or None if this is the last page.
+    """
+    if limit is None or len(items) <= limit:
+        return items, None
+    page = items[:limit]
+    last: Any = page[-1]
+    return page, encode_cursor(last.created_at, last.session_id)
+
+
+def paginate(
+    items: List[T], limit: Optional[int] = None, cursor: Optional[str] = None
+) -> Tuple[List[T], Optional[str]]:
+    """
+    Sort items with `created_at` and `session_id` attributes newest first and return the page after `cursor`.
+    Used by storage backends that cannot page on the server.
+    """
+
+    def sort_key(item: Any) -> Tuple[int, str]:
+        return item.created_at or 0, item.session_id
+
+    items = sorted(items, key=sort_key, reverse=True)
+    if cursor is not None:
+        position = decode_cursor(cursor)
+        items = [item for item in items if sort_key(item) < position]
+    return get_page(items, limit)
+
+
+def get_cursor_filter(created_at_column: Any, session_id_column: Any, cursor: str) -> Any:
+    """Build the SQLAlchemy filter that selects the rows after `cursor`, in the order of `get_cursor_order_by`."""
+    from sqlalchemy.sql.expression import and_, func, or_
+
+    created_at, session_id = decode_cursor(cursor)
+    row_created_at = func.coalesce(created_at_column, 0)
+    return or_(row_created_at < created_at, and_(row_created_at == created_at, session_id_column < session_id))
+
+
+def get_cursor_order_by(created_at_column: Any, session_id_column: Any) -> List[Any]:
+    """Build the SQLAlchemy order by clauses for paginated session listings, newest first."""
+    from sqlalchemy.sql.expression import func
+
+    return [func.coalesce(created_at_column, 0).desc(), session_id_column.desc()]
@@ -0,0 +1,291 @@
+import re
+from pathlib import Path
+from time import time
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Sequence, Union
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+from phi.utils.log import logger
+
+Row = Sequence[Any]
+# A batch of rows fetched from a cursor, or a pyarrow.RecordBatch
+Batch = Any
+# Name of the files that truncated results are saved to
+RESULT_FILE_NAME = re.compile(r"query-result-[0-9a-f]{32}\.parquet")
+
+
+def is_arrow_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def format_row(row: Row) -> str:
+    if len(row) == 1:
+        return str(row[0])
+    return ",".join(str(x) for x in row)
+
+
+def _num_rows(batch: Batch) -> int:
+    if isinstance(batch, (list, tuple)):
+        return len(batch)
+    return batch.num_rows
+
+
+def _get_rows(batch: Batch, num_rows: int) -> List[Row]:
+    """Returns the first num_rows rows of a batch, only converting those rows of a RecordBatch to Python"""
+    if isinstance(batch, (list, tuple)):
+        return list(batch[:num_rows])
+    if num_rows <= 0:
+        return []
+    return list(zip(*[column.to_pylist() for column in batch.slice(0, num_rows).columns]))
+
+
+class _ParquetSpill:
+    """Writes the batches of a query result to a Parquet file"""
+
+    def __init__(self, path: Path, columns: List[str]):
+        self.path = path
+        self.columns = columns
+        self.tmp_path = path.with_name(path.name + ".tmp")
+        self.writer: Any = None
+
+    def write(self, batch: Batch) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if isinstance(batch, (list, tuple)):
+            if len(batch) == 0:
+                return
+            table = pa.Table.from_arrays([pa.array(column) for column in zip(*batch)], names=self.columns)
+        else:
+            table = pa.Table.from_batches([batch])
+        if self.writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.writer = pq.ParquetWriter(str(self.tmp_path), table.schema)
+        elif table.schema != self.writer.schema:
+            table = table.cast(self.writer.schema)
+        self.writer.write_table(table)
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.tmp_path.replace(self.path)
+
+    def discard(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+
+class _CollectedRows(NamedTuple):
+    lines: List[str]
+    num_shown: int
+    truncated: bool
+    # None if the rows that were not shown were not counted
+    total_rows: Optional[int]
+    result_id: Optional[str]
+
+
+class QueryResultFormatter(BaseModel):
+    """Formats query results for the model within a row and byte budget.
+
+    Rows are fetched from the cursor in batches, so only the rows that are shown are kept in memory.
+    The rows that are not shown are counted, or saved to a Parquet file if `spill_dir` is set,
+    which the model can page through with `read_query_result`.
+    """
+
+    # Maximum number of rows shown. None shows all rows that fit in max_bytes.
+    max_rows: Optional[int] = 100
+    # Maximum size of the formatted rows, in bytes of UTF-8 encoded text
+    max_bytes: Optional[int] = 20_000
+    # Number of rows fetched from the cursor at a time
+    fetch_size: int = 1000
+    # Fetch the rows that are not shown to count the total number of rows
+    count_total_rows: bool = True
+    # Directory to save truncated results to as Parquet files. Requires `pyarrow`.
+    spill_dir: Optional[Union[str, Path]] = None
+    # Saved results older than this number of seconds are deleted when a result is saved. None keeps them.
+    spill_ttl: Optional[float] = 3600
+    # Maximum number of saved results in `spill_dir`, the oldest are deleted first. None keeps all results.
+    max_spilled_results: Optional[int] = 100
+
+    def format_rows(
+        self, columns: List[str], fetchmany: Callable[[int], Sequence[Row]], max_rows: Optional[int] = None
+    ) -> str:
+        """Formats the rows of a cursor, fetching them with fetchmany until the budget is used.
+
+        Args:
+            columns (List[str]): The column names.
+            fetchmany (Callable[[int], Sequence[Row]]): Fetches the next rows of the cursor.
+            max_rows (Optional[int]): Overrides the maximum number of rows shown.
+        """
+
+        def batches() -> Iterator[Sequence[Row]]:
+            while True:
+                rows = fetchmany(self.fetch_size)
+                if not rows:
+                    return
+                yield list(rows)
+
+        return self._format(self._collect(columns, batches(), max_rows))
+
+    def format_record_batches(self, columns: List[str], reader: Any, max_rows: Optional[int] = None) -> str:
+        """Formats a pyarrow RecordBatchReader, for drivers that can fetch results as Arrow.
+
+        Only the rows that are shown are converted to Python objects.
+        """
+        return self._format(self._collect(columns, iter(reader), max_rows))
+
+    def read_query_result(self, result_id: str, offset: int = 0, limit: int = 100) -> str:
+        """Use this function to page through the full result of a query that was truncated.
+
+        Args:
+            result_id (str): The result_id of the truncated query result.
+            offset (int): The number of rows to skip. Defaults to 0.
+            limit (int): The number of rows to return. Defaults to 100.
+
+        Returns:
+            str: The rows of the result.
+        """
+        path = self._get_result_path(result_id)
+        if path is None or not path.exists():
+            return f"Result {result_id} not found"
+
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(str(path))
+        total_rows = parquet_file.metadata.num_rows
+
+        def batches() -> Iterator[Batch]:
+            row_group_start = 0
+            for i in range(parquet_file.num_row_groups):
+                row_group_rows = parquet_file.metadata.row_group(i).num_rows
+                if row_group_start + row_group_rows > offset:
+                    row_group = parquet_file.read_row_group(i)
+                    yield from row_group.slice(max(offset - row_group_start, 0)).to_batches()
+                row_group_start += row_group_rows
+
+        collected = self._collect(
+            parquet_file.schema_arrow.names, batches(), max_rows=limit, spill=False, count_total_rows=False
+        )
+        footer = f"... rows {offset + 1} to {offset + collected.num_shown} of {total_rows}"
+        if collected.num_shown == 0:
+            footer = f"... no rows after offset {offset}, the result has {total_rows} rows"
+        return "\n".join(collected.lines + [footer])
+
+    def _get_result_path(self, result_id: str) -> Optional[Path]:
+        if self.spill_dir is None or not re.fullmatch(r"[0-9a-f]{32}", result_id):
+            return None
+        return Path(self.spill_dir).joinpath(f"query-result-{result_id}.parquet")
+
+    def _remove_old_results(self, keep: Path) -> None:
+        """Deletes the saved results older than `spill_ttl` and the oldest results over `max_spilled_results`"""
+        if self.spill_dir is None or (self.spill_ttl is None and self.max_spilled_results is None):
+            return
+        saved_results = []
+        for path in Path(self.spill_dir).iterdir():
+            if path != keep and RESULT_FILE_NAME.fullmatch(path.name):
+                try:
+                    saved_results.append((path.stat().st_mtime, path))
+                except FileNotFoundError:
+                    continue
+        saved_results.sort(reverse=True)
+        now = time()
+        # The result that was just saved counts towards max_spilled_results
+        for num_newer, (mtime, path) in enumerate(saved_results, start=1):
+            too_many = self.max_spilled_results is not None and num_newer >= self.max_spilled_results
+            expired = self.spill_ttl is not None and now - mtime > self.spill_ttl
+            if too_many or expired:
+                path.unlink(missing_ok=True)
+
+    def _collect(
+        self,
+        columns: List[str],
+        batches: Iterator[Batch],
+        max_rows: Optional[int] = None,
+        spill: bool = True,
+        count_total_rows: Optional[bool] = None,
+    ) -> _CollectedRows:
+        max_rows = max_rows if max_rows is not None else self.max_rows
+        spill = spill and self.spill_dir is not None
+        count_total_rows = self.count_total_rows if count_total_rows is None else count_total_rows
+
+        header = ",".join(columns)
+        lines = [header]
+        size = len(header.encode())
+        num_shown = 0
+        total_rows = 0
+        truncated = False
+        # Batches that were shown in full, written to the spill file if a later batch is truncated
+        shown_batches: List[Batch] = []
+        spill_file: Optional[_ParquetSpill] = None
+        result_id: Optional[str] = None
+
+        try:
+            for batch in batches:
+                num_rows = _num_rows(batch)
+                if not truncated:
+                    num_to_show = num_rows if max_rows is None else min(num_rows, max_rows - num_shown)
+                    for row in _get_rows(batch, num_to_show):
+                        line = format_row(row)
+                        line_size = len(line.encode()) + 1
+                        if self.max_bytes is not None and size + line_size > self.max_bytes:
+                            break
+                        lines.append(line)
+                        size += line_size
+                        num_shown += 1
+                    truncated = num_shown < total_rows + num_rows
+                    if not truncated:
+                        if spill:
+                            shown_batches.append(batch)
+                    elif spill:
+                        if is_arrow_available():
+                            result_id = uuid4().hex
+                            spill_file = _ParquetSpill(self._get_result_path(result_id), columns)  # type: ignore
+                            for shown_batch in shown_batches + [batch]:
+                                spill_file.write(shown_batch)
+                        else:
+                            logger.warning("`pyarrow` not installed, query results will not be saved")
+                        shown_batches = []
+                elif spill_file is not None:
+                    spill_file.write(batch)
+                total_rows += num_rows
+                if truncated and spill_file is None and not count_total_rows:
+                    return _CollectedRows(lines, num_shown, truncated, None, None)
+
+            if spill_file is not None:
+                spill_file.close()
+        except Exception as e:
+            if spill_file is None:
+                raise
+            # Results that do not fit a Parquet schema, e.g. a column with mixed types, are not saved
+            logger.warning(f"Could not save query result: {e}")
+            spill_file.discard()
+            return _CollectedRows(lines, num_shown, truncated, None, None)
+        if spill_file is not None:
+            try:
+                self._remove_old_results(keep=spill_file.path)
+            except OSError as e:
+                logger.warning(f"Could not remove old query results: {e}")
+        return _CollectedRows(lines, num_shown, truncated, total_rows, result_id)
+
+    def _format(self, collected: _CollectedRows) -> str:
+        lines = collected.lines
+        if collected.truncated:
+            if collected.total_rows is not None:
+                footer = f"... showing {collected.num_shown} of {collected.total_rows} rows"
+            else:
+                footer = f"... showing the first {collected.num_shown} rows"
+            if collected.result_id is not None:
+                footer += (
+                    f", the full result was saved with result_id {collected.result_id},"
+                    " use read_query_result to page through it"
+                )
+            else:
+                footer += ", add filters, aggregations or a LIMIT to the query to see the other rows"
+            lines = lines + [footer]
+        return "\n".join(lines)
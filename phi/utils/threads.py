@@ -0,0 +1,48 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Lock, Thread, get_ident
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Event loop running in a background thread, used to run coroutines from sync code.
+# Reusing one loop keeps the async clients pooled for that loop usable across calls.
+_bridge_loop: Optional[asyncio.AbstractEventLoop] = None
+_bridge_thread: Optional[Thread] = None
+_bridge_lock = Lock()
+
+
+async def run_in_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking function in the event loop's default executor and await the result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+
+def _get_bridge_loop() -> asyncio.AbstractEventLoop:
+    global _bridge_loop, _bridge_thread
+    with _bridge_lock:
+        if _bridge_loop is None or _bridge_loop.is_closed():
+            _bridge_loop = asyncio.new_event_loop()
+            _bridge_thread = Thread(target=_bridge_loop.run_forever, name="phi-async-bridge", daemon=True)
+            _bridge_thread.start()
+        return _bridge_loop
+
+
+def run_coroutine_sync(coroutine: Awaitable[T]) -> T:
+    """Runs a coroutine from sync code and returns its result.
+
+    The coroutine always runs on the same background event loop, so async clients created while it runs stay
+    bound to a loop that is still alive the next time they are used. This also works when called from a thread
+    that is already running an event loop, where asyncio.run cannot be used.
+    """
+
+    async def _await() -> T:
+        return await coroutine
+
+    loop = _get_bridge_loop()
+    if _bridge_thread is not None and _bridge_thread.ident == get_ident():
+        # Called from a coroutine running on the bridge loop, which cannot wait for itself
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, _await()).result()
+    return asyncio.run_coroutine_threadsafe(_await(), loop).result()
@@ -0,0 +1,99 @@
+import json
+from functools import lru_cache
+from typing import Any, Callable, List, Optional
+
+from phi.utils.log import logger
+
+# Tokens added per message for the role and separators (OpenAI counts 3-4)
+MESSAGE_OVERHEAD_TOKENS = 4
+# Estimated tokens for an image, e.g. a 1024x1024 image at high detail for OpenAI models
+IMAGE_TOKENS = 765
+# Tool results from previous runs are cut to this many tokens when the history does not fit the context
+TRUNCATED_TOOL_RESULT_TOKENS = 256
+
+# Approximate number of characters per token, used when no exact tokenizer is available for the model
+CHARS_PER_TOKEN = {
+    "anthropic": 3.5,
+    "awsbedrock": 3.5,
+    "google": 4.0,
+    "vertexai": 4.0,
+}
+DEFAULT_CHARS_PER_TOKEN = 4.0
+
+
+class Tokenizer:
+    """Counts tokens for a model.
+
+    Uses the model's tiktoken encoding for OpenAI models when tiktoken is installed,
+    and estimates tokens from the number of characters otherwise.
+    """
+
+    def __init__(self, name: str, encode: Optional[Callable[[str], List[int]]] = None, chars_per_token: float = 4.0):
+        # Identifies the tokenizer in token counts cached on messages
+        self.name: str = name
+        self.encode: Optional[Callable[[str], List[int]]] = encode
+        self.chars_per_token: float = chars_per_token
+
+    def count(self, text: Optional[str]) -> int:
+        """Returns the number of tokens in the text."""
+        if not text:
+            return 0
+        if self.encode is not None:
+            return len(self.encode(text))
+        return int(len(text) / self.chars_per_token) + 1
+
+    def count_json(self, value: Any) -> int:
+        """Returns the number of tokens in the value serialized as JSON."""
+        if value is None:
+            return 0
+        return self.count(json.dumps(value, default=str))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Returns the start of the text, cut to at most max_tokens tokens."""
+        num_tokens = self.count(text)
+        if num_tokens <= max_tokens:
+            return text
+        # Cut proportionally to the characters per token of this text
+        return text[: int(len(text) * max_tokens / num_tokens)]
+
+    def count_message(self, message: Any) -> int:
+        """Returns the number of tokens a Message adds to the context."""
+        num_tokens = MESSAGE_OVERHEAD_TOKENS + self.count(message.get_content_string()) + self.count(message.name)
+        if message.tool_calls:
+            num_tokens += self.count_json(message.tool_calls)
+        if message.images:
+            num_tokens += IMAGE_TOKENS * len(message.images)
+        return num_tokens
+
+
+def _get_tiktoken_encode(model_id: str) -> Optional[Callable[[str], List[int]]]:
+    try:
+        import tiktoken
+    except ImportError:
+        logger.debug("`tiktoken` not installed, estimating tokens from the number of characters")
+        return None
+
+    try:
+        encoding = tiktoken.encoding_for_model(model_id)
+    except KeyError:
+        encoding = tiktoken.get_encoding("o200k_base")
+    # Special tokens in messages are counted as text, they are not interpreted by the model either
+    return lambda text: encoding.encode(text, disallowed_special=())
+
+
+@lru_cache(maxsize=None)
+def _get_tokenizer(provider: str, model_id: str) -> Tokenizer:
+    if provider in ("openai", "azure") or model_id.startswith(("gpt-", "o1", "o3", "chatgpt-")):
+        encode = _get_tiktoken_encode(model_id)
+        if encode is not None:
+            return Tokenizer(name=f"tiktoken:{model_id}", encode=encode)
+    chars_per_token = CHARS_PER_TOKEN.get(provider, DEFAULT_CHARS_PER_TOKEN)
+    return Tokenizer(name=f"chars:{chars_per_token}", chars_per_token=chars_per_token)
+
+
+def get_tokenizer(model: Optional[Any] = None) -> Tokenizer:
+    """Returns the tokenizer for a Model. Tokenizers are created once per model id and shared."""
+    if model is None:
+        return _get_tokenizer("", "")
+    provider = (model.provider or "").split(" ")[0].lower()
+    return _get_tokenizer(provider, model.id or "")
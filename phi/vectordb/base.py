@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from hashlib import md5
+from typing import List, Optional, Dict, Any, Set
 
 from phi.document import Document
 
@@ -15,6 +16,31 @@ class VectorDb(ABC):
     def doc_exists(self, document: Document) -> bool:
         raise NotImplementedError
 
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which documents already exist in the vector db, returning one flag per document.
+
+        Vector dbs that can check many documents in a single round trip should override this method.
+        """
+        return [self.doc_exists(document) for document in documents]
+
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """Return the subset of `content_hashes` that exist in the vector db"""
+        raise NotImplementedError
+
+    def delete_by_content_hash(self, content_hashes: List[str]) -> None:
+        """Delete the documents with the given content hashes (md5 of the content) from the vector db"""
+        raise NotImplementedError
+
+    def _docs_exist_by_content_hash(self, documents: List[Document]) -> List[bool]:
+        """Implements `docs_exist` for vector dbs that key documents by the md5 hash of their content"""
+        content_hashes = [
+            md5(document.content.replace("\x00", "\ufffd").encode()).hexdigest() for document in documents
+        ]
+        if len(content_hashes) == 0:
+            return []
+        existing = self.existing_content_hashes(list(dict.fromkeys(content_hashes)))
+        return [content_hash in existing for content_hash in content_hashes]
+
     @abstractmethod
     def name_exists(self, name: str) -> bool:
         raise NotImplementedError
@@ -34,16 +60,33 @@ class VectorDb(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
+        """Returns the documents matching a query.
+
+        Args:
+            query: The search query.
+            limit: Maximum number of documents to return.
+            filters: Filters to apply to the search.
+            return_embeddings: Include the embedding of each document in the results.
+                Embeddings are not fetched by default, as they are rarely needed after the search.
+        """
         raise NotImplementedError
 
-    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+    def vector_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         raise NotImplementedError
 
-    def keyword_search(self, query: str, limit: int = 5) -> List[Document]:
+    def keyword_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         raise NotImplementedError
 
-    def hybrid_search(self, query: str, limit: int = 5) -> List[Document]:
+    def hybrid_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         raise NotImplementedError
 
     @abstractmethod
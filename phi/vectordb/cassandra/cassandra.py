@@ -49,12 +49,12 @@ class CassandraDb(VectorDb):
             logger.debug(f"Cassandra VectorDB : Creating table {self.table_name}")
             self.initialize_table()
 
-    def _row_to_document(self, row: Dict[str, Any]) -> Document:
+    def _row_to_document(self, row: Dict[str, Any], return_embeddings: bool = True) -> Document:
         return Document(
             id=row["row_id"],
             content=row["body_blob"],
             meta_data=row["metadata"],
-            embedding=row["vector"],
+            embedding=row["vector"] if return_embeddings else None,
             name=row["document_name"],
         )
 
@@ -79,8 +79,8 @@ class CassandraDb(VectorDb):
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         logger.debug(f"Cassandra VectorDB : Inserting Documents to the table {self.table_name}")
         futures = []
+        documents = Document.embed_documents(documents, embedder=self.embedder)
         for doc in documents:
-            doc.embed(embedder=self.embedder)
             metadata = {key: str(value) for key, value in doc.meta_data.items()}
             futures.append(
                 self.table.put_async(
@@ -99,18 +99,23 @@ class CassandraDb(VectorDb):
         """Insert or update documents based on primary key."""
         self.insert(documents, filters)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         """Keyword-based search on document metadata."""
         logger.debug(f"Cassandra VectorDB : Performing Vector Search on {self.table_name} with query {query}")
-        return self.vector_search(query=query, limit=limit)
+        return self.vector_search(query=query, limit=limit, filters=filters, return_embeddings=return_embeddings)
 
     def _search_to_documents(
         self,
         hits: Iterable[Dict[str, Any]],
+        return_embeddings: bool = True,
     ) -> List[Document]:
-        return [self._row_to_document(row=hit) for hit in hits]
+        return [self._row_to_document(row=hit, return_embeddings=return_embeddings) for hit in hits]
 
-    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+    def vector_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         """Vector similarity search implementation."""
         query_embedding = self.embedder.get_embedding(query)
         hits = list(
@@ -120,7 +125,8 @@ class CassandraDb(VectorDb):
                 metric="cos",
             )
         )
-        d = self._search_to_documents(hits)
+        # cassio always selects the vectors, they are dropped from the results unless requested
+        d = self._search_to_documents(hits, return_embeddings=return_embeddings)
         return d
 
     def drop(self) -> None:
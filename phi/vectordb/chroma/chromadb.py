@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 
 try:
     from chromadb import Client as ChromaDbClient
@@ -91,15 +91,45 @@ class ChromaDb(VectorDb):
         Returns:
             bool: True if document exists, False otherwise.
         """
+        return self.docs_exist([document])[0]
+
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """Check which documents exist in the collection, looking them up by id in batches.
+        Args:
+            documents (List[Document]): Documents to check.
+        Returns:
+            List[bool]: One flag per document, True if it exists.
+        """
+        return self._docs_exist_by_content_hash(documents)
+
+    def existing_content_hashes(self, content_hashes: List[str], batch_size: int = 100) -> Set[str]:
+        """Get the content hashes that exist in the collection.
+        Args:
+            content_hashes (List[str]): Content hashes to look up.
+            batch_size (int): Number of ids to look up per request.
+        Returns:
+            Set[str]: The content hashes found in the collection."""
+        existing: Set[str] = set()
         if self.client:
             try:
                 collection: Collection = self.client.get_collection(name=self.collection)
-                collection_data: GetResult = collection.get(include=["documents"])
-                if collection_data.get("documents") != []:
-                    return True
+                for i in range(0, len(content_hashes), batch_size):
+                    collection_data: GetResult = collection.get(ids=content_hashes[i : i + batch_size], include=[])
+                    existing.update(collection_data.get("ids", []))
             except Exception as e:
                 logger.error(f"Document does not exist: {e}")
-        return False
+        return existing
+
+    def delete_by_content_hash(self, content_hashes: List[str], batch_size: int = 100) -> None:
+        """Delete the documents with the given content hashes from the collection.
+        Args:
+            content_hashes (List[str]): Content hashes of the documents to delete.
+            batch_size (int): Number of ids to delete per request."""
+        if not self.client:
+            return
+        collection: Collection = self.client.get_collection(name=self.collection)
+        for i in range(0, len(content_hashes), batch_size):
+            collection.delete(ids=content_hashes[i : i + batch_size])
 
     def name_exists(self, name: str) -> bool:
         """Check if a document with a given name exists in the collection.
@@ -129,8 +159,8 @@ class ChromaDb(VectorDb):
         docs: List = []
         docs_embeddings: List = []
 
+        documents = Document.embed_documents(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -160,8 +190,8 @@ class ChromaDb(VectorDb):
         docs: List = []
         docs_embeddings: List = []
 
+        documents = Document.embed_documents(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             docs_embeddings.append(document.embedding)
@@ -176,13 +206,16 @@ class ChromaDb(VectorDb):
         else:
             logger.error("Collection does not exist")
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         """Search the collection for a query.
 
         Args:
             query (str): Query to search for.
             limit (int): Number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply while searching.
+            return_embeddings (bool): Include the document embeddings in the results.
         Returns:
             List[Document]: List of search results.
         """
@@ -194,9 +227,16 @@ class ChromaDb(VectorDb):
         if not self._collection:
             self._collection = self.client.get_collection(name=self.collection)
 
+        # Only fetch the embeddings if requested or needed by the reranker
+        include: List[Any] = ["metadatas", "documents", "distances"]
+        return_embeddings = return_embeddings or (self.reranker is not None and self.reranker.requires_embeddings)
+        if return_embeddings:
+            include.append("embeddings")
+
         result: QueryResult = self._collection.query(
             query_embeddings=query_embedding,
             n_results=limit,
+            include=include,
         )
 
         # Build search results
@@ -206,20 +246,20 @@ class ChromaDb(VectorDb):
         distances = result.get("distances", [[]])[0]  # type: ignore
         metadatas = result.get("metadatas", [[]])[0]  # type: ignore
         documents = result.get("documents", [[]])[0]  # type: ignore
-        embeddings = result.get("embeddings")
+        embeddings = (result.get("embeddings") or [None])[0]  # type: ignore
         uris = result.get("uris")
         data = result.get("data")
 
         try:
             # Use zip to iterate over multiple lists simultaneously
-            for id_, distance, metadata, document in zip(ids, distances, metadatas, documents):
+            for idx, (id_, distance, metadata, document) in enumerate(zip(ids, distances, metadatas, documents)):
                 search_results.append(
                     Document(
                         id=id_,
                         distances=distance,
                         metadatas=metadata,
                         content=document,
-                        embeddings=embeddings,
+                        embedding=list(embeddings[idx]) if embeddings is not None else None,
                         uris=uris,
                         data=data,
                     )
@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from phi.vectordb.clickhouse.index import HNSW
 
@@ -142,6 +142,31 @@ class ClickhouseDb(VectorDb):
         )
         return bool(result.result_rows)
 
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """
+        Validate which documents exist, using a single query
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        return self._docs_exist_by_content_hash(documents)
+
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Get the content hashes that exist in the table
+
+        Args:
+            content_hashes (List[str]): Content hashes to look up
+        """
+        parameters = self._get_base_parameters()
+        parameters["content_hashes"] = content_hashes
+
+        result = self.client.query(
+            "SELECT DISTINCT content_hash FROM {database_name:Identifier}.{table_name:Identifier} WHERE content_hash IN {content_hashes:Array(String)}",
+            parameters=parameters,
+        )
+        return {row[0] for row in result.result_rows}
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -180,8 +205,8 @@ class ClickhouseDb(VectorDb):
         filters: Optional[Dict[str, Any]] = None,
     ) -> None:
         rows: List[List[Any]] = []
+        documents = Document.embed_documents(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             content_hash = md5(cleaned_content.encode()).hexdigest()
             _id = document.id or content_hash
@@ -240,7 +265,9 @@ class ClickhouseDb(VectorDb):
             parameters=parameters,
         )
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
@@ -264,8 +291,12 @@ class ClickhouseDb(VectorDb):
             order_by_query = "ORDER BY cosineDistance(embedding, {query_embedding:Array(Float32)})"
             parameters["query_embedding"] = query_embedding
 
+        # Only select the embeddings if requested
+        columns = (
+            "name, meta_data, content, usage, embedding" if return_embeddings else "name, meta_data, content, usage"
+        )
         clickhouse_query = (
-            "SELECT name, meta_data, content, embedding, usage FROM "
+            f"SELECT {columns} FROM "
             "{database_name:Identifier}.{table_name:Identifier} "
             f"{where_query} {order_by_query} LIMIT {limit}"
         )
@@ -292,8 +323,8 @@ class ClickhouseDb(VectorDb):
                     meta_data=result[1],
                     content=result[2],
                     embedder=self.embedder,
-                    embedding=result[3],
-                    usage=result[4],
+                    embedding=result[4] if return_embeddings else None,
+                    usage=result[3],
                 )
             )
 
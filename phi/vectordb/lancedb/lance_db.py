@@ -1,6 +1,7 @@
 from hashlib import md5
-from typing import List, Optional, Dict, Any
+from typing import List, Literal, Optional, Dict, Any, Set, Tuple
 import json
+import re
 
 try:
     import lancedb
@@ -16,6 +17,11 @@ from phi.vectordb.search import SearchType
 from phi.utils.log import logger
 from phi.reranker.base import Reranker
 
+# Number of candidates searched per result when filtering on a meta_data key that is not stored in a column
+META_DATA_FILTER_CANDIDATES = 4
+# Filter keys that are stored in a column of the table, so Lance applies the filters before the search
+FILTER_COLUMN_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
 
 class LanceDb(VectorDb):
     def __init__(
@@ -31,7 +37,28 @@ class LanceDb(VectorDb):
         nprobes: Optional[int] = None,
         reranker: Optional[Reranker] = None,
         use_tantivy: bool = True,
+        vector_index_type: Literal["IVF_PQ", "IVF_HNSW_PQ", "IVF_HNSW_SQ"] = "IVF_PQ",
+        index_min_rows: int = 10_000,
     ):
+        """
+        Initialize the LanceDb instance.
+
+        Args:
+            uri: Location of the LanceDB database.
+            table: An existing LanceDB table to use.
+            table_name: Name of the table to open or create.
+            connection: An existing LanceDB connection to use.
+            api_key: API key for LanceDB Cloud.
+            embedder: Embedder for the document contents.
+            search_type: Type of search to perform.
+            distance: Distance metric for vector search and the vector index.
+            nprobes: Number of partitions to probe when searching an IVF index.
+            reranker: Reranker for the search results.
+            use_tantivy: Use the tantivy based full-text search index.
+            vector_index_type: Type of the vector index created by optimize().
+            index_min_rows: Minimum number of rows for optimize() to create a vector index.
+                Smaller tables are searched with a flat scan, which is fast and exact at that size.
+        """
         # Embedder for embedding the document contents
         if embedder is None:
             from phi.embedder.openai import OpenAIEmbedder
@@ -73,7 +100,7 @@ class LanceDb(VectorDb):
                 self.table = table
                 self.table_name = self.table.name
                 self._vector_col = self.table.schema.names[0]
-                self._id = self.tbl.schema.names[1]  # type: ignore
+                self._id = self.table.schema.names[1]  # type: ignore
             else:
                 if not table_name:
                     raise ValueError("Either table or table_name should be provided.")
@@ -84,8 +111,16 @@ class LanceDb(VectorDb):
 
         self.reranker: Optional[Reranker] = reranker
         self.nprobes: Optional[int] = nprobes
-        self.fts_index_exists = False
         self.use_tantivy = use_tantivy
+        # Vector index created by optimize()
+        self.vector_index_type: Literal["IVF_PQ", "IVF_HNSW_PQ", "IVF_HNSW_SQ"] = vector_index_type
+        self.index_min_rows: int = index_min_rows
+        # The full-text search index is stored with the table, check for it once instead of on every search
+        self.fts_index_exists: bool = self._fts_index_exists()
+        # True if the tantivy index may not contain every row. Tantivy indexes are not updated on write and are not
+        # listed by list_indices(), so they are rebuilt before the first keyword or hybrid search of each process
+        # and before the first keyword or hybrid search after a write.
+        self.fts_index_stale: bool = self.use_tantivy
 
         if self.use_tantivy and (self.search_type in [SearchType.keyword, SearchType.hybrid]):
             try:
@@ -100,7 +135,7 @@ class LanceDb(VectorDb):
     def create(self) -> None:
         """Create the table if it does not exist."""
         if not self.exists():
-            self.connection = self._init_table()  # Connection update is needed
+            self.table = self._init_table()
 
     def _init_table(self) -> lancedb.db.LanceTable:
         schema = pa.schema(
@@ -135,68 +170,290 @@ class LanceDb(VectorDb):
             return len(result) > 0
         return False
 
-    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
         """
-        Insert documents into the database.
+        Validate which documents exist, looking them up in batches
 
         Args:
-            documents (List[Document]): List of documents to insert
-            filters (Optional[Dict[str, Any]]): Filters to apply while inserting documents
+            documents (List[Document]): Documents to validate
         """
-        logger.debug(f"Inserting {len(documents)} documents")
-        data = []
+        return self._docs_exist_by_content_hash(documents)
+
+    def existing_content_hashes(self, content_hashes: List[str], batch_size: int = 100) -> Set[str]:
+        """
+        Get the content hashes that exist in the table
+
+        Args:
+            content_hashes (List[str]): Content hashes to look up
+            batch_size (int): Number of ids to look up per request
+        """
+        existing: Set[str] = set()
+        if self.table is not None:
+            for i in range(0, len(content_hashes), batch_size):
+                batch = content_hashes[i : i + batch_size]
+                ids = ", ".join(f"'{doc_id}'" for doc_id in batch)
+                result = (
+                    self.table.search().where(f"{self._id} IN ({ids})").select([self._id]).limit(len(batch)).to_arrow()
+                )
+                existing.update(result.column(self._id).to_pylist())
+        return existing
+
+    def delete_by_content_hash(self, content_hashes: List[str], batch_size: int = 100) -> None:
+        """
+        Delete the documents with the given content hashes from the table
+
+        Args:
+            content_hashes (List[str]): Content hashes of the documents to delete
+            batch_size (int): Number of ids to delete per request
+        """
+        if self.table is None:
+            return
+        for i in range(0, len(content_hashes), batch_size):
+            ids = ", ".join(f"'{doc_id}'" for doc_id in content_hashes[i : i + batch_size])
+            self.table.delete(f"{self._id} IN ({ids})")
+
+    def _get_filter_columns(self) -> Dict[str, pa.DataType]:
+        """The columns of the table that filters are applied to, with their type"""
+        if self.table is None:
+            return {}
+        return {
+            field.name: field.type
+            for field in self.table.schema
+            if field.name not in (self._id, self._vector_col, "payload")
+        }
+
+    @staticmethod
+    def _get_column_sql_type(value: Any) -> Optional[str]:
+        """The SQL type of the column storing a filter value, or None if the value is not stored in a column"""
+        if isinstance(value, bool):
+            return "boolean"
+        elif isinstance(value, int):
+            return "bigint"
+        elif isinstance(value, float):
+            return "double"
+        elif isinstance(value, str):
+            return "string"
+        return None
+
+    def _add_filter_columns(self, filters: Optional[Dict[str, Any]]) -> None:
+        """
+        Add a column for each filter key that does not have one, so searches on the key are filtered by Lance.
+
+        Rows written before the column was added have no value in it.
+        """
+        if not filters or self.table is None:
+            return
+        columns = set(self.table.schema.names)
+        new_columns: Dict[str, str] = {}
+        for key, value in filters.items():
+            sql_type = self._get_column_sql_type(value)
+            if key in columns or sql_type is None or not FILTER_COLUMN_NAME.fullmatch(key):
+                continue
+            new_columns[key] = f"CAST(NULL AS {sql_type})"
+        if not new_columns:
+            return
+        logger.debug(f"Adding filter columns to table {self.table_name}: {list(new_columns)}")
+        try:
+            self.table.add_columns(new_columns)
+        except Exception as e:
+            logger.warning(f"Could not add filter columns {list(new_columns)}, they are filtered after the search: {e}")
+
+    @staticmethod
+    def _get_column_value(value: Any, data_type: pa.DataType) -> Any:
+        """The value stored in a filter column, None if the value does not match the type of the column"""
+        if value is None:
+            return None
+        if pa.types.is_boolean(data_type):
+            return value if isinstance(value, bool) else None
+        if pa.types.is_integer(data_type):
+            return value if isinstance(value, int) and not isinstance(value, bool) else None
+        if pa.types.is_floating(data_type):
+            return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+        if pa.types.is_string(data_type) or pa.types.is_large_string(data_type):
+            return value if isinstance(value, str) else None
+        return value
+
+    def _build_records(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> List[Dict]:
+        """
+        Embed the documents and build the table rows, keyed by the content hash
+
+        The filters are stored in the meta_data of the payload. The meta_data values are also stored in the filter
+        columns of the table, which are added for the keys of the filters.
+
+        Args:
+            documents (List[Document]): Documents to convert
+            filters (Optional[Dict[str, Any]]): Filters to store with the documents
+        """
+        documents = Document.embed_documents(documents, embedder=self.embedder)
+        self._add_filter_columns(filters)
+        filter_columns = self._get_filter_columns()
+        records: Dict[str, Dict] = {}
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = str(md5(cleaned_content.encode()).hexdigest())
+            meta_data = {**document.meta_data, **(filters or {})}
             payload = {
                 "name": document.name,
-                "meta_data": document.meta_data,
+                "meta_data": meta_data,
                 "content": cleaned_content,
                 "usage": document.usage,
             }
-            data.append(
-                {
-                    "id": doc_id,
-                    "vector": document.embedding,
-                    "payload": json.dumps(payload),
-                }
-            )
-            logger.debug(f"Inserted document: {document.name} ({document.meta_data})")
+            # Documents with the same content share a key, the last one wins
+            records[doc_id] = {
+                self._id: doc_id,
+                self._vector_col: document.embedding,
+                "payload": json.dumps(payload),
+                **{
+                    name: self._get_column_value(meta_data.get(name), data_type)
+                    for name, data_type in filter_columns.items()
+                },
+            }
+        return list(records.values())
+
+    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Insert documents into the database.
 
+        Args:
+            documents (List[Document]): List of documents to insert
+            filters (Optional[Dict[str, Any]]): Filters to apply while inserting documents
+        """
+        logger.debug(f"Inserting {len(documents)} documents")
         if self.table is None:
             logger.error("Table not initialized. Please create the table first")
             return
 
+        data = self._build_records(documents, filters)
         if not data:
             logger.debug("No new data to insert")
             return
 
         self.table.add(data)
+        self._mark_fts_index_stale()
         logger.debug(f"Inserted {len(data)} documents")
 
+    def upsert_available(self) -> bool:
+        return True
+
     def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
-        Upsert documents into the database.
+        Upsert documents into the database, updating the rows with the same content hash.
 
         Args:
             documents (List[Document]): List of documents to upsert
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
-        self.insert(documents)
+        logger.debug(f"Upserting {len(documents)} documents")
+        if self.table is None:
+            logger.error("Table not initialized. Please create the table first")
+            return
+
+        data = self._build_records(documents, filters)
+        if not data:
+            logger.debug("No new data to upsert")
+            return
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+        (
+            self.table.merge_insert(self._id)  # type: ignore
+            .when_matched_update_all()
+            .when_not_matched_insert_all()
+            .execute(data)
+        )
+        self._mark_fts_index_stale()
+        logger.debug(f"Upserted {len(data)} documents")
+
+    def _split_filters(self, filters: Optional[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Split the filters into the filters on a column of the table and the filters on keys of the meta_data
+        that were never used as filters when inserting, which are not stored in a column.
+        """
+        if not filters or self.table is None:
+            return {}, dict(filters or {})
+        columns = set(self._get_filter_columns())
+        column_filters = {key: value for key, value in filters.items() if key in columns}
+        meta_data_filters = {key: value for key, value in filters.items() if key not in columns}
+        return column_filters, meta_data_filters
+
+    def _build_where(self, column_filters: Dict[str, Any]) -> Optional[str]:
+        """Build a SQL predicate matching the column filters, applied by Lance before the search"""
+        conditions: List[str] = []
+        for key, value in column_filters.items():
+            column = "`" + key.replace("`", "``") + "`"
+            if value is None:
+                conditions.append(f"{column} IS NULL")
+            elif isinstance(value, bool):
+                conditions.append(f"{column} = {str(value).lower()}")
+            elif isinstance(value, (int, float)):
+                conditions.append(f"{column} = {value}")
+            else:
+                escaped = str(value).replace("'", "''")
+                conditions.append(f"{column} = '{escaped}'")
+        return " AND ".join(conditions) if conditions else None
+
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         if self.search_type == SearchType.vector:
-            return self.vector_search(query, limit)
+            return self.vector_search(query, limit, filters=filters, return_embeddings=return_embeddings)
         elif self.search_type == SearchType.keyword:
-            return self.keyword_search(query, limit)
+            return self.keyword_search(query, limit, filters=filters, return_embeddings=return_embeddings)
         elif self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query, limit)
+            return self.hybrid_search(query, limit, filters=filters, return_embeddings=return_embeddings)
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
-    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+    def _run_search(
+        self, query: str, results: Any, limit: int, filters: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """
+        Run a search query, filtering and reranking the results.
+
+        Filters on a column of the table are applied by Lance before the search, so the search returns up to
+        `limit` matching rows. Filters on meta_data keys without a column are applied to
+        `META_DATA_FILTER_CANDIDATES` candidates per result, as the meta_data is stored in the JSON payload.
+        """
+        column_filters, meta_data_filters = self._split_filters(filters)
+        where = self._build_where(column_filters)
+        if where is not None:
+            results = results.where(where, prefilter=True)
+        if meta_data_filters:
+            logger.warning(
+                f"Filters {list(meta_data_filters)} are not stored in a column and are applied after the search, "
+                "pass them as filters when inserting the documents to filter before the search"
+            )
+            results = results.limit(limit * META_DATA_FILTER_CANDIDATES)
+        else:
+            results = results.limit(limit)
+
+        search_results = self._build_search_results(results.to_arrow())
+        if meta_data_filters:
+            search_results = [
+                document
+                for document in search_results
+                if all(document.meta_data.get(key) == value for key, value in meta_data_filters.items())
+            ][:limit]
+
+        if self.reranker:
+            search_results = self.reranker.rerank(query=query, documents=search_results)
+        return search_results
+
+    @property
+    def metric(self) -> Literal["l2", "cosine", "dot"]:
+        """The LanceDB distance metric for the configured distance"""
+        if self.distance == Distance.l2:
+            return "l2"
+        elif self.distance == Distance.max_inner_product:
+            return "dot"
+        return "cosine"
+
+    def vector_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = False,
+    ) -> List[Document]:
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
@@ -206,23 +463,25 @@ class LanceDb(VectorDb):
             logger.error("Table not initialized. Please create the table first")
             return []
 
-        results = self.table.search(
-            query=query_embedding,
-            vector_column_name=self._vector_col,
-        ).limit(limit)
-
+        results = (
+            self.table.search(
+                query=query_embedding,
+                vector_column_name=self._vector_col,
+            )
+            .metric(self.metric)
+            .select(self._search_columns(return_embeddings))
+        )
         if self.nprobes:
             results.nprobes(self.nprobes)
+        return self._run_search(query, results, limit, filters)
 
-        results = results.to_pandas()
-        search_results = self._build_search_results(results)
-
-        if self.reranker:
-            search_results = self.reranker.rerank(query=query, documents=search_results)
-
-        return search_results
-
-    def hybrid_search(self, query: str, limit: int = 5) -> List[Document]:
+    def hybrid_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = False,
+    ) -> List[Document]:
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
@@ -230,9 +489,7 @@ class LanceDb(VectorDb):
         if self.table is None:
             logger.error("Table not initialized. Please create the table first")
             return []
-        if not self.fts_index_exists:
-            self.table.create_fts_index("payload", use_tantivy=self.use_tantivy, replace=True)
-            self.fts_index_exists = True
+        self._ensure_fts_index()
 
         results = (
             self.table.search(
@@ -241,47 +498,42 @@ class LanceDb(VectorDb):
             )
             .vector(query_embedding)
             .text(query)
-            .limit(limit)
+            .metric(self.metric)
+            .select(self._search_columns(return_embeddings))
         )
-
         if self.nprobes:
             results.nprobes(self.nprobes)
+        return self._run_search(query, results, limit, filters)
 
-        results = results.to_pandas()
-
-        search_results = self._build_search_results(results)
-
-        if self.reranker:
-            search_results = self.reranker.rerank(query=query, documents=search_results)
-
-        return search_results
-
-    def keyword_search(self, query: str, limit: int = 5) -> List[Document]:
+    def keyword_search(
+        self,
+        query: str,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = False,
+    ) -> List[Document]:
         if self.table is None:
             logger.error("Table not initialized. Please create the table first")
             return []
-        if not self.fts_index_exists:
-            self.table.create_fts_index("payload", use_tantivy=self.use_tantivy, replace=True)
-            self.fts_index_exists = True
-
-        results = (
-            self.table.search(
-                query=query,
-                query_type="fts",
-            )
-            .limit(limit)
-            .to_pandas()
-        )
-        search_results = self._build_search_results(results)
+        self._ensure_fts_index()
 
-        if self.reranker:
-            search_results = self.reranker.rerank(query=query, documents=search_results)
-        return search_results
-
-    def _build_search_results(self, results) -> List[Document]:  # TODO: typehint pandas?
+        results = self.table.search(
+            query=query,
+            query_type="fts",
+        ).select(self._search_columns(return_embeddings))
+        return self._run_search(query, results, limit, filters)
+
+    def _search_columns(self, return_embeddings: bool = False) -> List[str]:
+        """Columns returned by a search. The vectors are only returned if requested or needed by the reranker."""
+        columns = [self._id, "payload"]
+        if return_embeddings or (self.reranker is not None and self.reranker.requires_embeddings):
+            columns.append(self._vector_col)
+        return columns
+
+    def _build_search_results(self, results: pa.Table) -> List[Document]:
         search_results: List[Document] = []
         try:
-            for _, item in results.iterrows():
+            for item in results.to_pylist():
                 payload = json.loads(item["payload"])
                 search_results.append(
                     Document(
@@ -289,7 +541,7 @@ class LanceDb(VectorDb):
                         meta_data=payload["meta_data"],
                         content=payload["content"],
                         embedder=self.embedder,
-                        embedding=item["vector"],
+                        embedding=item.get(self._vector_col),
                         usage=payload["usage"],
                     )
                 )
@@ -299,6 +551,62 @@ class LanceDb(VectorDb):
 
         return search_results
 
+    def _fts_index_exists(self) -> bool:
+        """Check if the table has a native full-text search index on the payload"""
+        if self.table is None:
+            return False
+        try:
+            return any(
+                index.index_type.upper() in ("FTS", "INVERTED") and "payload" in index.columns
+                for index in self.table.list_indices()
+            )
+        except Exception as e:
+            logger.debug(f"Could not check for the full-text search index: {e}")
+            return False
+
+    def _mark_fts_index_stale(self) -> None:
+        """Record a write. Native indexes also search the new rows, tantivy indexes are rebuilt before the next search."""
+        if self.use_tantivy:
+            self.fts_index_stale = True
+
+    def _ensure_fts_index(self) -> None:
+        """
+        Create the full-text search index if it does not exist, and rebuild a stale tantivy index.
+
+        Native indexes are not rebuilt: they also search the rows written after the index was built,
+        and optimize() adds them to the index.
+        """
+        if self.table is None:
+            return
+        if self.use_tantivy and self.fts_index_stale:
+            logger.debug(f"Rebuilding full-text search index on table: {self.table_name}")
+            self.table.create_fts_index("payload", use_tantivy=True, replace=True)
+            self.fts_index_exists = True
+            self.fts_index_stale = False
+            return
+        if self.fts_index_exists:
+            return
+        logger.debug(f"Creating full-text search index on table: {self.table_name}")
+        try:
+            self.table.create_fts_index("payload", use_tantivy=self.use_tantivy)
+        except Exception as e:
+            if "already exists" not in str(e):
+                raise
+        self.fts_index_exists = True
+
+    def _vector_index_exists(self) -> bool:
+        """Check if the table has an index on the vector column"""
+        if self.table is None:
+            return False
+        try:
+            return any(
+                self._vector_col in index.columns and index.index_type.upper().startswith("IVF")
+                for index in self.table.list_indices()
+            )
+        except Exception as e:
+            logger.debug(f"Could not check for the vector index: {e}")
+            return False
+
     def drop(self) -> None:
         if self.exists():
             logger.debug(f"Deleting collection: {self.table_name}")
@@ -315,8 +623,49 @@ class LanceDb(VectorDb):
             return self.table.count_rows()
         return 0
 
-    def optimize(self) -> None:
-        pass
+    def optimize(self, force_recreate: bool = False) -> None:
+        """
+        Create the indexes for the table and add new rows to the existing indexes.
+
+        A vector index of type `vector_index_type` is created once the table has `index_min_rows` rows.
+        The full-text search index is created for keyword and hybrid search, and tantivy indexes are rebuilt
+        if rows were written since they were built.
+
+        Args:
+            force_recreate (bool): If True, existing indexes are recreated.
+        """
+        if self.table is None:
+            logger.error("Table not initialized. Please create the table first")
+            return
+
+        num_rows = self.table.count_rows()
+        if num_rows < self.index_min_rows:
+            logger.debug(f"Skipping vector index: {num_rows} rows, the minimum is {self.index_min_rows}")
+        elif force_recreate or not self._vector_index_exists():
+            logger.debug(f"Creating {self.vector_index_type} index on table: {self.table_name}")
+            self.table.create_index(
+                metric=self.metric,
+                vector_column_name=self._vector_col,
+                index_type=self.vector_index_type,
+                replace=True,
+            )
+
+        if self.search_type in (SearchType.keyword, SearchType.hybrid):
+            if force_recreate:
+                logger.debug(f"Rebuilding full-text search index on table: {self.table_name}")
+                self.table.create_fts_index("payload", use_tantivy=self.use_tantivy, replace=True)
+                self.fts_index_exists = True
+                self.fts_index_stale = False
+            else:
+                self._ensure_fts_index()
+
+        # Add the rows written since the indexes were built to the indexes and compact the table
+        table_optimize = getattr(self.table, "optimize", None)
+        if table_optimize is not None:
+            try:
+                table_optimize()
+            except Exception as e:
+                logger.debug(f"Could not optimize table: {e}")
 
     def delete(self) -> bool:
         return False
@@ -346,7 +695,10 @@ class LanceDb(VectorDb):
             else:
                 setattr(copied_obj, k, deepcopy(v, memo))
 
-        # Recreate metadata and table for the copied instance
-        copied_obj.table = copied_obj._init_table()
+        # Reopen the table for the copied instance
+        if copied_obj.exists():
+            copied_obj.table = copied_obj.connection.open_table(str(copied_obj.table_name))
+        else:
+            copied_obj.table = copied_obj._init_table()
 
         return copied_obj
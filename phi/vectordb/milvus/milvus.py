@@ -1,5 +1,5 @@
 from hashlib import md5
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 
 try:
     from pymilvus import MilvusClient  # type: ignore
@@ -102,6 +102,34 @@ class Milvus(VectorDb):
             return len(collection_points) > 0
         return False
 
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """
+        Validate which documents exist, looking them up in batches
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        return self._docs_exist_by_content_hash(documents)
+
+    def existing_content_hashes(self, content_hashes: List[str], batch_size: int = 100) -> Set[str]:
+        """
+        Get the content hashes that exist in the collection
+
+        Args:
+            content_hashes (List[str]): Content hashes to look up
+            batch_size (int): Number of ids to look up per request
+        """
+        existing: Set[str] = set()
+        if self.client:
+            for i in range(0, len(content_hashes), batch_size):
+                results = self.client.get(
+                    collection_name=self.collection,
+                    ids=content_hashes[i : i + batch_size],
+                    output_fields=["id"],
+                )
+                existing.update(result["id"] for result in results)
+        return existing
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -141,8 +169,8 @@ class Milvus(VectorDb):
             batch_size (int): Batch size for inserting documents
         """
         logger.debug(f"Inserting {len(documents)} documents")
+        documents = Document.embed_documents(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -177,8 +205,8 @@ class Milvus(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
         logger.debug(f"Upserting {len(documents)} documents")
+        documents = Document.embed_documents(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
             data = {
@@ -195,7 +223,9 @@ class Milvus(VectorDb):
             )
             logger.debug(f"Upserted document: {document.name} ({document.meta_data})")
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         """
         Search for documents in the database.
 
@@ -203,17 +233,23 @@ class Milvus(VectorDb):
             query (str): Query to search for
             limit (int): Number of search results to return
             filters (Optional[Dict[str, Any]]): Filters to apply while searching
+            return_embeddings (bool): Include the document embeddings in the results
         """
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
             return []
 
+        # Only return the vectors if requested
+        output_fields = ["name", "meta_data", "content", "usage"]
+        if return_embeddings:
+            output_fields.append("vector")
+
         results = self.client.search(
             collection_name=self.collection,
             data=[query_embedding],
             filter=self._build_expr(filters),
-            output_fields=["*"],
+            output_fields=output_fields,
             limit=limit,
         )
 
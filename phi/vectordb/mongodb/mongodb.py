@@ -205,6 +205,7 @@ class MongoDBVector(VectorDb):
         """Insert documents into the MongoDB collection."""
         logger.info(f"Inserting {len(documents)} documents")
 
+        documents = Document.embed_documents(documents, embedder=self.embedder)
         prepared_docs = []
         for document in documents:
             try:
@@ -230,6 +231,7 @@ class MongoDBVector(VectorDb):
         """Upsert documents into the MongoDB collection."""
         logger.info(f"Upserting {len(documents)} documents")
 
+        documents = Document.embed_documents(documents, embedder=self.embedder)
         for document in documents:
             try:
                 doc_data = self.prepare_doc(document)
@@ -246,7 +248,9 @@ class MongoDBVector(VectorDb):
         """Indicate that upsert functionality is available."""
         return True
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         """Search the MongoDB collection for documents relevant to the query."""
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
@@ -258,15 +262,16 @@ class MongoDBVector(VectorDb):
                 {
                     "$vectorSearch": {
                         "index": "vector_index_1",
-                        "limit": 10,
-                        "numCandidates": 10,
-                        "queryVector": self.embedder.get_embedding(query),
+                        "limit": limit,
+                        "numCandidates": max(limit, 10),
+                        "queryVector": query_embedding,
                         "path": "embedding",
                     }
                 },
                 {"$set": {"score": {"$meta": "vectorSearchScore"}}},
             ]
-            pipeline.append({"$project": {"embedding": 0}})
+            if not return_embeddings:
+                pipeline.append({"$project": {"embedding": 0}})
             agg = list(self._collection.aggregate(pipeline))  # type: ignore
             docs = []
             for doc in agg:
@@ -276,6 +281,7 @@ class MongoDBVector(VectorDb):
                         name=doc.get("name"),
                         content=doc["content"],
                         meta_data=doc.get("meta_data", {}),
+                        embedding=doc.get("embedding"),
                     )
                 )
             logger.info(f"Search completed. Found {len(docs)} documents.")
@@ -284,17 +290,24 @@ class MongoDBVector(VectorDb):
             logger.error(f"Error during search: {e}")
             return []
 
-    def vector_search(self, query: str, limit: int = 5) -> List[Document]:
+    def vector_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         """Perform a vector-based search."""
         logger.debug("Performing vector search.")
-        return self.search(query, limit=limit)
+        return self.search(query, limit=limit, filters=filters, return_embeddings=return_embeddings)
 
-    def keyword_search(self, query: str, limit: int = 5) -> List[Document]:
+    def keyword_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         """Perform a keyword-based search."""
         try:
+            projection = {"_id": 1, "name": 1, "content": 1, "meta_data": 1}
+            if return_embeddings:
+                projection["embedding"] = 1
             cursor = self._collection.find(
                 {"content": {"$regex": query, "$options": "i"}},
-                {"_id": 1, "name": 1, "content": 1, "meta_data": 1},
+                projection,
             ).limit(limit)
             results = [
                 Document(
@@ -302,6 +315,7 @@ class MongoDBVector(VectorDb):
                     name=doc.get("name"),
                     content=doc["content"],
                     meta_data=doc.get("meta_data", {}),
+                    embedding=doc.get("embedding"),
                 )
                 for doc in cursor
             ]
@@ -311,7 +325,9 @@ class MongoDBVector(VectorDb):
             logger.error(f"Error during keyword search: {e}")
             return []
 
-    def hybrid_search(self, query: str, limit: int = 5) -> List[Document]:
+    def hybrid_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         """Perform a hybrid search combining vector and keyword-based searches."""
         logger.debug("Performing hybrid search is not yet implemented.")
         return []
@@ -360,7 +376,8 @@ class MongoDBVector(VectorDb):
 
     def prepare_doc(self, document: Document) -> Dict[str, Any]:
         """Prepare a document for insertion or upsertion into MongoDB."""
-        document.embed(embedder=self.embedder)
+        if document.embedding is None:
+            document.embed(embedder=self.embedder)
         if document.embedding is None:
             raise ValueError(f"Failed to generate embedding for document: {document.id}")
 
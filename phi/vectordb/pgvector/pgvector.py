@@ -1,14 +1,15 @@
+import re
 from math import sqrt
 from hashlib import md5
-from typing import Optional, List, Union, Dict, Any, cast
+from typing import Optional, List, Literal, Set, Union, Dict, Any, cast
 
 try:
     from sqlalchemy.dialects import postgresql
     from sqlalchemy.engine import create_engine, Engine
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import sessionmaker, scoped_session, Session
-    from sqlalchemy.schema import MetaData, Table, Column, Index
-    from sqlalchemy.sql.expression import text, func, select, desc, bindparam
+    from sqlalchemy.schema import MetaData, Table, Column, Computed, Index
+    from sqlalchemy.sql.expression import text, func, select, bindparam, any_, literal_column
     from sqlalchemy.types import DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed. Please install using `pip install sqlalchemy psycopg`")
@@ -48,6 +49,9 @@ class PgVector(VectorDb):
         distance: Distance = Distance.cosine,
         prefix_match: bool = False,
         vector_score_weight: float = 0.5,
+        hybrid_fusion: Literal["rrf", "weighted"] = "rrf",
+        hybrid_candidates: Optional[int] = None,
+        rrf_k: int = 60,
         content_language: str = "english",
         schema_version: int = 1,
         auto_upgrade_schema: bool = False,
@@ -67,13 +71,23 @@ class PgVector(VectorDb):
             distance (Distance): Distance metric for vector comparisons.
             prefix_match (bool): Enable prefix matching for full-text search.
             vector_score_weight (float): Weight for vector similarity in hybrid search.
+            hybrid_fusion (str): How hybrid search combines the vector and full-text results:
+                "rrf" (Reciprocal Rank Fusion) or "weighted" (weighted sum of the scores).
+            hybrid_candidates (Optional[int]): Number of candidates taken from each of the vector and full-text
+                searches in hybrid search. Defaults to 4 times the limit.
+            rrf_k (int): Rank constant for Reciprocal Rank Fusion.
             content_language (str): Language for full-text search.
             schema_version (int): Version of the database schema.
+                Version 2 stores the full-text search vector of the content in a generated column.
             auto_upgrade_schema (bool): Automatically upgrade schema if True.
         """
         if not table_name:
             raise ValueError("Table name must be provided.")
 
+        # The language is used in SQL expressions for the full-text search index and generated column
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_.]*", content_language):
+            raise ValueError(f"Invalid content_language: {content_language}")
+
         if db_engine is None and db_url is None:
             raise ValueError("Either 'db_url' or 'db_engine' must be provided.")
 
@@ -114,6 +128,12 @@ class PgVector(VectorDb):
         self.prefix_match: bool = prefix_match
         # Weight for the vector similarity score in hybrid search
         self.vector_score_weight: float = vector_score_weight
+        # Fusion of the vector and full-text results in hybrid search
+        self.hybrid_fusion: Literal["rrf", "weighted"] = hybrid_fusion
+        # Number of candidates from each search in hybrid search
+        self.hybrid_candidates: Optional[int] = hybrid_candidates
+        # Rank constant for Reciprocal Rank Fusion
+        self.rrf_k: int = rrf_k
         # Content language for full-text search
         self.content_language: str = content_language
 
@@ -131,6 +151,9 @@ class PgVector(VectorDb):
         self.table: Table = self.get_table()
         logger.debug(f"Initialized PgVector with table '{self.schema}.{self.table_name}'")
 
+        if self.auto_upgrade_schema:
+            self.upgrade_schema()
+
     def get_table_v1(self) -> Table:
         """
         Get the SQLAlchemy Table object for schema version 1.
@@ -163,6 +186,54 @@ class PgVector(VectorDb):
 
         return table
 
+    @property
+    def ts_config(self) -> str:
+        """The text search configuration used for the content, as a SQL literal."""
+        return f"'{self.content_language}'::regconfig"
+
+    @property
+    def content_tsv_expression(self) -> str:
+        """SQL expression for the full-text search vector of the content."""
+        return f"to_tsvector({self.ts_config}, coalesce(content, ''))"
+
+    @property
+    def gin_index_name(self) -> str:
+        """Name of the GIN index for full-text search."""
+        if self.schema_version >= 2:
+            return f"{self.table_name}_content_tsv_gin_index"
+        return f"{self.table_name}_content_gin_index"
+
+    def get_ts_vector(self):
+        """
+        Get the full-text search vector of the content.
+
+        Uses the stored `content_tsv` column on schema version 2 and otherwise computes the vector with the
+        same expression as the GIN index, so that both can be used by the full-text search index.
+        """
+        if "content_tsv" in self.table.c:
+            return self.table.c.content_tsv
+        return func.to_tsvector(
+            literal_column(self.ts_config), func.coalesce(self.table.c.content, literal_column("''"))
+        )
+
+    def get_table_v2(self) -> Table:
+        """
+        Get the SQLAlchemy Table object for schema version 2.
+
+        Version 2 adds the `content_tsv` column: the full-text search vector of the content,
+        generated by Postgres when a row is written and indexed with a GIN index.
+
+        Returns:
+            Table: SQLAlchemy Table object representing the database table.
+        """
+        table = self.get_table_v1()
+        table.append_column(
+            Column("content_tsv", postgresql.TSVECTOR, Computed(self.content_tsv_expression, persisted=True)),
+            replace_existing=True,
+        )
+        Index(self.gin_index_name, table.c.content_tsv, postgresql_using="gin")
+        return table
+
     def get_table(self) -> Table:
         """
         Get the SQLAlchemy Table object based on the current schema version.
@@ -172,6 +243,8 @@ class PgVector(VectorDb):
         """
         if self.schema_version == 1:
             return self.get_table_v1()
+        elif self.schema_version == 2:
+            return self.get_table_v2()
         else:
             raise NotImplementedError(f"Unsupported schema version: {self.schema_version}")
 
@@ -237,6 +310,56 @@ class PgVector(VectorDb):
         content_hash = md5(cleaned_content.encode()).hexdigest()
         return self._record_exists(self.table.c.content_hash, content_hash)
 
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """
+        Check which documents already exist in the table using a single query.
+
+        Args:
+            documents (List[Document]): The documents to check.
+
+        Returns:
+            List[bool]: One flag per document, True if it exists.
+        """
+        return self._docs_exist_by_content_hash(documents)
+
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Get the content hashes that exist in the table.
+
+        Args:
+            content_hashes (List[str]): The content hashes to look up.
+
+        Returns:
+            Set[str]: The content hashes found in the table.
+        """
+        try:
+            with self.Session() as sess, sess.begin():
+                stmt = select(self.table.c.content_hash).where(
+                    self.table.c.content_hash
+                    == any_(bindparam("content_hashes", value=content_hashes, type_=postgresql.ARRAY(String)))
+                )
+                return set(sess.execute(stmt).scalars().all())
+        except Exception as e:
+            logger.error(f"Error checking if records exist: {e}")
+            return set()
+
+    def delete_by_content_hash(self, content_hashes: List[str]) -> None:
+        """
+        Delete the documents with the given content hashes from the table.
+
+        Args:
+            content_hashes (List[str]): The content hashes of the documents to delete.
+        """
+        if len(content_hashes) == 0:
+            return
+        with self.Session() as sess, sess.begin():
+            stmt = self.table.delete().where(
+                self.table.c.content_hash
+                == any_(bindparam("content_hashes", value=content_hashes, type_=postgresql.ARRAY(String)))
+            )
+            result = sess.execute(stmt)
+            logger.debug(f"Deleted {result.rowcount} documents")
+
     def name_exists(self, name: str) -> bool:
         """
         Check if a document with the given name exists in the table.
@@ -293,11 +416,13 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     logger.debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the whole batch with a single call to the embedder
+                        batch_docs = Document.embed_documents(batch_docs, embedder=self.embedder, batch_size=batch_size)
+
                         # Prepare documents for insertion
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
                                 _id = doc.id or content_hash
@@ -357,11 +482,13 @@ class PgVector(VectorDb):
                     batch_docs = documents[i : i + batch_size]
                     logger.debug(f"Processing batch starting at index {i}, size: {len(batch_docs)}")
                     try:
+                        # Embed the whole batch with a single call to the embedder
+                        batch_docs = Document.embed_documents(batch_docs, embedder=self.embedder, batch_size=batch_size)
+
                         # Prepare documents for upserting
                         batch_records = []
                         for doc in batch_docs:
                             try:
-                                doc.embed(embedder=self.embedder)
                                 cleaned_content = self._clean_content(doc.content)
                                 content_hash = md5(cleaned_content.encode()).hexdigest()
                                 _id = doc.id or content_hash
@@ -404,7 +531,9 @@ class PgVector(VectorDb):
             logger.error(f"Error upserting documents: {e}")
             raise
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         """
         Perform a search based on the configured search type.
 
@@ -412,21 +541,48 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            return_embeddings (bool): Include the document embeddings in the results.
 
         Returns:
             List[Document]: List of matching documents.
         """
         if self.search_type == SearchType.vector:
-            return self.vector_search(query=query, limit=limit, filters=filters)
+            return self.vector_search(query=query, limit=limit, filters=filters, return_embeddings=return_embeddings)
         elif self.search_type == SearchType.keyword:
-            return self.keyword_search(query=query, limit=limit, filters=filters)
+            return self.keyword_search(query=query, limit=limit, filters=filters, return_embeddings=return_embeddings)
         elif self.search_type == SearchType.hybrid:
-            return self.hybrid_search(query=query, limit=limit, filters=filters)
+            return self.hybrid_search(query=query, limit=limit, filters=filters, return_embeddings=return_embeddings)
         else:
             logger.error(f"Invalid search type '{self.search_type}'.")
             return []
 
-    def vector_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def get_search_columns(self, return_embeddings: bool = False) -> List[Column]:
+        """
+        Get the columns selected by a search.
+
+        The embeddings are only selected if requested or needed by the reranker, as they are much larger
+        than the rest of the row and not needed once the documents are found.
+
+        Args:
+            return_embeddings (bool): Select the embedding column.
+
+        Returns:
+            List[Column]: The columns to select.
+        """
+        columns = [
+            self.table.c.id,
+            self.table.c.name,
+            self.table.c.meta_data,
+            self.table.c.content,
+            self.table.c.usage,
+        ]
+        if return_embeddings or (self.reranker is not None and self.reranker.requires_embeddings):
+            columns.append(self.table.c.embedding)
+        return columns
+
+    def vector_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         """
         Perform a vector similarity search.
 
@@ -434,6 +590,7 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            return_embeddings (bool): Include the document embeddings in the results.
 
         Returns:
             List[Document]: List of matching documents.
@@ -446,14 +603,7 @@ class PgVector(VectorDb):
                 return []
 
             # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
+            columns = self.get_search_columns(return_embeddings=return_embeddings)
 
             # Build the base statement
             stmt = select(*columns)
@@ -504,7 +654,7 @@ class PgVector(VectorDb):
                         meta_data=result.meta_data,
                         content=result.content,
                         embedder=self.embedder,
-                        embedding=result.embedding,
+                        embedding=result.embedding if "embedding" in result._fields else None,
                         usage=result.usage,
                     )
                 )
@@ -532,7 +682,9 @@ class PgVector(VectorDb):
         processed_words = [word + "*" for word in words]
         return " ".join(processed_words)
 
-    def keyword_search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def keyword_search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         """
         Perform a keyword search on the 'content' column.
 
@@ -540,32 +692,31 @@ class PgVector(VectorDb):
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            return_embeddings (bool): Include the document embeddings in the results.
 
         Returns:
             List[Document]: List of matching documents.
         """
         try:
             # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
+            columns = self.get_search_columns(return_embeddings=return_embeddings)
 
             # Build the base statement
             stmt = select(*columns)
 
             # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
+            ts_vector = self.get_ts_vector()
             # Create the ts_query using websearch_to_tsquery with parameter binding
             processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
+            ts_query = func.websearch_to_tsquery(
+                literal_column(self.ts_config), bindparam("query", value=processed_query)
+            )
             # Compute the text rank
             text_rank = func.ts_rank_cd(ts_vector, ts_query)
 
+            # Only match documents containing the query, so the GIN index can be used
+            stmt = stmt.where(ts_vector.op("@@")(ts_query))
+
             # Apply filters if provided
             if filters is not None:
                 # Use the contains() method for JSONB columns to check if the filters column contains the specified filters
@@ -600,7 +751,7 @@ class PgVector(VectorDb):
                         meta_data=result.meta_data,
                         content=result.content,
                         embedder=self.embedder,
-                        embedding=result.embedding,
+                        embedding=result.embedding if "embedding" in result._fields else None,
                         usage=result.usage,
                     )
                 )
@@ -615,14 +766,20 @@ class PgVector(VectorDb):
         query: str,
         limit: int = 5,
         filters: Optional[Dict[str, Any]] = None,
+        return_embeddings: bool = False,
     ) -> List[Document]:
         """
         Perform a hybrid search combining vector similarity and full-text search.
 
+        The top candidates of the vector search and of the full-text search are selected separately, so that each
+        can use its index, and then fused in the same statement using Reciprocal Rank Fusion or a weighted sum
+        of the scores, depending on `hybrid_fusion`.
+
         Args:
             query (str): The search query.
             limit (int): Maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Filters to apply to the search.
+            return_embeddings (bool): Include the document embeddings in the results.
 
         Returns:
             List[Document]: List of matching documents.
@@ -634,68 +791,91 @@ class PgVector(VectorDb):
                 logger.error(f"Error getting embedding for Query: {query}")
                 return []
 
-            # Define the columns to select
-            columns = [
-                self.table.c.id,
-                self.table.c.name,
-                self.table.c.meta_data,
-                self.table.c.content,
-                self.table.c.embedding,
-                self.table.c.usage,
-            ]
+            # Validate the vector_weight parameter
+            if not 0 <= self.vector_score_weight <= 1:
+                raise ValueError("vector_score_weight must be between 0 and 1")
+            text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
 
-            # Build the text search vector
-            ts_vector = func.to_tsvector(self.content_language, self.table.c.content)
-            # Create the ts_query using websearch_to_tsquery with parameter binding
-            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
-            ts_query = func.websearch_to_tsquery(self.content_language, bindparam("query", value=processed_query))
-            # Compute the text rank
-            text_rank = func.ts_rank_cd(ts_vector, ts_query)
+            # Number of candidates taken from each search
+            num_candidates = max(self.hybrid_candidates or limit * 4, limit)
+
+            # Define the columns to select
+            columns = self.get_search_columns(return_embeddings=return_embeddings)
 
-            # Compute the vector similarity score
+            # Compute the vector distance, smaller distances are better
             if self.distance == Distance.l2:
-                # For L2 distance, smaller distances are better
                 vector_distance = self.table.c.embedding.l2_distance(query_embedding)
-                # Invert and normalize the distance to get a similarity score between 0 and 1
-                vector_score = 1 / (1 + vector_distance)
             elif self.distance == Distance.cosine:
-                # For cosine distance, smaller distances are better
                 vector_distance = self.table.c.embedding.cosine_distance(query_embedding)
-                vector_score = 1 / (1 + vector_distance)
             elif self.distance == Distance.max_inner_product:
-                # For inner product, higher values are better
-                # Assume embeddings are normalized, so inner product ranges from -1 to 1
-                raw_vector_score = self.table.c.embedding.max_inner_product(query_embedding)
-                # Normalize to range [0, 1]
-                vector_score = (raw_vector_score + 1) / 2
+                # The negative inner product
+                vector_distance = self.table.c.embedding.max_inner_product(query_embedding)
             else:
                 logger.error(f"Unknown distance metric: {self.distance}")
                 return []
 
-            # Apply weights to control the influence of each score
-            # Validate the vector_weight parameter
-            if not 0 <= self.vector_score_weight <= 1:
-                raise ValueError("vector_score_weight must be between 0 and 1")
-            text_rank_weight = 1 - self.vector_score_weight  # weight for text rank
-
-            # Combine the scores into a hybrid score
-            hybrid_score = (self.vector_score_weight * vector_score) + (text_rank_weight * text_rank)
-
-            # Build the base statement, including the hybrid score
-            stmt = select(*columns, hybrid_score.label("hybrid_score"))
-
-            # Add the full-text search condition
-            # stmt = stmt.where(ts_vector.op("@@")(ts_query))
-
-            # Apply filters if provided
+            # Vector candidates: the nearest neighbours, ranked after the limit so the vector index can be used
+            vector_stmt = select(self.table.c.id, vector_distance.label("distance"))
             if filters is not None:
-                stmt = stmt.where(self.table.c.filters.contains(filters))
-
-            # Order the results by the hybrid score in descending order
-            stmt = stmt.order_by(desc("hybrid_score"))
+                vector_stmt = vector_stmt.where(self.table.c.filters.contains(filters))
+            vector_top = vector_stmt.order_by(vector_distance).limit(num_candidates).subquery("vector_top")
+            vector_candidates = select(
+                vector_top.c.id,
+                vector_top.c.distance,
+                func.row_number().over(order_by=vector_top.c.distance).label("rank"),
+            ).subquery("vector_candidates")
+
+            # Full-text candidates: the best ranked documents matching the query, using the GIN index
+            ts_vector = self.get_ts_vector()
+            processed_query = self.enable_prefix_matching(query) if self.prefix_match else query
+            ts_query = func.websearch_to_tsquery(
+                literal_column(self.ts_config), bindparam("query", value=processed_query)
+            )
+            text_rank = func.ts_rank_cd(ts_vector, ts_query)
+            text_stmt = select(self.table.c.id, text_rank.label("score")).where(ts_vector.op("@@")(ts_query))
+            if filters is not None:
+                text_stmt = text_stmt.where(self.table.c.filters.contains(filters))
+            text_top = text_stmt.order_by(text_rank.desc()).limit(num_candidates).subquery("text_top")
+            text_candidates = select(
+                text_top.c.id,
+                text_top.c.score,
+                func.row_number().over(order_by=text_top.c.score.desc()).label("rank"),
+            ).subquery("text_candidates")
+
+            # Fuse the candidates
+            if self.hybrid_fusion == "rrf":
+                vector_score = self.vector_score_weight / (self.rrf_k + vector_candidates.c.rank)
+                text_score = text_rank_weight / (self.rrf_k + text_candidates.c.rank)
+            elif self.hybrid_fusion == "weighted":
+                if self.distance == Distance.max_inner_product:
+                    # Assume embeddings are normalized, so inner product ranges from -1 to 1. Normalize to [0, 1]
+                    vector_score = self.vector_score_weight * (1 - vector_candidates.c.distance) / 2
+                else:
+                    # Invert and normalize the distance to get a similarity score between 0 and 1
+                    vector_score = self.vector_score_weight / (1 + vector_candidates.c.distance)
+                text_score = text_rank_weight * text_candidates.c.score
+            else:
+                logger.error(f"Unknown hybrid fusion: {self.hybrid_fusion}")
+                return []
+            hybrid_score = func.coalesce(vector_score, 0) + func.coalesce(text_score, 0)
+            fused = (
+                select(
+                    func.coalesce(vector_candidates.c.id, text_candidates.c.id).label("id"),
+                    hybrid_score.label("hybrid_score"),
+                )
+                .select_from(
+                    vector_candidates.join(text_candidates, vector_candidates.c.id == text_candidates.c.id, full=True)
+                )
+                .subquery("fused")
+            )
 
-            # Limit the number of results
-            stmt = stmt.limit(limit)
+            # Build the statement, ordering the results by the hybrid score in descending order
+            stmt = (
+                select(*columns, fused.c.hybrid_score)
+                .join_from(self.table, fused, self.table.c.id == fused.c.id)
+                .order_by(fused.c.hybrid_score.desc())
+                .limit(limit)
+            )
 
             # Log the query for debugging
             logger.debug(f"Hybrid search query: {stmt}")
@@ -723,7 +903,7 @@ class PgVector(VectorDb):
                         meta_data=result.meta_data,
                         content=result.content,
                         embedder=self.embedder,
-                        embedding=result.embedding,
+                        embedding=result.embedding if "embedding" in result._fields else None,
                         usage=result.usage,
                     )
                 )
@@ -944,7 +1124,7 @@ class PgVector(VectorDb):
         Args:
             force_recreate (bool): If True, existing index will be dropped and recreated.
         """
-        gin_index_name = f"{self.table_name}_content_gin_index"
+        gin_index_name = self.gin_index_name
 
         gin_index_exists = self._index_exists(gin_index_name)
 
@@ -962,15 +1142,52 @@ class PgVector(VectorDb):
             with self.Session() as sess, sess.begin():
                 logger.debug(f"Creating GIN index '{gin_index_name}' on table '{self.table.fullname}'.")
                 # Create index
-                create_gin_index_sql = text(
-                    f'CREATE INDEX "{gin_index_name}" ON {self.table.fullname} '
-                    f"USING GIN (to_tsvector({self.content_language}, content));"
-                )
+                if "content_tsv" in self.table.c:
+                    create_gin_index_sql = text(
+                        f'CREATE INDEX "{gin_index_name}" ON {self.table.fullname} USING GIN (content_tsv);'
+                    )
+                else:
+                    # Index the same expression that is used in the search queries
+                    create_gin_index_sql = text(
+                        f'CREATE INDEX "{gin_index_name}" ON {self.table.fullname} '
+                        f"USING GIN (({self.content_tsv_expression}));"
+                    )
                 sess.execute(create_gin_index_sql)
         except Exception as e:
             logger.error(f"Error creating GIN index '{gin_index_name}': {e}")
             raise
 
+    def upgrade_schema(self) -> None:
+        """
+        Upgrade an existing table to the configured schema version.
+
+        Version 2 adds the generated `content_tsv` column and its GIN index. Postgres computes the column for the
+        existing rows when it is added, which rewrites the table. The GIN index on the content expression used by
+        version 1 tables is dropped.
+        """
+        if self.schema_version < 2 or not self.table_exists():
+            return
+
+        columns = inspect(self.db_engine).get_columns(self.table_name, schema=self.schema)
+        if any(column["name"] == "content_tsv" for column in columns):
+            return
+
+        logger.info(f"Upgrading table '{self.table.fullname}' to schema version {self.schema_version}.")
+        preparer = self.db_engine.dialect.identifier_preparer
+        version_1_index_name = preparer.quote(f"{self.table_name}_content_gin_index")
+        if self.schema is not None:
+            version_1_index_name = f"{preparer.quote_schema(self.schema)}.{version_1_index_name}"
+        with self.Session() as sess, sess.begin():
+            sess.execute(
+                text(
+                    f"ALTER TABLE {preparer.format_table(self.table)} ADD COLUMN IF NOT EXISTS content_tsv tsvector "
+                    f"GENERATED ALWAYS AS ({self.content_tsv_expression}) STORED;"
+                )
+            )
+            sess.execute(text(f"DROP INDEX IF EXISTS {version_1_index_name};"))
+        self._create_gin_index()
+        logger.info(f"Upgraded table '{self.table.fullname}' to schema version {self.schema_version}.")
+
     def delete(self) -> bool:
         """
         Delete all records from the table.
@@ -1,4 +1,4 @@
-from typing import Optional, List, Union, Dict, Any
+from typing import Optional, List, Set, Union, Dict, Any
 from hashlib import md5
 
 try:
@@ -7,7 +7,7 @@ try:
     from sqlalchemy.inspection import inspect
     from sqlalchemy.orm import Session, sessionmaker
     from sqlalchemy.schema import MetaData, Table, Column
-    from sqlalchemy.sql.expression import text, func, select
+    from sqlalchemy.sql.expression import text, func, select, bindparam, any_
     from sqlalchemy.types import DateTime, String
 except ImportError:
     raise ImportError("`sqlalchemy` not installed")
@@ -129,6 +129,30 @@ class PgVector2(VectorDb):
                 result = sess.execute(stmt).first()
                 return result is not None
 
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """
+        Validate which documents exist, using a single query
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        return self._docs_exist_by_content_hash(documents)
+
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Get the content hashes that exist in the table
+
+        Args:
+            content_hashes (List[str]): Content hashes to look up
+        """
+        with self.Session() as sess:
+            with sess.begin():
+                stmt = select(self.table.c.content_hash).where(
+                    self.table.c.content_hash
+                    == any_(bindparam("content_hashes", value=content_hashes, type_=postgresql.ARRAY(String)))
+                )
+                return set(sess.execute(stmt).scalars().all())
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -158,8 +182,8 @@ class PgVector2(VectorDb):
     def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None, batch_size: int = 10) -> None:
         with self.Session() as sess:
             counter = 0
+            documents = Document.embed_documents(documents, embedder=self.embedder, batch_size=batch_size)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -201,8 +225,8 @@ class PgVector2(VectorDb):
         """
         with self.Session() as sess:
             counter = 0
+            documents = Document.embed_documents(documents, embedder=self.embedder, batch_size=batch_size)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -243,7 +267,9 @@ class PgVector2(VectorDb):
                 sess.commit()
                 logger.info(f"Committed {counter} documents")
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         query_embedding = self.embedder.get_embedding(query)
         if query_embedding is None:
             logger.error(f"Error getting embedding for Query: {query}")
@@ -253,9 +279,12 @@ class PgVector2(VectorDb):
             self.table.c.name,
             self.table.c.meta_data,
             self.table.c.content,
-            self.table.c.embedding,
             self.table.c.usage,
         ]
+        # Only select the embeddings if requested or needed by the reranker, they are the largest column
+        return_embeddings = return_embeddings or (self.reranker is not None and self.reranker.requires_embeddings)
+        if return_embeddings:
+            columns.append(self.table.c.embedding)
 
         stmt = select(*columns)
 
@@ -299,7 +328,7 @@ class PgVector2(VectorDb):
                     meta_data=neighbor.meta_data,
                     content=neighbor.content,
                     embedder=self.embedder,
-                    embedding=neighbor.embedding,
+                    embedding=neighbor.embedding if return_embeddings else None,
                     usage=neighbor.usage,
                 )
             )
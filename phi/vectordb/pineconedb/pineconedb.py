@@ -218,8 +218,8 @@ class PineconeDB(VectorDb):
         """
 
         vectors = []
+        documents = Document.embed_documents(documents, embedder=self.embedder)
         for document in documents:
-            document.embed(embedder=self.embedder)
             document.meta_data["text"] = document.content
             data_to_upsert = {
                 "id": document.id,
@@ -279,13 +279,16 @@ class PineconeDB(VectorDb):
         hdense = [v * alpha for v in dense]
         return hdense, hsparse
 
-    def search(
+    # namespace and include_values stay positional for existing callers, so return_embeddings is keyword-only
+    def search(  # type: ignore[override]
         self,
         query: str,
         limit: int = 5,
         filters: Optional[Dict[str, Union[str, float, int, bool, List, dict]]] = None,
         namespace: Optional[str] = None,
         include_values: Optional[bool] = None,
+        *,
+        return_embeddings: bool = False,
     ) -> List[Document]:
         """Search for similar documents in the index.
 
@@ -295,6 +298,7 @@ class PineconeDB(VectorDb):
             filters (Optional[Dict[str, Union[str, float, int, bool, List, dict]]], optional): The filter for the search. Defaults to None.
             namespace (Optional[str], optional): The namespace to search in. Defaults to None.
             include_values (Optional[bool], optional): Whether to include values in the search results. Defaults to None.
+            return_embeddings (bool, optional): Include the document embeddings in the results, if include_values is not set. Defaults to False.
             include_metadata (Optional[bool], optional): Whether to include metadata in the search results. Defaults to None.
 
         Returns:
@@ -303,6 +307,10 @@ class PineconeDB(VectorDb):
         """
         dense_embedding = self.embedder.get_embedding(query)
 
+        # Only return the vectors if requested or needed by the reranker
+        if include_values is None:
+            include_values = return_embeddings or (self.reranker is not None and self.reranker.requires_embeddings)
+
         if self.use_hybrid_search:
             sparse_embedding = self.sparse_encoder.encode_queries(query)
 
@@ -1,8 +1,11 @@
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from hashlib import md5
-from typing import List, Optional, Dict, Any
+from typing import Deque, Iterator, List, Optional, Dict, Any, Set
 
 try:
-    from qdrant_client import QdrantClient  # noqa: F401
+    from qdrant_client import AsyncQdrantClient, QdrantClient  # noqa: F401
     from qdrant_client.http import models
 except ImportError:
     raise ImportError(
@@ -14,6 +17,7 @@ from phi.embedder import Embedder
 from phi.vectordb.base import VectorDb
 from phi.vectordb.distance import Distance
 from phi.utils.log import logger
+from phi.utils.threads import run_in_thread
 from phi.reranker.base import Reranker
 
 
@@ -35,8 +39,25 @@ class Qdrant(VectorDb):
         host: Optional[str] = None,
         path: Optional[str] = None,
         reranker: Optional[Reranker] = None,
+        batch_size: int = 256,
+        embedding_workers: int = 4,
         **kwargs,
     ):
+        """
+        Initialize the Qdrant vector db.
+
+        Args:
+            collection: Name of the collection.
+            distance: Distance metric for the collection.
+            embedder: Embedder for the document contents.
+            location, url, port, grpc_port, prefer_grpc, https, api_key, prefix, timeout, host, path:
+                Arguments for the QdrantClient and AsyncQdrantClient. In local mode, with location ":memory:"
+                or a path, the async methods use the QdrantClient in a thread so that both share the collection.
+            reranker: Reranker for the search results.
+            batch_size: Number of documents embedded and uploaded per request when inserting.
+            embedding_workers: Number of batches embedded concurrently while the previous batches are uploaded.
+            kwargs: Additional arguments for the Qdrant clients.
+        """
         # Collection attributes
         self.collection: str = collection
 
@@ -51,8 +72,9 @@ class Qdrant(VectorDb):
         # Distance metric
         self.distance: Distance = distance
 
-        # Qdrant client instance
+        # Qdrant client instances
         self._client: Optional[QdrantClient] = None
+        self._async_client: Optional[AsyncQdrantClient] = None
 
         # Qdrant client arguments
         self.location: Optional[str] = location
@@ -70,42 +92,78 @@ class Qdrant(VectorDb):
         # Reranker instance
         self.reranker: Optional[Reranker] = reranker
 
+        # Insert settings
+        self.batch_size: int = batch_size
+        self.embedding_workers: int = embedding_workers
+        # Payload fields that have an index, created for the filters used when inserting
+        self._indexed_fields: Set[str] = set()
+
         # Qdrant client kwargs
         self.kwargs = kwargs
 
+    def _get_client_params(self) -> Dict[str, Any]:
+        return dict(
+            location=self.location,
+            url=self.url,
+            port=self.port,
+            grpc_port=self.grpc_port,
+            prefer_grpc=self.prefer_grpc,
+            https=self.https,
+            api_key=self.api_key,
+            prefix=self.prefix,
+            timeout=int(self.timeout) if self.timeout is not None else None,
+            host=self.host,
+            path=self.path,
+            **self.kwargs,
+        )
+
     @property
     def client(self) -> QdrantClient:
         if self._client is None:
             logger.debug("Creating Qdrant Client")
-            self._client = QdrantClient(
-                location=self.location,
-                url=self.url,
-                port=self.port,
-                grpc_port=self.grpc_port,
-                prefer_grpc=self.prefer_grpc,
-                https=self.https,
-                api_key=self.api_key,
-                prefix=self.prefix,
-                timeout=int(self.timeout) if self.timeout is not None else None,
-                host=self.host,
-                path=self.path,
-                **self.kwargs,
-            )
+            self._client = QdrantClient(**self._get_client_params())
         return self._client
 
-    def create(self) -> None:
+    @property
+    def is_local(self) -> bool:
+        """True if the collection is stored in this process, in memory or at a local path"""
+        return self.location == ":memory:" or self.path is not None
+
+    @property
+    def async_client(self) -> AsyncQdrantClient:
+        if self._async_client is None:
+            if self.is_local:
+                # A second local client would open a separate in-memory store, or fail to lock the path
+                raise ValueError("The async client is not available in local mode, use the client instead")
+            logger.debug("Creating Async Qdrant Client")
+            self._async_client = AsyncQdrantClient(**self._get_client_params())
+        return self._async_client
+
+    def _get_vectors_config(self) -> models.VectorParams:
         # Collection distance
         _distance = models.Distance.COSINE
         if self.distance == Distance.l2:
             _distance = models.Distance.EUCLID
         elif self.distance == Distance.max_inner_product:
             _distance = models.Distance.DOT
+        return models.VectorParams(size=self.dimensions, distance=_distance)
 
+    def create(self) -> None:
         if not self.exists():
             logger.debug(f"Creating collection: {self.collection}")
             self.client.create_collection(
                 collection_name=self.collection,
-                vectors_config=models.VectorParams(size=self.dimensions, distance=_distance),
+                vectors_config=self._get_vectors_config(),
+            )
+
+    async def acreate(self) -> None:
+        if self.is_local:
+            return await run_in_thread(self.create)
+        if not await self.async_client.collection_exists(self.collection):
+            logger.debug(f"Creating collection: {self.collection}")
+            await self.async_client.create_collection(
+                collection_name=self.collection,
+                vectors_config=self._get_vectors_config(),
             )
 
     def doc_exists(self, document: Document) -> bool:
@@ -125,6 +183,53 @@ class Qdrant(VectorDb):
             return len(collection_points) > 0
         return False
 
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """
+        Validate which documents exist, looking them up in batches
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        return self._docs_exist_by_content_hash(documents)
+
+    def existing_content_hashes(self, content_hashes: List[str], batch_size: int = 100) -> Set[str]:
+        """
+        Get the content hashes that exist in the collection
+
+        Args:
+            content_hashes (List[str]): Content hashes to look up
+            batch_size (int): Number of ids to look up per request
+        """
+        existing: Set[str] = set()
+        if self.client:
+            for i in range(0, len(content_hashes), batch_size):
+                points = self.client.retrieve(
+                    collection_name=self.collection,
+                    ids=content_hashes[i : i + batch_size],
+                    with_payload=False,
+                    with_vectors=False,
+                )
+                # Qdrant returns the md5 ids formatted as UUIDs
+                existing.update(str(point.id).replace("-", "") for point in points)
+        return existing
+
+    def delete_by_content_hash(self, content_hashes: List[str], batch_size: int = 100) -> None:
+        """
+        Delete the documents with the given content hashes from the collection
+
+        Args:
+            content_hashes (List[str]): Content hashes of the documents to delete
+            batch_size (int): Number of ids to delete per request
+        """
+        if not self.client:
+            return
+        for i in range(0, len(content_hashes), batch_size):
+            self.client.delete(
+                collection_name=self.collection,
+                points_selector=models.PointIdsList(points=content_hashes[i : i + batch_size]),
+                wait=True,
+            )
+
     def name_exists(self, name: str) -> bool:
         """
         Validates if a document with the given name exists in the collection.
@@ -146,37 +251,154 @@ class Qdrant(VectorDb):
             return len(scroll_result[0]) > 0
         return False
 
-    def insert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None, batch_size: int = 10) -> None:
+    @staticmethod
+    def _get_filter_key(key: str) -> str:
+        """Payload key for a filter. Filters set on insert are stored under "filters", dotted keys are used as is."""
+        return key if "." in key else f"filters.{key}"
+
+    @staticmethod
+    def _get_payload_schema(value: Any) -> Optional[models.PayloadSchemaType]:
+        if isinstance(value, (list, tuple)):
+            value = value[0] if len(value) > 0 else None
+        if isinstance(value, bool):
+            return models.PayloadSchemaType.BOOL
+        if isinstance(value, int):
+            return models.PayloadSchemaType.INTEGER
+        if isinstance(value, float):
+            return models.PayloadSchemaType.FLOAT
+        if isinstance(value, str):
+            return models.PayloadSchemaType.KEYWORD
+        return None
+
+    def _build_filter(self, filters: Optional[Dict[str, Any]]) -> Optional[models.Filter]:
         """
-        Insert documents into the database.
+        Translate a filters dict into a Qdrant payload filter.
+
+        Each key must match: lists match any of their values, dicts are ranges (e.g. {"gte": 1, "lt": 5}),
+        None matches missing or null values and other values match exactly.
 
         Args:
-            documents (List[Document]): List of documents to insert
-            filters (Optional[Dict[str, Any]]): Filters to apply while inserting documents
-            batch_size (int): Batch size for inserting documents
+            filters (Optional[Dict[str, Any]]): Filters to translate
         """
-        logger.debug(f"Inserting {len(documents)} documents")
+        if not filters:
+            return None
+        conditions: List[Any] = []
+        for key, value in filters.items():
+            payload_key = self._get_filter_key(key)
+            if value is None:
+                conditions.append(models.IsEmptyCondition(is_empty=models.PayloadField(key=payload_key)))
+            elif isinstance(value, (list, tuple)):
+                conditions.append(models.FieldCondition(key=payload_key, match=models.MatchAny(any=list(value))))
+            elif isinstance(value, dict):
+                conditions.append(models.FieldCondition(key=payload_key, range=models.Range(**value)))
+            else:
+                conditions.append(models.FieldCondition(key=payload_key, match=models.MatchValue(value=value)))
+        return models.Filter(must=conditions)
+
+    def _get_missing_payload_indexes(self, filters: Optional[Dict[str, Any]]) -> Dict[str, models.PayloadSchemaType]:
+        """Get the payload indexes needed to filter on the given filters that were not created yet"""
+        indexes: Dict[str, models.PayloadSchemaType] = {}
+        for key, value in (filters or {}).items():
+            payload_key = self._get_filter_key(key)
+            schema = self._get_payload_schema(value)
+            if schema is not None and payload_key not in self._indexed_fields:
+                indexes[payload_key] = schema
+        return indexes
+
+    def create_payload_indexes(self, filters: Optional[Dict[str, Any]]) -> None:
+        """
+        Create payload indexes for the filter keys, so that filtered searches do not scan the collection.
+
+        Args:
+            filters (Optional[Dict[str, Any]]): Filters to index
+        """
+        for field_name, field_schema in self._get_missing_payload_indexes(filters).items():
+            logger.debug(f"Creating payload index: {field_name}")
+            self.client.create_payload_index(
+                collection_name=self.collection, field_name=field_name, field_schema=field_schema
+            )
+            self._indexed_fields.add(field_name)
+
+    async def acreate_payload_indexes(self, filters: Optional[Dict[str, Any]]) -> None:
+        if self.is_local:
+            return await run_in_thread(self.create_payload_indexes, filters)
+        for field_name, field_schema in self._get_missing_payload_indexes(filters).items():
+            logger.debug(f"Creating payload index: {field_name}")
+            await self.async_client.create_payload_index(
+                collection_name=self.collection, field_name=field_name, field_schema=field_schema
+            )
+            self._indexed_fields.add(field_name)
+
+    def _build_points(
+        self, documents: List[Document], filters: Optional[Dict[str, Any]] = None
+    ) -> List[models.PointStruct]:
+        """
+        Embed the documents and build the points to upload, keyed by the content hash
+
+        Args:
+            documents (List[Document]): Documents to convert
+            filters (Optional[Dict[str, Any]]): Filters stored with the points
+        """
+        documents = Document.embed_documents(documents, embedder=self.embedder, batch_size=len(documents))
         points = []
         for document in documents:
-            document.embed(embedder=self.embedder)
             cleaned_content = document.content.replace("\x00", "\ufffd")
             doc_id = md5(cleaned_content.encode()).hexdigest()
-            points.append(
-                models.PointStruct(
-                    id=doc_id,
-                    vector=document.embedding,
-                    payload={
-                        "name": document.name,
-                        "meta_data": document.meta_data,
-                        "content": cleaned_content,
-                        "usage": document.usage,
-                    },
-                )
-            )
-            logger.debug(f"Inserted document: {document.name} ({document.meta_data})")
-        if len(points) > 0:
+            payload: Dict[str, Any] = {
+                "name": document.name,
+                "meta_data": document.meta_data,
+                "content": cleaned_content,
+                "usage": document.usage,
+            }
+            if filters:
+                payload["filters"] = filters
+            points.append(models.PointStruct(id=doc_id, vector=document.embedding, payload=payload))
+        return points
+
+    def _embed_batches(
+        self, documents: List[Document], filters: Optional[Dict[str, Any]] = None, batch_size: Optional[int] = None
+    ) -> Iterator[List[models.PointStruct]]:
+        """
+        Yield the points for each batch of documents, in order.
+
+        Batches are embedded on `embedding_workers` threads, at most `embedding_workers` batches ahead of the
+        batch being consumed, so embedding overlaps the upload of the previous batches.
+        """
+        _batch_size = batch_size or self.batch_size
+        batches = [documents[i : i + _batch_size] for i in range(0, len(documents), _batch_size)]
+        if self.embedding_workers <= 1 or len(batches) <= 1:
+            for batch in batches:
+                yield self._build_points(batch, filters)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.embedding_workers, thread_name_prefix="phi-qdrant") as executor:
+            pending: Deque[Future] = deque()
+            for batch in batches:
+                pending.append(executor.submit(self._build_points, batch, filters))
+                if len(pending) > self.embedding_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def insert(
+        self, documents: List[Document], filters: Optional[Dict[str, Any]] = None, batch_size: Optional[int] = None
+    ) -> None:
+        """
+        Insert documents into the database, embedding and uploading them in batches.
+
+        Args:
+            documents (List[Document]): List of documents to insert
+            filters (Optional[Dict[str, Any]]): Filters stored with the documents, used to filter searches
+            batch_size (Optional[int]): Number of documents per batch, defaults to `self.batch_size`
+        """
+        logger.debug(f"Inserting {len(documents)} documents")
+        self.create_payload_indexes(filters)
+        count = 0
+        for points in self._embed_batches(documents, filters, batch_size):
             self.client.upsert(collection_name=self.collection, wait=False, points=points)
-        logger.debug(f"Upsert {len(points)} documents")
+            count += len(points)
+            logger.debug(f"Upserted batch of {len(points)} documents")
+        logger.debug(f"Upsert {count} documents")
 
     def upsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -187,31 +409,43 @@ class Qdrant(VectorDb):
             filters (Optional[Dict[str, Any]]): Filters to apply while upserting
         """
         logger.debug("Redirecting the request to insert")
-        self.insert(documents)
+        self.insert(documents, filters=filters)
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    async def ainsert(
+        self, documents: List[Document], filters: Optional[Dict[str, Any]] = None, batch_size: Optional[int] = None
+    ) -> None:
         """
-        Search for documents in the database.
+        Insert documents into the database using the async client.
+
+        Up to `embedding_workers` batches are embedded in threads and uploaded concurrently.
 
         Args:
-            query (str): Query to search for
-            limit (int): Number of search results to return
-            filters (Optional[Dict[str, Any]]): Filters to apply while searching
+            documents (List[Document]): List of documents to insert
+            filters (Optional[Dict[str, Any]]): Filters stored with the documents, used to filter searches
+            batch_size (Optional[int]): Number of documents per batch, defaults to `self.batch_size`
         """
-        query_embedding = self.embedder.get_embedding(query)
-        if query_embedding is None:
-            logger.error(f"Error getting embedding for Query: {query}")
-            return []
-
-        results = self.client.search(
-            collection_name=self.collection,
-            query_vector=query_embedding,
-            with_vectors=True,
-            with_payload=True,
-            limit=limit,
+        if self.is_local:
+            return await run_in_thread(self.insert, documents, filters, batch_size)
+        logger.debug(f"Inserting {len(documents)} documents (async)")
+        await self.acreate_payload_indexes(filters)
+        _batch_size = batch_size or self.batch_size
+        semaphore = asyncio.Semaphore(max(self.embedding_workers, 1))
+
+        async def insert_batch(batch: List[Document]) -> int:
+            async with semaphore:
+                points = await run_in_thread(self._build_points, batch, filters)
+                await self.async_client.upsert(collection_name=self.collection, wait=False, points=points)
+                return len(points)
+
+        counts = await asyncio.gather(
+            *[insert_batch(documents[i : i + _batch_size]) for i in range(0, len(documents), _batch_size)]
         )
+        logger.debug(f"Upsert {sum(counts)} documents")
 
-        # Build search results
+    async def aupsert(self, documents: List[Document], filters: Optional[Dict[str, Any]] = None) -> None:
+        await self.ainsert(documents, filters=filters)
+
+    def _build_search_results(self, results: List[models.ScoredPoint]) -> List[Document]:
         search_results: List[Document] = []
         for result in results:
             if result.payload is None:
@@ -222,16 +456,76 @@ class Qdrant(VectorDb):
                     meta_data=result.payload["meta_data"],
                     content=result.payload["content"],
                     embedder=self.embedder,
-                    embedding=result.vector,
+                    embedding=result.vector,  # type: ignore
                     usage=result.payload["usage"],
                 )
             )
+        return search_results
+
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
+        """
+        Search for documents in the database.
+
+        Args:
+            query (str): Query to search for
+            limit (int): Number of search results to return
+            filters (Optional[Dict[str, Any]]): Filters to apply while searching
+            return_embeddings (bool): Include the document embeddings in the results
+        """
+        query_embedding = self.embedder.get_embedding(query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        results = self.client.query_points(
+            collection_name=self.collection,
+            query=query_embedding,
+            query_filter=self._build_filter(filters),
+            with_vectors=return_embeddings or (self.reranker is not None and self.reranker.requires_embeddings),
+            with_payload=True,
+            limit=limit,
+        )
+
+        # Build search results
+        search_results = self._build_search_results(results.points)
 
         if self.reranker:
             search_results = self.reranker.rerank(query=query, documents=search_results)
 
         return search_results
 
+    async def asearch(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
+        """
+        Search for documents in the database using the async client. See search().
+        """
+        if self.is_local:
+            return await run_in_thread(self.search, query, limit, filters, return_embeddings)
+        query_embedding = await run_in_thread(self.embedder.get_embedding, query)
+        if query_embedding is None:
+            logger.error(f"Error getting embedding for Query: {query}")
+            return []
+
+        results = await self.async_client.query_points(
+            collection_name=self.collection,
+            query=query_embedding,
+            query_filter=self._build_filter(filters),
+            with_vectors=return_embeddings or (self.reranker is not None and self.reranker.requires_embeddings),
+            with_payload=True,
+            limit=limit,
+        )
+
+        # Build search results
+        search_results = self._build_search_results(results.points)
+
+        if self.reranker:
+            search_results = await run_in_thread(self.reranker.rerank, query=query, documents=search_results)
+
+        return search_results
+
     def drop(self) -> None:
         if self.exists():
             logger.debug(f"Deleting collection: {self.collection}")
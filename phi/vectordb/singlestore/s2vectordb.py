@@ -1,5 +1,5 @@
 import json
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Set, Dict, Any
 from hashlib import md5
 
 try:
@@ -144,6 +144,26 @@ class S2VectorDb(VectorDb):
             result = sess.execute(stmt).first()
             return result is not None
 
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        """
+        Validate which documents exist, using a single query
+
+        Args:
+            documents (List[Document]): Documents to validate
+        """
+        return self._docs_exist_by_content_hash(documents)
+
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        """
+        Get the content hashes that exist in the table
+
+        Args:
+            content_hashes (List[str]): Content hashes to look up
+        """
+        with self.Session.begin() as sess:
+            stmt = select(self.table.c.content_hash).where(self.table.c.content_hash.in_(content_hashes))
+            return set(sess.execute(stmt).scalars().all())
+
     def name_exists(self, name: str) -> bool:
         """
         Validate if a row with this name exists or not
@@ -179,8 +199,8 @@ class S2VectorDb(VectorDb):
         """
         with self.Session.begin() as sess:
             counter = 0
+            documents = Document.embed_documents(documents, embedder=self.embedder, batch_size=batch_size)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -218,8 +238,8 @@ class S2VectorDb(VectorDb):
         """
         with self.Session.begin() as sess:
             counter = 0
+            documents = Document.embed_documents(documents, embedder=self.embedder, batch_size=batch_size)
             for document in documents:
-                document.embed(embedder=self.embedder)
                 cleaned_content = document.content.replace("\x00", "\ufffd")
                 content_hash = md5(cleaned_content.encode()).hexdigest()
                 _id = document.id or content_hash
@@ -257,7 +277,9 @@ class S2VectorDb(VectorDb):
             sess.commit()
             logger.debug(f"Committed {counter} documents")
 
-    def search(self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None) -> List[Document]:
+    def search(
+        self, query: str, limit: int = 5, filters: Optional[Dict[str, Any]] = None, return_embeddings: bool = False
+    ) -> List[Document]:
         """
         Search for documents based on a query and optional filters.
 
@@ -265,6 +287,7 @@ class S2VectorDb(VectorDb):
             query (str): The search query.
             limit (int): The maximum number of results to return.
             filters (Optional[Dict[str, Any]]): Optional filters for the search.
+            return_embeddings (bool): Include the document embeddings in the results.
 
         Returns:
             List[Document]: List of documents that match the query.
@@ -278,9 +301,14 @@ class S2VectorDb(VectorDb):
             self.table.c.name,
             self.table.c.meta_data,
             self.table.c.content,
-            self.table.c.embedding,
             self.table.c.usage,
         ]
+        # Only select the embeddings if requested or needed by the reranker, they are the largest column
+        return_embeddings = return_embeddings or (self.reranker is not None and self.reranker.requires_embeddings)
+        if return_embeddings:
+            columns.append(
+                self.table.c.embedding,
+            )
 
         stmt = select(*columns)
 
@@ -323,7 +351,9 @@ class S2VectorDb(VectorDb):
             meta_data_dict = json.loads(neighbor.meta_data) if neighbor.meta_data else {}
             usage_dict = json.loads(neighbor.usage) if neighbor.usage else {}
             # Convert the embedding mysql.TEXT back into a list
-            embedding_list = json.loads(neighbor.embedding) if neighbor.embedding else []
+            embedding_list = None
+            if return_embeddings:
+                embedding_list = json.loads(neighbor.embedding) if neighbor.embedding else []
 
             search_results.append(
                 Document(
@@ -31,3 +31,62 @@ class WorkflowSession(BaseModel):
 
     def telemetry_data(self) -> Dict[str, Any]:
         return self.model_dump(include={"created_at", "updated_at"})
+
+
+class WorkflowSessionSummary(BaseModel):
+    """Lightweight view of a WorkflowSession, used to list sessions without loading their memory"""
+
+    # Session UUID
+    session_id: str
+    # ID of the workflow that this session is associated with
+    workflow_id: Optional[str] = None
+    # ID of the user interacting with this workflow
+    user_id: Optional[str] = None
+    # Name of the session, from the session data
+    session_name: Optional[str] = None
+    # The session name, or the first line of the first response in the session
+    title: Optional[str] = None
+    # The Unix timestamp when this session was created
+    created_at: Optional[int] = None
+    # The Unix timestamp when this session was last updated
+    updated_at: Optional[int] = None
+
+    @staticmethod
+    def get_title(session_name: Optional[str], has_runs: bool, first_response_content: Optional[Any]) -> str:
+        """Get the title from the session name or the response of the first run in the session."""
+        if session_name is not None:
+            return session_name
+        if not has_runs:
+            return "Unnamed session"
+        if not first_response_content:
+            return "No title"
+        return str(first_response_content).split("\n")[0]
+
+    @classmethod
+    def from_first_response(
+        cls, has_runs: bool = False, first_response_content: Optional[Any] = None, **kwargs: Any
+    ) -> "WorkflowSessionSummary":
+        summary = cls(**kwargs)
+        summary.title = cls.get_title(summary.session_name, has_runs, first_response_content)
+        return summary
+
+    @classmethod
+    def from_session(cls, session: WorkflowSession) -> "WorkflowSessionSummary":
+        has_runs = False
+        first_response_content: Optional[Any] = None
+        if session.memory is not None:
+            runs = session.memory.get("runs")
+            if isinstance(runs, list) and len(runs) > 0:
+                has_runs = True
+                response = runs[0].get("response") if isinstance(runs[0], dict) else None
+                first_response_content = response.get("content") if response else None
+        return cls.from_first_response(
+            has_runs=has_runs,
+            first_response_content=first_response_content,
+            session_id=session.session_id,
+            workflow_id=session.workflow_id,
+            user_id=session.user_id,
+            session_name=session.session_data.get("session_name") if session.session_data else None,
+            created_at=session.created_at,
+            updated_at=session.updated_at,
+        )
@@ -214,6 +214,28 @@ class Workflow(BaseModel):
             self._workflow_session = self.storage.upsert(session=self.get_workflow_session())
         return self._workflow_session
 
+    async def aread_from_storage(self) -> Optional[WorkflowSession]:
+        """Load the WorkflowSession from storage without blocking the event loop.
+
+        Returns:
+            Optional[WorkflowSession]: The loaded WorkflowSession or None if not found.
+        """
+        if self.storage is not None and self.session_id is not None:
+            self._workflow_session = await self.storage.aread(session_id=self.session_id)
+            if self._workflow_session is not None:
+                self.from_workflow_session(session=self._workflow_session)
+        return self._workflow_session
+
+    async def awrite_to_storage(self) -> Optional[WorkflowSession]:
+        """Save the WorkflowSession to storage without blocking the event loop.
+
+        Returns:
+            Optional[WorkflowSession]: The saved WorkflowSession or None if not saved.
+        """
+        if self.storage is not None:
+            self._workflow_session = await self.storage.aupsert(session=self.get_workflow_session())
+        return self._workflow_session
+
     def load_session(self, force: bool = False) -> Optional[str]:
         """Load an existing session from the database and return the session_id.
         If a session does not exist, create a new session.
@@ -245,6 +267,27 @@ class Workflow(BaseModel):
                 self.log_workflow_session()
         return self.session_id
 
+    async def aload_session(self, force: bool = False) -> Optional[str]:
+        """Load an existing session from the database without blocking the event loop and return the session_id.
+        If a session does not exist, create a new session.
+        """
+        if self._workflow_session is not None and not force:
+            if self.session_id is not None and self._workflow_session.session_id == self.session_id:
+                return self._workflow_session.session_id
+
+        if self.storage is not None:
+            logger.debug(f"Reading WorkflowSession: {self.session_id}")
+            await self.aread_from_storage()
+
+            if self._workflow_session is None:
+                logger.debug("-*- Creating new WorkflowSession")
+                await self.awrite_to_storage()
+                if self._workflow_session is None:
+                    raise Exception("Failed to create new WorkflowSession in storage")
+                logger.debug(f"-*- Created WorkflowSession: {self._workflow_session.session_id}")
+                self.log_workflow_session()
+        return self.session_id
+
     def run(self, *args: Any, **kwargs: Any):
         logger.error(f"{self.__class__.__name__}.run() method not implemented.")
         return
@@ -384,6 +427,23 @@ class Workflow(BaseModel):
             raise ValueError("Storage is not set")
         self.storage.delete_session(session_id)
 
+    async def arename_session(self, session_id: str, name: str):
+        if self.storage is None:
+            raise ValueError("Storage is not set")
+        workflow_session = await self.storage.aread(session_id)
+        if workflow_session is None:
+            raise Exception(f"WorkflowSession not found: {session_id}")
+        if workflow_session.session_data is not None:
+            workflow_session.session_data["session_name"] = name
+        else:
+            workflow_session.session_data = {"session_name": name}
+        await self.storage.aupsert(workflow_session)
+
+    async def adelete_session(self, session_id: str):
+        if self.storage is None:
+            raise ValueError("Storage is not set")
+        await self.storage.adelete_session(session_id)
+
     def deep_copy(self, *, update: Optional[Dict[str, Any]] = None) -> "Workflow":
         """Create and return a deep copy of this Workflow, optionally updating fields.
 
@@ -400,7 +460,7 @@ class Workflow(BaseModel):
             field_value = getattr(self, field_name)
             if field_value is not None:
                 if isinstance(field_value, Agent):
-                    fields_for_new_workflow[field_name] = field_value.deep_copy()
+                    fields_for_new_workflow[field_name] = field_value.copy_for_run()
                 else:
                     fields_for_new_workflow[field_name] = self._deep_copy_field(field_name, field_value)
 
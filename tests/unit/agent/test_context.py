@@ -0,0 +1,61 @@
+import pytest
+
+pytest.importorskip("phi.agent")
+
+from phi.agent import Agent  # noqa: E402
+from phi.model.message import Message  # noqa: E402
+from phi.utils.tokens import TRUNCATED_TOOL_RESULT_TOKENS, Tokenizer  # noqa: E402
+
+
+@pytest.fixture
+def tokenizer() -> Tokenizer:
+    return Tokenizer(name="chars", chars_per_token=4.0)
+
+
+def get_history(tool_result: str):
+    return [
+        Message(role="user", content="first question"),
+        Message(role="assistant", tool_calls=[{"id": "call_1", "function": {"name": "search", "arguments": "{}"}}]),
+        Message(role="tool", tool_call_id="call_1", content=tool_result),
+        Message(role="assistant", content="first answer"),
+        Message(role="user", content="second question"),
+        Message(role="assistant", content="second answer"),
+    ]
+
+
+def test_history_that_fits_is_unchanged(tokenizer):
+    history = get_history("short result")
+    assert Agent().fit_history_to_context(history, max_tokens=10_000, tokenizer=tokenizer) is history
+
+
+def test_long_tool_results_are_truncated_first(tokenizer):
+    history = get_history("x" * 40_000)
+    max_tokens = sum(m.get_token_count(tokenizer) for m in history) - 1000
+
+    fitted = Agent().fit_history_to_context(history, max_tokens=max_tokens, tokenizer=tokenizer)
+    assert [m.role for m in fitted] == [m.role for m in history]
+    assert fitted[2].content.endswith("\n[truncated]")
+    assert tokenizer.count(fitted[2].content) <= TRUNCATED_TOOL_RESULT_TOKENS + 5
+    # The messages in memory are not modified
+    assert history[2].content == "x" * 40_000
+
+
+def test_oldest_runs_are_dropped_with_their_tool_calls(tokenizer):
+    history = get_history("short result")
+    last_run_tokens = sum(m.get_token_count(tokenizer) for m in history[4:])
+
+    fitted = Agent().fit_history_to_context(history, max_tokens=last_run_tokens, tokenizer=tokenizer)
+    assert fitted == history[4:]
+    assert Agent().fit_history_to_context(history, max_tokens=1, tokenizer=tokenizer) == []
+
+
+def test_leading_references_that_fit_are_kept(tokenizer):
+    agent = Agent()
+    references = [{"content": "a" * 400}, {"content": "b" * 400}, {"content": "c" * 40}]
+    one_reference_tokens = tokenizer.count(agent.convert_documents_to_string(references[:1]))
+
+    assert agent.fit_references_to_context(references, max_tokens=10_000, tokenizer=tokenizer) == references
+    # References are kept in order, a later smaller reference does not replace a dropped one
+    fitted = agent.fit_references_to_context(references, max_tokens=one_reference_tokens + 10, tokenizer=tokenizer)
+    assert fitted == references[:1]
+    assert agent.fit_references_to_context(references, max_tokens=0, tokenizer=tokenizer) == []
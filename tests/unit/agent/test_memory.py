@@ -0,0 +1,30 @@
+import pytest
+
+pytest.importorskip("phi.agent")
+
+from phi.agent import Agent  # noqa: E402
+from phi.memory.agent import AgentMemory, MemoryRetrieval  # noqa: E402
+from phi.memory.row import MemoryRow  # noqa: E402
+
+
+def test_semantic_retrieval_loads_only_the_memories_relevant_to_the_message(memory_db, embedder, monkeypatch):
+    for memory in ["cooks food every day", "owns a pet cat"]:
+        memory_db.upsert_memory(MemoryRow(user_id="user", memory={"memory": memory}))
+    reads = []
+    read_memories = memory_db.read_memories
+    monkeypatch.setattr(memory_db, "read_memories", lambda **kwargs: reads.append(kwargs) or read_memories(**kwargs))
+    agent = Agent(
+        user_id="user",
+        memory=AgentMemory(
+            db=memory_db,
+            create_user_memories=True,
+            retrieval=MemoryRetrieval.semantic,
+            num_memories=1,
+            embedder=embedder,
+        ),
+    )
+
+    agent.read_from_storage(memory_query="what pet do I own?")
+    assert [memory.memory for memory in agent.memory.memories or []] == ["owns a pet cat"]
+    # The memories are only read to be ranked, without loading the most recent memories first
+    assert all(read.get("limit") is None for read in reads)
@@ -0,0 +1,29 @@
+import pytest
+
+pytest.importorskip("phi.agent")
+
+from phi.agent.session import AgentSession, AgentSessionSummary  # noqa: E402
+
+
+def test_title_is_the_first_user_message():
+    session = AgentSession(
+        session_id="s1",
+        memory={
+            "runs": [
+                {"response": {"content": "Hello"}},
+                {"message": {"role": "system", "content": "Be brief"}},
+                {"message": {"role": "user", "content": "What is the weather?"}},
+                {"message": {"role": "user", "content": "And tomorrow?"}},
+            ]
+        },
+    )
+    assert AgentSessionSummary.from_session(session).title == "What is the weather?"
+
+
+def test_session_name_is_the_title():
+    session = AgentSession(
+        session_id="s1",
+        session_data={"session_name": "Weather"},
+        memory={"runs": [{"message": {"role": "user", "content": "What is the weather?"}}]},
+    )
+    assert AgentSessionSummary.from_session(session).title == "Weather"
@@ -0,0 +1,55 @@
+import json
+
+from threading import Event
+
+from phi.api.exporter import EventExporter, StreamSink
+
+
+def test_exporter_batches_and_flushes(list_sink):
+    sink = list_sink
+    exporter = EventExporter(sink=sink, batch_size=2, flush_interval=60)
+    for i in range(5):
+        assert exporter.submit("/route", {"i": i})
+    assert exporter.flush()
+    assert [p["i"] for batch in sink.batches for p in batch] == [0, 1, 2, 3, 4]
+    assert all(len(batch) <= 2 for batch in sink.batches)
+    exporter.shutdown()
+    assert not exporter.submit("/route", {"i": 5})
+
+
+def test_exporter_drops_when_full(list_sink):
+    exporter = EventExporter(sink=list_sink, max_queue_size=1, flush_interval=60)
+    # Hold the queue full without starting the exporter thread
+    exporter._ensure_thread = lambda: None  # type: ignore
+    assert exporter.submit("/route", {"i": 0})
+    assert not exporter.submit("/route", {"i": 1})
+    exporter.drop_policy = "drop_oldest"
+    assert exporter.submit("/route", {"i": 2})
+    assert exporter.dropped == 2
+    assert exporter._queue.get_nowait()[0].payload == {"i": 2}
+
+
+def test_drop_oldest_keeps_pending_flushes(list_sink):
+    exporter = EventExporter(sink=list_sink, max_queue_size=2, flush_interval=60, drop_policy="drop_oldest")
+    exporter._ensure_thread = lambda: None  # type: ignore
+    done = Event()
+    exporter._queue.put_nowait((None, done))
+    assert exporter.submit("/route", {"i": 0})
+    assert exporter.submit("/route", {"i": 1})
+    assert exporter.dropped == 1
+    assert exporter._queue.get_nowait() == (None, done)
+    assert exporter._queue.get_nowait()[0].payload == {"i": 1}
+
+    # A queue holding only flush requests drops the new event
+    exporter._queue.put_nowait((None, Event()))
+    exporter._queue.put_nowait((None, Event()))
+    assert not exporter.submit("/route", {"i": 2})
+
+
+def test_stream_sink_writes_json_lines(tmp_path):
+    path = tmp_path / "events.jsonl"
+    exporter = EventExporter(sink=StreamSink(path=str(path)), flush_interval=60)
+    exporter.submit("/route", {"run": {"run_id": "1"}})
+    exporter.shutdown()
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["payload"] for line in lines] == [{"run": {"run_id": "1"}}]
@@ -0,0 +1,180 @@
+from hashlib import md5
+from typing import Dict, List, Optional, Set, Tuple
+
+import pytest
+
+from phi.api.exporter import EventSink, ExportEvent
+from phi.document import Document
+from phi.embedder.base import Embedder
+from phi.memory.db import MemoryDb
+from phi.memory.row import MemoryRow
+from phi.vectordb.base import VectorDb
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class FakeEmbedder(Embedder):
+    """Embeds texts by the keywords "food" and "pet", counting requests and embedded texts."""
+
+    dimensions: int = 2
+    # Number of requests made to the embedder, and number of texts embedded
+    requests: int = 0
+    calls: int = 0
+    # The next `rate_limited_requests` batch requests fail with a rate limit error
+    rate_limited_requests: int = 0
+    # Texts containing this string cannot be embedded
+    fail_on: Optional[str] = None
+
+    def _embed(self, text: str) -> List[float]:
+        if self.fail_on is not None and self.fail_on in text:
+            raise ValueError(f"Cannot embed: {text}")
+        self.calls += 1
+        return [float("food" in text), float("pet" in text) + 0.01]
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embedding_and_usage(text)[0]
+
+    def get_embedding_and_usage(self, text: str) -> Tuple[List[float], Optional[Dict]]:
+        self.requests += 1
+        return self._embed(text), {"total_tokens": len(text.split())}
+
+    def get_embeddings_and_usage(self, texts: List[str]) -> Tuple[List[List[float]], Optional[Dict]]:
+        self.requests += 1
+        if self.rate_limited_requests > 0:
+            self.rate_limited_requests -= 1
+            raise RateLimitError("Rate limit reached for requests")
+        return [self._embed(text) for text in texts], {"total_tokens": sum(len(text.split()) for text in texts)}
+
+
+@pytest.fixture
+def embedder() -> FakeEmbedder:
+    return FakeEmbedder()
+
+
+class InMemoryVectorDb(VectorDb):
+    """Stores documents by the md5 hash of their content, recording the writes and existence lookups."""
+
+    def __init__(self, embedder: Optional[Embedder] = None):
+        self.embedder = embedder or FakeEmbedder()
+        self.rows: Dict[str, Document] = {}
+        # Number of documents in each insert or upsert
+        self.writes: List[int] = []
+        # Content hashes looked up by each existing_content_hashes call
+        self.lookups: List[List[str]] = []
+
+    @staticmethod
+    def content_hash(document: Document) -> str:
+        return md5(document.content.encode()).hexdigest()
+
+    def create(self) -> None:
+        pass
+
+    def doc_exists(self, document: Document) -> bool:
+        return self.content_hash(document) in self.rows
+
+    def docs_exist(self, documents: List[Document]) -> List[bool]:
+        return self._docs_exist_by_content_hash(documents)
+
+    def existing_content_hashes(self, content_hashes: List[str]) -> Set[str]:
+        self.lookups.append(content_hashes)
+        return {content_hash for content_hash in content_hashes if content_hash in self.rows}
+
+    def name_exists(self, name: str) -> bool:
+        return False
+
+    def id_exists(self, id: str) -> bool:
+        return False
+
+    def insert(self, documents: List[Document], filters: Optional[Dict] = None) -> None:
+        documents = Document.embed_documents(documents, embedder=self.embedder)
+        self.writes.append(len(documents))
+        self.rows.update({self.content_hash(document): document for document in documents})
+
+    def upsert(self, documents: List[Document], filters: Optional[Dict] = None) -> None:
+        self.insert(documents, filters)
+
+    def delete_by_content_hash(self, content_hashes: List[str]) -> None:
+        for content_hash in content_hashes:
+            self.rows.pop(content_hash, None)
+
+    def search(self, query: str, limit: int = 5, filters: Optional[Dict] = None) -> List[Document]:
+        return []
+
+    def drop(self) -> None:
+        self.rows = {}
+
+    def exists(self) -> bool:
+        return True
+
+    def delete(self) -> bool:
+        self.rows = {}
+        return True
+
+
+@pytest.fixture
+def vector_db(embedder: FakeEmbedder) -> InMemoryVectorDb:
+    return InMemoryVectorDb(embedder=embedder)
+
+
+class ListSink(EventSink):
+    """Collects the payloads of exported events, one list per batch."""
+
+    def __init__(self):
+        self.batches: List[List[Dict]] = []
+
+    def export(self, events: List[ExportEvent]) -> None:
+        self.batches.append([event.payload for event in events])
+
+
+@pytest.fixture
+def list_sink() -> ListSink:
+    return ListSink()
+
+
+class InMemoryDb(MemoryDb):
+    """Stores memory rows in a dict. Embeddings are stored, but only returned by read_memory_embeddings."""
+
+    def __init__(self):
+        self.rows: Dict[str, MemoryRow] = {}
+
+    def create(self) -> None:
+        pass
+
+    def memory_exists(self, memory: MemoryRow) -> bool:
+        return memory.id in self.rows
+
+    def read_memories(
+        self, user_id: Optional[str] = None, limit: Optional[int] = None, sort: Optional[str] = None
+    ) -> List[MemoryRow]:
+        rows = [row.model_copy(update={"embedding": None}) for row in self.rows.values()]
+        rows = [row for row in rows if user_id is None or row.user_id == user_id]
+        if sort != "asc":
+            rows.reverse()
+        return rows[:limit] if limit is not None else rows
+
+    def read_memory_embeddings(self, ids: List[str]) -> Dict[str, List[float]]:
+        return {id: self.rows[id].embedding for id in ids if self.rows[id].embedding is not None}  # type: ignore
+
+    def upsert_memory(self, memory: MemoryRow) -> Optional[MemoryRow]:
+        self.rows[memory.id] = memory.model_copy()  # type: ignore
+        return memory
+
+    def delete_memory(self, id: str) -> None:
+        self.rows.pop(id, None)
+
+    def drop_table(self) -> None:
+        self.rows = {}
+
+    def table_exists(self) -> bool:
+        return True
+
+    def clear(self) -> bool:
+        self.rows = {}
+        return True
+
+
+@pytest.fixture
+def memory_db() -> InMemoryDb:
+    return InMemoryDb()
@@ -0,0 +1,109 @@
+import asyncio
+from functools import partial
+from typing import Dict, List
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("bs4")
+
+import phi.document.reader.website as website  # noqa: E402
+from phi.document.reader.website import WebsiteReader  # noqa: E402
+
+ROBOTS = "User-agent: *\nDisallow: /private\nSitemap: https://example.com/sitemap.xml\n"
+SITEMAP = (
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+    "<url><loc>https://example.com/from-sitemap</loc></url>"
+    "<url><loc>https://other.org/elsewhere</loc></url>"
+    "</urlset>"
+)
+PAGES = {
+    "/": '<main>Home</main><a href="/about">About</a><a href="/private/page">Private</a>',
+    "/about": '<main>About</main><a href="/">Home</a><a href="/team">Team</a>',
+    "/team": "<main>Team</main>",
+    "/from-sitemap": "<main>From the sitemap</main>",
+    "/private/page": "<main>Private</main>",
+}
+
+
+class Site:
+    """Serves the pages with an ETag, answering conditional requests for unchanged pages with 304."""
+
+    def __init__(self):
+        self.requests: List[httpx.Request] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if path == "/robots.txt":
+            return httpx.Response(200, text=ROBOTS)
+        if path == "/sitemap.xml":
+            return httpx.Response(200, text=SITEMAP)
+        if path not in PAGES:
+            return httpx.Response(404)
+        etag = f'"{path}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, text=PAGES[path], headers={"content-type": "text/html", "etag": etag})
+
+    def requested_paths(self) -> List[str]:
+        return [request.url.path for request in self.requests]
+
+
+@pytest.fixture
+def site(monkeypatch) -> Site:
+    site = Site()
+    transport = httpx.MockTransport(site.handle)
+    monkeypatch.setattr(website.httpx, "AsyncClient", partial(httpx.AsyncClient, transport=transport))
+    return site
+
+
+def crawl(reader: WebsiteReader, url: str = "https://example.com/") -> Dict[str, str]:
+    async def run() -> Dict[str, str]:
+        return {page_url: content async for page_url, content in reader.acrawl(url)}
+
+    return asyncio.run(run())
+
+
+def test_acrawl_follows_links_and_the_sitemap_and_respects_robots(site):
+    reader = WebsiteReader(host_delay=0, max_depth=3)
+    assert crawl(reader) == {
+        "https://example.com/": "Home",
+        "https://example.com/about": "About",
+        "https://example.com/team": "Team",
+        "https://example.com/from-sitemap": "From the sitemap",
+    }
+    paths = site.requested_paths()
+    assert "/private/page" not in paths
+    assert paths.count("/") == 1
+
+
+def test_acrawl_stops_at_max_depth_and_max_links(site):
+    assert set(crawl(WebsiteReader(host_delay=0, max_depth=1, use_sitemap=False))) == {"https://example.com/"}
+    assert len(crawl(WebsiteReader(host_delay=0, max_links=2))) == 2
+
+
+def test_unchanged_pages_are_requested_with_their_etag(site):
+    reader = WebsiteReader(host_delay=0, use_sitemap=False)
+    first_crawl = crawl(reader)
+
+    site.requests.clear()
+    assert crawl(reader) == first_crawl
+    page_requests = [request for request in site.requests if request.url.path in PAGES]
+    assert len(page_requests) == 3
+    assert all(request.headers["If-None-Match"] == f'"{request.url.path}"' for request in page_requests)
+
+
+def test_pages_are_fetched_while_the_caller_processes_a_page(site):
+    reader = WebsiteReader(host_delay=0, use_sitemap=False, max_queued_pages=1)
+
+    async def run() -> List[int]:
+        # Number of pages requested after each page was processed
+        requested: List[int] = []
+        async for _ in reader.acrawl("https://example.com/"):
+            await asyncio.sleep(0.05)
+            requested.append(len([path for path in site.requested_paths() if path in PAGES]))
+        return requested
+
+    # The linked pages are fetched while the first page is processed
+    assert asyncio.run(run()) == [3, 3, 3]
@@ -0,0 +1,20 @@
+from phi.document import Document
+
+
+def test_embed_documents_records_batch_usage_once(embedder):
+    documents = [Document(content=f"food {i}") for i in range(5)]
+    embedded = Document.embed_documents(documents, embedder=embedder, batch_size=2)
+    assert embedded == documents and embedder.requests == 3
+    assert sum(document.usage["total_tokens"] for document in documents if document.usage) == 10
+
+    # Documents already embedded by the same embedder are not embedded again
+    assert Document.embed_documents(documents, embedder=embedder) == documents
+    assert embedder.requests == 3
+
+
+def test_embed_documents_falls_back_to_one_document_at_a_time(embedder):
+    embedder.fail_on = "bad"
+    documents = [Document(content="food"), Document(content="bad"), Document(content="pet")]
+    embedded = Document.embed_documents(documents, embedder=embedder)
+    assert [document.content for document in embedded] == ["food", "pet"]
+    assert documents[1].embedding is None
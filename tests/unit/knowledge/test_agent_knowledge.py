@@ -0,0 +1,12 @@
+from phi.document import Document
+from phi.knowledge.agent import AgentKnowledge
+
+
+def test_load_documents_skips_existing_documents_with_one_lookup(vector_db):
+    knowledge_base = AgentKnowledge(vector_db=vector_db)
+    knowledge_base.load_documents([Document(content="first")])
+
+    knowledge_base.load_documents([Document(content="first"), Document(content="second"), Document(content="third")])
+    assert len(vector_db.rows) == 3
+    assert vector_db.writes == [1, 2]
+    assert len(vector_db.lookups) == 2
@@ -0,0 +1,59 @@
+import os
+
+from phi.document import Document
+from phi.knowledge.manifest import DocumentSource, KnowledgeManifest, get_content_hash
+from phi.knowledge.text import TextKnowledgeBase
+
+
+def test_manifest_detects_changed_and_removed_sources(tmp_path):
+    first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+    first.write_text("first")
+    second.write_text("second")
+
+    def get_source(path):
+        return DocumentSource.from_file(path, lambda: [Document(content=path.read_text())])
+
+    manifest = KnowledgeManifest(path=tmp_path / "manifest.json")
+    for path in (first, second):
+        source = get_source(path)
+        assert not manifest.is_unchanged(source)
+        manifest.update(source, source.read())
+    manifest.write()
+
+    manifest = KnowledgeManifest(path=tmp_path / "manifest.json")
+    assert manifest.is_unchanged(get_source(first))
+    # Files that were only touched are not read again
+    os.utime(first, (0, 0))
+    assert manifest.is_unchanged(get_source(first))
+
+    second.write_text("changed")
+    source = get_source(second)
+    assert not manifest.is_unchanged(source)
+    assert manifest.update(source, source.read()) == [get_content_hash(Document(content="second"))]
+
+    assert manifest.remove_missing({str(second.resolve())}) == [get_content_hash(Document(content="first"))]
+
+
+def test_load_reads_only_changed_sources_and_deletes_stale_documents(tmp_path, embedder, vector_db):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "first.txt").write_text("first")
+    (docs / "second.txt").write_text("second")
+    (docs / "third.txt").write_text("third")
+
+    def load():
+        knowledge_base = TextKnowledgeBase(
+            path=docs, vector_db=vector_db, manifest=KnowledgeManifest(path=tmp_path / "manifest.json")
+        )
+        knowledge_base.load()
+
+    load()
+    assert sorted(document.content for document in vector_db.rows.values()) == ["first", "second", "third"]
+    assert embedder.calls == 3
+
+    (docs / "second.txt").write_text("changed")
+    (docs / "third.txt").unlink()
+    load()
+    # Only the changed file is embedded, the documents of the changed and removed files are deleted
+    assert embedder.calls == 4
+    assert sorted(document.content for document in vector_db.rows.values()) == ["changed", "first"]
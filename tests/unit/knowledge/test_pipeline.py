@@ -0,0 +1,18 @@
+from phi.document import Document
+from phi.knowledge.pipeline import IngestionPipeline
+
+
+def test_pipeline_batches_retries_and_skips_existing(embedder, vector_db):
+    embedder.rate_limited_requests = 1
+    pipeline = IngestionPipeline(read_workers=2, embed_workers=1, batch_size=4, retry_delay=0.01)
+    sources = [lambda i=i: [Document(content=f"doc {i}-{j}") for j in range(3)] for i in range(4)]
+
+    metrics = pipeline.run(vector_db=vector_db, sources=sources)
+    assert len(vector_db.rows) == 12
+    assert sorted(vector_db.writes) == [4, 4, 4]
+    assert metrics.documents_written == 12 and metrics.embedding_retries == 1
+    # One failed request and one request per batch, documents embedded by the pipeline are not embedded again
+    assert embedder.requests == 4 and embedder.calls == 12
+
+    metrics = pipeline.run(vector_db=vector_db, sources=[[Document(content="doc 0-0"), Document(content="new")]])
+    assert metrics.documents_skipped == 1 and metrics.documents_written == 1
@@ -0,0 +1,41 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+
+from phi.memory.agent import AgentMemory, AgentRun
+from phi.memory.classifier import MemoryClassifier
+from phi.memory.manager import MemoryManager
+from phi.memory.summarizer import MemorySummarizer
+from phi.model.base import Model
+from phi.model.message import Message
+
+
+def test_copy_for_run_does_not_share_run_state():
+    memory = AgentMemory(
+        classifier=MemoryClassifier(model=Model(id="test", provider="test")),
+        manager=MemoryManager(model=Model(id="test", provider="test"), user_id="owner"),
+        summarizer=MemorySummarizer(model=Model(id="test", provider="test")),
+    )
+
+    def run(user_id: str) -> Tuple[AgentMemory, str]:
+        run_memory = memory.copy_for_run()
+        assert run_memory.manager is not None and run_memory.manager.model is not None
+        run_memory.manager.user_id = user_id
+        run_memory.manager.model.metrics["user_id"] = user_id
+        run_memory.add_run(AgentRun(message=Message(role="user", content=user_id)))
+        time.sleep(0.05)
+        return run_memory, run_memory.manager.user_id
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(run, ["alice", "bob"]))
+
+    for (run_memory, user_id), expected_user_id in zip(results, ["alice", "bob"]):
+        assert user_id == expected_user_id
+        assert run_memory.manager.model.metrics == {"user_id": expected_user_id}
+        assert [agent_run.message.content for agent_run in run_memory.runs] == [expected_user_id]
+        for field_name in ("classifier", "manager", "summarizer"):
+            assert getattr(run_memory, field_name) is not getattr(memory, field_name)
+            assert getattr(run_memory, field_name).model is not getattr(memory, field_name).model
+    assert memory.manager.user_id == "owner"
+    assert memory.manager.model.metrics == {}
+    assert memory.runs == []
@@ -0,0 +1,88 @@
+from threading import Event
+
+import pytest
+
+from phi.memory.background import flush_memory_updates, submit_memory_update
+
+
+def test_updates_run_in_order_and_coalesce():
+    started, release = Event(), Event()
+    calls = []
+
+    def update(inputs):
+        calls.append(inputs)
+        started.set()
+        release.wait(5)
+
+    submit_memory_update(session_id="session", inputs=["first"], update=update)
+    assert started.wait(5)
+    # Updates submitted while the first one runs are coalesced into one update
+    submit_memory_update(session_id="session", inputs=["second"], update=update)
+    submit_memory_update(session_id="session", inputs=["third"], update=update)
+    assert not flush_memory_updates(session_id="session", timeout=0.05)
+
+    release.set()
+    assert flush_memory_updates(session_id="session", timeout=5)
+    assert calls == [["first"], ["second", "third"]]
+
+
+summarizer_started, summarizer_release = Event(), Event()
+
+
+def test_agent_updates_overlapping_runs_and_sessions(tmp_path):
+    pytest.importorskip("sqlalchemy")
+    from phi.agent import Agent
+    from phi.memory.agent import AgentMemory, AgentRun
+    from phi.memory.summarizer import MemorySummarizer
+    from phi.memory.summary import SessionSummary
+    from phi.model.message import Message
+    from phi.run.response import RunResponse
+    from phi.storage.agent.sqlite import SqlAgentStorage
+
+    class SlowSummarizer(MemorySummarizer):
+        def run(self, message_pairs, **kwargs):
+            summarizer_started.set()
+            summarizer_release.wait(5)
+            return SessionSummary(summary=" ".join(user.get_content_string() for user, _ in message_pairs))
+
+    def add_run(agent, content):
+        messages = [Message(role="user", content=content), Message(role="assistant", content="ok")]
+        agent.memory.add_run(AgentRun(response=RunResponse(content="ok", messages=messages)))
+        agent.write_to_storage()
+
+    storage = SqlAgentStorage(table_name="agent_sessions", db_file=str(tmp_path.joinpath("agent.db")))
+    agent = Agent(
+        session_id="s1",
+        storage=storage,
+        memory=AgentMemory(create_session_summary=True, summarizer=SlowSummarizer(), flush_timeout=0.01),
+    )
+    agent.load_session()
+    add_run(agent, "first")
+    agent.defer_memory_update([])
+    assert summarizer_started.wait(5)
+
+    # A run and session data saved while the update of the first run is running
+    add_run(agent, "second")
+    agent.session_data = {"note": "kept"}
+    agent.write_to_storage()
+
+    # The new session does not wait for the summarizer, whose update continues for the first session
+    agent.new_session()
+    second_session_id = agent.session_id
+    add_run(agent, "third")
+    agent.defer_memory_update([])
+
+    summarizer_release.set()
+    assert flush_memory_updates(session_id="s1", timeout=5)
+    assert agent.flush_memory_updates(timeout=5)
+
+    first_session = storage.read(session_id="s1")
+    assert first_session is not None and first_session.memory is not None
+    assert first_session.memory["summary"]["summary"] == "first"
+    assert len(first_session.memory["runs"]) == 2
+    assert first_session.session_data == {"note": "kept"}
+
+    second_session = storage.read(session_id=second_session_id)
+    assert second_session is not None and second_session.memory is not None
+    assert second_session.memory["summary"]["summary"] == "third"
+    assert agent.memory.summary is not None and agent.memory.summary.summary == "third"
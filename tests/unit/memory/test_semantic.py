@@ -0,0 +1,31 @@
+import pytest
+
+from phi.memory.agent import AgentMemory, MemoryRetrieval
+from phi.memory.row import MemoryRow
+from phi.memory.semantic import search_memories
+
+
+def test_search_memories_embeds_each_memory_once(memory_db, embedder):
+    db = memory_db
+    for memory in ["likes food from italy", "has a pet dog", "feeds the pet food twice a day"]:
+        db.upsert_memory(MemoryRow(user_id="user", memory={"memory": memory}))
+
+    relevant = search_memories(db=db, embedder=embedder, query="which pet do I have?", user_id="user", limit=1)
+    assert [row.memory["memory"] for row in relevant] == ["has a pet dog"]
+    # The query and the three memories were embedded, and the embeddings were saved
+    assert embedder.calls == 4
+    assert all(row.embedding is not None for row in db.rows.values())
+
+    relevant = search_memories(db=db, embedder=embedder, query="suggest some food", user_id="user", limit=1)
+    assert [row.memory["memory"] for row in relevant] == ["likes food from italy"]
+    assert embedder.calls == 5
+
+
+@pytest.mark.parametrize("num_memories, expected", [(None, 5), (2, 2)])
+def test_semantic_retrieval_without_a_query_loads_a_bounded_number_of_memories(memory_db, num_memories, expected):
+    for i in range(10):
+        memory_db.upsert_memory(MemoryRow(user_id="user", memory={"memory": f"memory {i}"}))
+    memory = AgentMemory(db=memory_db, user_id="user", retrieval=MemoryRetrieval.semantic, num_memories=num_memories)
+
+    memory.load_user_memories()
+    assert memory.memories is not None and len(memory.memories) == expected
@@ -0,0 +1,61 @@
+import asyncio
+import time
+from typing import List
+
+from phi.model.base import Model
+from phi.model.message import Message
+from phi.model.response import ModelResponse
+from phi.tools.function import Function, FunctionCall
+
+
+def slow_echo(text: str) -> str:
+    """Echo the text after a delay.
+
+    Args:
+        text (str): The text to echo.
+    """
+    time.sleep(0.2)
+    return text
+
+
+def test_tool_calls_run_in_parallel_and_keep_their_order():
+    model = Model(id="test", provider="test", run_tools_in_parallel=True)
+    function = Function.from_callable(slow_echo)
+    function_calls = [
+        FunctionCall(function=function, arguments={"text": text}, call_id=f"call_{text}") for text in ["a", "b", "c"]
+    ]
+    function_call_results: List[Message] = []
+
+    start = time.perf_counter()
+    list(model.run_function_calls(function_calls=function_calls, function_call_results=function_call_results))
+    assert time.perf_counter() - start < 0.5
+    assert [message.content for message in function_call_results] == ["a", "b", "c"]
+    assert [message.tool_call_id for message in function_call_results] == ["call_a", "call_b", "call_c"]
+    assert len(model.metrics["tool_call_times"]["slow_echo"]) == 3
+
+
+def test_async_tool_call_handler_runs_tools_and_answers_unknown_tools():
+    model = Model(id="test", provider="test", show_tool_calls=True)
+    model.functions = {"slow_echo": Function.from_callable(slow_echo)}
+    assistant_message = Message(
+        role="assistant",
+        tool_calls=[
+            {"id": "call_1", "type": "function", "function": {"name": "slow_echo", "arguments": '{"text": "a"}'}},
+            {"id": "call_2", "type": "function", "function": {"name": "missing", "arguments": "{}"}},
+        ],
+    )
+    messages: List[Message] = []
+
+    model_response = asyncio.run(model.ahandle_tool_calls(assistant_message, messages, ModelResponse()))
+    assert model_response is not None
+    assert model_response.content == "\nRunning:\n - slow_echo(text=a)\n\n"
+    assert [(message.tool_call_id, message.content) for message in messages] == [
+        ("call_2", "Could not find function to call."),
+        ("call_1", "a"),
+    ]
+
+
+def test_async_tool_call_handler_skips_messages_without_tool_calls():
+    model = Model(id="test", provider="test")
+    assistant_message = Message(role="assistant", content="hello")
+    assert asyncio.run(model.ahandle_tool_calls(assistant_message, [], ModelResponse())) is None
@@ -0,0 +1,79 @@
+import asyncio
+from threading import Event
+from typing import List
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+from phi.document import Document  # noqa: E402
+from phi.knowledge.agent import AgentKnowledge  # noqa: E402
+from phi.playground.ingest import IngestQueue  # noqa: E402
+
+# Set to let BlockedKnowledge load documents
+loading_allowed = Event()
+
+
+class BlockedKnowledge(AgentKnowledge):
+    def load_documents(self, documents: List[Document], *args, **kwargs) -> None:
+        loading_allowed.wait(timeout=10)
+
+
+def test_ingest_queue_loads_files_off_the_event_loop(vector_db):
+    queue = IngestQueue(max_workers=2, max_jobs=2)
+    knowledge = AgentKnowledge(vector_db=vector_db)
+
+    async def ingest():
+        jobs = [
+            queue.submit("agent", knowledge, f"file {i} about food".encode(), f"file-{i}.txt", "text/plain")
+            for i in range(3)
+        ]
+        await queue.wait([job.job_id for job in jobs])
+        return jobs
+
+    jobs = asyncio.run(ingest())
+    assert [job.status for job in jobs] == ["completed"] * 3
+    assert len(vector_db.rows) == 3
+    # Only the most recent finished jobs are kept for status lookups
+    assert queue.get(jobs[0].job_id) is None
+    assert queue.get(jobs[2].job_id) is jobs[2]
+
+    queue.shutdown()
+    assert queue._executor is None
+
+
+def test_ingest_queue_keeps_the_jobs_that_are_not_finished(vector_db):
+    queue = IngestQueue(max_workers=1, max_jobs=1)
+    knowledge = BlockedKnowledge(vector_db=vector_db)
+
+    async def ingest():
+        jobs = [queue.submit("agent", knowledge, b"about food", f"file-{i}.txt", "text/plain") for i in range(3)]
+        await asyncio.sleep(0.1)
+        assert all(queue.get(job.job_id) is job for job in jobs)
+        loading_allowed.set()
+        await queue.wait([job.job_id for job in jobs])
+        return jobs
+
+    try:
+        jobs = asyncio.run(ingest())
+    finally:
+        loading_allowed.set()
+        queue.shutdown()
+    assert [queue.get(job.job_id) for job in jobs] == [None, None, jobs[2]]
+
+
+def test_ingest_queue_is_shut_down_with_the_app():
+    pytest.importorskip("phi.agent")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from phi.agent import Agent
+    from phi.playground.router import get_async_playground_router
+
+    queue = IngestQueue()
+    assert queue.executor is not None
+    app = FastAPI()
+    app.include_router(get_async_playground_router(agents=[Agent()], ingest_queue=queue))
+    with TestClient(app):
+        assert queue._executor is not None
+    assert queue._executor is None
@@ -0,0 +1,24 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import phi.playground.playground as playground_module  # noqa: E402
+from phi.agent import Agent  # noqa: E402
+from phi.playground.playground import Playground  # noqa: E402
+
+
+def test_app_closes_the_client_pool_on_shutdown(monkeypatch):
+    closed = []
+
+    async def aclose_client_pool():
+        closed.append(True)
+
+    monkeypatch.setattr(playground_module, "aclose_client_pool", aclose_client_pool)
+    app = Playground(agents=[Agent(agent_id="agent")]).get_app()
+    with TestClient(app) as client:
+        assert client.get("/v1/playground/status").status_code == 200
+        assert closed == []
+    assert closed
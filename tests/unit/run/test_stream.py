@@ -0,0 +1,102 @@
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from phi.model.message import Message
+from phi.run.response import RunEvent, RunResponse
+from phi.run.stream import RunEventEncoder
+
+
+def decode(lines: List[str]) -> List[Dict[str, Any]]:
+    for line in lines:
+        assert line.endswith("\n") and line.count("\n") == 1
+    return [json.loads(line) for line in lines]
+
+
+def run_stream() -> List[RunResponse]:
+    """The RunResponse objects yielded by a streamed run with one tool call."""
+    tool = {"tool_call_id": "call_1", "tool_name": "get_weather", "tool_args": {"city": "Paris"}}
+    run_response = RunResponse(run_id="r1", session_id="s1", agent_id="a1", model="gpt-4o")
+    events = [
+        run_response.model_copy(update={"event": RunEvent.run_started.value}),
+        run_response.model_copy(update={"event": RunEvent.tool_call_started.value, "tools": [tool]}),
+        run_response.model_copy(update={"event": RunEvent.tool_call_started.value, "tools": [tool]}),
+        run_response.model_copy(
+            update={"event": RunEvent.tool_call_completed.value, "tools": [{**tool, "content": "Sunny"}]}
+        ),
+        run_response.model_copy(update={"content": "It is "}),
+        run_response.model_copy(update={"content": "sunny"}),
+        run_response.model_copy(
+            update={
+                "event": RunEvent.run_completed.value,
+                "content": "It is sunny",
+                "messages": [Message(role="system", content="x" * 5000), Message(role="user", content="Weather?")],
+                "metrics": {"time": [0.5]},
+            }
+        ),
+    ]
+    return events
+
+
+def test_ndjson_events_are_deltas():
+    encoder = RunEventEncoder()
+    events = decode(list(encoder.stream(iter(run_stream()))))
+
+    assert [e["event"] for e in events] == [
+        "RunStarted",
+        "ToolCallStarted",
+        "ToolCallCompleted",
+        "RunResponse",
+        "RunResponse",
+        "RunCompleted",
+    ]
+    # The ids are only sent with the first event
+    assert events[0]["run_id"] == "r1" and events[0]["model"] == "gpt-4o"
+    assert all("run_id" not in e for e in events[1:-1])
+    # Each tool call is sent once when it starts and once when it completes
+    assert events[1]["tool"]["tool_call_id"] == "call_1"
+    assert events[2]["tool"]["content"] == "Sunny"
+    assert [e["content"] for e in events[3:5]] == ["It is ", "sunny"]
+
+
+def test_summary_has_the_full_content_without_messages():
+    encoder = RunEventEncoder()
+    lines = list(encoder.stream(iter(run_stream())))
+    summary = decode(lines)[-1]
+
+    assert summary["content"] == "It is sunny"
+    assert summary["metrics"] == {"time": [0.5]}
+    assert "messages" not in summary
+    assert sum(len(line) for line in lines) < 1000
+
+
+def test_summary_uses_the_final_response():
+    encoder = RunEventEncoder()
+    final_response = RunResponse(run_id="r1", content="Done")
+    events = decode(list(encoder.stream(iter([RunResponse(content="Do")]), lambda: final_response)))
+    assert events[-1] == {"event": "RunCompleted", **final_response.model_dump(exclude_none=True, exclude={"event"})}
+
+
+def test_astream_matches_stream():
+    async def arun_stream():
+        for run_response in run_stream():
+            yield run_response
+
+    async def collect() -> List[str]:
+        return [line async for line in RunEventEncoder().astream(arun_stream())]
+
+    assert asyncio.run(collect()) == list(RunEventEncoder().stream(iter(run_stream())))
+
+
+def test_sse_events():
+    encoder = RunEventEncoder(format="sse")
+    assert encoder.media_type == "text/event-stream"
+    event = encoder.encode(RunResponse(content="Hi"))[0]
+    assert event.startswith("event: RunResponse\ndata: {") and event.endswith("\n\n")
+
+
+def test_unsupported_format():
+    with pytest.raises(ValueError):
+        RunEventEncoder(format="xml")  # type: ignore
@@ -0,0 +1,99 @@
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("phi.agent")
+
+from sqlalchemy import inspect  # noqa: E402
+
+from phi.agent.session import AgentSession  # noqa: E402
+from phi.storage.agent.sqlite import SqlAgentStorage  # noqa: E402
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = SqlAgentStorage(table_name="agent_sessions", db_file=str(tmp_path.joinpath("agent.db")))
+    storage.create()
+    return storage
+
+
+def test_list_sessions_titles_by_the_first_user_message(storage):
+    storage.upsert(
+        AgentSession(
+            session_id="s1",
+            agent_id="a1",
+            memory={
+                "runs": [
+                    {"response": {"content": "Hello"}},
+                    {"message": {"role": "user", "content": "What is the weather?"}},
+                ]
+            },
+        )
+    )
+    storage.upsert(AgentSession(session_id="s2", agent_id="a1", memory={"runs": []}))
+
+    summaries, _ = storage.list_sessions(agent_id="a1")
+    titles = {summary.session_id: summary.title for summary in summaries}
+    assert titles["s1"] == "What is the weather?"
+    assert titles["s2"] != "What is the weather?"
+
+
+def test_list_sessions_pages_with_the_cursor(storage):
+    for i in range(3):
+        storage.upsert(AgentSession(session_id=f"s{i}", agent_id="a1"))
+
+    first_page, cursor = storage.list_sessions(limit=2)
+    assert len(first_page) == 2 and cursor is not None
+    second_page, cursor = storage.list_sessions(limit=2, cursor=cursor)
+    assert len(second_page) == 1 and cursor is None
+    assert {s.session_id for s in first_page + second_page} == {"s0", "s1", "s2"}
+
+
+def test_update_session_memory_keeps_the_other_keys_and_columns(storage):
+    storage.upsert(
+        AgentSession(
+            session_id="s1",
+            memory={"runs": [{"message": {"role": "user", "content": "Hi"}}], "summary": {"summary": "Old"}},
+            session_data={"note": "kept"},
+        )
+    )
+
+    assert storage.update_session_memory("s1", {"summary": {"summary": "New"}, "memories": [{"memory": "Likes tea"}]})
+    assert not storage.update_session_memory("missing", {"summary": {"summary": "New"}})
+
+    session = storage.read(session_id="s1")
+    assert session is not None
+    assert session.memory == {
+        "runs": [{"message": {"role": "user", "content": "Hi"}}],
+        "summary": {"summary": "New"},
+        "memories": [{"memory": "Likes tea"}],
+    }
+    assert session.session_data == {"note": "kept"}
+
+
+def test_list_sessions_reads_the_title_column_instead_of_the_memory(storage):
+    storage.upsert(AgentSession(session_id="s1", memory={"runs": [{"message": {"role": "user", "content": "Hi"}}]}))
+    # Changing the memory without an upsert does not change the stored title
+    with storage.Session() as sess, sess.begin():
+        sess.execute(storage.table.update().values(memory={"runs": []}))
+
+    summaries, _ = storage.list_sessions()
+    assert [summary.title for summary in summaries] == ["Hi"]
+
+
+def test_title_column_is_added_to_existing_tables(tmp_path):
+    db_file = str(tmp_path.joinpath("agent.db"))
+    legacy = SqlAgentStorage(table_name="agent_sessions", db_file=db_file)
+    legacy.table.create(legacy.db_engine)
+    with legacy.Session() as sess, sess.begin():
+        sess.execute(
+            legacy.table.insert().values(
+                session_id="old", memory={"runs": [{"message": {"role": "user", "content": "Old"}}]}, created_at=1
+            )
+        )
+
+    storage = SqlAgentStorage(table_name="agent_sessions", db_file=db_file)
+    storage.upsert(AgentSession(session_id="new", memory={"runs": [{"message": {"role": "user", "content": "New"}}]}))
+
+    assert "title" in {column["name"] for column in inspect(storage.db_engine).get_columns("agent_sessions")}
+    summaries, _ = storage.list_sessions()
+    assert {summary.session_id: summary.title for summary in summaries} == {"old": "Old", "new": "New"}
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("duckdb")
+
+from phi.tools.csv_tools import CsvTools  # noqa: E402
+
+
+def write_csv(path: Path, rows: int) -> Path:
+    path.write_text("id,name\n" + "".join(f"{i},name {i}\n" for i in range(rows)))
+    return path
+
+
+def test_query_reloads_the_csv_only_when_it_changes(tmp_path):
+    sales = write_csv(tmp_path / "sales.csv", 3)
+    tools = CsvTools(csvs=[sales])
+
+    assert tools.query_csv_file("sales", "SELECT count(*) AS n FROM sales") == "n\n3"
+    source = tools._loaded_csvs["sales"]
+    assert tools.query_csv_file("sales", "SELECT max(id) AS m FROM sales") == "m\n2"
+    assert tools._loaded_csvs["sales"] == source
+
+    write_csv(sales, 5)
+    assert tools.query_csv_file("sales", "SELECT count(*) AS n FROM sales") == "n\n5"
+
+
+def test_cache_dir_removes_only_the_stale_files_of_the_csv(tmp_path):
+    cache_dir = tmp_path / "cache"
+    sales = write_csv(tmp_path / "sales.csv", 3)
+    sales_2024 = write_csv(tmp_path / "sales-2024.csv", 2)
+    tools = CsvTools(csvs=[sales, sales_2024], cache_dir=cache_dir)
+
+    assert tools.query_csv_file("sales-2024", 'SELECT count(*) AS n FROM "sales-2024"') == "n\n2"
+    assert tools.query_csv_file("sales", "SELECT count(*) AS n FROM sales") == "n\n3"
+    assert len(list(cache_dir.glob("*.parquet"))) == 2
+
+    write_csv(sales, 4)
+    assert tools.query_csv_file("sales", "SELECT count(*) AS n FROM sales") == "n\n4"
+    cached_files = sorted(path.name for path in cache_dir.glob("*.parquet"))
+    # The file cached for the previous version of sales.csv is removed, the file of sales-2024.csv is kept
+    assert len(cached_files) == 2
+    assert [name for name in cached_files if name.startswith("sales-2024-")] == [
+        tools._get_parquet_path(sales_2024, sales_2024.stat().st_mtime, sales_2024.stat().st_size).name
+    ]
+
+    # A new toolkit reuses the cached files
+    tools = CsvTools(csvs=[sales], cache_dir=cache_dir)
+    assert tools.query_csv_file("sales", "SELECT count(*) AS n FROM sales") == "n\n4"
+    assert len(list(cache_dir.glob("*.parquet"))) == 2
+
+
+def test_parquet_path_requires_a_cache_dir(tmp_path):
+    sales = write_csv(tmp_path / "sales.csv", 1)
+    with pytest.raises(ValueError):
+        CsvTools(csvs=[sales])._get_parquet_path(sales, 0, 0)
@@ -0,0 +1,38 @@
+import asyncio
+import threading
+from typing import List
+
+from phi.tools.function import Function, FunctionCall
+
+
+def echo(text: str) -> str:
+    """Echo the text.
+
+    Args:
+        text (str): The text to echo.
+    """
+    return text
+
+
+def test_async_execute_runs_sync_hooks_off_the_event_loop():
+    hook_threads: List[int] = []
+
+    def pre_hook() -> None:
+        hook_threads.append(threading.get_ident())
+
+    async def post_hook() -> None:
+        hook_threads.append(threading.get_ident())
+
+    function = Function.from_callable(echo)
+    function.pre_hook = pre_hook
+    function.post_hook = post_hook
+    function_call = FunctionCall(function=function, arguments={"text": "hi"})
+
+    async def run() -> int:
+        assert await function_call.aexecute()
+        return threading.get_ident()
+
+    loop_thread = asyncio.run(run())
+    assert function_call.result == "hi"
+    assert hook_threads[0] != loop_thread
+    assert hook_threads[1] == loop_thread
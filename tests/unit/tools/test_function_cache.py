@@ -0,0 +1,65 @@
+from phi.tools.function import Function, FunctionCall, get_call_parameters, get_entrypoint_schema
+from phi.tools.toolkit import Toolkit
+
+
+class MathTools(Toolkit):
+    def __init__(self, factor: int):
+        super().__init__(name="math_tools")
+        self.factor = factor
+        self.register(self.multiply)
+
+    def multiply(self, a: int, fc: FunctionCall) -> str:
+        """Multiply a number by the factor.
+
+        Args:
+            a (int): The number to multiply.
+        """
+        return f"{fc.function.name}: {a * self.factor}"
+
+
+def test_schema_is_shared_between_instances():
+    first, second = MathTools(factor=2), MathTools(factor=3)
+    assert get_entrypoint_schema(first.multiply) is get_entrypoint_schema(second.multiply)
+    assert get_entrypoint_schema(first.multiply, strict=True) is not get_entrypoint_schema(first.multiply)
+
+    functions = []
+    for tools in (first, second):
+        function = tools.functions["multiply"].model_copy()
+        function.process_entrypoint()
+        functions.append(function)
+    assert functions[0].parameters == functions[1].parameters
+    assert functions[0].parameters is not functions[1].parameters
+    assert "a" in functions[0].to_dict()["parameters"]["properties"]
+
+    # Validated entrypoints stay bound to their own toolkit instance
+    results = []
+    for function in functions:
+        function_call = FunctionCall(function=function, arguments={"a": "5"})
+        assert function_call.execute()
+        results.append(function_call.result)
+    assert results == ["multiply: 10", "multiply: 15"]
+
+
+def test_processing_twice_does_not_rewrap():
+    def add(a: int, b: int = 1) -> int:
+        return a + b
+
+    function = Function.from_callable(add)
+    entrypoint = function.entrypoint
+    function.process_entrypoint()
+    assert function.entrypoint is entrypoint
+    assert function.parameters["required"] == ["a"]
+
+
+class SlottedCallable:
+    """A callable that cannot be weakly referenced, so its call parameters are not cached"""
+
+    __slots__ = ()
+
+    def __call__(self, agent, query: str) -> str:
+        return query
+
+
+def test_call_parameters_of_callables_without_weakrefs():
+    assert get_call_parameters(SlottedCallable()) == (True, False)
+    assert get_call_parameters(MathTools(2).multiply) == (False, True)
@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, text  # noqa: E402
+
+from phi.tools.sql import SQLTools  # noqa: E402
+from phi.utils.query_result import QueryResultFormatter  # noqa: E402
+
+
+@pytest.fixture
+def db_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path.joinpath('test.db')}")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE pets (id INTEGER, name TEXT)"))
+        connection.execute(text("INSERT INTO pets VALUES (1, 'dog'), (2, 'cat'), (3, 'fish')"))
+    return engine
+
+
+def test_query_results_are_json_rows_by_default(db_engine):
+    tools = SQLTools(db_engine=db_engine)
+    result = tools.run_sql_query("SELECT id, name FROM pets ORDER BY id", limit=2)
+    assert json.loads(result) == [{"id": 1, "name": "dog"}, {"id": 2, "name": "cat"}]
+
+
+def test_csv_query_results_are_limited_by_the_formatter(db_engine):
+    tools = SQLTools(db_engine=db_engine, result_format="csv", result_formatter=QueryResultFormatter(max_rows=2))
+    result = tools.run_sql_query("SELECT id, name FROM pets ORDER BY id", limit=None)
+    assert result.splitlines() == [
+        "id,name",
+        "1,dog",
+        "2,cat",
+        "... showing 2 of 3 rows, add filters, aggregations or a LIMIT to the query to see the other rows",
+    ]
@@ -0,0 +1,49 @@
+import asyncio
+
+import httpx
+
+from phi.utils.client_pool import get_shared_client, close_client_pool
+
+
+class DummyClient:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_get_shared_client_reuses_client_for_same_params():
+    client_a = get_shared_client(DummyClient, {"api_key": "key", "default_headers": {"a": "b"}})
+    client_b = get_shared_client(DummyClient, {"api_key": "key", "default_headers": {"a": "b"}})
+    assert client_a is client_b
+    close_client_pool()
+
+
+def test_get_shared_client_separates_different_params():
+    client_a = get_shared_client(DummyClient, {"api_key": "key-a"})
+    client_b = get_shared_client(DummyClient, {"api_key": "key-b"})
+    assert client_a is not client_b
+    close_client_pool()
+
+
+def test_get_shared_client_creates_pooled_http_client():
+    client = get_shared_client(DummyClient, {"api_key": "key"}, http_client=True)
+    assert isinstance(client.kwargs["http_client"], httpx.Client)
+    close_client_pool()
+    assert client.closed
+
+
+def test_get_shared_async_client_is_bound_to_event_loop():
+    async def get_clients():
+        return (
+            get_shared_client(DummyClient, {"api_key": "key"}, is_async=True),
+            get_shared_client(DummyClient, {"api_key": "key"}, is_async=True),
+        )
+
+    first_a, first_b = asyncio.run(get_clients())
+    second_a, _ = asyncio.run(get_clients())
+    assert first_a is first_b
+    assert first_a is not second_a
+    close_client_pool()
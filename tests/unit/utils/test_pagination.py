@@ -0,0 +1,45 @@
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from phi.utils.pagination import decode_cursor, encode_cursor, paginate
+
+
+class Summary(BaseModel):
+    session_id: str
+    created_at: Optional[int] = None
+
+
+def make_summary(session_id: str, created_at: int) -> Summary:
+    return Summary(session_id=session_id, created_at=created_at)
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(10, "abc")) == (10, "abc")
+    assert decode_cursor(encode_cursor(None, "abc")) == (0, "abc")
+
+
+def test_decode_invalid_cursor():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_paginate_walks_all_pages_newest_first():
+    items = [make_summary(f"s{i}", created_at=i // 2) for i in range(5)]
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = paginate(items, limit=2, cursor=cursor)
+        assert len(page) <= 2
+        seen.extend(item.session_id for item in page)
+        if cursor is None:
+            break
+    assert seen == ["s4", "s3", "s2", "s1", "s0"]
+
+
+def test_paginate_without_limit_returns_everything():
+    items = [make_summary("a", 1), make_summary("b", 2)]
+    page, cursor = paginate(items)
+    assert [item.session_id for item in page] == ["b", "a"]
+    assert cursor is None
@@ -0,0 +1,109 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from phi.utils.query_result import QueryResultFormatter
+
+
+def get_fetchmany(rows):
+    fetched = []
+
+    def fetchmany(size):
+        batch = rows[len(fetched) : len(fetched) + size]
+        fetched.extend(batch)
+        return batch
+
+    return fetchmany, fetched
+
+
+def test_rows_are_fetched_in_batches_and_truncated():
+    rows = [(i, f"name {i}") for i in range(25)]
+    formatter = QueryResultFormatter(max_rows=3, fetch_size=10)
+
+    fetchmany, _ = get_fetchmany(rows)
+    output = formatter.format_rows(["id", "name"], fetchmany).split("\n")
+    assert output[:4] == ["id,name", "0,name 0", "1,name 1", "2,name 2"]
+    assert output[4].startswith("... showing 3 of 25 rows")
+
+    # Without counting, only the batch with the rows shown and the next one are fetched
+    formatter.count_total_rows = False
+    fetchmany, fetched = get_fetchmany(rows)
+    output = formatter.format_rows(["id", "name"], fetchmany, max_rows=10).split("\n")
+    assert len(output) == 12 and output[-1].startswith("... showing the first 10 rows")
+    assert len(fetched) == 20
+
+
+def test_byte_budget_and_untruncated_results():
+    formatter = QueryResultFormatter(max_rows=None, max_bytes=20)
+    fetchmany, _ = get_fetchmany([("a" * 8,)] * 5)
+    assert formatter.format_rows(["value"], fetchmany).split("\n")[:3] == [
+        "value",
+        "a" * 8,
+        "... showing 1 of 5 rows, add filters, aggregations or a LIMIT to the query to see the other rows",
+    ]
+
+    fetchmany, _ = get_fetchmany([(1,), (2,)])
+    assert QueryResultFormatter().format_rows(["value"], fetchmany) == "value\n1\n2"
+
+
+def test_byte_budget_counts_encoded_bytes():
+    # Each row is 4 characters, but 8 bytes of UTF-8
+    formatter = QueryResultFormatter(max_rows=None, max_bytes=24)
+    fetchmany, _ = get_fetchmany([("é" * 4,)] * 5)
+    assert formatter.format_rows(["value"], fetchmany).split("\n")[:3] == ["value", "é" * 4, "é" * 4]
+
+
+def test_truncated_results_are_saved_and_paged(tmp_path):
+    pytest.importorskip("pyarrow")
+    formatter = QueryResultFormatter(max_rows=3, fetch_size=4, spill_dir=tmp_path)
+    fetchmany, _ = get_fetchmany([(i, f"name {i}") for i in range(25)])
+    footer = formatter.format_rows(["id", "name"], fetchmany).split("\n")[-1]
+    assert footer.startswith("... showing 3 of 25 rows, the full result was saved with result_id ")
+    result_id = footer.split("result_id ")[1].split(",")[0]
+
+    assert formatter.read_query_result(result_id, offset=10, limit=2).split("\n") == [
+        "id,name",
+        "10,name 10",
+        "11,name 11",
+        "... rows 11 to 12 of 25",
+    ]
+    assert formatter.read_query_result(result_id, offset=30).endswith("no rows after offset 30, the result has 25 rows")
+    assert formatter.read_query_result("../" + result_id) == f"Result ../{result_id} not found"
+
+
+def test_record_batches_are_formatted_without_converting_every_row():
+    pa = pytest.importorskip("pyarrow")
+    batches = [pa.record_batch([pa.array(range(i, i + 10))], names=["id"]) for i in range(0, 30, 10)]
+    reader = pa.RecordBatchReader.from_batches(batches[0].schema, batches)
+    output = QueryResultFormatter(max_rows=2).format_record_batches(["id"], reader)
+    assert (
+        output
+        == "id\n0\n1\n... showing 2 of 30 rows, add filters, aggregations or a LIMIT to the query to see the other rows"
+    )
+
+
+def test_old_saved_results_are_removed(tmp_path):
+    pytest.importorskip("pyarrow")
+    formatter = QueryResultFormatter(max_rows=1, spill_dir=tmp_path, max_spilled_results=2)
+    other_file = tmp_path / "notes.parquet"
+    other_file.write_text("kept")
+
+    def save_result() -> Path:
+        fetchmany, _ = get_fetchmany([(1,), (2,)])
+        footer = formatter.format_rows(["value"], fetchmany)
+        return tmp_path / f"query-result-{footer.split('result_id ')[1].split(',')[0]}.parquet"
+
+    first, second = save_result(), save_result()
+    os.utime(first, (time.time() - 10, time.time() - 10))
+    third = save_result()
+    assert not first.exists() and second.exists() and third.exists()
+
+    # Results older than the ttl are removed even below max_spilled_results
+    formatter.max_spilled_results = None
+    formatter.spill_ttl = 60
+    os.utime(second, (time.time() - 120, time.time() - 120))
+    fourth = save_result()
+    assert not second.exists() and third.exists() and fourth.exists()
+    assert other_file.exists()
@@ -0,0 +1,29 @@
+import asyncio
+
+from phi.utils.threads import run_coroutine_sync
+
+
+async def get_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+def test_run_coroutine_sync_reuses_one_event_loop():
+    first_loop = run_coroutine_sync(get_loop())
+    assert run_coroutine_sync(get_loop()) is first_loop
+    assert not first_loop.is_closed()
+
+
+def test_run_coroutine_sync_inside_a_running_loop():
+    async def main() -> asyncio.AbstractEventLoop:
+        loop = run_coroutine_sync(get_loop())
+        assert loop is not asyncio.get_running_loop()
+        return loop
+
+    assert asyncio.run(main()) is run_coroutine_sync(get_loop())
+
+
+def test_run_coroutine_sync_from_the_bridge_loop():
+    async def nested() -> str:
+        return run_coroutine_sync(asyncio.sleep(0, result="done"))
+
+    assert run_coroutine_sync(nested()) == "done"
@@ -0,0 +1,34 @@
+from phi.model.message import Message
+from phi.utils.tokens import Tokenizer, get_tokenizer
+
+
+class CountingTokenizer(Tokenizer):
+    def __init__(self):
+        super().__init__(name="counting", chars_per_token=4.0)
+        self.calls = 0
+
+    def count(self, text):
+        self.calls += 1
+        return super().count(text)
+
+
+def test_message_token_count_is_cached():
+    tokenizer = CountingTokenizer()
+    message = Message(role="user", content="hello " * 100)
+    num_tokens = message.get_token_count(tokenizer)
+    calls = tokenizer.calls
+    assert message.get_token_count(tokenizer) == num_tokens
+    assert tokenizer.calls == calls
+
+    # Changing the content invalidates the cached count
+    message.content = "hello"
+    assert message.get_token_count(tokenizer) < num_tokens
+
+
+def test_truncate_and_fallback_tokenizer():
+    tokenizer = get_tokenizer()
+    assert tokenizer.encode is None
+    text = "word " * 1000
+    truncated = tokenizer.truncate(text, 100)
+    assert tokenizer.count(truncated) <= 101
+    assert text.startswith(truncated)
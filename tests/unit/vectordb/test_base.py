@@ -0,0 +1,24 @@
+import inspect
+
+import pytest
+
+from phi.document import Document
+from phi.vectordb.base import VectorDb
+
+
+def test_docs_exist_looks_up_each_content_hash_once(vector_db):
+    vector_db.insert([Document(content="stored")])
+
+    documents = [Document(content="stored"), Document(content="new"), Document(content="stored")]
+    assert vector_db.docs_exist(documents) == [True, False, True]
+    assert len(vector_db.lookups) == 1
+    assert len(vector_db.lookups[0]) == 2
+
+    assert vector_db.docs_exist([]) == []
+    assert len(vector_db.lookups) == 1
+
+
+@pytest.mark.parametrize("method", ["search", "vector_search", "keyword_search", "hybrid_search"])
+def test_search_methods_take_filters_before_return_embeddings(method):
+    parameters = list(inspect.signature(getattr(VectorDb, method)).parameters)
+    assert parameters[:5] == ["self", "query", "limit", "filters", "return_embeddings"]
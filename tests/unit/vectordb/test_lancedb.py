@@ -0,0 +1,93 @@
+import pytest
+
+pytest.importorskip("lancedb")
+
+from phi.document import Document  # noqa: E402
+from phi.vectordb.lancedb import LanceDb  # noqa: E402
+from phi.vectordb.search import SearchType  # noqa: E402
+
+
+@pytest.fixture
+def lance_db(tmp_path, embedder):
+    return LanceDb(
+        uri=str(tmp_path.joinpath("lancedb")),
+        table_name="recipes",
+        embedder=embedder,
+        search_type=SearchType.keyword,
+        use_tantivy=False,
+    )
+
+
+def test_filters_are_stored_in_the_meta_data(lance_db):
+    lance_db.insert([Document(content="thai food curry", meta_data={"page": 1})], filters={"cuisine": "thai"})
+    lance_db.insert([Document(content="italian food pasta")], filters={"cuisine": "italian"})
+
+    results = lance_db.vector_search("food", limit=5, filters={"cuisine": "thai"})
+    assert [document.content for document in results] == ["thai food curry"]
+    assert results[0].meta_data == {"page": 1, "cuisine": "thai"}
+    assert lance_db.vector_search("food", limit=5, filters={"cuisine": "french"}) == []
+
+
+def test_filters_are_applied_before_the_search(lance_db):
+    lance_db.insert([Document(content=f"food {i}") for i in range(10)], filters={"cuisine": "italian", "page": 1})
+    lance_db.insert([Document(content="pet food"), Document(content="pet treats")], filters={"cuisine": "thai"})
+    assert lance_db._split_filters({"cuisine": "thai", "chef": "ann"}) == ({"cuisine": "thai"}, {"chef": "ann"})
+
+    # The thai documents rank below every italian document, but are found by filtering before the search
+    results = lance_db.vector_search("food", limit=2, filters={"cuisine": "thai"})
+    assert {document.content for document in results} == {"pet food", "pet treats"}
+    assert len(lance_db.vector_search("food", limit=3, filters={"cuisine": "italian", "page": 1})) == 3
+    assert [document.content for document in lance_db.keyword_search("pet", limit=5, filters={"cuisine": "thai"})]
+    assert lance_db.vector_search("food", limit=2, filters={"page": 2}) == []
+
+
+def test_where_clause_quotes_columns_and_values(lance_db):
+    assert lance_db._build_where({"cuisine": "it's", "page": 1, "draft": False, "chef": None}) == (
+        "`cuisine` = 'it''s' AND `page` = 1 AND `draft` = false AND `chef` IS NULL"
+    )
+
+
+def test_fts_index_is_created_once_and_searches_new_rows(lance_db, monkeypatch):
+    lance_db.insert([Document(content="thai curry")])
+    assert lance_db.keyword_search("curry") != []
+    assert lance_db.fts_index_exists
+
+    created = []
+    monkeypatch.setattr(lance_db.table, "create_fts_index", lambda *args, **kwargs: created.append(kwargs))
+    # Native indexes search rows written after the index was built without rebuilding it
+    lance_db.insert([Document(content="green curry")])
+    assert {document.content for document in lance_db.keyword_search("curry")} == {"thai curry", "green curry"}
+    assert created == []
+
+
+def test_existing_fts_index_is_reused(lance_db, tmp_path, embedder):
+    lance_db.insert([Document(content="thai curry")])
+    lance_db.keyword_search("curry")
+
+    reopened = LanceDb(
+        uri=str(tmp_path.joinpath("lancedb")),
+        table_name="recipes",
+        embedder=embedder,
+        search_type=SearchType.keyword,
+        use_tantivy=False,
+    )
+    assert reopened.fts_index_exists
+    assert [document.content for document in reopened.keyword_search("curry")] == ["thai curry"]
+
+
+def test_tantivy_index_is_rebuilt_before_searching_new_rows(tmp_path, embedder, monkeypatch):
+    # Tantivy indexes are not listed by list_indices(), so each process rebuilds the index before its first search
+    lance_db = LanceDb(uri=str(tmp_path.joinpath("lancedb")), table_name="recipes", embedder=embedder)
+    created = []
+    monkeypatch.setattr(lance_db.table, "create_fts_index", lambda *args, **kwargs: created.append(kwargs))
+    assert lance_db.fts_index_stale
+
+    lance_db._ensure_fts_index()
+    lance_db._ensure_fts_index()
+    assert created == [{"use_tantivy": True, "replace": True}]
+
+    # Rows written since the index was built are added by rebuilding it before the next search
+    lance_db.insert([Document(content="thai curry")])
+    assert lance_db.fts_index_stale
+    lance_db._ensure_fts_index()
+    assert len(created) == 2 and not lance_db.fts_index_stale
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("qdrant_client")
+
+from qdrant_client import AsyncQdrantClient  # noqa: E402
+
+from phi.document import Document  # noqa: E402
+from phi.vectordb.qdrant import Qdrant  # noqa: E402
+
+DOCUMENTS = [
+    Document(content="pet food"),
+    Document(content="food"),
+    Document(content="pet"),
+]
+
+
+def test_async_client_inserts_and_searches(embedder):
+    vector_db = Qdrant(collection="docs", embedder=embedder, batch_size=1, embedding_workers=2)
+    vector_db._async_client = AsyncQdrantClient(location=":memory:")
+
+    async def run():
+        await vector_db.acreate()
+        await vector_db.ainsert(DOCUMENTS[:2], filters={"user": "a"})
+        await vector_db.aupsert(DOCUMENTS[2:], filters={"user": "b"})
+        return (
+            await vector_db.asearch("pet", limit=3),
+            await vector_db.asearch("pet", limit=3, filters={"user": "a"}, return_embeddings=True),
+        )
+
+    all_results, filtered_results = asyncio.run(run())
+    assert {document.content for document in all_results} == {"pet food", "food", "pet"}
+    assert [document.content for document in filtered_results] == ["pet food", "food"]
+    assert filtered_results[0].embedding is not None
+    assert vector_db._indexed_fields == {"filters.user"}
+    # The sync client was not used
+    assert vector_db._client is None
+
+
+def test_local_mode_shares_the_collection_between_sync_and_async_methods(embedder):
+    vector_db = Qdrant(collection="docs", embedder=embedder, location=":memory:")
+    with pytest.raises(ValueError):
+        vector_db.async_client
+
+    asyncio.run(vector_db.acreate())
+    asyncio.run(vector_db.ainsert(DOCUMENTS, filters={"user": "a"}))
+    assert vector_db.get_count() == 3
+    assert [document.content for document in vector_db.search("pet food", limit=1)] == ["pet food"]
+    assert asyncio.run(vector_db.asearch("pet", limit=3, filters={"user": "b"})) == []